@@ -0,0 +1,76 @@
+"""0921b_test_product_raw_data compayny_goods_cd unique
+
+Revision ID: 9e2b5f7a1c36
+Revises: 7a4c1d9e3b58
+Create Date: 2025-09-21 15:27:12.880514
+
+"""
+import logging
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e2b5f7a1c36'
+down_revision: Union[str, None] = '7a4c1d9e3b58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    bind = op.get_bind()
+
+    # 자체상품코드 중복 행 정리 (upsert가 같은 코드의 행을 모두 같은 값으로 수정하므로 가장 먼저 만든 id만 남김)
+    # 지울 행 id -> 남길 id 매핑
+    bind.execute(sa.text(
+        "CREATE TEMP TABLE tmp_raw_data_duplicates AS "
+        "SELECT a.id AS duplicate_id, k.keep_id FROM test_product_raw_data a "
+        "JOIN (SELECT compayny_goods_cd, min(id) AS keep_id FROM test_product_raw_data "
+        "      GROUP BY compayny_goods_cd HAVING count(*) > 1) k "
+        "ON a.compayny_goods_cd = k.compayny_goods_cd AND a.id <> k.keep_id"
+    ))
+
+    # 자식 테이블은 ON DELETE CASCADE라 그대로 지우면 가격/수정 데이터가 같이 지워지므로 남길 id로 옮김
+    # one_one_price는 상품당 하나(unique)라 같은 코드 묶음에서 가장 최근 id만 남기고 옮김
+    one_one_deleted = bind.execute(sa.text(
+        "DELETE FROM one_one_price o USING ("
+        "  SELECT p.id, row_number() OVER ("
+        "    PARTITION BY coalesce(d.keep_id, p.test_product_raw_data_id) ORDER BY p.id DESC) AS rn"
+        "  FROM one_one_price p LEFT JOIN tmp_raw_data_duplicates d ON d.duplicate_id = p.test_product_raw_data_id"
+        "  WHERE p.test_product_raw_data_id IN ("
+        "    SELECT duplicate_id FROM tmp_raw_data_duplicates UNION SELECT keep_id FROM tmp_raw_data_duplicates)"
+        ") r WHERE o.id = r.id AND r.rn > 1"
+    )).rowcount
+    moved = {}
+    for table in ("one_one_price", "mall_price", "modified_product_data"):
+        moved[table] = bind.execute(sa.text(
+            f"UPDATE {table} t SET test_product_raw_data_id = d.keep_id "
+            "FROM tmp_raw_data_duplicates d WHERE t.test_product_raw_data_id = d.duplicate_id"
+        )).rowcount
+
+    deleted = bind.execute(sa.text(
+        "DELETE FROM test_product_raw_data a USING tmp_raw_data_duplicates d WHERE a.id = d.duplicate_id"
+    )).rowcount
+    bind.execute(sa.text("DROP TABLE tmp_raw_data_duplicates"))
+    logger.info(
+        "test_product_raw_data 중복 자체상품코드 행 %d건 삭제 "
+        "(자식 행 이동: one_one_price %d건, mall_price %d건, modified_product_data %d건 / "
+        "중복 one_one_price %d건 삭제)",
+        deleted, moved["one_one_price"], moved["mall_price"], moved["modified_product_data"], one_one_deleted,
+    )
+
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.create_unique_constraint('test_product_raw_data_compayny_goods_cd_key', 'test_product_raw_data', ['compayny_goods_cd'])
+    # ### end Alembic commands ###
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.drop_constraint('test_product_raw_data_compayny_goods_cd_key', 'test_product_raw_data', type_='unique')
+    # ### end Alembic commands ###
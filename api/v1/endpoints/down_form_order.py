@@ -2,6 +2,7 @@
 from typing import Optional, Any
 # core
 from core.db import get_async_session
+from core.offload import run_io
 # sql
 from sqlalchemy.ext.asyncio import AsyncSession
 # fastapi
@@ -282,7 +283,8 @@ async def upload_excel_file_and_get_url(
     """
     file_name = file.filename
     file_path = temp_file_to_object_name(file)
-    file_url, minio_object_name = upload_and_get_url(
+    file_url, minio_object_name = await run_io(
+        upload_and_get_url,
         file_path, template_code, file_name)
     return {"file_url": file_url, "object_name": minio_object_name, "template_code": template_code}
 
@@ -394,7 +396,8 @@ async def db_to_excel_url(
         work_status=work_status,
         template_code=template_code
     )
-    file_url, minio_object_name = upload_and_get_url(
+    file_url, minio_object_name = await run_io(
+        upload_and_get_url,
         file_path,
         template_code,
         file_name
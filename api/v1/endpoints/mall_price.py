@@ -1,7 +1,9 @@
 from core.db import get_async_session
 from fastapi import APIRouter, Depends, HTTPException
 from schemas.mall_price.request.create_mall_price_form import CreateMallPriceForm
+from schemas.mall_price.request.bulk_mall_price_form import BulkMallPriceForm
 from schemas.mall_price.response.setting_price_response import SettingPriceResponse
+from schemas.mall_price.response.bulk_setting_price_response import BulkSettingPriceResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from services.usecase.product_mall_price_usecase import ProductMallPriceUsecase
 from utils.logs.sabangnet_logger import get_logger
@@ -35,4 +37,18 @@ async def mall_price_setting(
         else:
             raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/bulk", response_model=BulkSettingPriceResponse)
+async def mall_price_setting_bulk(
+    request: BulkMallPriceForm,
+    product_mall_price_usecase: ProductMallPriceUsecase = Depends(get_product_mall_price_usecase)
+):
+    try:
+        result = await product_mall_price_usecase.setting_mall_prices(
+            compayny_goods_cds=request.compayny_goods_cds,
+        )
+        return BulkSettingPriceResponse(**result)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
@@ -11,6 +11,7 @@ import os
 # core
 from core.settings import SETTINGS
 from core.db import get_async_session
+from core.offload import run_io
 # fastapi
 from fastapi.responses import StreamingResponse
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
@@ -202,7 +203,8 @@ async def download_test_products_excel(
         )
 
         # 2) MinIO 업로드
-        file_url, minio_object_name, uploaded_size = upload_and_get_url_and_size(
+        file_url, minio_object_name, uploaded_size = await run_io(
+            upload_and_get_url_and_size,
             temp_path,
             "test_product_excel",   # 버킷/경로명은 실제 정책에 맞게 지정
             file_name
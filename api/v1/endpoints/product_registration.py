@@ -23,6 +23,7 @@ from fastapi import Query
 from urllib.parse import urlencode
 
 from core.db import get_async_session
+from core.offload import run_io
 from services.product_registration import ProductRegistrationService, ProductCodeIntegratedService, ProductRegistrationReadService
 from services.product_registration.product_integrated_service_v2 import ProductCodeIntegratedServiceV2
 from services.product.product_read_service import ProductReadService
@@ -180,7 +181,8 @@ async def download_products_excel(
         )
 
         # 2) MinIO 업로드
-        file_url, minio_object_name, uploaded_size = upload_and_get_url_and_size(
+        file_url, minio_object_name, uploaded_size = await run_io(
+            upload_and_get_url_and_size,
             temp_file_path, "product_registration", file_name
         )
         file_url = url_arrange(file_url)
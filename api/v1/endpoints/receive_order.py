@@ -103,15 +103,14 @@ async def save_receive_orders_to_db(
     주문 수집 데이터 XML 파일을 업로드하여 주문 데이터를 생성함.
     """
     try:
-        xml_file_path = order_create_service.create_request_xml(
+        safe_mode = os.getenv("DEPLOY_ENV", "production") != "production"
+        # 기간을 일 단위 구간으로 나눠 동시에 수집하고, 응답은 내려받는 대로 파싱해서 저장
+        return await order_create_service.collect_orders_to_db(
             ord_st_date=request.get_order_date_from_yyyymmdd(),
             ord_ed_date=request.get_end_date_yyyymmdd(),
-            order_status=request.get_order_status_code()
+            order_status=request.get_order_status_code(),
+            safe_mode=safe_mode
         )
-        xml_url = order_create_service.get_xml_url_from_minio(xml_file_path)
-        xml_content = order_create_service.get_orders_from_sabangnet(xml_url)
-        safe_mode = os.getenv("DEPLOY_ENV", "production") != "production"
-        return await order_create_service.save_orders_to_db_from_xml(xml_content, safe_mode)
     except Exception as e:
         from fastapi import HTTPException
         raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
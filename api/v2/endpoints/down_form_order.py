@@ -8,6 +8,7 @@ import zipfile
 
 # core
 from core.db import get_async_session
+from core.offload import run_io
 
 # sql
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -160,7 +161,8 @@ async def db_to_excel_url(
                 zip_temp_path = zip_tmp_file.name
 
             # MinIO에 ZIP 파일 업로드
-            file_url, minio_object_name, file_size = upload_and_get_url_and_size(
+            file_url, minio_object_name, file_size = await run_io(
+                upload_and_get_url_and_size,
                 zip_temp_path, "down_form_orders", zip_file_name
             )
             file_url = url_arrange(file_url)
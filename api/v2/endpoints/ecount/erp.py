@@ -16,6 +16,7 @@ from schemas.integration_response import ResponseHandler, Metadata as ResponseMe
 from schemas.ecount.ecount_excel_sale_dto import EcountSaleExcelRequestDto
 from services.ecount.ecount_auth_service import EcountAuthManager
 from services.ecount.ecount_excel_sale_service import EcountExcelSaleService
+from services.ecount.ecount_outbox_service import EcountOutboxService
 
 logger = get_logger(__name__)
 
@@ -110,6 +111,44 @@ async def create_sale_bulk_from_excel(
             )
         )
 
+@router.post(
+    "/outbox/drain",
+    summary="이카운트 전송 대기열(outbox) 전송",
+    description="ecount_outbox의 pending 전표를 묶어서 이카운트로 전송합니다. 처리되지 않은 전표만 다시 보냅니다.",
+    response_class=Response
+)
+@api_exception_handler(logger)
+async def drain_outbox(
+    limit: Optional[int] = None,
+    session: AsyncSession = Depends(get_async_session)
+):
+    """
+    이카운트 전송 대기열을 전송합니다. (워커/스케줄러에서 주기적으로 호출)
+    """
+    summary = await EcountOutboxService(session).drain(limit=limit)
+    summary.pop("results")
+    summary.pop("api_response")
+    return ResponseHandler.ok(data=summary, metadata=ResponseMetadata(version="v2"))
+
+
+@router.post(
+    "/outbox/requeue",
+    summary="이카운트 전송 대기열(outbox) 재전송 대상 지정",
+    description="이카운트에서 처리되지 않은 것을 확인한 unknown/failed 전표를 다시 pending으로 돌립니다.",
+    response_class=Response
+)
+@api_exception_handler(logger)
+async def requeue_outbox(
+    ids: List[int] = Body(..., embed=True),
+    session: AsyncSession = Depends(get_async_session)
+):
+    """
+    unknown/failed 전표를 다시 전송 대기 상태로 돌립니다.
+    """
+    requeued = await EcountOutboxService(session).requeue(ids)
+    return ResponseHandler.ok(data={"requeued": requeued}, metadata=ResponseMetadata(version="v2"))
+
+
 @router.get("/health")
 @api_exception_handler(logger)
 async def health_check():
@@ -9,6 +9,7 @@ legacy_ssl_handler = LegacySSLHandler()
 legacy_ssl_handler.fix_legacy_ssl_config()
 # 레거시 SSL 수정 완료
 # std
+import os
 import typer
 import asyncio
 # sql
@@ -126,6 +127,32 @@ def order_list():
     asyncio.run(_order_list())
 
 
+@app.command(help="워터마크 이후 주문만 주기적으로 수집합니다")
+def order_sync(
+    order_status: list[str] = typer.Option(None, "--order-status", help="주문 상태 코드 (기본값: RECEIVE_ORDER_SYNC_ORDER_STATUSES)"),
+    interval: int = typer.Option(SETTINGS.RECEIVE_ORDER_SYNC_INTERVAL, help="수집 주기(초)"),
+    once: bool = typer.Option(False, "--once", help="한 번만 수집하고 종료")
+):
+    from services.receive_orders.receive_order_sync_service import (
+        get_sync_order_statuses,
+        run_receive_order_sync_once,
+        run_receive_order_sync_worker,
+    )
+
+    async def _order_sync():
+        order_statuses = order_status or get_sync_order_statuses()
+        safe_mode = os.getenv("DEPLOY_ENV", "production") != "production"
+        if once:
+            await run_receive_order_sync_once(order_statuses, safe_mode)
+        else:
+            await run_receive_order_sync_worker(order_statuses, interval, safe_mode)
+
+    try:
+        asyncio.run(_order_sync())
+    except KeyboardInterrupt:
+        logger.info("주문 증분 수집을 종료합니다.")
+
+
 @app.command(help="DB 연결을 테스트합니다")
 def test_db_connection():
     """PostgreSQL DB 연결 테스트 명령어"""
@@ -0,0 +1,168 @@
+"""
+외부 API 호출용 AIMD(가산 증가 / 곱셈 감소) 동시성 제한 모듈.
+
+고정 크기 Semaphore와 고정 sleep으로는 상대 서버가 느려지거나 429를 줄 때 줄이지 못하고,
+여유가 있을 때는 처리량을 남깁니다. 여기서는 TCP 혼잡 제어처럼 동시 요청 창(window)을 조절합니다.
+
+    - 성공       : window += increase / window  (창 하나만큼 성공하면 +increase)
+    - 혼잡 신호  : window *= decrease_factor     (429, 5xx, 타임아웃/연결 실패)
+    - window는 [min_window, max_window] 사이 (max_window가 하드 캡)
+    - 같은 창에서 보낸 요청들이 한꺼번에 실패해도 감소는 한 번만 적용
+      (감소 이후에 시작한 요청의 혼잡 신호만 다시 감소시킴)
+
+사용법:
+    from core.adaptive_limiter import get_adaptive_limiter
+
+    limiter = get_adaptive_limiter("ecount")
+    async with limiter.slot() as slot:
+        data, status, error = await aiohttp_post(...)
+        slot.report(congested=is_congestion_status(status))
+"""
+import math
+import asyncio
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, asdict
+from typing import Any, AsyncIterator, Optional
+
+from core.settings import SETTINGS
+from utils.logs.sabangnet_logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def is_congestion_status(status: Optional[int]) -> bool:
+    """혼잡 신호로 볼 HTTP 상태인지 (status None은 타임아웃/연결 실패)"""
+    return status is None or status == 429 or status >= 500
+
+
+@dataclass
+class LimiterMetrics:
+    """제한기 단위 지표"""
+
+    name: str
+    window: float
+    min_window: int
+    max_window: int
+    in_flight: int = 0
+    waiting: int = 0
+    succeeded: int = 0
+    congested: int = 0
+    decreases: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["window"] = round(self.window, 2)
+        data["limit"] = int(self.window)
+        return data
+
+
+class _Slot:
+    """slot() 안에서 호출 결과를 보고하는 객체"""
+
+    def __init__(self, limiter: "AdaptiveConcurrencyLimiter", epoch: int):
+        self._limiter = limiter
+        self._epoch = epoch
+        self.reported = False
+
+    def report(self, congested: bool) -> None:
+        if not self.reported:
+            self.reported = True
+            self._limiter._on_result(self._epoch, congested)
+
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD로 동시 실행 수를 조절하는 비동기 제한기"""
+
+    def __init__(
+        self,
+        name: str,
+        initial_window: int,
+        min_window: int,
+        max_window: int,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+    ):
+        self.name = name
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.metrics = LimiterMetrics(
+            name=name,
+            window=float(min(max(initial_window, min_window), max_window)),
+            min_window=min_window,
+            max_window=max_window,
+        )
+        self._epoch = 0
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    @property
+    def limit(self) -> int:
+        return max(self.metrics.min_window, int(self.metrics.window))
+
+    def _get_condition(self) -> asyncio.Condition:
+        # 다른 이벤트 루프(CLI의 asyncio.run 등)에서 쓰면 대기열을 새로 만듦
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self.metrics.in_flight = 0
+            self.metrics.waiting = 0
+        return self._condition
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[_Slot]:
+        """창에 자리가 날 때까지 기다렸다가 실행 (보고 없이 끝나면 창 크기는 그대로)"""
+        condition = self._get_condition()
+        async with condition:
+            self.metrics.waiting += 1
+            try:
+                await condition.wait_for(lambda: self.metrics.in_flight < self.limit)
+            finally:
+                self.metrics.waiting -= 1
+            self.metrics.in_flight += 1
+        slot = _Slot(self, self._epoch)
+        try:
+            yield slot
+        finally:
+            async with condition:
+                self.metrics.in_flight -= 1
+                condition.notify_all()
+
+    def _on_result(self, epoch: int, congested: bool) -> None:
+        metrics = self.metrics
+        if not congested:
+            metrics.succeeded += 1
+            metrics.window = min(float(metrics.max_window), metrics.window + self.increase / metrics.window)
+            return
+        metrics.congested += 1
+        if epoch != self._epoch:
+            # 이미 줄인 창에서 보낸 요청의 실패는 무시
+            return
+        self._epoch += 1
+        metrics.decreases += 1
+        metrics.window = max(float(metrics.min_window), math.floor(metrics.window * self.decrease_factor))
+        logger.warning(f"[{self.name}] 혼잡 감지, 동시 요청 수 감소: {metrics.window:.0f}")
+
+
+_limiters: dict[str, AdaptiveConcurrencyLimiter] = {}
+
+
+def get_adaptive_limiter(name: str) -> AdaptiveConcurrencyLimiter:
+    """이름별 공용 제한기 (처음 요청할 때 SETTINGS 값으로 생성)"""
+    limiter = _limiters.get(name)
+    if limiter is None:
+        prefix = name.upper()
+        limiter = AdaptiveConcurrencyLimiter(
+            name=name,
+            initial_window=getattr(SETTINGS, f"{prefix}_CONCURRENCY_INITIAL"),
+            min_window=getattr(SETTINGS, f"{prefix}_CONCURRENCY_MIN"),
+            max_window=getattr(SETTINGS, f"{prefix}_CONCURRENCY_MAX"),
+        )
+        _limiters[name] = limiter
+    return limiter
+
+
+def get_adaptive_limiter_metrics() -> dict[str, dict[str, Any]]:
+    """제한기별 현재 창 크기, 실행/대기 수 등 지표 반환"""
+    return {name: limiter.metrics.to_dict() for name, limiter in _limiters.items()}
@@ -0,0 +1,103 @@
+"""
+외부 연동(사방넷, 한진, n8n 등)에 쓰는 앱 공용 aiohttp 클라이언트 모듈.
+
+호출할 때마다 aiohttp.ClientSession()을 새로 만들면 요청마다 TCP/TLS 연결을 새로 맺고
+keep-alive 연결을 재사용하지 못합니다. 여기서는 앱이 떠 있는 동안 세션(커넥션 풀) 하나를 공유합니다.
+
+    - 호스트별 동시 연결 수 제한 (HTTP_CLIENT_LIMIT_PER_HOST), 전체 제한 (HTTP_CLIENT_LIMIT)
+    - DNS 조회 결과 캐시 (HTTP_CLIENT_DNS_TTL 초)
+    - 응답이 끝난 연결은 HTTP_CLIENT_KEEPALIVE_TIMEOUT 초 동안 재사용
+    - 쿠키는 저장하지 않음 (한 연동에서 받은 쿠키가 다른 연동 요청에 실리지 않도록)
+
+사용법:
+    from core.http_client import http_session
+
+    async with http_session() as session:
+        async with session.post(url, json=data, timeout=aiohttp.ClientTimeout(total=30)) as response:
+            ...
+
+공용 세션은 main.py lifespan에서 start_http_client()로 만들고 close_http_client()로 닫습니다.
+공용 세션이 없거나 다른 이벤트 루프에서 호출하면(CLI의 asyncio.run, 테스트 등)
+기존처럼 호출 단위 임시 세션을 열고 닫습니다.
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import aiohttp
+
+from core.settings import SETTINGS
+from utils.logs.sabangnet_logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+def _make_connector() -> aiohttp.TCPConnector:
+    return aiohttp.TCPConnector(
+        limit=SETTINGS.HTTP_CLIENT_LIMIT,
+        limit_per_host=SETTINGS.HTTP_CLIENT_LIMIT_PER_HOST,
+        use_dns_cache=True,
+        ttl_dns_cache=SETTINGS.HTTP_CLIENT_DNS_TTL,
+        keepalive_timeout=SETTINGS.HTTP_CLIENT_KEEPALIVE_TIMEOUT,
+    )
+
+
+class _HttpClientRegistry:
+    """공용 ClientSession과 그 세션을 만든 이벤트 루프를 묶어서 관리"""
+
+    def __init__(self):
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def get(self) -> Optional[aiohttp.ClientSession]:
+        """현재 이벤트 루프에서 쓸 수 있는 공용 세션 (없으면 None)"""
+        if self._session is None or self._session.closed:
+            return None
+        if self._loop is not asyncio.get_running_loop():
+            return None
+        return self._session
+
+    async def start(self) -> aiohttp.ClientSession:
+        if self.get() is None:
+            # 여러 연동이 세션을 공유하므로 쿠키는 저장하지 않음 (호출마다 새 세션을 쓰던 때와 같이 쿠키가 다음 요청으로 넘어가지 않음)
+            self._session = aiohttp.ClientSession(connector=_make_connector(), cookie_jar=aiohttp.DummyCookieJar())
+            self._loop = asyncio.get_running_loop()
+            logger.info(
+                f"공용 HTTP 클라이언트 생성 (limit={SETTINGS.HTTP_CLIENT_LIMIT}, "
+                f"limit_per_host={SETTINGS.HTTP_CLIENT_LIMIT_PER_HOST})"
+            )
+        return self._session
+
+    async def close(self) -> None:
+        session, self._session, self._loop = self._session, None, None
+        if session is not None and not session.closed:
+            await session.close()
+            logger.info("공용 HTTP 클라이언트 종료")
+
+
+_registry = _HttpClientRegistry()
+
+
+async def start_http_client() -> aiohttp.ClientSession:
+    """공용 세션 생성 (main.py lifespan 시작 시 호출)"""
+    return await _registry.start()
+
+
+async def close_http_client() -> None:
+    """공용 세션 종료 (main.py lifespan 종료 시 호출)"""
+    await _registry.close()
+
+
+@asynccontextmanager
+async def http_session() -> AsyncIterator[aiohttp.ClientSession]:
+    """
+    공용 세션을 빌려줌 (블록이 끝나도 닫지 않음)
+    공용 세션이 없으면 블록 동안만 쓰는 임시 세션을 열고 닫음
+    """
+    session = _registry.get()
+    if session is not None:
+        yield session
+        return
+    async with aiohttp.ClientSession() as session:
+        yield session
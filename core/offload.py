@@ -0,0 +1,239 @@
+"""
+이벤트 루프에서 무거운 동기 작업을 떼어내는 공용 실행기 모듈.
+
+async 엔드포인트 안에서 requests, MinIO fput_object, openpyxl 매크로 같은 동기 코드를
+그대로 호출하면 uvicorn 워커의 이벤트 루프가 멈춰서 모든 요청(헬스체크 포함)이 같이 대기합니다.
+여기서는 용도별로 이름 붙은 풀 세 개를 제공합니다.
+
+    - io 풀     : 스레드 풀 (blocking I/O - HTTP, 파일 읽기/쓰기)
+    - cpu 풀    : 프로세스 풀 (엑셀 매크로 같은 CPU 작업, GIL 회피)
+    - upload 풀 : 스레드 풀 (MinIO 업로드 전용, 큰 파일 업로드가 io 풀을 다 차지하지 않도록 분리)
+
+사용법:
+    from core.offload import run_io, run_cpu, io_bound
+
+    # 헬퍼 (호출하는 쪽에서 감싸기)
+    xml_content = await run_io(order_create_service.get_orders_from_sabangnet, xml_url)
+    result_path = await run_cpu(etc_site_merge_packaging, file_path)
+
+    # 데코레이터 (동기 함수를 io 풀에서 도는 async 함수로 만들기)
+    @io_bound
+    def upload(...): ...
+    await upload(...)
+
+주의:
+    cpu 풀로 보내는 함수와 인자는 pickle 가능해야 합니다. (모듈 최상단 함수, 경로 문자열 등)
+    그래서 cpu 풀은 데코레이터 없이 run_cpu 헬퍼로만 사용합니다. (데코레이터가 원본 함수 이름을 덮어쓰면 pickle 불가)
+    DB 세션이나 openpyxl 객체처럼 프로세스를 넘길 수 없는 값은 run_io를 사용하세요.
+"""
+import time
+import asyncio
+import functools
+import threading
+import multiprocessing
+from dataclasses import dataclass, asdict
+from typing import Any, Callable, Optional, TypeVar
+from concurrent.futures import Executor, ThreadPoolExecutor, ProcessPoolExecutor
+
+from core.settings import SETTINGS
+from utils.logs.sabangnet_logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+T = TypeVar("T")
+
+
+IO_POOL_NAME = "sabangnet-io"
+CPU_POOL_NAME = "sabangnet-cpu"
+UPLOAD_POOL_NAME = "sabangnet-upload"
+
+
+@dataclass
+class OffloadMetrics:
+    """풀 단위 실행 지표"""
+
+    name: str
+    max_workers: int
+    submitted: int = 0
+    queued: int = 0           # 제출됐지만 아직 워커를 못 잡은 작업 수 (queue depth)
+    running: int = 0          # 현재 실행 중인 작업 수
+    completed: int = 0
+    failed: int = 0
+    total_wait_time: float = 0.0
+    total_run_time: float = 0.0
+    max_run_time: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        data = asdict(self)
+        finished = self.completed + self.failed
+        data["avg_wait_time"] = round(self.total_wait_time / finished, 4) if finished else 0.0
+        data["avg_run_time"] = round(self.total_run_time / finished, 4) if finished else 0.0
+        data["total_wait_time"] = round(self.total_wait_time, 4)
+        data["total_run_time"] = round(self.total_run_time, 4)
+        data["max_run_time"] = round(self.max_run_time, 4)
+        return data
+
+
+class _OffloadPool:
+    """
+    Executor 하나와 그 지표를 묶어서 관리.
+    Executor는 처음 사용할 때 생성하고, shutdown 이후에 다시 쓰면 새로 만듭니다.
+    """
+
+    def __init__(self, name: str, max_workers: int, factory: Callable[[int], Executor]):
+        self.name = name
+        self.max_workers = max_workers
+        self._factory = factory
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self.metrics = OffloadMetrics(name=name, max_workers=max_workers)
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = self._factory(self.max_workers)
+                    logger.info(f"오프로드 풀 생성: {self.name} (max_workers={self.max_workers})")
+        return self._executor
+
+    def _sync_process_counts(self, delta: int) -> None:
+        with self._lock:
+            self._in_flight += delta
+            self.metrics.running = min(self._in_flight, self.max_workers)
+            self.metrics.queued = self._in_flight - self.metrics.running
+
+    def _on_start(self, wait_time: float) -> None:
+        with self._lock:
+            self.metrics.running += 1
+            self.metrics.total_wait_time += wait_time
+
+    def _on_finish(self, run_time: float, failed: bool, counted: bool = True) -> None:
+        with self._lock:
+            if counted:
+                self.metrics.running -= 1
+            if failed:
+                self.metrics.failed += 1
+            else:
+                self.metrics.completed += 1
+            self.metrics.total_run_time += run_time
+            self.metrics.max_run_time = max(self.metrics.max_run_time, run_time)
+
+    async def submit(self, func: Callable[..., T], *args, **kwargs) -> T:
+        is_process_pool = isinstance(self.executor, ProcessPoolExecutor)
+        with self._lock:
+            self.metrics.submitted += 1
+            if not is_process_pool:
+                self.metrics.queued += 1
+
+        call = functools.partial(func, *args, **kwargs)
+        submitted_at = time.perf_counter()
+        loop = asyncio.get_running_loop()
+
+        if is_process_pool:
+            # 프로세스 풀은 워커 안에서 시작 시각을 알 수 없으므로
+            # 진행 중인 작업 수로 실행/대기 수를 추정하고, 제출 -> 완료 전체를 실행 시간으로 봄
+            self._sync_process_counts(+1)
+            failed = True
+            try:
+                result = await loop.run_in_executor(self.executor, call)
+                failed = False
+                return result
+            finally:
+                self._sync_process_counts(-1)
+                self._on_finish(time.perf_counter() - submitted_at, failed, counted=False)
+
+        dequeued = False
+
+        def _leave_queue() -> None:
+            # 워커가 잡을 때와 잡기 전에 취소될 때 중 먼저 온 쪽에서 한 번만 queued 를 줄임
+            nonlocal dequeued
+            with self._lock:
+                if not dequeued:
+                    dequeued = True
+                    self.metrics.queued -= 1
+
+        def _run():
+            started_at = time.perf_counter()
+            _leave_queue()
+            self._on_start(started_at - submitted_at)
+            failed = True
+            try:
+                result = call()
+                failed = False
+                return result
+            finally:
+                self._on_finish(time.perf_counter() - started_at, failed)
+
+        try:
+            return await loop.run_in_executor(self.executor, _run)
+        finally:
+            # 워커가 잡기 전에 취소되면 _run 이 호출되지 않으므로 여기서 대기열에서 뺌
+            _leave_queue()
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=not wait)
+            logger.info(f"오프로드 풀 종료: {self.name}")
+
+
+def _make_io_executor(max_workers: int) -> Executor:
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=IO_POOL_NAME)
+
+
+def _make_upload_executor(max_workers: int) -> Executor:
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=UPLOAD_POOL_NAME)
+
+
+def _make_cpu_executor(max_workers: int) -> Executor:
+    # 이벤트 루프/스레드가 떠 있는 프로세스를 fork 하면 락 상태가 복제되므로 spawn 사용
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+_io_pool = _OffloadPool(IO_POOL_NAME, SETTINGS.OFFLOAD_IO_WORKERS, _make_io_executor)
+_cpu_pool = _OffloadPool(CPU_POOL_NAME, SETTINGS.OFFLOAD_CPU_WORKERS, _make_cpu_executor)
+_upload_pool = _OffloadPool(UPLOAD_POOL_NAME, SETTINGS.OFFLOAD_UPLOAD_WORKERS, _make_upload_executor)
+
+
+async def run_io(func: Callable[..., T], *args, **kwargs) -> T:
+    """blocking I/O 함수를 io 스레드 풀에서 실행하고 결과를 기다림"""
+    return await _io_pool.submit(func, *args, **kwargs)
+
+
+async def run_cpu(func: Callable[..., T], *args, **kwargs) -> T:
+    """CPU 작업 함수를 cpu 프로세스 풀에서 실행하고 결과를 기다림 (func, 인자 모두 pickle 가능해야 함)"""
+    return await _cpu_pool.submit(func, *args, **kwargs)
+
+
+async def run_upload(func: Callable[..., T], *args, **kwargs) -> T:
+    """업로드 함수를 upload 스레드 풀에서 실행하고 결과를 기다림 (동시 업로드 수는 풀 크기로 제한)"""
+    return await _upload_pool.submit(func, *args, **kwargs)
+
+
+def io_bound(func: Callable[..., T]) -> Callable[..., Any]:
+    """동기 함수를 io 풀에서 실행되는 async 함수로 바꾸는 데코레이터"""
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        return await run_io(func, *args, **kwargs)
+    return wrapper
+
+
+def get_offload_metrics() -> dict[str, dict[str, Any]]:
+    """풀별 대기열 길이, 실행 시간 등 지표 반환"""
+    return {
+        _io_pool.name: _io_pool.metrics.to_dict(),
+        _cpu_pool.name: _cpu_pool.metrics.to_dict(),
+        _upload_pool.name: _upload_pool.metrics.to_dict(),
+    }
+
+
+def shutdown_offload_pools(wait: bool = True) -> None:
+    """앱 종료 시 풀 정리 (main.py lifespan에서 호출)"""
+    _io_pool.shutdown(wait=wait)
+    _cpu_pool.shutdown(wait=wait)
+    _upload_pool.shutdown(wait=wait)
@@ -20,6 +20,11 @@ class Settings(BaseSettings):
     MINIO_BUCKET_NAME: Optional[str] = None
     MINIO_USE_SSL: Optional[bool] = None
     MINIO_PORT: Optional[int] = None
+    MINIO_MULTIPART_PART_SIZE: Optional[int] = 16 * 1024 * 1024  # 이보다 큰 파일은 파트로 나눠 업로드 (바이트, 최소 5MiB)
+    MINIO_MULTIPART_PARALLEL: Optional[int] = 4  # 파일 하나당 동시에 올리는 파트 수
+    MINIO_PRESIGN_EXPIRES: Optional[int] = 7 * 24 * 3600  # presigned URL 유효 시간(초, 최대 7일)
+    MINIO_PRESIGN_CACHE_WINDOW: Optional[int] = 3600  # 같은 구간(초) 안의 요청은 같은 서명 시각으로 서명해서 캐시 재사용
+    MINIO_PRESIGN_CACHE_SIZE: Optional[int] = 10000  # presigned URL 캐시 최대 건수
 
     # DB
     DB_HOST: Optional[str] = None
@@ -46,7 +51,63 @@ class Settings(BaseSettings):
 
     DEPLOY_ENV: Optional[str] = "development"
 
+    # Offload (이벤트 루프 밖에서 돌릴 동기 작업용 풀 크기)
+    OFFLOAD_IO_WORKERS: Optional[int] = 16
+    OFFLOAD_CPU_WORKERS: Optional[int] = 2
+    OFFLOAD_UPLOAD_WORKERS: Optional[int] = 8  # 동시에 업로드하는 파일 수 (MinIO)
+
+    # Logging (로그 큐 / 반복 로그 제한)
+    LOG_QUEUE_ENABLED: Optional[bool] = True  # 콘솔/파일 쓰기를 백그라운드 스레드에서 (False면 호출한 스레드에서 바로 씀)
+    LOG_RATE_LIMIT_PER_SECOND: Optional[int] = 20  # 같은 위치(파일:줄)의 INFO 이하 로그를 초당 몇 건까지 남길지 (0이면 제한 없음)
+
+    # Shared HTTP client (외부 연동 공용 aiohttp 커넥션 풀)
+    HTTP_CLIENT_LIMIT: Optional[int] = 100  # 전체 동시 연결 수
+    HTTP_CLIENT_LIMIT_PER_HOST: Optional[int] = 20  # 호스트별 동시 연결 수
+    HTTP_CLIENT_DNS_TTL: Optional[int] = 300  # DNS 캐시 유지 시간(초)
+    HTTP_CLIENT_KEEPALIVE_TIMEOUT: Optional[float] = 30  # 유휴 연결 유지 시간(초)
+
+    # Macro result cache (같은 엑셀 재업로드 시 매크로 실행 생략)
+    MACRO_RESULT_CACHE_ENABLED: Optional[bool] = True
+    MACRO_RESULT_CACHE_VERSION: Optional[str] = "1"  # 매크로 로직이 바뀌면 올려서 기존 캐시 무효화
+    MACRO_RESULT_CACHE_MAX_BYTES: Optional[int] = 1024 * 1024 * 1024
+    MACRO_RESULT_CACHE_MAX_ENTRIES: Optional[int] = 1000
+
+    # Receive order streaming (사방넷 주문 수집 응답 스트리밍 파싱/저장)
+    RECEIVE_ORDER_STREAM_BATCH_SIZE: Optional[int] = 500
+    RECEIVE_ORDER_STREAM_READ_TIMEOUT: Optional[int] = 60  # 응답 청크 사이 최대 대기 시간(초)
+    RECEIVE_ORDER_COLLECT_WINDOW_DAYS: Optional[int] = 1  # 수집 기간을 나누는 구간 크기(일)
+    RECEIVE_ORDER_COLLECT_CONCURRENCY: Optional[int] = 4  # 동시에 요청하는 구간 수
+    RECEIVE_ORDER_COLLECT_MAX_RETRIES: Optional[int] = 3
+    RECEIVE_ORDER_COLLECT_RETRY_BACKOFF: Optional[float] = 1.0  # 재시도 대기 기본 시간(초), 시도마다 2배
+
+    # Receive order incremental sync (워터마크 기반 주문 증분 수집 워커)
+    RECEIVE_ORDER_SYNC_ENABLED: Optional[bool] = False  # True면 FastAPI 서버 시작 시 워커 실행
+    RECEIVE_ORDER_SYNC_ORDER_STATUSES: Optional[str] = "004"  # 콤마 구분
+    RECEIVE_ORDER_SYNC_INTERVAL: Optional[int] = 300  # 수집 주기(초)
+    RECEIVE_ORDER_SYNC_OVERLAP_MINUTES: Optional[int] = 10  # 워터마크에서 겹쳐 다시 확인하는 시간(분)
+    RECEIVE_ORDER_SYNC_INITIAL_DAYS: Optional[int] = 1  # 워터마크가 없을 때 수집 기간(일)
+    RECEIVE_ORDER_SYNC_LEASE_SECONDS: Optional[int] = 1800  # 수집 중 표시가 이보다 오래되면 (워커 중단) 다른 워커가 가져감
+
+    # Mall price bulk registration (쇼핑몰 가격 대량 등록)
+    MALL_PRICE_BULK_CHUNK_SIZE: Optional[int] = 100  # XML 파일 하나에 넣는 상품 수 (상품당 DATA 31개)
+    MALL_PRICE_BULK_CONCURRENCY: Optional[int] = 4  # 동시에 업로드/요청하는 XML 수
+
+    # Product code generation (품번코드 생성 -> test_product_raw_data)
+    PRODUCT_CODE_UPSERT_CHUNK_SIZE: Optional[int] = 200  # upsert 한 번에 넣는 행 수 (행당 컬럼 약 110개)
+
+    # One one price bulk (1+1 가격 대량 계산)
+    ONE_ONE_PRICE_UPSERT_CHUNK_SIZE: Optional[int] = 500  # upsert 한 번에 넣는 행 수 (행당 파라미터 37개)
+
     # Ecount
+    ECOUNT_SESSION_TTL: Optional[int] = 1800  # 로그인 세션을 검증 없이 재사용하는 시간(초)
+    ECOUNT_CONCURRENCY_INITIAL: Optional[int] = 4  # API 동시 요청 창 시작 크기
+    ECOUNT_CONCURRENCY_MIN: Optional[int] = 1  # 429/5xx/타임아웃 시 줄일 수 있는 최소 창 크기
+    ECOUNT_CONCURRENCY_MAX: Optional[int] = 20  # 창 크기 하드 캡
+    ECOUNT_THROTTLE_MAX_RETRIES: Optional[int] = 2  # 429 응답 재시도 횟수 (서버가 처리하지 않은 요청만 재시도)
+    ECOUNT_THROTTLE_RETRY_BACKOFF: Optional[float] = 0.5  # 429 재시도 대기(초), 재시도마다 배로 늘림
+    ECOUNT_OUTBOX_DRAIN_SIZE: Optional[int] = 100  # outbox에서 한 번에 가져가 한 요청으로 보낼 전표 수
+    ECOUNT_OUTBOX_MAX_ATTEMPTS: Optional[int] = 5  # 이 횟수만큼 보내도 처리되지 않으면 failed
+    ECOUNT_OUTBOX_LEASE_SECONDS: Optional[int] = 300  # sending 상태가 이보다 오래되면 unknown (전송 중 중단)
     ECOUNT_API: Optional[str] = None
     ECOUNT_ZONE: Optional[str] = None
     ECOUNT_DOMAIN: Optional[str] = None
@@ -62,10 +123,21 @@ class Settings(BaseSettings):
     ECOUNT_COM_CODE_IYES: Optional[str] = None
     ECOUNT_API_IYES_TEST: Optional[str] = None
 
+    # File server (사방넷이 가져갈 XML 업로드)
+    FILE_SERVER_MAX_RETRIES: Optional[int] = 3  # 업로드 최대 시도 횟수 (연결 오류, 429, 5xx만 재시도)
+    FILE_SERVER_RETRY_BACKOFF: Optional[float] = 0.5  # 재시도 대기 기본 시간(초), 시도마다 2배
+    FILE_SERVER_CONNECT_TIMEOUT: Optional[float] = 10  # 연결 타임아웃(초)
+    FILE_SERVER_READ_TIMEOUT: Optional[float] = 30  # 소켓 읽기 타임아웃(초), 큰 파일도 전체 시간은 제한하지 않음
+
     # Hanjin
     HANJIN_API: Optional[str] = None
     HANJIN_CLIENT_ID: Optional[str] = None
     HANJIN_CSR_NUM: Optional[str] = None
+    HANJIN_PRINT_WBLS_CHUNK_SIZE: Optional[int] = 100  # print-wbls 요청 1회당 주소 수 (API 최대 100)
+    HANJIN_PRINT_WBLS_CONCURRENCY: Optional[int] = 4  # 동시에 보내는 print-wbls 요청 수
+    HANJIN_PRINT_WBLS_MAX_RETRIES: Optional[int] = 3  # 청크별 최대 시도 횟수
+    HANJIN_PRINT_WBLS_RETRY_BACKOFF: Optional[float] = 1.0  # 재시도 대기 기본 시간(초), 시도마다 2배
+    HANJIN_PRINT_WBLS_TIMEOUT: Optional[int] = 30  # print-wbls 요청 1회 타임아웃(초)
 
     class Config:
         env_file = ".env"
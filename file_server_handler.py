@@ -1,6 +1,10 @@
 import os
+import asyncio
+import aiohttp
 import requests
-from typing import Optional
+from typing import Callable, Optional
+from core.settings import SETTINGS
+from core.http_client import http_session
 from utils.logs.sabangnet_logger import get_logger
 
 logger = get_logger(__name__)
@@ -13,54 +17,92 @@ FILE_SERVER_DOWNLOAD_URL = f"{FILE_SERVER_BASE_URL}/files"
 # SSL 검증 설정 (개발환경에서는 false, 프로덕션에서는 true)
 VERIFY_SSL = os.getenv('VERIFY_SSL', 'false').lower() == 'true'
 
-def upload_to_file_server(local_file_path: str, object_name: Optional[str] = None) -> str:
+# 재시도할 응답 코드 (서버가 요청을 처리하지 못한 경우)
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+
+class _RetryableUploadError(Exception):
+    """재시도할 수 있는 업로드 실패 (연결 오류, 타임아웃, 429/5xx)"""
+
+
+async def _post_to_file_server(path: str, make_form: Callable[[], aiohttp.FormData], description: str) -> dict:
+    """
+    파일 서버에 multipart POST (공용 커넥션 풀 사용, 연결 오류/429/5xx는 지수 백오프로 재시도)
+    본문은 시도마다 make_form()으로 새로 만듦 (파일 스트림은 한 번 읽으면 다시 못 보내므로)
+    """
+    max_retries = max(SETTINGS.FILE_SERVER_MAX_RETRIES, 1)
+    backoff = SETTINGS.FILE_SERVER_RETRY_BACKOFF
+    timeout = aiohttp.ClientTimeout(
+        total=None,
+        sock_connect=SETTINGS.FILE_SERVER_CONNECT_TIMEOUT,
+        sock_read=SETTINGS.FILE_SERVER_READ_TIMEOUT
+    )
+    for attempt in range(1, max_retries + 1):
+        try:
+            async with http_session() as session:
+                async with session.post(
+                    f"{FILE_SERVER_API_URL}{path}",
+                    data=make_form(),
+                    timeout=timeout,
+                    ssl=None if VERIFY_SSL else False  # SSL 검증 설정 적용
+                ) as response:
+                    if response.status in RETRYABLE_STATUSES:
+                        raise _RetryableUploadError(f"HTTP {response.status}: {(await response.text())[:200]}")
+                    if response.status >= 400:
+                        raise RuntimeError(f"HTTP {response.status}: {(await response.text())[:200]}")
+                    return await response.json(content_type=None)
+        except asyncio.CancelledError:
+            raise
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError, _RetryableUploadError) as e:
+            if attempt >= max_retries:
+                logger.error(f"Network error during {description} ({attempt} attempts): {e!r}")
+                raise RuntimeError(f"{description} failed (network error): {e!r}")
+            logger.warning(f"{description} retry {attempt}/{max_retries}: {e!r}")
+            await asyncio.sleep(backoff * (2 ** (attempt - 1)))
+
+
+async def upload_to_file_server_async(local_file_path: str, object_name: Optional[str] = None) -> str:
     """
     Upload a file to the file server and return the object name (filename).
+    The file is streamed from disk in chunks (not loaded into memory) and the event loop is never blocked.
     """
+    local_file_path = str(local_file_path)
     if not os.path.exists(local_file_path):
         raise FileNotFoundError(f"Local file not found: {local_file_path}")
-    
+
     if not object_name:
         object_name = os.path.basename(local_file_path)
-    
+
+    opened_files = []
+
+    def make_form() -> aiohttp.FormData:
+        f = open(local_file_path, 'rb')
+        opened_files.append(f)
+        form = aiohttp.FormData()
+        form.add_field('file', f, filename=os.path.basename(local_file_path))
+        form.add_field('filename', object_name)
+        return form
+
     try:
-        with open(local_file_path, 'rb') as f:
-            files = {'file': f}
-            data = {'filename': object_name}
-            
-            logger.info(f"Uploading {local_file_path} as {object_name}")
-            response = requests.post(
-                f"{FILE_SERVER_API_URL}/upload", 
-                files=files, 
-                data=data,
-                timeout=30,
-                verify=VERIFY_SSL  # SSL 검증 설정 적용
-            )
-            response.raise_for_status()
-            
-            result = response.json()
-            
-            if not result.get('success', False):
-                raise RuntimeError(f"Upload failed: {result.get('message', 'Unknown error')}")
-            
-            filename = result.get('filename', object_name)
-            logger.info(f"Upload successful: {filename}")
-            return filename
-            
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Network error during upload: {e}")
-        raise RuntimeError(f"File server upload failed (network error): {e}")
+        logger.info(f"Uploading {local_file_path} as {object_name}")
+        result = await _post_to_file_server("/upload", make_form, "File server upload")
+        if not result.get('success', False):
+            raise RuntimeError(f"Upload failed: {result.get('message', 'Unknown error')}")
+
+        filename = result.get('filename', object_name)
+        logger.info(f"Upload successful: {filename}")
+        return filename
+    except RuntimeError:
+        raise
     except Exception as e:
         logger.error(f"Upload error: {e}")
         raise RuntimeError(f"File server upload failed: {e}")
+    finally:
+        for f in opened_files:
+            f.close()
 
-def get_file_server_url(object_name: str) -> str:
-    """
-    Get a public URL for the uploaded object on the file server.
-    """
-    return f"{FILE_SERVER_DOWNLOAD_URL}/{object_name}"
 
-def upload_xml_content_to_file_server(xml_content: str, filename: str) -> str:
+async def upload_xml_content_to_file_server_async(xml_content: str, filename: str) -> str:
     """
     Upload XML content directly to the file server.
     Args:
@@ -71,32 +113,47 @@ def upload_xml_content_to_file_server(xml_content: str, filename: str) -> str:
     Raises:
         RuntimeError: If the upload fails
     """
+    def make_form() -> aiohttp.FormData:
+        form = aiohttp.FormData()
+        form.add_field('content', xml_content)
+        form.add_field('filename', filename)
+        return form
+
     try:
-        data = {
-            'content': xml_content,
-            'filename': filename
-        }
         logger.info(f"Uploading XML content as {filename}")
-        response = requests.post(
-            f"{FILE_SERVER_API_URL}/upload-xml",
-            data=data,
-            timeout=30,
-            verify=VERIFY_SSL
-        )
-        response.raise_for_status()
-        result = response.json()
+        result = await _post_to_file_server("/upload-xml", make_form, "XML upload")
         if not result.get('success', False):
             raise RuntimeError(f"XML upload failed: {result.get('message', 'Unknown error')}")
         uploaded_filename = result.get('filename', filename)
         logger.info(f"XML upload successful: {uploaded_filename}")
         return uploaded_filename
-    except requests.exceptions.RequestException as e:
-        logger.error(f"Network error during XML upload: {e}")
-        raise RuntimeError(f"XML upload failed (network error): {e}")
+    except RuntimeError:
+        raise
     except Exception as e:
         logger.error(f"XML upload error: {e}")
         raise RuntimeError(f"XML upload failed: {e}")
 
+
+def upload_to_file_server(local_file_path: str, object_name: Optional[str] = None) -> str:
+    """
+    동기 코드(CLI)용 upload_to_file_server_async 래퍼. async 코드에서는 upload_to_file_server_async를 await 하세요.
+    """
+    return asyncio.run(upload_to_file_server_async(local_file_path, object_name))
+
+
+def get_file_server_url(object_name: str) -> str:
+    """
+    Get a public URL for the uploaded object on the file server.
+    """
+    return f"{FILE_SERVER_DOWNLOAD_URL}/{object_name}"
+
+
+def upload_xml_content_to_file_server(xml_content: str, filename: str) -> str:
+    """
+    동기 코드(CLI)용 upload_xml_content_to_file_server_async 래퍼. async 코드에서는 async 버전을 await 하세요.
+    """
+    return asyncio.run(upload_xml_content_to_file_server_async(xml_content, filename))
+
 # 테스트용 함수
 def test_connection():
     """
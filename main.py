@@ -9,6 +9,9 @@
 ################################################
 
 
+import os
+import asyncio
+import contextlib
 from contextlib import asynccontextmanager
 
 
@@ -36,7 +39,12 @@ from api.v2.endpoints.ecount.erp_transfer import router as ecount_erp_transfer_v
 from api.v2.endpoints.ecount.erp import router as ecount_erp_v2_router
 
 
-from utils.logs.sabangnet_logger import get_logger, HTTPLoggingMiddleware
+from core.settings import SETTINGS
+from core.offload import get_offload_metrics, shutdown_offload_pools
+from core.adaptive_limiter import get_adaptive_limiter_metrics
+from core.http_client import start_http_client, close_http_client
+from services.receive_orders.receive_order_sync_service import get_sync_order_statuses, run_receive_order_sync_worker
+from utils.logs.sabangnet_logger import get_logger, stop_log_listener, HTTPLoggingMiddleware
 from api.v1.endpoints.mall_certification_handling.mall_certification_handling import router as mall_certification_handling_router
 
 
@@ -47,8 +55,23 @@ logger = get_logger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # FastAPI 서버 시작 전 작업영역
+    await start_http_client()
+    sync_worker = None
+    if SETTINGS.RECEIVE_ORDER_SYNC_ENABLED:
+        sync_worker = asyncio.create_task(run_receive_order_sync_worker(
+            get_sync_order_statuses(),
+            interval=SETTINGS.RECEIVE_ORDER_SYNC_INTERVAL,
+            safe_mode=os.getenv("DEPLOY_ENV", "production") != "production",
+        ))
     yield
     # FastAPI 서버 종료 후 작업영역
+    if sync_worker is not None:
+        sync_worker.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await sync_worker
+    await close_http_client()
+    shutdown_offload_pools(wait=False)
+    stop_log_listener()
 
 
 # 메인 라우터
@@ -117,3 +140,11 @@ app.add_middleware(
 @app.get("/")
 def root() -> str:
     return "FastAPI 메인페이지 입니다."
+
+
+@app.get("/health")
+async def health() -> dict:
+    """
+    헬스체크. 매크로 같은 무거운 작업은 오프로드 풀에서 돌기 때문에 이벤트 루프는 바로 응답함.
+    """
+    return {"status": "ok", "offload": get_offload_metrics(), "adaptive_limiters": get_adaptive_limiter_metrics()}
@@ -1,11 +1,20 @@
+import io
 import os
+import time
+import asyncio
+import threading
+from collections import OrderedDict
+import certifi
+import urllib3
+from typing import BinaryIO, Iterable, Union
 from minio import Minio
 from minio.error import S3Error
 from urllib.parse import urlparse, urlunparse
 from utils.logs.sabangnet_logger import get_logger
 from core.settings import SETTINGS
+from core.offload import run_upload
 import shutil
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 logger = get_logger(__name__)
 
@@ -22,13 +31,42 @@ if MINIO_PORT:
 else:
     endpoint = MINIO_ENDPOINT
 
+MINIO_PART_SIZE = max(SETTINGS.MINIO_MULTIPART_PART_SIZE, 5 * 1024 * 1024)
+MINIO_PARALLEL_UPLOADS = max(SETTINGS.MINIO_MULTIPART_PARALLEL, 1)
+
+# 기본 커넥션 풀(maxsize=10)은 동시 업로드 x 파트 병렬 수보다 작아서 연결을 기다리게 되므로 크기를 맞춰서 생성
+# (나머지 옵션은 minio 기본값과 동일)
+_minio_http_client = urllib3.PoolManager(
+    timeout=urllib3.Timeout(connect=300, read=300),
+    maxsize=max(SETTINGS.OFFLOAD_UPLOAD_WORKERS * MINIO_PARALLEL_UPLOADS, 10),
+    cert_reqs='CERT_REQUIRED',
+    ca_certs=os.environ.get('SSL_CERT_FILE') or certifi.where(),
+    retries=urllib3.Retry(
+        total=5,
+        backoff_factor=0.2,
+        status_forcelist=[500, 502, 503, 504]
+    )
+)
+
 minio_client = Minio(
     endpoint,
     access_key=MINIO_ACCESS_KEY,
     secret_key=MINIO_SECRET_KEY,
-    secure=MINIO_USE_SSL
+    secure=MINIO_USE_SSL,
+    http_client=_minio_http_client
 )
 
+# presigned URL 캐시: (bucket, object, 유효시간, 서명 구간 시작) -> URL
+# 서명 시각을 구간 시작으로 맞추므로 같은 구간 안에서는 같은 URL이 나오고, 구간 끝에서도 (유효시간 - 구간 길이)만큼은 유효함
+MINIO_PRESIGN_EXPIRES = min(SETTINGS.MINIO_PRESIGN_EXPIRES, 7 * 24 * 3600)
+MINIO_PRESIGN_CACHE_WINDOW = max(min(SETTINGS.MINIO_PRESIGN_CACHE_WINDOW, MINIO_PRESIGN_EXPIRES // 2), 1)
+_presign_cache: "OrderedDict[tuple, str]" = OrderedDict()
+_presign_lock = threading.Lock()
+
+# 버킷 존재 확인은 프로세스당 한 번만 (업로드마다 list_buckets + bucket_exists 두 번씩 왕복하지 않도록)
+_bucket_ready = False
+_bucket_lock = threading.Lock()
+
 def check_minio_connection():
     """
     Check if MinIO server is reachable and credentials are valid.
@@ -41,29 +79,126 @@ def check_minio_connection():
     except Exception as e:
         raise RuntimeError(f"MinIO connection failed: {e}")
 
+def ensure_bucket():
+    """
+    Make sure the bucket exists. Checked once per process; a failed check is retried on the next call.
+    """
+    global _bucket_ready
+    if _bucket_ready:
+        return
+    with _bucket_lock:
+        if _bucket_ready:
+            return
+        try:
+            if not minio_client.bucket_exists(MINIO_BUCKET_NAME):
+                minio_client.make_bucket(MINIO_BUCKET_NAME)
+        except Exception as e:
+            raise RuntimeError(f"MinIO connection failed: {e}")
+        _bucket_ready = True
+
+def _put_with_bucket_check(put):
+    """
+    Run an upload after ensure_bucket().
+    If the bucket was removed after the cached check, check again and retry once.
+    """
+    global _bucket_ready
+    ensure_bucket()
+    try:
+        return put()
+    except S3Error as e:
+        if e.code != "NoSuchBucket":
+            raise
+        logger.warning(f"MinIO 버킷이 없어 다시 확인 후 재시도합니다: {MINIO_BUCKET_NAME}")
+        with _bucket_lock:
+            _bucket_ready = False
+        ensure_bucket()
+        return put()
+
 def upload_file_to_minio(local_file_path, object_name=None):
     """
     Upload a file to MinIO and return the object name.
+    Files larger than MINIO_PART_SIZE are uploaded as parallel multipart.
     """
-    # Check connection before upload
-    check_minio_connection()
     if not object_name:
         object_name = os.path.basename(local_file_path)
     try:
-        # Ensure bucket exists
-        if not minio_client.bucket_exists(MINIO_BUCKET_NAME):
-            minio_client.make_bucket(MINIO_BUCKET_NAME)
-        minio_client.fput_object(
+        _put_with_bucket_check(lambda: minio_client.fput_object(
             MINIO_BUCKET_NAME,
             object_name,
-            local_file_path
-        )
+            local_file_path,
+            part_size=MINIO_PART_SIZE,
+            num_parallel_uploads=MINIO_PARALLEL_UPLOADS
+        ))
         logger.info(f"MinIO에 업로드된 파일 이름: {object_name}")
         logger.info(f"MinIO에 업로드된 파일 경로: {local_file_path}")
         return object_name
     except S3Error as e:
         raise RuntimeError(f"MinIO upload failed: {e}")
 
+def _buffer_length(buffer: BinaryIO) -> int:
+    """Remaining bytes from the current position of a seekable buffer."""
+    if isinstance(buffer, io.BytesIO):
+        return buffer.getbuffer().nbytes - buffer.tell()
+    position = buffer.tell()
+    end = buffer.seek(0, io.SEEK_END)
+    buffer.seek(position)
+    return end - position
+
+def upload_bytes_to_minio(data: Union[bytes, BinaryIO], object_name, content_type="application/octet-stream"):
+    """
+    Upload in-memory bytes or a seekable binary buffer (e.g. BytesIO) to MinIO and return the object name.
+    Buffers are read from their current position without copying.
+    """
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        stream, length = io.BytesIO(data), len(data)
+    else:
+        stream, length = data, _buffer_length(data)
+    start = stream.tell()
+
+    def put():
+        stream.seek(start)
+        return minio_client.put_object(
+            MINIO_BUCKET_NAME,
+            object_name,
+            stream,
+            length=length,
+            content_type=content_type,
+            part_size=MINIO_PART_SIZE,
+            num_parallel_uploads=MINIO_PARALLEL_UPLOADS
+        )
+
+    try:
+        _put_with_bucket_check(put)
+        logger.info(f"MinIO에 업로드된 객체 이름: {object_name} ({length} bytes)")
+        return object_name
+    except S3Error as e:
+        raise RuntimeError(f"MinIO upload failed: {e}")
+
+def download_bytes_from_minio(object_name) -> bytes:
+    """
+    Download an object from MinIO and return its content.
+    """
+    response = None
+    try:
+        response = minio_client.get_object(MINIO_BUCKET_NAME, object_name)
+        return response.read()
+    except S3Error as e:
+        raise RuntimeError(f"MinIO download failed: {e}")
+    finally:
+        if response is not None:
+            response.close()
+            response.release_conn()
+
+def remove_objects_from_minio(object_names):
+    """
+    Remove objects from MinIO. Missing objects are ignored.
+    """
+    for object_name in object_names:
+        try:
+            minio_client.remove_object(MINIO_BUCKET_NAME, object_name)
+        except S3Error as e:
+            logger.warning(f"MinIO 객체 삭제 실패: {object_name} | {e}")
+
 def remove_port_from_url(url):
     parsed = urlparse(url)
     # netloc에서 포트(:9000 등)만 제거
@@ -86,27 +221,83 @@ def remove_port_from_url(url):
     ))
     return new_url
 
+def get_presigned_urls(object_names: Iterable[str], expires: int = None) -> dict:
+    """
+    Presign many objects at once and return {object_name: presigned_url}.
+    Objects signed within the same cache window are served from the cache.
+    """
+    expires = min(expires or MINIO_PRESIGN_EXPIRES, 7 * 24 * 3600)
+    window = min(MINIO_PRESIGN_CACHE_WINDOW, max(expires // 2, 1))
+    window_start = int(time.time()) // window * window
+    request_date = datetime.fromtimestamp(window_start, tz=timezone.utc)
+
+    object_names = list(object_names)
+    urls = {}
+    missing = []
+    with _presign_lock:
+        for object_name in object_names:
+            key = (MINIO_BUCKET_NAME, object_name, expires, window_start)
+            url = _presign_cache.get(key)
+            if url is None:
+                missing.append(object_name)
+            else:
+                _presign_cache.move_to_end(key)
+                urls[object_name] = url
+
+    for object_name in missing:
+        if object_name in urls:
+            continue
+        try:
+            urls[object_name] = minio_client.presigned_get_object(
+                MINIO_BUCKET_NAME,
+                object_name,
+                expires=timedelta(seconds=expires),
+                request_date=request_date
+            )
+        except S3Error as e:
+            raise RuntimeError(f"MinIO get URL failed: {e}")
+
+    if missing:
+        with _presign_lock:
+            for object_name in missing:
+                _presign_cache[(MINIO_BUCKET_NAME, object_name, expires, window_start)] = urls[object_name]
+            while len(_presign_cache) > SETTINGS.MINIO_PRESIGN_CACHE_SIZE:
+                _presign_cache.popitem(last=False)
+    return {object_name: urls[object_name] for object_name in object_names}
+
+def get_presigned_url(object_name, expires: int = None) -> str:
+    """
+    Presign a single object (cached, see get_presigned_urls).
+    """
+    return get_presigned_urls([object_name], expires)[object_name]
+
 def get_minio_file_url(object_name):
     """
     Get a public URL for the uploaded object.
     """
-    try:
-        url = minio_client.presigned_get_object(MINIO_BUCKET_NAME, object_name)
-        return_url = remove_port_from_url(url)
-        logger.info(f"get_minio_file_url MinIO에 업로드된 XML 파일 URL: {return_url}")
-        return return_url
-    except S3Error as e:
-        raise RuntimeError(f"MinIO get URL failed: {e}")
+    return_url = remove_port_from_url(get_presigned_url(object_name))
+    logger.info(f"get_minio_file_url MinIO에 업로드된 XML 파일 URL: {return_url}")
+    return return_url
+
+def get_minio_file_urls(object_names: Iterable[str]) -> dict:
+    """
+    Get public URLs for many objects at once. {object_name: url}
+    """
+    return {
+        object_name: remove_port_from_url(url)
+        for object_name, url in get_presigned_urls(object_names).items()
+    }
 
-def get_minio_file_url_and_size(object_name):
+def get_minio_file_url_and_size(object_name, file_size=None):
     """
     Get a public URL and file size for the uploaded object.
+    If file_size is already known (e.g. the local file just uploaded), stat_object is skipped.
     """
     try:
-        url = minio_client.presigned_get_object(MINIO_BUCKET_NAME, object_name)
-        return_url = remove_port_from_url(url)
-        stat = minio_client.stat_object(MINIO_BUCKET_NAME, object_name)
-        file_size = stat.size  # content_length
+        return_url = remove_port_from_url(get_presigned_url(object_name))
+        if file_size is None:
+            stat = minio_client.stat_object(MINIO_BUCKET_NAME, object_name)
+            file_size = stat.size  # content_length
         logger.info(f"get_minio_file_url_and_size MinIO에 업로드된 파일 URL: {return_url}, size: {file_size}")
         return return_url, file_size
     except S3Error as e:
@@ -152,8 +343,9 @@ def upload_and_get_url_with_count_rev(file_path, template_code, file_name=None,
     """
     minio_object_name = f"excel/{template_code}/{count_rev}_{file_name}"
     object_name = upload_file_to_minio(file_path, minio_object_name)
+    file_size = os.path.getsize(file_path)
     delete_temp_file(file_path)
-    file_url, file_size = get_minio_file_url_and_size(object_name)
+    file_url, file_size = get_minio_file_url_and_size(object_name, file_size)
     return file_url, minio_object_name, file_size
 
 def upload_and_get_url_and_size(file_path, template_code, file_name=None):
@@ -167,6 +359,30 @@ def upload_and_get_url_and_size(file_path, template_code, file_name=None):
     date_now = datetime.now().strftime("%Y%m%d%H%M%S")
     minio_object_name = f"excel/{template_code}/{date_now}_{file_name}"
     object_name = upload_file_to_minio(file_path, minio_object_name)
+    file_size = os.path.getsize(file_path)
     delete_temp_file(file_path)
-    file_url, file_size = get_minio_file_url_and_size(object_name)
-    return file_url, minio_object_name, file_size
\ No newline at end of file
+    file_url, file_size = get_minio_file_url_and_size(object_name, file_size)
+    return file_url, minio_object_name, file_size
+
+async def upload_file_to_minio_async(local_file_path, object_name=None):
+    """upload_file_to_minio를 업로드 풀에서 실행 (이벤트 루프를 막지 않음)"""
+    return await run_upload(upload_file_to_minio, local_file_path, object_name)
+
+async def upload_bytes_to_minio_async(data: Union[bytes, BinaryIO], object_name, content_type="application/octet-stream"):
+    """upload_bytes_to_minio를 업로드 풀에서 실행 (이벤트 루프를 막지 않음)"""
+    return await run_upload(upload_bytes_to_minio, data, object_name, content_type)
+
+async def upload_and_get_url_and_size_async(file_path, template_code, file_name=None):
+    """upload_and_get_url_and_size를 업로드 풀에서 실행 (이벤트 루프를 막지 않음)"""
+    return await run_upload(upload_and_get_url_and_size, file_path, template_code, file_name)
+
+async def upload_many_and_get_url_and_size_async(files):
+    """
+    여러 파일을 동시에 업로드 (동시 업로드 수는 OFFLOAD_UPLOAD_WORKERS로 제한)
+    files: [(file_path, template_code, file_name), ...]
+    반환: files 순서대로 (file_url, minio_object_name, file_size) 또는 실패한 파일의 예외 객체
+    """
+    return await asyncio.gather(
+        *(upload_and_get_url_and_size_async(file_path, template_code, file_name) for file_path, template_code, file_name in files),
+        return_exceptions=True
+    )
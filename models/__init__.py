@@ -14,8 +14,10 @@ from models.product.product_mycategory_data import ProductMycategoryData
 from models.product.product_raw_data import ProductRawData
 from models.product.product_registration_data import ProductRegistrationRawData
 from models.receive_orders.receive_orders import ReceiveOrders
+from models.receive_orders.receive_order_sync_state import ReceiveOrderSyncState
 from models.macro_batch_processing.macro_info import MacroInfo
 from models.macro_batch_processing.batch_process import BatchProcess 
+from models.macro_batch_processing.macro_result_cache import MacroResultCache
 from models.down_form_orders.test_down_form_orders import TestDownFormOrder
 from models.hanjin.hanjin_printwbls import HanjinPrintwbls
 from models.hanjin.hanjin_orders import HanjinOrder
@@ -26,4 +28,5 @@ from models.smile.smile_macro import SmileMacro
 from models.vlookup_datas.vlookup_datas import VlookupDatas
 from models.ecount.erp_partner_code import EcountErpPartnerCode
 from models.ecount.iyes_cost import EcountIyesCost
-from models.ecount.ecount_models import EcountSale, EcountPurchase, EcountAuthSession, EcountApiLog, EcountConfig
\ No newline at end of file
+from models.ecount.ecount_models import EcountSale, EcountPurchase, EcountAuthSession, EcountApiLog, EcountConfig
+from models.ecount.ecount_outbox import EcountOutbox
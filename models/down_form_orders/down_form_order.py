@@ -3,7 +3,7 @@ from datetime import datetime
 from models.base_model import Base
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy import Integer, String, Text, Numeric, DateTime, UniqueConstraint
+from sqlalchemy import Integer, String, Text, Numeric, DateTime, UniqueConstraint, Index
 from schemas.receive_orders.receive_orders_dto import ReceiveOrdersDto
 
 
@@ -171,6 +171,8 @@ class BaseDownFormOrder(BaseFormOrder):
     __tablename__ = "down_form_orders"
 
     # __table_args__ = (UniqueConstraint("idx", name="uq_down_form_orders_idx"),) 다른 쇼핑몰의 주문번호가 같을 수 있어서.
+    # 운송장번호 일괄 업데이트가 idx로 조인하므로 일반 인덱스만 둠
+    __table_args__ = (Index("idx_down_form_orders_idx", "idx"),)
     
 
 
@@ -0,0 +1,39 @@
+from models.base_model import Base
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy import Integer, String, Text, Boolean, DateTime, Column, Index
+
+
+class EcountOutbox(Base):
+    """
+    이카운트 판매/구매 전송 대기열 (outbox)
+    전표(UPLOAD_SER_NO 묶음) 하나당 한 행. 같은 내용은 idempotency_key가 같아서 다시 쌓이지 않음.
+
+    status
+        pending   : 전송 대기 (429, 세션 오류 등 이카운트가 처리하지 않은 경우 포함)
+        sending   : 워커가 가져가서 전송 중
+        succeeded : 전표 생성 완료 (slip_no 저장)
+        failed    : 이카운트가 거부했거나 재시도 횟수 초과
+        unknown   : 5xx/타임아웃/전송 중 중단 등 처리 여부를 알 수 없음 (확인 후 requeue)
+    """
+
+    __tablename__ = "ecount_outbox"
+    __table_args__ = (
+        Index("idx_ecount_outbox_status_id", "status", "id"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    idempotency_key = Column(String(64), nullable=False, unique=True, comment="전표 내용 해시(sha256)")
+    kind = Column(String(10), nullable=False, comment="sale / purchase")
+    com_code = Column(String(6), nullable=False, comment="회사코드")
+    is_test = Column(Boolean, nullable=False, default=True, comment="테스트 여부")
+    template_code = Column(String(255), nullable=True, comment="템플릿코드")
+    batch_id = Column(String(255), nullable=True, comment="최초로 쌓은 배치ID")
+    order_keys = Column(Text, nullable=True, comment="전표에 포함된 주문번호(size_des), 쉼표 구분")
+    payload = Column(JSONB, nullable=False, comment="BulkDatas 목록 (UPLOAD_SER_NO는 전송 시 다시 매김)")
+
+    status = Column(String(10), nullable=False, default="pending", comment="전송 상태")
+    attempts = Column(Integer, nullable=False, default=0, comment="전송 시도 횟수")
+    locked_at = Column(DateTime(timezone=True), nullable=True, comment="워커가 가져간 시각")
+    slip_no = Column(String(30), nullable=True, comment="전표번호(ERP)")
+    trace_id = Column(String(100), nullable=True, comment="로그확인용 일련번호")
+    last_error = Column(Text, nullable=True, comment="마지막 오류 메시지")
@@ -0,0 +1,27 @@
+from datetime import datetime
+from models.base_model import Base
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Integer, String, DateTime, Text, BigInteger, Boolean, func
+
+
+class MacroResultCache(Base):
+    """
+    매크로 실행 결과 캐시 테이블(macro_result_cache)의 ORM 매핑 모델
+    실제 결과물(엑셀, 행 데이터)은 MinIO에 있고 여기에는 키와 LRU 정리용 메타데이터만 저장
+    """
+
+    __tablename__ = "macro_result_cache"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, comment="캐시 고유 ID")
+    cache_key: Mapped[str] = mapped_column(String(64), unique=True, nullable=False, comment="업로드 파일 + 매크로 조건 SHA-256")
+    template_code: Mapped[str] = mapped_column(String(100), nullable=False, comment="템플릿 코드")
+    sub_site: Mapped[str | None] = mapped_column(String(100), comment="서브 사이트")
+    is_star: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False, comment="스타배송 여부")
+    macro_version: Mapped[str] = mapped_column(String(50), nullable=False, comment="매크로 버전")
+    workbook_object_name: Mapped[str] = mapped_column(Text, nullable=False, comment="매크로 결과 엑셀 MinIO 객체명")
+    rows_object_name: Mapped[str] = mapped_column(Text, nullable=False, comment="매크로 결과 행 데이터 MinIO 객체명")
+    row_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="결과 행 수")
+    size_bytes: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, comment="MinIO 저장 크기 합계")
+    hit_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="캐시 적중 횟수")
+    last_accessed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False, index=True, comment="마지막 사용 시각 (LRU 기준)")
@@ -24,7 +24,8 @@ class OneOnePrice(Base):
     test_product_raw_data_id: Mapped[int] = mapped_column(
         ForeignKey("test_product_raw_data.id",
                     name="test_product_raw_data", ondelete="CASCADE"),
-        nullable=False
+        nullable=False,
+        unique=True,
     )
 
     # 상품명
@@ -3,18 +3,24 @@ from __future__ import annotations
 from decimal import Decimal
 
 from sqlalchemy import (
-    BigInteger, SmallInteger, String, Text, Numeric, CHAR, Integer
+    BigInteger, SmallInteger, String, Text, Numeric, CHAR, Integer, Index, text
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from models.base_model import Base
 
 
+# 사방넷 응답의 자체상품코드는 대괄호가 빠져서 오므로 대괄호를 뺀 코드로 매칭 (함수 인덱스와 같은 식을 써야 인덱스를 탐)
+UNBRACKETED_COMPAYNY_GOODS_CD = "replace(replace(compayny_goods_cd, '[', ''), ']', '')"
+
 class ProductRawData(Base):
     """
     상품 원본 데이터 테이블(test_product_raw_data)의 ORM 매핑 모델
     """
     __tablename__ = "test_product_raw_data"
+    __table_args__ = (
+        Index('idx_test_product_raw_data_unbracketed_goods_cd', text(UNBRACKETED_COMPAYNY_GOODS_CD)),
+    )
 
     # 기본 정보
     id: Mapped[int] = mapped_column(
@@ -26,7 +32,7 @@ class ProductRawData(Base):
     model_nm: Mapped[str | None] = mapped_column(String(60))
     model_no: Mapped[str | None] = mapped_column(String(60))
     brand_nm: Mapped[str | None] = mapped_column(String(50))
-    compayny_goods_cd: Mapped[str] = mapped_column(String(100), nullable=False)
+    compayny_goods_cd: Mapped[str] = mapped_column(String(100), nullable=False, unique=True)
     goods_search: Mapped[str | None] = mapped_column(String(255))
 
     # 분류·구분 코드
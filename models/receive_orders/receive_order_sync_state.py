@@ -0,0 +1,21 @@
+from datetime import datetime
+from models.base_model import Base
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import Integer, String, Text, DateTime
+
+
+class ReceiveOrderSyncState(Base):
+    """
+    주문 증분 수집 상태 테이블(receive_order_sync_state)의 ORM 매핑 모델
+    주문 상태별로 마지막으로 저장한 주문의 reg_date/idx(워터마크)를 저장
+    """
+
+    __tablename__ = "receive_order_sync_state"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, comment="상태 고유 ID")
+    order_status: Mapped[str] = mapped_column(String(10), unique=True, nullable=False, comment="사방넷 주문 상태 코드")
+    last_reg_date: Mapped[str | None] = mapped_column(String(14), comment="마지막으로 저장한 주문 수집일시 (YYYYMMDDHHMMSS)")
+    last_idx: Mapped[str | None] = mapped_column(Text, comment="마지막 수집일시의 주문 idx")
+    last_synced_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), comment="마지막 동기화 완료 시각")
+    last_synced_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, comment="마지막 동기화 저장 건수")
+    sync_started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), comment="수집 중 표시 시각 (수집이 끝나면 비움)")
@@ -0,0 +1,133 @@
+"""
+EcountOutbox Repository
+이카운트 판매/구매 전송 대기열 저장소
+"""
+
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import select, update, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models.ecount.ecount_outbox import EcountOutbox
+
+
+class EcountOutboxRepository:
+    """EcountOutbox 데이터 저장소"""
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def enqueue(self, rows: list[dict], chunk_size: int = 500) -> list[EcountOutbox]:
+        """
+        대기열에 전표 추가 (idempotency_key가 이미 있으면 건너뜀)
+        요청한 키의 현재 행(새로 넣은 행 + 기존 행)을 전부 반환
+        """
+        if not rows:
+            return []
+        try:
+            for i in range(0, len(rows), chunk_size):
+                stmt = pg_insert(EcountOutbox).values(rows[i:i + chunk_size]).on_conflict_do_nothing(
+                    index_elements=[EcountOutbox.idempotency_key]
+                )
+                await self.session.execute(stmt)
+            await self.session.commit()
+
+            keys = [row["idempotency_key"] for row in rows]
+            saved: list[EcountOutbox] = []
+            for i in range(0, len(keys), chunk_size):
+                query = select(EcountOutbox).where(
+                    EcountOutbox.idempotency_key.in_(keys[i:i + chunk_size])
+                ).execution_options(populate_existing=True)
+                result = await self.session.execute(query)
+                saved.extend(result.scalars().all())
+            return saved
+        except Exception as e:
+            await self.session.rollback()
+            raise e
+        finally:
+            await self.session.close()
+
+    async def claim_pending(
+        self,
+        limit: int,
+        after_id: int = 0,
+        ids: Optional[list[int]] = None,
+        lease_seconds: int = 300,
+    ) -> list[EcountOutbox]:
+        """
+        pending 행을 id 순으로 limit개 가져가서 sending으로 표시 (attempts + 1)
+        FOR UPDATE SKIP LOCKED라서 여러 워커가 동시에 돌아도 같은 행을 두 번 보내지 않음
+        lease_seconds보다 오래 sending에 머문 행(전송 중 프로세스 중단)은 unknown으로 돌림
+        """
+        try:
+            stale_before = datetime.now(timezone.utc) - timedelta(seconds=lease_seconds)
+            await self.session.execute(
+                update(EcountOutbox)
+                .where(EcountOutbox.status == "sending", EcountOutbox.locked_at < stale_before)
+                .values(status="unknown", locked_at=None, last_error="전송 중 중단됨 (처리 여부 확인 필요)")
+                .execution_options(synchronize_session=False)
+            )
+
+            candidates = (
+                select(EcountOutbox.id)
+                .where(EcountOutbox.status == "pending", EcountOutbox.id > after_id)
+                .order_by(EcountOutbox.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            if ids is not None:
+                candidates = candidates.where(EcountOutbox.id.in_(ids))
+            stmt = (
+                update(EcountOutbox)
+                .where(EcountOutbox.id.in_(candidates))
+                .values(status="sending", attempts=EcountOutbox.attempts + 1, locked_at=func.now())
+                .returning(EcountOutbox)
+                .execution_options(synchronize_session=False, populate_existing=True)
+            )
+            result = await self.session.execute(stmt)
+            claimed = sorted(result.scalars().all(), key=lambda row: row.id)
+            await self.session.commit()
+            return claimed
+        except Exception as e:
+            await self.session.rollback()
+            raise e
+        finally:
+            await self.session.close()
+
+    async def save_results(self, results: list[dict]) -> None:
+        """
+        전송 결과 일괄 저장 (id 기준 ORM bulk UPDATE, 커밋 1회)
+        results: [{"id", "status", "slip_no", "trace_id", "last_error"}, ...]
+        """
+        if not results:
+            return
+        try:
+            rows = [{**result, "locked_at": None} for result in results]
+            await self.session.execute(update(EcountOutbox), rows)
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            raise e
+        finally:
+            await self.session.close()
+
+    async def requeue(self, ids: list[int], statuses: tuple[str, ...] = ("unknown", "failed")) -> int:
+        """처리 여부를 확인한 unknown/failed 행을 다시 pending으로 (attempts 초기화)"""
+        if not ids:
+            return 0
+        try:
+            result = await self.session.execute(
+                update(EcountOutbox)
+                .where(EcountOutbox.id.in_(ids), EcountOutbox.status.in_(statuses))
+                .values(status="pending", attempts=0, last_error=None)
+                .execution_options(synchronize_session=False)
+            )
+            await self.session.commit()
+            return result.rowcount
+        except Exception as e:
+            await self.session.rollback()
+            raise e
+        finally:
+            await self.session.close()
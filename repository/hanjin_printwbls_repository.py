@@ -1,6 +1,8 @@
+from datetime import datetime
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, insert, update, bindparam, true, String
+from sqlalchemy.dialects.postgresql import ARRAY
 from models.hanjin.hanjin_printwbls import HanjinPrintwbls
 from models.down_form_orders.down_form_order import BaseDownFormOrder
 from schemas.hanjin.hanjin_printWbls_dto import AddressResult
@@ -9,6 +11,13 @@ from utils.logs.sabangnet_logger import get_logger
 logger = get_logger(__name__)
 
 
+# API 응답에서 hanjin_printwbls에 저장하는 필드 (prt_add, zip_cod는 요청값을 저장)
+API_RESPONSE_FIELDS = (
+    'msg_key', 'result_code', 'result_message', 's_tml_nam', 's_tml_cod', 'tml_nam', 'tml_cod',
+    'cen_nam', 'cen_cod', 'pd_tim', 'dom_rgn', 'hub_cod', 'dom_mid', 'es_cod', 'grp_rnk', 'es_nam', 'wbl_num',
+)
+
+
 class HanjinPrintwblsRepository:
     """한진택배 운송장 출력 Repository"""
     
@@ -375,4 +384,138 @@ class HanjinPrintwblsRepository:
             logger.error(f"API 응답 기반 hanjin_printwbls 레코드 생성 실패: {str(e)}")
             raise
         finally:
-            await self.session.close()
\ No newline at end of file
+            await self.session.close()
+
+    async def create_many_from_api_responses(
+        self,
+        records: List[dict],
+        batch_id: Optional[int] = None,
+        process_dt: Optional[datetime] = None
+    ) -> tuple[List[HanjinPrintwbls], int]:
+        """
+        API 응답 여러 건을 한 트랜잭션으로 저장합니다.
+        hanjin_printwbls는 multi-row INSERT, down_form_orders는 운송장번호가 있는 주문만 UPDATE 한 번으로 반영합니다.
+        합포장 주문번호(a/b/c)는 SQL에서 a, b, c와 원래 값(a/b/c)으로 펼쳐서 업데이트합니다.
+        
+        Args:
+            records: idx, prt_add, zip_cod, snd_zip와 API 응답 필드를 담은 딕셔너리 리스트
+            batch_id: 배치 ID (선택사항)
+            process_dt: 처리 날짜 (선택사항)
+            
+        Returns:
+            (생성된 HanjinPrintwbls 객체 리스트(records 순서), 업데이트된 down_form_orders 행 수)
+        """
+        if not records:
+            return [], 0
+        try:
+            rows = [
+                {
+                    'idx': record.get('idx'),
+                    'prt_add': record.get('prt_add'),
+                    'zip_cod': record.get('zip_cod'),
+                    'snd_zip': record.get('snd_zip'),
+                    **{field: record.get(field) for field in API_RESPONSE_FIELDS},
+                }
+                for record in records
+            ]
+            result = await self.session.execute(
+                insert(HanjinPrintwbls).returning(HanjinPrintwbls, sort_by_parameter_order=True),
+                rows
+            )
+            created_records = list(result.scalars().all())
+
+            invoice_rows = [row for row in rows if row['idx'] and row['wbl_num']]
+            updated_count = 0
+            if invoice_rows:
+                stmt = self._build_invoice_no_update(
+                    [row['idx'] for row in invoice_rows],
+                    [row['wbl_num'] for row in invoice_rows],
+                    batch_id,
+                    process_dt
+                )
+                updated_count = (await self.session.execute(stmt)).rowcount
+
+            await self.session.commit()
+            logger.info(f"API 응답 기반 hanjin_printwbls {len(created_records)}건 생성, down_form_orders {updated_count}건 운송장번호 업데이트")
+            return created_records, updated_count
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"API 응답 기반 hanjin_printwbls 일괄 저장 실패: {str(e)}")
+            raise
+        finally:
+            await self.session.close()
+
+    @staticmethod
+    def _build_invoice_no_update(
+        idxs: List[str],
+        invoice_nos: List[str],
+        batch_id: Optional[int] = None,
+        process_dt: Optional[datetime] = None
+    ):
+        """
+        (idx, invoice_no) 배열을 unnest 해서 down_form_orders를 한 번에 업데이트하는 UPDATE ... FROM 문
+        idx는 '/'로 나눈 값과 원래 값으로 펼치고, 같은 idx가 여러 번 나오면 마지막 invoice_no를 사용
+        """
+        pairs = func.unnest(
+            bindparam("idxs", idxs, type_=ARRAY(String)),
+            bindparam("invoice_nos", invoice_nos, type_=ARRAY(String)),
+        ).table_valued("idx", "invoice_no", with_ordinality="ord").render_derived(name="v")
+        expanded = func.unnest(
+            func.array_append(func.string_to_array(pairs.c.idx, "/"), pairs.c.idx)
+        ).table_valued("idx").render_derived(name="e").lateral()
+        targets = (
+            select(expanded.c.idx, pairs.c.invoice_no)
+            .select_from(pairs.join(expanded, true()))
+            .distinct(expanded.c.idx)
+            .order_by(expanded.c.idx, pairs.c.ord.desc())
+            .subquery("t")
+        )
+
+        update_values = {"invoice_no": targets.c.invoice_no}
+        if batch_id is not None:
+            update_values["batch_id"] = batch_id
+        if process_dt is not None:
+            update_values["process_dt"] = process_dt
+        return (
+            update(BaseDownFormOrder)
+            .where(BaseDownFormOrder.idx == targets.c.idx)
+            .values(**update_values)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def update_many_with_api_responses(self, responses: List[dict]) -> List[HanjinPrintwbls]:
+        """
+        API 응답 여러 건으로 hanjin_printwbls 레코드들을 한 번에 업데이트합니다. (id 기준 ORM bulk UPDATE, 커밋 1회)
+        
+        Args:
+            responses: id와 API 응답 필드를 담은 딕셔너리 리스트
+            
+        Returns:
+            업데이트된 HanjinPrintwbls 객체 리스트 (id 순)
+        """
+        if not responses:
+            return []
+        try:
+            rows = [
+                {'id': response['id'], **{field: response[field] for field in API_RESPONSE_FIELDS if field in response}}
+                for response in responses
+            ]
+            await self.session.execute(update(HanjinPrintwbls), rows)
+            await self.session.commit()
+
+            query = (
+                select(HanjinPrintwbls)
+                .where(HanjinPrintwbls.id.in_([row['id'] for row in rows]))
+                .order_by(HanjinPrintwbls.id)
+                .execution_options(populate_existing=True)
+            )
+            result = await self.session.execute(query)
+            updated_records = list(result.scalars().all())
+            logger.info(f"hanjin_printwbls {len(updated_records)}건 일괄 업데이트 성공")
+            return updated_records
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"hanjin_printwbls 일괄 업데이트 실패: {str(e)}")
+            raise
+        finally:
+            await self.session.close()
@@ -0,0 +1,87 @@
+from typing import Any
+from sqlalchemy import select, update, delete, func, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.macro_batch_processing.macro_result_cache import MacroResultCache
+
+
+class MacroResultCacheRepository:
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_by_cache_key(self, cache_key: str) -> MacroResultCache | None:
+        """cache_key로 캐시 항목 조회"""
+        query = select(MacroResultCache).where(MacroResultCache.cache_key == cache_key)
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def touch(self, cache_id: int) -> None:
+        """캐시 적중 시 적중 횟수와 마지막 사용 시각 갱신 (LRU 순서 유지)"""
+        try:
+            stmt = (
+                update(MacroResultCache)
+                .where(MacroResultCache.id == cache_id)
+                .values(
+                    hit_count=MacroResultCache.hit_count + 1,
+                    last_accessed_at=func.now()
+                )
+            )
+            await self.session.execute(stmt)
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            raise e
+
+    async def upsert(self, values: dict[str, Any]) -> MacroResultCache:
+        """캐시 항목 저장 (같은 cache_key가 있으면 객체 정보만 갱신)"""
+        try:
+            stmt = insert(MacroResultCache).values(**values)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=['cache_key'],
+                set_={
+                    "workbook_object_name": stmt.excluded.workbook_object_name,
+                    "rows_object_name": stmt.excluded.rows_object_name,
+                    "row_count": stmt.excluded.row_count,
+                    "size_bytes": stmt.excluded.size_bytes,
+                    "last_accessed_at": func.now(),
+                    "updated_at": func.now(),
+                }
+            ).returning(MacroResultCache)
+            result = await self.session.execute(stmt)
+            await self.session.commit()
+            return result.scalar_one()
+        except Exception as e:
+            await self.session.rollback()
+            raise e
+
+    async def get_eviction_candidates(self, max_bytes: int, max_entries: int) -> list[MacroResultCache]:
+        """
+        최근 사용 순으로 누적 크기/개수를 계산해서 한도를 넘는 항목(가장 오래 안 쓴 것들) 반환
+        """
+        lru_order = (MacroResultCache.last_accessed_at.desc(), MacroResultCache.id.desc())
+        ranked = select(
+            MacroResultCache.id.label("id"),
+            func.sum(MacroResultCache.size_bytes).over(order_by=lru_order).label("cumulative_size"),
+            func.row_number().over(order_by=lru_order).label("rank"),
+        ).subquery()
+        query = (
+            select(MacroResultCache)
+            .join(ranked, ranked.c.id == MacroResultCache.id)
+            .where(or_(ranked.c.cumulative_size > max_bytes, ranked.c.rank > max_entries))
+        )
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def delete_by_ids(self, ids: list[int]) -> int:
+        """캐시 항목 일괄 삭제"""
+        if not ids:
+            return 0
+        try:
+            result = await self.session.execute(
+                delete(MacroResultCache).where(MacroResultCache.id.in_(ids))
+            )
+            await self.session.commit()
+            return result.rowcount
+        except Exception as e:
+            await self.session.rollback()
+            raise e
@@ -30,4 +30,33 @@ class MallPriceRepository:
                 continue
             setattr(mall_price, field, getattr(new_obj, field))
         await self.session.commit()
-        return mall_price
\ No newline at end of file
+        return mall_price
+
+    async def save_mall_prices(self, new_objs: list[MallPrice]) -> list[MallPrice]:
+        """
+        여러 상품의 쇼핑몰 가격을 한 번에 저장 (product_raw_data_id 기준으로 있으면 갱신, 없으면 추가)
+        조회 1회 + 커밋 1회
+        """
+        if not new_objs:
+            return []
+        product_raw_data_ids = [new_obj.test_product_raw_data_id for new_obj in new_objs]
+        result = await self.session.execute(
+            select(MallPrice).where(MallPrice.test_product_raw_data_id.in_(product_raw_data_ids))
+        )
+        existing = {mall_price.test_product_raw_data_id: mall_price for mall_price in result.scalars().all()}
+        fields = [field for field in MallPrice.__table__.columns.keys() if field not in ("id", "created_at", "updated_at")]
+
+        saved = []
+        for new_obj in new_objs:
+            mall_price = existing.get(new_obj.test_product_raw_data_id)
+            if mall_price is None:
+                self.session.add(new_obj)
+                existing[new_obj.test_product_raw_data_id] = new_obj
+                saved.append(new_obj)
+                continue
+            for field in fields:
+                setattr(mall_price, field, getattr(new_obj, field))
+            saved.append(mall_price)
+        await self.session.flush()
+        await self.session.commit()
+        return saved
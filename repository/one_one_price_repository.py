@@ -1,5 +1,6 @@
 from datetime import datetime
-from sqlalchemy import select, insert
+from sqlalchemy import select, insert, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from models.one_one_price.one_one_price import OneOnePrice
 from schemas.one_one_price.one_one_price_dto import OneOnePriceDto
@@ -23,6 +24,38 @@ class OneOnePriceRepository:
         finally:
             await self.session.close()
 
+    async def upsert_one_one_price_data_bulk(self, rows: list[dict], chunk_size: int = 500) -> list[OneOnePrice]:
+        """
+        쇼핑몰별 1+1 가격 데이터 일괄 생성/수정
+        test_product_raw_data_id 기준 INSERT ... ON CONFLICT DO UPDATE (청크당 쿼리 1회, 커밋 1회)
+        rows 안에 test_product_raw_data_id가 중복되면 안 됨
+        """
+        if not rows:
+            return []
+        try:
+            saved: list[OneOnePrice] = []
+            for i in range(0, len(rows), chunk_size):
+                stmt = pg_insert(OneOnePrice).values(rows[i:i + chunk_size])
+                update_columns = {
+                    column.name: stmt.excluded[column.name]
+                    for column in OneOnePrice.__table__.columns
+                    if column.name not in ("id", "test_product_raw_data_id", "created_at", "updated_at")
+                }
+                update_columns["updated_at"] = func.now()
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[OneOnePrice.test_product_raw_data_id],
+                    set_=update_columns,
+                ).returning(OneOnePrice).execution_options(populate_existing=True)
+                result = await self.session.execute(stmt)
+                saved.extend(result.scalars().all())
+            await self.session.commit()
+            return saved
+        except Exception as e:
+            await self.session.rollback()
+            raise e
+        finally:
+            await self.session.close()
+
     async def find_all_one_one_price_data(self) -> list[OneOnePrice]:
         """쇼핑몰별 1+1 가격 데이터 전체 조회"""
         try:
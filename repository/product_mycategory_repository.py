@@ -37,4 +37,23 @@ class ProductMyCategoryRepository:
         result = await self.session.execute(query)
         row = result.first()
         return row[0] if row else None
-        
\ No newline at end of file
+        
+    async def get_class_cd_maps(self) -> dict[int, dict[str, str]]:
+        """
+        1~4레벨 분류명 -> 분류코드 매핑을 한 번에 조회 (행마다 get_class_cd_from_nm 을 호출하지 않도록)
+        같은 분류명이 여러 행에 있으면 처음 조회된 코드를 사용
+        :return: {level: {분류명: 분류코드}}
+        """
+        levels = [1, 2, 3, 4]
+        columns = []
+        for level in levels:
+            columns.append(getattr(ProductMycategoryData, f'class_nm{level}'))
+            columns.append(getattr(ProductMycategoryData, f'class_cd{level}'))
+        result = await self.session.execute(select(*columns))
+        class_cd_maps: dict[int, dict[str, str]] = {level: {} for level in levels}
+        for row in result.all():
+            for i, level in enumerate(levels):
+                class_nm = row[i * 2]
+                if class_nm is not None:
+                    class_cd_maps[level].setdefault(class_nm, row[i * 2 + 1])
+        return class_cd_maps
@@ -2,8 +2,9 @@ from typing import Optional, List
 from sqlalchemy.inspection import inspect
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, insert, update, func
-from models.product.product_raw_data import ProductRawData
+from sqlalchemy import select, insert, update, func, tuple_, literal_column, bindparam, String, Integer
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
+from models.product.product_raw_data import ProductRawData, UNBRACKETED_COMPAYNY_GOODS_CD
 from models.product.modified_product_data import ModifiedProductData
 from utils.logs.sabangnet_logger import get_logger
 from datetime import datetime
@@ -23,6 +24,24 @@ class ProductRepository:
         result = await self.session.execute(query)
         return result.scalar_one_or_none()
 
+    async def find_price_rows_by_product_nm_and_gubun_pairs(self, pairs: list[tuple[str, str]]) -> list[dict]:
+        """
+        (상품명, 구분) 목록으로 가격 계산에 필요한 컬럼만 한 번에 조회 (IN 쿼리 1회)
+        Returns:
+            id, product_nm, gubun, compayny_goods_cd, goods_price 키를 가진 dict 리스트
+        """
+        if not pairs:
+            return []
+        query = select(
+            ProductRawData.id,
+            ProductRawData.product_nm,
+            ProductRawData.gubun,
+            ProductRawData.compayny_goods_cd,
+            ProductRawData.goods_price,
+        ).where(tuple_(ProductRawData.product_nm, ProductRawData.gubun).in_(pairs))
+        result = await self.session.execute(query)
+        return [dict(row) for row in result.mappings().all()]
+
     async def get_products_all(self, skip: int, limit: int) -> list[ProductRawData]:
         query = (
             select(ProductRawData)
@@ -277,6 +296,47 @@ class ProductRepository:
             finally:
                 await self.session.close()
 
+    async def bulk_upsert_product_raw_data(self, rows: list[dict], chunk_size: int = 200) -> dict[str, str]:
+        """
+        compayny_goods_cd 기준 일괄 upsert (INSERT ... ON CONFLICT DO UPDATE, 청크당 쿼리 1회, 커밋 1회)
+        같은 compayny_goods_cd가 여러 번 있으면 upsert_product_raw_data를 순서대로 호출한 것처럼 마지막 값으로 저장
+        Args:
+            rows: 상품 데이터 딕셔너리 리스트 (모든 행의 키가 같아야 함)
+            chunk_size: INSERT 한 번에 넣는 행 수
+        Returns:
+            {compayny_goods_cd: 'created' | 'updated'}
+        """
+        if not rows:
+            return {}
+        # 한 INSERT 안에서 같은 키를 두 번 갱신할 수 없으므로 중복 제거
+        rows = list({row['compayny_goods_cd']: row for row in rows}.values())
+        try:
+            actions: dict[str, str] = {}
+            for i in range(0, len(rows), chunk_size):
+                chunk = rows[i:i + chunk_size]
+                stmt = pg_insert(ProductRawData).values(chunk)
+                update_columns = {key: stmt.excluded[key] for key in chunk[0] if key != 'compayny_goods_cd'}
+                update_columns['updated_at'] = func.now()
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[ProductRawData.compayny_goods_cd],
+                    set_=update_columns,
+                ).returning(
+                    ProductRawData.compayny_goods_cd,
+                    # xmax가 0이면 새로 INSERT된 행
+                    literal_column("xmax = 0").label("inserted"),
+                )
+                result = await self.session.execute(stmt)
+                for company_goods_cd, inserted in result.all():
+                    actions[company_goods_cd] = 'created' if inserted else 'updated'
+            await self.session.commit()
+            return actions
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"[Bulk Upsert Error] {e}")
+            raise
+        finally:
+            await self.session.close()
+
     async def find_product_id_raw_data_by_product_nm_and_gubun(self, product_nm: str, gubun: str) -> Optional[int]:
         """상품명과 구분으로 test_product_raw_data의 ID 조회"""
         # SELECT id FROM test_product_raw_data WHERE product_nm = ? AND gubun = ?
@@ -425,52 +485,48 @@ class ProductRepository:
     async def update_product_ids_by_compayny_goods_cd_with_bracket_removal_batch(self, compayny_goods_cd_and_product_ids: list[tuple[str, int]]) -> dict:
         """
         여러 개의 compayny_goods_cd와 product_id 쌍을 배치로 처리하여 업데이트
+        UPDATE ... FROM unnest(코드 배열, product_id 배열) 한 번으로 대괄호를 뺀 코드가 같은 행에 product_id를 저장
+        (대괄호를 뺀 코드의 함수 인덱스를 사용하므로 전체 상품을 읽지 않음)
         
         Args:
             compayny_goods_cd_and_product_ids: (response_compayny_goods_cd, product_id) 튜플 리스트
             
         Returns:
-            dict: 성공/실패 통계
+            dict: 성공/실패 통계 (failed_items에는 매칭되지 않은 항목만)
         """
-        # DB에서 모든 ProductRawData를 한 번만 조회
-        query = select(ProductRawData)
-        result = await self.session.execute(query)
-        all_products = result.scalars().all()
-        
-        # DB 데이터를 딕셔너리로 변환 (성능 최적화)
-        db_products_dict = {}
-        for product in all_products:
-            db_compayny_goods_cd_cleaned = product.compayny_goods_cd.replace('[', '').replace(']', '')
-            db_products_dict[db_compayny_goods_cd_cleaned] = product.id
-        
-        success_count = 0
-        failed_count = 0
-        failed_items = []
-        
-        # 각 response compayny_goods_cd에 대해 매칭 시도
-        for response_compayny_goods_cd, product_id in compayny_goods_cd_and_product_ids:
-            if response_compayny_goods_cd in db_products_dict:
-                # 매칭되는 경우 product_id 업데이트
-                update_query = (
-                    update(ProductRawData)
-                    .where(ProductRawData.id == db_products_dict[response_compayny_goods_cd])
-                    .values(product_id=product_id)
-                )
-                await self.session.execute(update_query)
-                success_count += 1
-            else:
-                failed_count += 1
-                failed_items.append({
-                    'response_compayny_goods_cd': response_compayny_goods_cd,
-                    'product_id': product_id
-                })
-        
-        # 모든 업데이트를 한 번에 커밋
-        await self.session.commit()
-        
+        if not compayny_goods_cd_and_product_ids:
+            return {'success_count': 0, 'failed_count': 0, 'failed_items': []}
+
+        # 같은 코드가 여러 번 오면 마지막 product_id 사용
+        product_id_by_code = dict(compayny_goods_cd_and_product_ids)
+        values = func.unnest(
+            bindparam("codes", list(product_id_by_code.keys()), type_=ARRAY(String)),
+            bindparam("product_ids", list(product_id_by_code.values()), type_=ARRAY(Integer)),
+        ).table_valued("code", "product_id").render_derived(name="v")
+        query = (
+            update(ProductRawData)
+            .where(literal_column(UNBRACKETED_COMPAYNY_GOODS_CD) == values.c.code)
+            .values(product_id=values.c.product_id)
+            .returning(values.c.code)
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            result = await self.session.execute(query)
+            matched_codes = set(result.scalars().all())
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"[Update Error] {e}")
+            raise
+
+        failed_items = [
+            {'response_compayny_goods_cd': response_compayny_goods_cd, 'product_id': product_id}
+            for response_compayny_goods_cd, product_id in compayny_goods_cd_and_product_ids
+            if response_compayny_goods_cd not in matched_codes
+        ]
         return {
-            'success_count': success_count,
-            'failed_count': failed_count,
+            'success_count': len(compayny_goods_cd_and_product_ids) - len(failed_items),
+            'failed_count': len(failed_items),
             'failed_items': failed_items
         }
         
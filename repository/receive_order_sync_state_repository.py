@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select, update, func, or_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from models.receive_orders.receive_order_sync_state import ReceiveOrderSyncState
+
+
+class ReceiveOrderSyncStateRepository:
+    """
+    주문 증분 수집 워터마크 저장소
+    커밋은 주문 저장과 한 트랜잭션으로 묶기 위해 호출자(ReceiveOrderSyncService)가 담당
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def claim_state(self, order_status: str, lease_seconds: int) -> ReceiveOrderSyncState | None:
+        """
+        주문 상태별 워터마크 행에 수집 중 표시(sync_started_at)를 하고 반환 (없으면 생성)
+        UPDATE 한 문장으로 표시하므로 행 잠금은 이 문장 동안만 잡힘 (외부 수집 전에 바로 커밋)
+        다른 워커가 수집 중이면(표시가 lease_seconds 이내) 기다리지 않고 None 반환
+        """
+        await self.session.execute(
+            insert(ReceiveOrderSyncState)
+            .values(order_status=order_status, last_synced_count=0)
+            .on_conflict_do_nothing(index_elements=['order_status'])
+        )
+        stale_before = datetime.now(timezone.utc) - timedelta(seconds=lease_seconds)
+        stmt = (
+            update(ReceiveOrderSyncState)
+            .where(
+                ReceiveOrderSyncState.order_status == order_status,
+                or_(ReceiveOrderSyncState.sync_started_at.is_(None), ReceiveOrderSyncState.sync_started_at < stale_before),
+            )
+            .values(sync_started_at=func.now())
+            .returning(ReceiveOrderSyncState)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def lock_state(self, order_status: str) -> ReceiveOrderSyncState | None:
+        """워터마크 갱신 직전에 행을 잠그고 다시 읽음 (잠금은 호출자의 커밋까지)"""
+        query = (
+            select(ReceiveOrderSyncState)
+            .where(ReceiveOrderSyncState.order_status == order_status)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        )
+        result = await self.session.execute(query)
+        return result.scalar_one_or_none()
+
+    async def release_claim(self, order_status: str, claimed_at: datetime) -> None:
+        """수집 중 표시 해제 (lease가 지나 다른 워커가 다시 표시한 경우는 건드리지 않음)"""
+        await self.session.execute(
+            update(ReceiveOrderSyncState)
+            .where(
+                ReceiveOrderSyncState.order_status == order_status,
+                ReceiveOrderSyncState.sync_started_at == claimed_at,
+            )
+            .values(sync_started_at=None)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def advance(
+            self,
+            state: ReceiveOrderSyncState,
+            last_reg_date: str | None,
+            last_idx: str | None,
+            synced_count: int,
+            synced_at: datetime
+    ) -> ReceiveOrderSyncState:
+        """워터마크 갱신 (더 최근 값일 때만 앞으로 이동)"""
+        if last_reg_date and (not state.last_reg_date or (last_reg_date, last_idx or '') > (state.last_reg_date, state.last_idx or '')):
+            state.last_reg_date = last_reg_date
+            state.last_idx = last_idx
+        state.last_synced_at = synced_at
+        state.last_synced_count = synced_count
+        await self.session.flush()
+        return state
@@ -159,11 +159,12 @@ class ReceiveOrdersRepository:
         finally:
             await self.session.close()
 
-    async def bulk_insert_orders(self, orders: list[dict]) -> list[ReceiveOrders]:
+    async def bulk_insert_orders(self, orders: list[dict], commit: bool = True) -> list[ReceiveOrders]:
         """
         주문 데이터 배치 삽입 (중복 시 무시)
         Args:
             orders: 주문 데이터 dict 리스트
+            commit: False면 커밋/세션 종료를 호출자에게 맡김 (다른 변경과 한 트랜잭션으로 묶을 때)
         Returns:
             저장된 ReceiveOrders 모델 리스트
         """
@@ -222,7 +223,8 @@ class ReceiveOrdersRepository:
                     logger.info(
                         f"배치 {batch_num} 완료: {batch_success}개 성공, {batch_duplicated}개 중복값 무시")
 
-            await self.session.commit()
+            if commit:
+                await self.session.commit()
 
             # 전체 결과 요약
             total_success = len(all_success_models)
@@ -233,11 +235,13 @@ class ReceiveOrdersRepository:
             return all_success_models
 
         except Exception as e:
-            await self.session.rollback()
+            if commit:
+                await self.session.rollback()
             logger.error(f"배치 삽입 실패: {e}")
             raise e
         finally:
-            await self.session.close()
+            if commit:
+                await self.session.close()
 
     def _parse_date_to_string(self, val):
         """날짜를 reg_date 필드에 맞는 문자열 형식으로 변환 (YYYYMMDD 형식)"""
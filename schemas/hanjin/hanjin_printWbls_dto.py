@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 
@@ -47,6 +47,14 @@ class PrintWblsResponse(BaseModel):
     error_cnt: Optional[int] = Field(None, description="오류 건수")
     address_list: Optional[List[AddressResult]] = Field(None, description="주소 목록")
 
+class PrintWblsChunkedResponse(BaseModel):
+    """청크 단위 운송장 출력 결과 (msg_key 기준 매칭)"""
+    total_cnt: int = Field(0, description="응답받은 전체 건수")
+    error_cnt: int = Field(0, description="응답받은 오류 건수")
+    results: Dict[str, AddressResult] = Field(default_factory=dict, description="msg_key별 응답")
+    errors: Dict[str, str] = Field(default_factory=dict, description="응답을 받지 못한 msg_key별 오류 메시지")
+    failed_items: List[AddressItem] = Field(default_factory=list, description="응답을 받지 못한 요청 항목 (그대로 다시 요청 가능)")
+
 
 # ============= down_form_orders에서 hanjin_printwbls 생성 응답 스키마 =============
 
@@ -0,0 +1,5 @@
+from pydantic import BaseModel, Field
+
+
+class BulkMallPriceForm(BaseModel):
+    compayny_goods_cds: list[str] = Field(..., min_length=1, description="상품코드 목록")
@@ -0,0 +1,21 @@
+from pydantic import BaseModel, Field
+from typing import List, Dict, Optional
+
+
+class BulkSettingPriceItem(BaseModel):
+    compayny_goods_cd: str = Field(..., description="상품코드")
+    success: bool = Field(..., description="모든 쇼핑몰 가격 수정 성공 여부")
+    message: str = Field(..., description="처리 결과 메시지")
+    xml_file_path: Optional[str] = Field(None, description="상품이 포함된 요청 XML URL")
+    success_items: List[Dict[str, str]] = Field(default_factory=list)
+    failed_items: List[Dict[str, str]] = Field(default_factory=list)
+
+
+class BulkSettingPriceResponse(BaseModel):
+    success: bool
+    message: str
+    total_count: int
+    success_count: int
+    failed_count: int
+    xml_file_paths: List[str]
+    items: List[BulkSettingPriceItem]
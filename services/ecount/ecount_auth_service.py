@@ -1,7 +1,10 @@
 """
 이카운트 인증 서비스
 """
-from typing import Optional, Tuple
+import time
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, Tuple
 
 from core.settings import SETTINGS
 from schemas.ecount.auth_schemas import (
@@ -281,11 +284,41 @@ class EcountAuthService:
         return session_id is not None and len(session_id) > 0
 
 
+# 세션 만료/무효 응답으로 볼 오류 메시지 키워드
+_SESSION_ERROR_KEYWORDS = ("session", "login", "세션", "로그인")
+
+
+def is_session_error(response_data: Any) -> bool:
+    """이카운트 API 응답(또는 aiohttp_post의 error 값)이 세션 만료/무효 오류인지 확인"""
+    if not isinstance(response_data, dict):
+        return False
+    error = response_data.get("Error") or response_data.get("Errors")
+    if not error:
+        return False
+    if isinstance(error, dict):
+        error = " ".join(str(value) for value in error.values() if value)
+    message = str(error).lower()
+    return any(keyword in message for keyword in _SESSION_ERROR_KEYWORDS)
+
+
+@dataclass
+class _CachedAuth:
+    """캐시된 인증 정보와 로컬 만료 시각 (time.monotonic 기준)"""
+    auth_info: EcountAuthInfo
+    expires_at: float
+
+
 class EcountAuthManager:
-    """이카운트 인증 관리자 (싱글톤 패턴)"""
+    """
+    이카운트 인증 관리자 (싱글톤 패턴)
+    로그인한 세션은 ECOUNT_SESSION_TTL 동안 검증 요청 없이 재사용하고,
+    만료되었거나 API 호출이 세션 오류로 실패했을 때(invalidate_session)만 다시 로그인합니다.
+    같은 키로 동시에 들어온 요청은 진행 중인 로그인 하나를 같이 기다립니다.
+    """
 
     _instance = None
-    _auth_cache = {}
+    _auth_cache: dict[str, _CachedAuth] = {}
+    _inflight_logins: dict[str, asyncio.Future] = {}
     auth_service = EcountAuthService()
 
     def __new__(cls):
@@ -293,7 +326,45 @@ class EcountAuthManager:
             cls._instance = super().__new__(cls)
             cls._instance.auth_service = EcountAuthService()
         return cls._instance
-    
+
+    async def _get_or_login(
+        self,
+        cache_key: str,
+        login: Callable[[], Awaitable[Optional[EcountAuthInfo]]]
+    ) -> Optional[EcountAuthInfo]:
+        """캐시가 유효하면 바로 반환, 아니면 로그인 (키별 진행 중인 로그인은 하나만)"""
+        cached = self._auth_cache.get(cache_key)
+        if cached is not None:
+            if cached.expires_at > time.monotonic():
+                return cached.auth_info
+            del self._auth_cache[cache_key]
+
+        future = self._inflight_logins.get(cache_key)
+        if future is None or future.get_loop() is not asyncio.get_running_loop():
+            future = asyncio.ensure_future(self._login_and_cache(cache_key, login))
+            self._inflight_logins[cache_key] = future
+            future.add_done_callback(lambda done: self._forget_inflight_login(cache_key, done))
+        # 기다리던 요청 하나가 취소되어도 다른 요청이 기다리는 로그인은 계속 진행
+        return await asyncio.shield(future)
+
+    def _forget_inflight_login(self, cache_key: str, future: asyncio.Future) -> None:
+        if self._inflight_logins.get(cache_key) is future:
+            del self._inflight_logins[cache_key]
+
+    async def _login_and_cache(
+        self,
+        cache_key: str,
+        login: Callable[[], Awaitable[Optional[EcountAuthInfo]]]
+    ) -> Optional[EcountAuthInfo]:
+        auth_info = await login()
+        if auth_info and auth_info.session_id:
+            self._auth_cache[cache_key] = _CachedAuth(
+                auth_info=auth_info,
+                expires_at=time.monotonic() + SETTINGS.ECOUNT_SESSION_TTL,
+            )
+            return auth_info
+        return None
+
     async def get_authenticated_info(
         self,
         com_code: str,
@@ -312,25 +383,11 @@ class EcountAuthManager:
         Returns:
             Optional[EcountAuthInfo]: 인증 정보
         """
-        cache_key = f"{com_code}_{user_id}_{is_test}"
-        
-        # 캐시 확인
-        if cache_key in self._auth_cache:
-            auth_info = self._auth_cache[cache_key]
-            # 세션 유효성 검증
-            if await self.auth_service.validate_session(auth_info.session_id, auth_info, is_test):
-                return auth_info
-            else:
-                # 세션이 만료된 경우 캐시에서 제거
-                del self._auth_cache[cache_key]
-        
-        # 새로 인증
-        session_id, auth_info = await self.auth_service.authenticate(com_code, user_id, api_cert_key, is_test)
-        if auth_info:
-            self._auth_cache[cache_key] = auth_info
+        async def _login() -> Optional[EcountAuthInfo]:
+            _, auth_info = await self.auth_service.authenticate(com_code, user_id, api_cert_key, is_test)
             return auth_info
-        
-        return None
+
+        return await self._get_or_login(f"{com_code}_{user_id}_{is_test}", _login)
     
     async def get_authenticated_info_from_env(
         self, is_test: bool = True
@@ -343,25 +400,11 @@ class EcountAuthManager:
         Returns:
             Optional[EcountAuthInfo]: 인증 정보
         """
-        cache_key = f"env_auth_{is_test}"
-        
-        # 캐시 확인
-        if cache_key in self._auth_cache:
-            auth_info = self._auth_cache[cache_key]
-            # 세션 유효성 검증
-            if await self.auth_service.validate_session(auth_info.session_id, auth_info, is_test):
-                return auth_info
-            else:
-                # 세션이 만료된 경우 캐시에서 제거
-                del self._auth_cache[cache_key]
-        
-        # 환경변수로 새로 인증
-        auth_info = await self.auth_service.authenticate_with_env(is_test)
-        if auth_info:
-            self._auth_cache[cache_key] = auth_info
+        async def _login() -> Optional[EcountAuthInfo]:
+            _, auth_info = await self.auth_service.authenticate_with_env(is_test)
             return auth_info
-        
-        return None
+
+        return await self._get_or_login(f"env_auth_{is_test}", _login)
     
     async def get_authenticated_info_from_env_with_template_code(
         self,
@@ -377,25 +420,20 @@ class EcountAuthManager:
         Returns:
             Optional[EcountAuthInfo]: 인증 정보
         """
-        cache_key = f"env_auth_{template_code}_{is_test}"
-        
-        # 캐시 확인
-        if cache_key in self._auth_cache:
-            auth_info = self._auth_cache[cache_key]
-            # 세션 유효성 검증
-            if await self.auth_service.validate_session(auth_info.session_id, auth_info, is_test):
-                return auth_info
-            else:
-                # 세션이 만료된 경우 캐시에서 제거
-                del self._auth_cache[cache_key]
-        
-        # 환경변수로 새로 인증
-        session_id, auth_info = await self.auth_service.authenticate_with_env_with_template_code(is_test, template_code)
-        if auth_info:
-            self._auth_cache[cache_key] = auth_info
+        async def _login() -> Optional[EcountAuthInfo]:
+            _, auth_info = await self.auth_service.authenticate_with_env_with_template_code(is_test, template_code)
             return auth_info
-        
-        return None
+
+        return await self._get_or_login(f"env_auth_{template_code}_{is_test}", _login)
+
+    def invalidate_session(self, session_id: Optional[str]) -> None:
+        """API 호출이 세션 오류로 실패했을 때 해당 세션을 캐시에서 제거 (다음 요청에서 다시 로그인)"""
+        if not session_id:
+            return
+        for cache_key, cached in list(self._auth_cache.items()):
+            if cached.auth_info.session_id == session_id:
+                del self._auth_cache[cache_key]
+                logger.info(f"이카운트 세션 무효화: {cache_key}")
     
     def clear_cache(
         self,
@@ -36,7 +36,6 @@ class EcountBatchIntegrationService:
         
         # 설정
         self.batch_size = 50  # 한 번에 처리할 배치 크기
-        self.max_concurrent = 10  # 최대 동시 처리 수
         self.retry_count = 3  # 재시도 횟수
     
     async def process_orders_by_condition(
@@ -183,21 +182,12 @@ class EcountBatchIntegrationService:
             for i in range(0, len(orders), self.batch_size):
                 batch_orders = orders[i:i + self.batch_size]
                 
-                # 동시 처리를 위한 태스크 생성
-                tasks = []
-                for order in batch_orders:
-                    task = self._process_single_order(order, auth_info, is_test, com_code, user_id)
-                    tasks.append(task)
-                
-                # 동시 실행 (제한된 수)
-                semaphore = asyncio.Semaphore(self.max_concurrent)
-                
-                async def process_with_semaphore(task):
-                    async with semaphore:
-                        return await task
-                
+                # 동시 실행 (이카운트 호출 동시 수는 EcountSaleService의 공용 AIMD 제한기가 조절)
                 results = await asyncio.gather(
-                    *[process_with_semaphore(task) for task in tasks],
+                    *[
+                        self._process_single_order(order, auth_info, is_test, com_code, user_id)
+                        for order in batch_orders
+                    ],
                     return_exceptions=True
                 )
                 
@@ -218,9 +208,6 @@ class EcountBatchIntegrationService:
                         fail += 1
                         error_msg = f"주문 {order.idx} 처리 실패: {result.get('error', '알 수 없는 오류')}"
                         errors.append(error_msg)
-                
-                # 짧은 대기 (API 제한 고려)
-                await asyncio.sleep(0.1)
             
             # 성공한 주문들의 상태 업데이트
             if successful_order_ids:
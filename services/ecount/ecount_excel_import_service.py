@@ -16,6 +16,7 @@ from repository.ecount_erp_partner_code_repository import EcountErpPartnerCodeRe
 from repository.ecount_iyes_cost_repository import EcountIyesCostRepository
 from utils.logs.sabangnet_logger import get_logger
 from utils.decorators import api_exception_handler
+from core.offload import run_io
 from minio_handler import upload_and_get_url_and_size, url_arrange
 from schemas.ecount.ecount_excel_import_dto import (
     EcountErpPartnerCodeImportResponseDto,
@@ -280,7 +281,8 @@ class EcountExcelImportService:
             df.to_excel(file_path, index=False, engine='openpyxl')
             
             # MinIO에 업로드
-            download_url, minio_object_name, file_size = upload_and_get_url_and_size(
+            download_url, minio_object_name, file_size = await run_io(
+                upload_and_get_url_and_size,
                 file_path, 
                 template_code="erp", 
                 file_name=file_name
@@ -337,7 +339,8 @@ class EcountExcelImportService:
             df.to_excel(file_path, index=False, engine='openpyxl')
             
             # MinIO에 업로드
-            download_url, minio_object_name, file_size = upload_and_get_url_and_size(
+            download_url, minio_object_name, file_size = await run_io(
+                upload_and_get_url_and_size,
                 file_path, 
                 template_code="erp", 
                 file_name=file_name
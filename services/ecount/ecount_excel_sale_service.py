@@ -12,12 +12,14 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 import pandas as pd
 from fastapi import HTTPException
 
+from core.offload import run_io
 from minio_handler import upload_and_get_url_with_count_rev, url_arrange
 from models.count_executing_data.count_executing_data import CountExecuting
 from repository.count_executing_repository import CountExecutingRepository
 from schemas.ecount.auth_schemas import EcountAuthInfo
 from schemas.ecount.ecount_schemas import EcountApiResponse, EcountSaleDto, EcountPurchaseDto
 from services.ecount.ecount_sale_service import EcountSaleService
+from services.ecount.ecount_outbox_service import EcountOutboxService
 from utils.decorators import api_exception_handler
 from utils.logs.sabangnet_logger import get_logger
 from utils.mappings.ecount_excel_mapping import EcountExcelMapper
@@ -73,7 +75,8 @@ class EcountExcelSaleService:
             count_rev = await count_repo.get_and_increment(CountExecuting, "ecount_excel_upload_to_api")
             try:
                 # MinIO에 업로드
-                file_url, minio_object_name, file_size = upload_and_get_url_with_count_rev(
+                file_url, minio_object_name, file_size = await run_io(
+                    upload_and_get_url_with_count_rev,
                     tmp_file_path,
                     template_code,
                     file_name,
@@ -200,10 +203,13 @@ class EcountExcelSaleService:
         batch_id: str,
         user_id: str,
         work_status: str,
-        template_code: str
+        template_code: str,
+        session
     ) -> Tuple[Optional[EcountApiResponse], List[str], Dict[str, Any]]:
         """
         판매/구매 배치를 처리합니다.
+        검증된 데이터는 전표 단위로 ecount_outbox에 쌓은 뒤 전송하므로, 같은 파일을 다시 올려도
+        이미 성공한 전표는 다시 보내지 않고 처리되지 않은 전표만 보냅니다.
         
         Args:
             ecount_dtos: 판매/구매 DTO 리스트
@@ -212,6 +218,7 @@ class EcountExcelSaleService:
             user_id: 사용자 ID
             work_status: 작업 상태
             template_code: 템플릿 코드
+            session: DB 세션 (outbox 저장용)
         Returns:
             Tuple[Optional[EcountApiResponse], List[str], Dict[str, Any]]: 
                 (API 응답, 오류 목록, 배치 정보)
@@ -222,20 +229,24 @@ class EcountExcelSaleService:
                 dto.batch_id = batch_id
                 dto.is_test = auth_info.is_test if hasattr(auth_info, 'is_test') else True
 
-            api_response, errors = await self.sale_service.create_sales_with_validation_and_template_code(
-                ecount_dtos=ecount_dtos,  
-                auth_info=auth_info,
-                template_code=template_code
-            )
+            valid_dtos, errors = self.sale_service.validate_ecount_dtos(ecount_dtos, template_code)
+
+            api_response = None
+            counts = {"success_count": 0, "fail_count": 0, "skipped_count": 0}
+            if valid_dtos:
+                api_response, submit_errors, counts = await EcountOutboxService(session).submit(
+                    valid_dtos, auth_info, template_code, batch_id, is_test=True
+                )
+                errors = errors + submit_errors
 
-            
             # 배치 정보 구성
             batch_info = {
                 "batch_id": batch_id,
                 "user_id": user_id,
                 "total_processed": len(ecount_dtos),
-                "success_count": api_response.Data.SuccessCnt if api_response and api_response.Data else 0,
-                "fail_count": api_response.Data.FailCnt if api_response and api_response.Data else 0,
+                "success_count": counts["success_count"],
+                "fail_count": counts["fail_count"],
+                "skipped_count": counts["skipped_count"],
                 "validation_errors": len(errors),
                 "processed_at": datetime.now().isoformat(),
                 "work_status": work_status
@@ -313,7 +324,7 @@ class EcountExcelSaleService:
         
         # 6. 배치 처리
         api_response, errors, batch_info = await self.process_sale_batch(
-            ecount_dtos, auth_info, batch_id, user_id, work_status, template_code
+            ecount_dtos, auth_info, batch_id, user_id, work_status, template_code, session
         )
         
         # 7. 성공한 데이터만 필터링
@@ -0,0 +1,304 @@
+"""
+이카운트 판매/구매 전송 outbox 서비스
+
+전표를 바로 API로 보내지 않고 ecount_outbox 테이블에 먼저 쌓은 뒤(enqueue) 워커가 묶어서 보냅니다(drain).
+    - 전표 내용으로 만든 idempotency_key가 같으면 다시 쌓이지 않으므로, 같은 파일을 다시 올려도
+      이미 성공한 전표는 다시 보내지 않음
+    - 전송 중 프로세스가 죽거나 타임아웃이 나도 어떤 전표가 처리됐는지 행 단위로 남음
+    - 재시도는 pending 상태(이카운트가 처리하지 않은 것이 확실한 전표)만 다시 보냄
+      5xx/타임아웃은 전표가 이미 저장됐을 수 있어서 unknown으로 두고 확인 후 requeue
+"""
+import json
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.settings import SETTINGS
+from models.ecount.ecount_outbox import EcountOutbox
+from repository.ecount_outbox_repository import EcountOutboxRepository
+from schemas.ecount.auth_schemas import EcountAuthInfo
+from schemas.ecount.ecount_schemas import EcountApiResponse, EcountSaleDto, EcountPurchaseDto, snake_to_upper_snake
+from services.ecount.ecount_auth_service import EcountAuthManager
+from services.ecount.ecount_sale_service import EcountSaleService
+from utils.logs.sabangnet_logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# 이카운트 입력값이 아닌 내부 기록용 필드 (payload, idempotency_key에서 제외)
+OUTBOX_EXCLUDED_FIELDS = {
+    "is_success", "slip_nos", "trace_id", "error_message",
+    "is_test", "work_status", "batch_id", "template_code",
+}
+
+
+def build_idempotency_key(
+    kind: str,
+    com_code: str,
+    is_test: bool,
+    template_code: Optional[str],
+    lines: List[dict],
+    occurrence: int = 0
+) -> str:
+    """
+    전표 내용으로 idempotency_key 생성 (sha256)
+    UPLOAD_SER_NO는 파일 안 위치라서 제외하고, 한 번에 올린 같은 내용의 전표는 occurrence로 구분
+    """
+    body = {
+        "kind": kind,
+        "com_code": com_code,
+        "is_test": is_test,
+        "template_code": template_code,
+        "lines": [{k: v for k, v in line.items() if k != "UPLOAD_SER_NO"} for line in lines],
+        "occurrence": occurrence,
+    }
+    encoded = json.dumps(body, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class EcountOutboxService:
+    """이카운트 전송 outbox 서비스"""
+
+    def __init__(self, session: AsyncSession):
+        self.outbox_repository = EcountOutboxRepository(session)
+        self.sale_service = EcountSaleService()
+        self.auth_manager = EcountAuthManager()
+
+    def build_outbox_rows(
+        self,
+        ecount_dtos: List[Union[EcountSaleDto, EcountPurchaseDto]],
+        template_code: Optional[str],
+        batch_id: Optional[str],
+        is_test: bool = True
+    ) -> List[Tuple[dict, List[Union[EcountSaleDto, EcountPurchaseDto]]]]:
+        """DTO를 전표(upload_ser_no) 단위로 묶어서 (outbox 행, 전표에 속한 DTO 목록) 리스트로 변환"""
+        kind = "purchase" if template_code and "purchase" in template_code.lower() else "sale"
+
+        slips: Dict[Any, List[Union[EcountSaleDto, EcountPurchaseDto]]] = {}
+        for index, dto in enumerate(ecount_dtos):
+            slip_key = dto.upload_ser_no if dto.upload_ser_no is not None else ("row", index)
+            slips.setdefault(slip_key, []).append(dto)
+
+        entries = []
+        occurrences: Dict[str, int] = {}
+        for dtos in slips.values():
+            lines = [
+                snake_to_upper_snake(dto.model_dump(exclude_unset=True, exclude=OUTBOX_EXCLUDED_FIELDS))
+                for dto in dtos
+            ]
+            com_code = dtos[0].com_code
+            base_key = build_idempotency_key(kind, com_code, is_test, template_code, lines)
+            occurrence = occurrences.get(base_key, 0)
+            occurrences[base_key] = occurrence + 1
+            order_keys = [dto.size_des for dto in dtos if dto.size_des] if kind == "sale" else []
+            row = {
+                "idempotency_key": build_idempotency_key(kind, com_code, is_test, template_code, lines, occurrence),
+                "kind": kind,
+                "com_code": com_code,
+                "is_test": is_test,
+                "template_code": template_code,
+                "batch_id": batch_id,
+                "order_keys": ",".join(order_keys) or None,
+                "payload": lines,
+                "status": "pending",
+                "attempts": 0,
+            }
+            entries.append((row, dtos))
+        return entries
+
+    async def submit(
+        self,
+        ecount_dtos: List[Union[EcountSaleDto, EcountPurchaseDto]],
+        auth_info: EcountAuthInfo,
+        template_code: Optional[str],
+        batch_id: Optional[str],
+        is_test: bool = True
+    ) -> Tuple[Optional[EcountApiResponse], List[str], Dict[str, int]]:
+        """
+        검증된 DTO를 outbox에 쌓고 이번에 쌓인 pending 전표만 바로 전송
+        결과(성공 여부, 전표번호, 오류)는 DTO에 반영
+
+        Returns:
+            tuple: (마지막 API 응답, 오류 메시지 리스트, {success_count, fail_count, skipped_count})
+        """
+        counts = {"success_count": 0, "fail_count": 0, "skipped_count": 0}
+        entries = self.build_outbox_rows(ecount_dtos, template_code, batch_id, is_test)
+        if not entries:
+            return None, [], counts
+
+        rows = await self.outbox_repository.enqueue([row for row, _ in entries])
+        rows_by_key = {row.idempotency_key: row for row in rows}
+        pending_ids = [row.id for row in rows if row.status == "pending"]
+
+        summary = await self.drain(ids=pending_ids, auth_info=auth_info) if pending_ids else None
+        results = summary["results"] if summary else {}
+
+        errors = []
+        for row_dict, dtos in entries:
+            row = rows_by_key[row_dict["idempotency_key"]]
+            result = results.get(row.id) or {
+                "status": row.status, "slip_no": row.slip_no, "trace_id": row.trace_id, "last_error": row.last_error,
+            }
+            is_success = result["status"] == "succeeded"
+            for dto in dtos:
+                dto.is_success = is_success
+                dto.slip_nos = result["slip_no"]
+                dto.trace_id = result["trace_id"]
+                dto.error_message = None if is_success else result["last_error"]
+
+            if is_success:
+                counts["success_count"] += len(dtos)
+                if row.id not in results:
+                    counts["skipped_count"] += len(dtos)
+            else:
+                counts["fail_count"] += len(dtos)
+                errors.append(
+                    f"전표 {row.order_keys or row.id} {result['status']}: {result['last_error'] or '전송 대기'}"
+                )
+
+        if counts["skipped_count"]:
+            logger.info(f"이미 전송된 전표 재전송 생략: {counts['skipped_count']}건 (batch_id={batch_id})")
+        return (summary["api_response"] if summary else None), errors, counts
+
+    async def drain(
+        self,
+        ids: Optional[List[int]] = None,
+        auth_info: Optional[EcountAuthInfo] = None,
+        limit: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        pending 전표를 ECOUNT_OUTBOX_DRAIN_SIZE개씩 가져가서 (회사/구분/템플릿별) 한 요청으로 전송
+        한 번의 drain에서 같은 행은 한 번만 보냄 (다시 pending이 된 행은 다음 drain에서 재시도)
+
+        Args:
+            ids: 이 id들만 전송 (None이면 전체 pending)
+            auth_info: 인증 정보 (None이면 행의 template_code로 환경변수 인증)
+            limit: 최대 전송 전표 수
+
+        Returns:
+            dict: 상태별 건수, 행별 결과(results), 마지막 API 응답(api_response)
+        """
+        summary: Dict[str, Any] = {"claimed": 0, "succeeded": 0, "failed": 0, "pending": 0, "unknown": 0}
+        results: Dict[int, dict] = {}
+        api_response = None
+        after_id = 0
+
+        while limit is None or summary["claimed"] < limit:
+            size = SETTINGS.ECOUNT_OUTBOX_DRAIN_SIZE
+            if limit is not None:
+                size = min(size, limit - summary["claimed"])
+            rows = await self.outbox_repository.claim_pending(
+                size, after_id=after_id, ids=ids, lease_seconds=SETTINGS.ECOUNT_OUTBOX_LEASE_SECONDS
+            )
+            if not rows:
+                break
+            after_id = rows[-1].id
+            summary["claimed"] += len(rows)
+
+            chunk_results = []
+            for group in self._group_rows(rows):
+                group_results, group_response = await self._send_group(group, auth_info)
+                chunk_results.extend(group_results)
+                api_response = group_response or api_response
+            await self.outbox_repository.save_results(chunk_results)
+
+            for result in chunk_results:
+                summary[result["status"]] += 1
+                results[result["id"]] = result
+
+        logger.info(
+            f"이카운트 outbox 전송: {summary['claimed']}건 중 성공 {summary['succeeded']}, "
+            f"실패 {summary['failed']}, 재시도 대기 {summary['pending']}, 확인 필요 {summary['unknown']}"
+        )
+        summary["results"] = results
+        summary["api_response"] = api_response
+        return summary
+
+    async def requeue(self, ids: List[int]) -> int:
+        """처리되지 않은 것을 확인한 unknown/failed 전표를 다시 pending으로"""
+        return await self.outbox_repository.requeue(ids)
+
+    @staticmethod
+    def _group_rows(rows: List[EcountOutbox]) -> List[List[EcountOutbox]]:
+        """같은 API 요청으로 보낼 수 있는 행끼리 묶음 (id 순서 유지)"""
+        groups: Dict[tuple, List[EcountOutbox]] = {}
+        for row in rows:
+            groups.setdefault((row.kind, row.com_code, row.is_test, row.template_code), []).append(row)
+        return list(groups.values())
+
+    async def _send_group(
+        self,
+        rows: List[EcountOutbox],
+        auth_info: Optional[EcountAuthInfo]
+    ) -> Tuple[List[dict], Optional[EcountApiResponse]]:
+        """전표 묶음을 한 요청으로 보내고 행별 결과 반환"""
+        first = rows[0]
+        if auth_info is None:
+            auth_info = await self.auth_manager.get_authenticated_info_from_env_with_template_code(
+                first.is_test, first.template_code
+            )
+        if not auth_info:
+            return [self._retry_or_fail(row, "이카운트 인증 실패") for row in rows], None
+
+        # 다른 배치에서 쌓인 전표가 한 요청에 섞이므로 UPLOAD_SER_NO를 행마다 다시 매김
+        bulk_datas = [
+            {**line, "UPLOAD_SER_NO": ser_no}
+            for ser_no, row in enumerate(rows, start=1)
+            for line in row.payload
+        ]
+        data, status, error = await self.sale_service.send_bulk_datas(
+            bulk_datas, auth_info, first.is_test, first.kind == "purchase"
+        )
+        return self._map_results(rows, data, status, error)
+
+    def _map_results(
+        self,
+        rows: List[EcountOutbox],
+        data: Optional[dict],
+        status: Optional[int],
+        error: Any
+    ) -> Tuple[List[dict], Optional[EcountApiResponse]]:
+        """API 응답을 행별 상태로 변환"""
+        if status is None or status >= 500:
+            return [self._result(row, "unknown", error=f"처리 여부 확인 필요: {error or status}") for row in rows], None
+        if status != 200 or not data:
+            return [self._retry_or_fail(row, f"HTTP {status}: {error}") for row in rows], None
+
+        try:
+            api_response = EcountApiResponse(**data)
+        except Exception:
+            # Data가 없는 오류 응답(세션 만료 등)은 전표가 저장되지 않은 것
+            return [self._retry_or_fail(row, str(data.get("Error") or data.get("Errors") or data)) for row in rows], None
+
+        response_data = api_response.Data
+        slip_nos = iter(response_data.SlipNos)
+        if len(response_data.ResultDetails) == len(rows):
+            results = []
+            for row, detail in zip(rows, response_data.ResultDetails):
+                if detail.IsSuccess:
+                    results.append(self._result(row, "succeeded", next(slip_nos, None), response_data.TRACE_ID))
+                else:
+                    results.append(self._result(row, "failed", trace_id=response_data.TRACE_ID, error=detail.TotalError))
+            return results, api_response
+        if response_data.FailCnt == 0 and len(response_data.SlipNos) == len(rows):
+            return [self._result(row, "succeeded", next(slip_nos), response_data.TRACE_ID) for row in rows], api_response
+
+        error = f"응답 전표 수가 요청과 다름 (요청 {len(rows)}건, 성공 {response_data.SuccessCnt}건)"
+        return [self._result(row, "unknown", trace_id=response_data.TRACE_ID, error=error) for row in rows], api_response
+
+    def _retry_or_fail(self, row: EcountOutbox, error: str) -> dict:
+        """이카운트가 처리하지 않은 전표: 재시도 횟수가 남았으면 pending, 아니면 failed"""
+        status = "failed" if row.attempts >= SETTINGS.ECOUNT_OUTBOX_MAX_ATTEMPTS else "pending"
+        return self._result(row, status, error=error)
+
+    @staticmethod
+    def _result(
+        row: EcountOutbox,
+        status: str,
+        slip_no: Optional[str] = None,
+        trace_id: Optional[str] = None,
+        error: Optional[str] = None
+    ) -> dict:
+        return {"id": row.id, "status": status, "slip_no": slip_no, "trace_id": trace_id, "last_error": error}
@@ -10,17 +10,22 @@ from decimal import Decimal
 from utils.logs.sabangnet_logger import get_logger
 from utils.decorators import api_exception_handler
 from utils.api_client import aiohttp_post
+from core.settings import SETTINGS
+from core.adaptive_limiter import get_adaptive_limiter, is_congestion_status
 from schemas.ecount.ecount_schemas import (
     EcountSaleDto,
     EcountPurchaseDto,
     EcountApiRequest,
     EcountApiResponse,
+    EcountSaleItem,
+    EcountPurchaseItem,
+    EcountApiPurchaseRequest,
     convert_dto_to_ecount_api_request,
     convert_dto_to_ecount_api_request_with_template_code,
     snake_to_upper_snake
 )
 from schemas.ecount.auth_schemas import EcountAuthInfo
-from .ecount_auth_service import EcountAuthManager
+from .ecount_auth_service import EcountAuthManager, is_session_error
 
 
 logger = get_logger(__name__)
@@ -49,6 +54,30 @@ class EcountSaleService:
         url = base_url.format(auth_info.zone + auth_info.domain)
         return f"{url}?SESSION_ID={auth_info.session_id}"
     
+    def _invalidate_session_on_error(self, auth_info: EcountAuthInfo, response_data) -> None:
+        """세션 만료/무효 응답이면 캐시된 세션을 버려서 다음 요청에서 다시 로그인"""
+        if is_session_error(response_data):
+            logger.warning(f"이카운트 세션 오류 응답, 다음 요청에서 재로그인: {response_data}")
+            self.auth_manager.invalidate_session(auth_info.session_id)
+
+    async def _post(self, url: str, request_data: dict) -> tuple:
+        """
+        공용 AIMD 제한기로 동시 요청 수를 조절하면서 이카운트 API 호출
+        429/5xx/타임아웃이면 창을 줄이고, 429는 서버가 처리하지 않은 요청이라 재시도함
+        (5xx/타임아웃은 전표가 이미 저장됐을 수 있어 재시도하지 않음)
+        """
+        limiter = get_adaptive_limiter("ecount")
+        for attempt in range(SETTINGS.ECOUNT_THROTTLE_MAX_RETRIES + 1):
+            async with limiter.slot() as slot:
+                data, status, error = await aiohttp_post(
+                    url, request_data, timeout=self.session_timeout, logger=logger
+                )
+                slot.report(congested=is_congestion_status(status))
+            if status != 429 or attempt == SETTINGS.ECOUNT_THROTTLE_MAX_RETRIES:
+                break
+            await asyncio.sleep(SETTINGS.ECOUNT_THROTTLE_RETRY_BACKOFF * (2 ** attempt))
+        return data, status, error
+
     def _convert_simple_to_full_request(self, simple_request: EcountSaleDto) -> EcountSaleDto:
         """간단한 요청을 전체 요청 형식으로 변환합니다."""
         # 현재 날짜를 기본값으로 사용
@@ -87,9 +116,8 @@ class EcountSaleService:
             url = self._build_sale_url(auth_info, is_test)
             request_data = api_request.model_dump(exclude_unset=True)
 
-            data, status, error = await aiohttp_post(
-                url, request_data, timeout=self.session_timeout, logger=logger
-            )
+            data, status, error = await self._post(url, request_data)
+            self._invalidate_session_on_error(auth_info, data if data is not None else error)
 
             if status == 200 and data:
                 try:
@@ -143,9 +171,8 @@ class EcountSaleService:
             url = self._build_sale_url(auth_info, is_test)
             request_data = api_request.model_dump(exclude_unset=True)
 
-            data, status, error = await aiohttp_post(
-                url, request_data, timeout=self.session_timeout, logger=logger
-            )
+            data, status, error = await self._post(url, request_data)
+            self._invalidate_session_on_error(auth_info, data if data is not None else error)
 
             if status == 200 and data:
                 try:
@@ -314,6 +341,44 @@ class EcountSaleService:
                 if not sale_dto.vat_amt:
                     sale_dto.vat_amt = float(vat_amt)
     
+    def validate_ecount_dtos(
+        self,
+        ecount_dtos: List[Union[EcountSaleDto, EcountPurchaseDto]],
+        template_code: Optional[str]
+    ) -> tuple[List[Union[EcountSaleDto, EcountPurchaseDto]], List[str]]:
+        """템플릿 코드에 따라 판매/구매 데이터를 검증합니다."""
+        if template_code and "purchase" in template_code.lower():
+            return self._validate_purchase_data(ecount_dtos)
+        return self._validate_sales_data(ecount_dtos)
+
+    async def send_bulk_datas(
+        self,
+        bulk_datas: List[dict],
+        auth_info: EcountAuthInfo,
+        is_test: bool = True,
+        is_purchase: bool = False
+    ) -> tuple:
+        """
+        BulkDatas 목록을 판매/구매 API로 그대로 전송합니다. (outbox 워커용)
+
+        Returns:
+            tuple: (응답 데이터, HTTP 상태, 오류)
+        """
+        if is_purchase:
+            url = self._build_purchase_url(auth_info, is_test)
+            request_data = EcountApiPurchaseRequest(
+                PurchasesList=[EcountPurchaseItem(BulkDatas=line) for line in bulk_datas]
+            ).model_dump(exclude_unset=True)
+        else:
+            url = self._build_sale_url(auth_info, is_test)
+            request_data = EcountApiRequest(
+                SaleList=[EcountSaleItem(BulkDatas=line) for line in bulk_datas]
+            ).model_dump(exclude_unset=True)
+
+        data, status, error = await self._post(url, request_data)
+        self._invalidate_session_on_error(auth_info, data if data is not None else error)
+        return data, status, error
+
     def _prepare_api_request(
         self, 
         sale_dtos: List[Union[EcountSaleDto, EcountPurchaseDto]], 
@@ -405,12 +470,8 @@ class EcountSaleService:
         url, request_data = self._prepare_api_request(sale_dtos, auth_info, is_test)
 
         # 2단계: API 요청 전송
-        response_data, status, error = await aiohttp_post(
-            url=url,
-            json=request_data,
-            timeout=self.session_timeout,
-            logger=logger
-        )
+        response_data, status, error = await self._post(url, request_data)
+        self._invalidate_session_on_error(auth_info, response_data if response_data is not None else error)
 
         # 3단계: 응답 검증
         if error:
@@ -443,12 +504,8 @@ class EcountSaleService:
         )
 
         # 2단계: API 요청 전송
-        response_data, status, error = await aiohttp_post(
-            url=url,
-            json=request_data,
-            timeout=self.session_timeout,
-            logger=logger
-        )
+        response_data, status, error = await self._post(url, request_data)
+        self._invalidate_session_on_error(auth_info, response_data if response_data is not None else error)
 
         # 3단계: 응답 검증
         if error:
@@ -529,10 +586,7 @@ class EcountSaleService:
         )
 
         # 1단계: 데이터 검증
-        if is_purchase:
-            valid_dtos, validation_errors = self._validate_purchase_data(ecount_dtos)
-        else:
-            valid_dtos, validation_errors = self._validate_sales_data(ecount_dtos)
+        valid_dtos, validation_errors = self.validate_ecount_dtos(ecount_dtos, template_code)
 
         if not valid_dtos:
             return None, validation_errors
@@ -24,6 +24,7 @@ from schemas.ecount.erp_transfer_dto import (
     FormNameType
 )
 from utils.logs.sabangnet_logger import get_logger
+from core.offload import run_io
 from minio_handler import upload_and_get_url_and_size, url_arrange
 
 logger = get_logger(__name__)
@@ -359,7 +360,8 @@ class ErpTransferService:
             file_path = f"files/excel/{excel_filename}"
             
             # MinIO에 업로드
-            file_url, minio_object_name, file_size = upload_and_get_url_and_size(
+            file_url, minio_object_name, file_size = await run_io(
+                upload_and_get_url_and_size,
                 file_path, 
                 form_name, 
                 excel_filename
@@ -1,7 +1,15 @@
+import asyncio
 import aiohttp
+from core.settings import SETTINGS
+from core.http_client import http_session
 from utils.logs.sabangnet_logger import get_logger
 from services.hanjin.adapter.hanjin_base_adapter import HanjinBaseAdapter
-from schemas.hanjin.hanjin_printWbls_dto import AddressItem, PrintWblsRequest, PrintWblsResponse
+from schemas.hanjin.hanjin_printWbls_dto import (
+    AddressItem,
+    PrintWblsRequest,
+    PrintWblsResponse,
+    PrintWblsChunkedResponse,
+)
 
 
 logger = get_logger(__name__)
@@ -95,8 +103,13 @@ class HanjinWblsAdapter(HanjinBaseAdapter):
             
             logger.info(f"한진 API print-wbls 요청: {url}, client_id={client_id}, 건수={len(print_request.address_list)}")
             
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, json=request_data, headers=headers) as response:
+            async with http_session() as session:
+                async with session.post(
+                    url,
+                    json=request_data,
+                    headers=headers,
+                    timeout=aiohttp.ClientTimeout(total=SETTINGS.HANJIN_PRINT_WBLS_TIMEOUT)
+                ) as response:
                     if response.status == 200:
                         response_data = await response.json()
                         logger.info(f"한진 API print-wbls 응답 성공: {response_data}")
@@ -165,4 +178,89 @@ class HanjinWblsAdapter(HanjinBaseAdapter):
             
         except Exception as e:
             logger.error(f"환경변수 한진 API print-wbls 요청 실패: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    async def generate_print_wbls_in_chunks(
+        self,
+        address_list: list[AddressItem]
+    ) -> PrintWblsChunkedResponse:
+        """
+        주소 목록을 HANJIN_PRINT_WBLS_CHUNK_SIZE건씩 나눠 동시에(최대 HANJIN_PRINT_WBLS_CONCURRENCY개)
+        print-wbls 요청하고, 응답은 목록 순서가 아니라 msg_key로 요청 항목과 매칭합니다.
+        청크는 각자 재시도하고, 끝내 실패한 청크의 항목은 failed_items로 돌려줘서 그것만 다시 요청할 수 있습니다.
+
+        Args:
+            address_list: 주소 목록 (msg_key 필수, 중복 불가)
+
+        Returns:
+            msg_key별 응답과 실패 항목
+        """
+        if not self.validate_env_vars():
+            raise ValueError("한진 API 환경변수가 설정되지 않았습니다.")
+
+        msg_keys = [address.msg_key for address in address_list]
+        if not all(msg_keys) or len(set(msg_keys)) != len(msg_keys):
+            raise ValueError("print-wbls 청크 요청은 항목마다 고유한 msg_key가 필요합니다.")
+
+        chunk_size = min(max(SETTINGS.HANJIN_PRINT_WBLS_CHUNK_SIZE, 1), 100)
+        chunks = [address_list[i:i + chunk_size] for i in range(0, len(address_list), chunk_size)]
+        semaphore = asyncio.Semaphore(max(SETTINGS.HANJIN_PRINT_WBLS_CONCURRENCY, 1))
+        outcomes = await asyncio.gather(
+            *[self._request_print_wbls_chunk(chunk, semaphore) for chunk in chunks],
+            return_exceptions=True
+        )
+
+        merged = PrintWblsChunkedResponse()
+        for chunk, outcome in zip(chunks, outcomes):
+            if isinstance(outcome, BaseException):
+                merged.failed_items.extend(chunk)
+                merged.errors.update({address.msg_key: str(outcome) for address in chunk})
+                continue
+
+            merged.total_cnt += outcome.total_cnt or 0
+            merged.error_cnt += outcome.error_cnt or 0
+            chunk_keys = {address.msg_key for address in chunk}
+            for result in outcome.address_list or []:
+                if result.msg_key in chunk_keys:
+                    merged.results[result.msg_key] = result
+                else:
+                    logger.warning(f"요청하지 않은 msg_key 응답 무시: {result.msg_key}")
+            for address in chunk:
+                if address.msg_key not in merged.results:
+                    merged.failed_items.append(address)
+                    merged.errors[address.msg_key] = "한진 API 응답에 해당 msg_key가 없습니다."
+
+        logger.info(
+            f"한진 API print-wbls 청크 요청 완료: {len(address_list)}건, {len(chunks)}개 청크, "
+            f"응답 {len(merged.results)}건, 실패 {len(merged.failed_items)}건"
+        )
+        return merged
+
+    async def _request_print_wbls_chunk(
+        self,
+        chunk: list[AddressItem],
+        semaphore: asyncio.Semaphore
+    ) -> PrintWblsResponse:
+        """청크 하나를 요청 (동시 실행 수는 semaphore로 제한, 실패 시 지수 백오프 재시도)"""
+        max_retries = max(SETTINGS.HANJIN_PRINT_WBLS_MAX_RETRIES, 1)
+        backoff = SETTINGS.HANJIN_PRINT_WBLS_RETRY_BACKOFF
+        async with semaphore:
+            for attempt in range(1, max_retries + 1):
+                try:
+                    response = await self.generate_print_wbls_with_env_vars_from_api(
+                        PrintWblsRequest(address_list=chunk)
+                    )
+                    if not isinstance(response, PrintWblsResponse):
+                        raise ValueError(f"한진 API print-wbls 응답 형식 오류: {response}")
+                    return response
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    if attempt >= max_retries:
+                        logger.error(
+                            f"한진 API print-wbls 청크 실패: {chunk[0].msg_key}~{chunk[-1].msg_key} "
+                            f"({attempt}회 시도) {e}"
+                        )
+                        raise
+                    logger.warning(f"한진 API print-wbls 청크 재시도 {attempt}/{max_retries}: {e}")
+                    await asyncio.sleep(backoff * (2 ** (attempt - 1)))
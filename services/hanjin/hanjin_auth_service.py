@@ -2,6 +2,7 @@
 한진 API 인증 서비스
 """
 import aiohttp
+from core.http_client import http_session
 from utils.logs.sabangnet_logger import get_logger
 from schemas.hanjin.hanjin_auth_schemas import HmacResponse
 from services.hanjin.adapter.hanjin_auth_adapter import HanjinAuthAdapter
@@ -37,7 +38,7 @@ class HanjinAuthService(HanjinAuthAdapter):
 
             logger.info(f"한진 API 요청: {url}, client_id={request_client_id}")
             
-            async with aiohttp.ClientSession() as session:
+            async with http_session() as session:
                 async with session.post(url, headers=headers) as response:
                     if response.status == 200:
                         response_data = await response.json()
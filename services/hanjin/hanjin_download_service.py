@@ -24,6 +24,7 @@ from schemas.hanjin.hanjin_printWbls_dto import (
     UpdatedRecord,
 )
 from schemas.macro_batch_processing.batch_process_dto import BatchProcessDto
+from core.offload import run_io
 from minio_handler import upload_and_get_url_with_count_rev, url_arrange
 
 
@@ -220,7 +221,8 @@ class HanjinDownloadService:
             count_rev = await self.count_executing_service.get_and_increment(CountExecuting, "hanjin_excel_download")
             
             # 6. MinIO 업로드
-            file_url, minio_object_name, file_size = upload_and_get_url_with_count_rev(
+            file_url, minio_object_name, file_size = await run_io(
+                upload_and_get_url_with_count_rev,
                 file_path=excel_file_path,
                 template_code="hanjin_excel",
                 file_name=os.path.basename(excel_file_path),
@@ -429,7 +431,8 @@ class HanjinDownloadService:
             )
             
             # 11. MinIO 업로드
-            file_url, minio_object_name, file_size = upload_and_get_url_with_count_rev(
+            file_url, minio_object_name, file_size = await run_io(
+                upload_and_get_url_with_count_rev,
                 file_path=result_excel_path,
                 template_code="hanjin_excel_upload",
                 file_name=os.path.basename(result_excel_path),
@@ -190,41 +190,36 @@ class HanjinPrintService(HanjinWblsAdapter):
             # 현재 날짜로 YYMMDD 형식 생성
             current_date = datetime.now().strftime("%y%m%d")
             
-            # API 요청 데이터 준비
+            # API 요청 데이터 준비 (응답은 msg_key로 레코드와 매칭)
             address_list = []
+            records_by_msg_key = {}
             for i, record in enumerate(records, 1):
                 # msg_key 생성: YYMMDD + random num(XX) + 요청개수순서(1,2,3,4,5,...)
                 random_num = random.randint(10, 99)
                 msg_key = f"{current_date}{random_num:02d}{i:02d}"
                 
-                address_item = {
-                    "csr_num": self.hanjin_csr_num,
-                    "address": record.prt_add,
-                    "snd_zip": record.snd_zip,
-                    "rcv_zip": record.zip_cod,
-                    "msg_key": msg_key
-                }
-                address_list.append(address_item)
-            
-            # PrintWblsRequest 객체 생성
-            print_request = PrintWblsRequest(
-                address_list=[AddressItem(**item) for item in address_list]
-            )
-            
-            # 한진 API 호출
-            api_response = await self.generate_print_wbls_with_env_vars_from_api(print_request)
-            
-            # 응답 데이터로 레코드 업데이트
-            updated_records = []
-            if api_response.address_list:
-                for i, address_result in enumerate(api_response.address_list):
-                    if i < len(records):
-                        record = records[i]
-                        # API 응답 데이터를 딕셔너리로 변환
-                        response_data = address_result.model_dump()
-                        # 레코드 업데이트
-                        updated_record = await printwbls_repo.update_with_api_response(record.id, response_data)
-                        updated_records.append(updated_record)
+                address_list.append(AddressItem(
+                    csr_num=self.hanjin_csr_num,
+                    address=record.prt_add,
+                    snd_zip=record.snd_zip,
+                    rcv_zip=record.zip_cod,
+                    msg_key=msg_key
+                ))
+                records_by_msg_key[msg_key] = record
+            
+            # 한진 API 호출 (청크 단위 동시 요청)
+            api_response = await self.generate_print_wbls_in_chunks(address_list)
+            
+            # 응답 데이터로 레코드 일괄 업데이트 (커밋 1회)
+            responses = []
+            for msg_key, record in records_by_msg_key.items():
+                address_result = api_response.results.get(msg_key)
+                if address_result is None:
+                    continue
+                responses.append({**address_result.model_dump(), 'id': record.id})
+            updated_records = await printwbls_repo.update_many_with_api_responses(responses)
+            if api_response.failed_items:
+                logger.warning(f"hanjin_printwbls 응답을 받지 못한 레코드 {len(api_response.failed_items)}건은 다음 처리 때 다시 요청합니다.")
             
             logger.info(f"hanjin_printwbls {len(updated_records)}건 API 처리 및 업데이트 완료")
             
@@ -314,7 +309,6 @@ class HanjinPrintService(HanjinWblsAdapter):
                 try:
                     from repository.batch_info_repository import BatchInfoRepository
                     from schemas.macro_batch_processing.batch_process_dto import BatchProcessDto
-                    from datetime import datetime
                     
                     batch_repo = BatchInfoRepository(self.session)
                     
@@ -351,29 +345,25 @@ class HanjinPrintService(HanjinWblsAdapter):
             # 현재 날짜로 YYMMDD 형식 생성
             current_date = datetime.now().strftime("%y%m%d")
             
-            # API 요청 데이터 준비
+            # API 요청 데이터 준비 (응답은 msg_key로 주문과 매칭)
             address_list = []
+            msg_keys = []
             for i, order in enumerate(orders_without_invoice, 1):
                 # msg_key 생성: YYMMDD + random num(XX) + 요청개수순서(1,2,3,4,5,...)
                 random_num = random.randint(10, 99)
                 msg_key = f"{current_date}{random_num:02d}{i:02d}"
                 
-                address_item = {
-                    "csr_num": self.hanjin_csr_num,
-                    "address": order.receive_addr,
-                    "snd_zip": "08609",  # 고정값
-                    "rcv_zip": order.receive_zipcode,
-                    "msg_key": msg_key
-                }
-                address_list.append(address_item)
-            
-            # PrintWblsRequest 객체 생성
-            print_request = PrintWblsRequest(
-                address_list=[AddressItem(**item) for item in address_list]
-            )
-            
-            # 한진 API 호출
-            api_response = await self.generate_print_wbls_with_env_vars_from_api(print_request)
+                address_list.append(AddressItem(
+                    csr_num=self.hanjin_csr_num,
+                    address=order.receive_addr,
+                    snd_zip="08609",  # 고정값
+                    rcv_zip=order.receive_zipcode,
+                    msg_key=msg_key
+                ))
+                msg_keys.append(msg_key)
+            
+            # 한진 API 호출 (청크 단위 동시 요청, 실패한 청크만 재시도)
+            api_response = await self.generate_print_wbls_in_chunks(address_list)
             
             # hanjin_printwbls 리포지토리 생성
             printwbls_repo = HanjinPrintwblsRepository(self.session)
@@ -384,65 +374,55 @@ class HanjinPrintService(HanjinWblsAdapter):
             details = []
             created_records = []  # 파일 생성용
             
-            if api_response.address_list:
-                for i, address_result in enumerate(api_response.address_list):
-                    if i < len(orders_without_invoice):
-                        order = orders_without_invoice[i]
-                        
-                        try:
-                            # API 응답 데이터를 딕셔너리로 변환
-                            response_data = address_result.model_dump()
-                            
-                            # hanjin_printwbls 테이블에 새 레코드 생성
-                            created_record = await printwbls_repo.create_from_api_response(
-                                idx=order.idx,
-                                prt_add=order.receive_addr,
-                                zip_cod=order.receive_zipcode,
-                                snd_zip="08609",
-                                api_response_data=response_data
-                            )
-                            created_printwbls_count += 1
-                            created_records.append(created_record)
-                            
-                            # down_form_orders 테이블에 invoice_no, batch_id, process_dt 업데이트 (합포장용, brandi_erp용)
-                            if address_result.wbl_num:
-                                process_dt = datetime.now()
-                                await down_form_repo.update_invoice_no_by_idx(
-                                    idx=order.idx,
-                                    invoice_no=address_result.wbl_num,
-                                    batch_id=batch_id,
-                                    process_dt=process_dt
-                                )
-                                updated_down_form_orders_count += 1
-                                # 주문번호안에 "/"가 있으면 "/"를 기준으로 split 해서 각 idx에 대해서 업데이트 (ERP용)
-                                if "/" in order.idx:
-                                    idx_list = order.idx.split("/")
-                                    for idx in idx_list:
-                                        await down_form_repo.update_invoice_no_by_idx(
-                                            idx=idx,
-                                            invoice_no=address_result.wbl_num,
-                                            batch_id=batch_id,
-                                            process_dt=process_dt
-                                        )
-                                        # ERP 업로드 완료 출력
-                                        logger.info(f"ERP 업로드 완료: {idx}")
-                            
-                            # 성공 상세 정보 추가
-                            details.append(ProcessDetail(
-                                idx=order.idx,
-                                success=True,
-                                invoice_no=address_result.wbl_num,
-                                error_message=None
-                            ))
-                            
-                        except Exception as e:
-                            logger.error(f"주문번호 {order.idx} 처리 실패: {str(e)}")
-                            details.append(ProcessDetail(
-                                idx=order.idx,
-                                success=False,
-                                invoice_no=None,
-                                error_message=str(e)
-                            ))
+            matched_orders = []
+            records = []
+            for order, msg_key in zip(orders_without_invoice, msg_keys):
+                address_result = api_response.results.get(msg_key)
+                if address_result is None:
+                    details.append(ProcessDetail(
+                        idx=order.idx,
+                        success=False,
+                        invoice_no=None,
+                        error_message=api_response.errors.get(msg_key)
+                    ))
+                    continue
+                
+                matched_orders.append((order, address_result))
+                records.append({
+                    **address_result.model_dump(),
+                    'idx': order.idx,
+                    'prt_add': order.receive_addr,
+                    'zip_cod': order.receive_zipcode,
+                    'snd_zip': "08609",
+                })
+            
+            # hanjin_printwbls 생성과 down_form_orders invoice_no, batch_id, process_dt 업데이트를 한 트랜잭션으로 저장
+            # (합포장 주문번호 a/b/c는 a, b, c 각각도 업데이트 - ERP용)
+            try:
+                created_records, updated_rows = await printwbls_repo.create_many_from_api_responses(
+                    records,
+                    batch_id=batch_id,
+                    process_dt=datetime.now()
+                )
+                created_printwbls_count = len(created_records)
+                updated_down_form_orders_count = len([1 for _, address_result in matched_orders if address_result.wbl_num])
+                logger.info(f"down_form_orders {updated_rows}행 운송장번호 업데이트 완료")
+                for order, address_result in matched_orders:
+                    details.append(ProcessDetail(
+                        idx=order.idx,
+                        success=True,
+                        invoice_no=address_result.wbl_num,
+                        error_message=None
+                    ))
+            except Exception as e:
+                logger.error(f"운송장 출력 결과 {len(records)}건 저장 실패: {str(e)}")
+                for order, _ in matched_orders:
+                    details.append(ProcessDetail(
+                        idx=order.idx,
+                        success=False,
+                        invoice_no=None,
+                        error_message=str(e)
+                    ))
             
             # 파일 생성 및 MinIO 업로드
             if created_records and batch_id:
@@ -450,7 +430,7 @@ class HanjinPrintService(HanjinWblsAdapter):
                     import pandas as pd
                     import tempfile
                     import os
-                    from minio_handler import upload_file_to_minio, get_minio_file_url, url_arrange
+                    from minio_handler import upload_file_to_minio_async, get_minio_file_url, url_arrange
                     
                     # DataFrame 생성
                     df = create_hanjin_print_records_dataframe(created_records, batch_id)
@@ -463,7 +443,7 @@ class HanjinPrintService(HanjinWblsAdapter):
                     try:
                         # MinIO 업로드
                         file_name = f"hanjin_printwbls_batch_{batch_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-                        uploaded_object = upload_file_to_minio(tmp_file_path, file_name)
+                        uploaded_object = await upload_file_to_minio_async(tmp_file_path, file_name)
                         file_url = get_minio_file_url(uploaded_object)
                         file_url_arranged = url_arrange(file_url)
                         
@@ -0,0 +1,223 @@
+"""
+매크로 실행 결과 캐시 서비스.
+
+같은 엑셀 파일을 같은 조건(템플릿, 서브 사이트, 스타배송, 매크로 버전)으로 다시 올리면
+매크로를 다시 돌리지 않고 저장해 둔 결과 행 데이터로 바로 DB 저장 단계로 넘어갑니다.
+
+    - 키    : SHA-256(업로드 파일 바이트 + template_code + sub_site + is_star + 매크로 버전)
+    - 저장  : MinIO macro_cache/{키}/ 아래에 결과 엑셀과 행 데이터(gzip 압축 JSON, 컬럼별 dtype 포함)를 저장
+              (버킷에 쓸 수 있는 누구나 객체를 바꿀 수 있으므로 읽을 때 코드가 실행될 수 있는 pickle은 쓰지 않음)
+    - 정리  : 최근 사용 순으로 누적 크기/개수 한도를 넘는 항목부터 삭제 (LRU)
+
+캐시 조회/저장 실패는 본 작업(매크로 실행 -> DB 저장)을 막지 않고 경고 로그만 남깁니다.
+"""
+import gzip
+import json
+import hashlib
+import datetime as dt
+from decimal import Decimal
+import pandas as pd
+from fastapi import UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+from core.offload import run_io
+from core.settings import SETTINGS
+from utils.logs.sabangnet_logger import get_logger
+from repository.macro_result_cache_repository import MacroResultCacheRepository
+from minio_handler import upload_bytes_to_minio, download_bytes_from_minio, remove_objects_from_minio
+
+
+logger = get_logger(__name__)
+
+
+def _encode_value(value):
+    """JSON 기본 타입이 아닌 셀 값을 태그 붙인 dict로 변환 (json.dumps default 훅)"""
+    if value is pd.NaT:
+        return {"$nat": 1}
+    if isinstance(value, pd.Timestamp):
+        return {"$ts": value.isoformat()}
+    if isinstance(value, dt.datetime):
+        return {"$dt": value.isoformat()}
+    if isinstance(value, dt.date):
+        return {"$d": value.isoformat()}
+    if isinstance(value, dt.time):
+        return {"$t": value.isoformat()}
+    if isinstance(value, pd.Timedelta):
+        return {"$td": value.value}
+    if isinstance(value, Decimal):
+        return {"$dec": str(value)}
+    raise TypeError(f"매크로 캐시에 저장할 수 없는 값 타입: {type(value).__name__}")
+
+
+_DECODERS = {
+    "$nat": lambda _: pd.NaT,
+    "$ts": pd.Timestamp,
+    "$dt": dt.datetime.fromisoformat,
+    "$d": dt.date.fromisoformat,
+    "$t": dt.time.fromisoformat,
+    "$td": pd.Timedelta,
+    "$dec": Decimal,
+}
+
+
+def _decode_value(obj: dict):
+    """_encode_value로 태그 붙인 dict를 원래 값으로 되돌림 (json.loads object_hook)"""
+    if len(obj) == 1:
+        tag, value = next(iter(obj.items()))
+        if tag in _DECODERS:
+            return _DECODERS[tag](value)
+    return obj
+
+
+class MacroResultCacheService:
+
+    OBJECT_PREFIX = "macro_cache"
+    XLSX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    _HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.macro_result_cache_repository = MacroResultCacheRepository(session)
+
+    @classmethod
+    def hash_upload_file(cls, file: UploadFile) -> str:
+        """업로드 파일 내용의 SHA-256 (읽은 뒤 파일 포인터는 처음으로 되돌림)"""
+        digest = hashlib.sha256()
+        file.file.seek(0)
+        for chunk in iter(lambda: file.file.read(cls._HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+        file.file.seek(0)
+        return digest.hexdigest()
+
+    @staticmethod
+    def build_cache_key(
+        file_hash: str,
+        template_code: str,
+        sub_site: str | None,
+        is_star: bool,
+        macro_version: str | None = None
+    ) -> str:
+        """파일 해시와 매크로 실행 조건을 묶어 캐시 키 생성"""
+        if macro_version is None:
+            macro_version = SETTINGS.MACRO_RESULT_CACHE_VERSION
+        parts = [file_hash, template_code, sub_site or "", "1" if is_star else "0", macro_version]
+        return hashlib.sha256("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+    @classmethod
+    def build_cache_key_from_upload(cls, file: UploadFile, template_code: str, sub_site: str | None, is_star: bool) -> str:
+        return cls.build_cache_key(cls.hash_upload_file(file), template_code, sub_site, is_star)
+
+    @staticmethod
+    def dataframe_to_blob(df: pd.DataFrame) -> bytes:
+        """DataFrame을 컬럼별 값 목록 + dtype JSON으로 바꾼 뒤 gzip 압축 (dtype, 컬럼 순서 유지)"""
+        document = {
+            "version": 1,
+            "columns": list(df.columns),
+            "dtypes": [str(dtype) for dtype in df.dtypes],
+            "index": (
+                {"range": [df.index.start, df.index.stop, df.index.step]}
+                if isinstance(df.index, pd.RangeIndex) else df.index.tolist()
+            ),
+            "data": [df.iloc[:, i].tolist() for i in range(df.shape[1])],
+        }
+        payload = json.dumps(document, default=_encode_value, ensure_ascii=False, separators=(",", ":"))
+        return gzip.compress(payload.encode("utf-8"), compresslevel=1)
+
+    @staticmethod
+    def blob_to_dataframe(blob: bytes) -> pd.DataFrame:
+        document = json.loads(gzip.decompress(blob), object_hook=_decode_value)
+        if document.get("version") != 1:
+            raise ValueError(f"지원하지 않는 매크로 캐시 형식: {document.get('version')}")
+        # 컬럼 이름이 중복될 수 있으므로 위치로 만든 뒤 이름을 붙임
+        df = pd.DataFrame({
+            i: pd.Series(values, dtype=object).astype(dtype)
+            for i, (values, dtype) in enumerate(zip(document["data"], document["dtypes"]))
+        })
+        index = document["index"]
+        df.index = pd.RangeIndex(*index["range"]) if isinstance(index, dict) else pd.Index(index)
+        df.columns = document["columns"]
+        return df
+
+    @classmethod
+    def _object_names(cls, cache_key: str) -> tuple[str, str]:
+        base = f"{cls.OBJECT_PREFIX}/{cache_key}"
+        return f"{base}/result.xlsx", f"{base}/rows.json.gz"
+
+    async def get(self, cache_key: str) -> pd.DataFrame | None:
+        """
+        캐시 조회
+        args:
+            cache_key: build_cache_key 결과
+        returns:
+            캐시된 매크로 결과 DataFrame, 없으면 None
+        """
+        try:
+            entry = await self.macro_result_cache_repository.get_by_cache_key(cache_key)
+            if entry is None:
+                return None
+            try:
+                blob = await run_io(download_bytes_from_minio, entry.rows_object_name)
+            except RuntimeError as e:
+                # MinIO 객체가 없어진 경우 메타데이터도 정리하고 miss 처리
+                logger.warning(f"매크로 캐시 객체 조회 실패, 항목 삭제 | cache_key={cache_key} | {e}")
+                await self.macro_result_cache_repository.delete_by_ids([entry.id])
+                return None
+            dataframe = await run_io(self.blob_to_dataframe, blob)
+            await self.macro_result_cache_repository.touch(entry.id)
+            logger.info(f"매크로 캐시 적중 | cache_key={cache_key} | rows={len(dataframe)}")
+            return dataframe
+        except Exception as e:
+            logger.warning(f"매크로 캐시 조회 실패 | cache_key={cache_key} | {e}")
+            return None
+
+    async def put(
+        self,
+        cache_key: str,
+        template_code: str,
+        sub_site: str | None,
+        is_star: bool,
+        workbook_bytes: bytes,
+        dataframe: pd.DataFrame
+    ) -> None:
+        """
+        매크로 결과 엑셀과 행 데이터를 MinIO에 저장하고 캐시 항목 등록 후 한도 초과분 정리
+        """
+        try:
+            rows_blob = await run_io(self.dataframe_to_blob, dataframe)
+            size_bytes = len(workbook_bytes) + len(rows_blob)
+            if size_bytes > SETTINGS.MACRO_RESULT_CACHE_MAX_BYTES:
+                logger.info(f"매크로 캐시 저장 생략 (한도 초과) | cache_key={cache_key} | size={size_bytes}")
+                return
+
+            workbook_object_name, rows_object_name = self._object_names(cache_key)
+            await run_io(upload_bytes_to_minio, workbook_bytes, workbook_object_name, self.XLSX_CONTENT_TYPE)
+            await run_io(upload_bytes_to_minio, rows_blob, rows_object_name)
+            await self.macro_result_cache_repository.upsert({
+                "cache_key": cache_key,
+                "template_code": template_code,
+                "sub_site": sub_site,
+                "is_star": bool(is_star),
+                "macro_version": SETTINGS.MACRO_RESULT_CACHE_VERSION,
+                "workbook_object_name": workbook_object_name,
+                "rows_object_name": rows_object_name,
+                "row_count": len(dataframe),
+                "size_bytes": size_bytes,
+                "hit_count": 0,
+            })
+            logger.info(f"매크로 캐시 저장 | cache_key={cache_key} | rows={len(dataframe)} | size={size_bytes}")
+            await self.evict()
+        except Exception as e:
+            logger.warning(f"매크로 캐시 저장 실패 | cache_key={cache_key} | {e}")
+
+    async def evict(self) -> int:
+        """누적 크기/개수 한도를 넘는 오래된 항목 삭제, 삭제 건수 반환"""
+        candidates = await self.macro_result_cache_repository.get_eviction_candidates(
+            SETTINGS.MACRO_RESULT_CACHE_MAX_BYTES,
+            SETTINGS.MACRO_RESULT_CACHE_MAX_ENTRIES,
+        )
+        if not candidates:
+            return 0
+        object_names = [name for entry in candidates for name in (entry.workbook_object_name, entry.rows_object_name)]
+        await run_io(remove_objects_from_minio, object_names)
+        deleted = await self.macro_result_cache_repository.delete_by_ids([entry.id for entry in candidates])
+        logger.info(f"매크로 캐시 정리 | deleted={deleted}")
+        return deleted
@@ -23,4 +23,16 @@ class MallPriceWriteService:
             )
         else:
             mall_price = await self.mall_price_repository.save_mall_price(new_obj)
-        return MallPriceDto.model_validate(mall_price)
\ No newline at end of file
+        return MallPriceDto.model_validate(mall_price)
+
+    async def setting_mall_prices(self, products: list[dict]) -> list[MallPriceDto]:
+        """
+        여러 상품의 쇼핑몰 가격을 계산해서 한 번에 저장
+        Args:
+            products: product_raw_data_id, standard_price, product_nm, compayny_goods_cd 키를 가진 dict 리스트
+        Returns:
+            products 순서대로 MallPriceDto 리스트
+        """
+        new_objs = [MallPrice.builder(**product) for product in products]
+        mall_prices = await self.mall_price_repository.save_mall_prices(new_objs)
+        return [MallPriceDto.model_validate(mall_price) for mall_price in mall_prices]
@@ -1,5 +1,7 @@
 import math
 from decimal import Decimal
+import numpy as np
+from core.settings import SETTINGS
 from utils.logs.sabangnet_logger import get_logger
 from sqlalchemy.ext.asyncio import AsyncSession
 from schemas.one_one_price.one_one_price_dto import OneOnePriceDto
@@ -88,6 +90,68 @@ class OneOnePriceService:
 
         return OneOnePriceDto.model_validate(await self.one_one_price_repository.create_one_one_price_data(one_one_price_dto))
 
+    def build_one_one_price_rows(self, products: list[dict]) -> list[dict]:
+        """
+        상품 목록의 1+1 가격/쇼핑몰 그룹별 가격을 한 번에 계산해서 one_one_price 행(dict) 목록으로 반환
+        Args:
+            products: id, compayny_goods_cd, product_nm, goods_price 키를 가진 dict 리스트
+        Returns:
+            calculate_and_save_one_one_price 와 같은 값의 행 목록 (입력 순서 유지)
+        """
+        if not products:
+            return []
+        standard_prices = [Decimal(product['goods_price']) for product in products]
+        # 정수 기준가만 numpy 정수 연산으로 계산 (소수점이 있으면 기존 계산기로)
+        integral = [price == price.to_integral_value() for price in standard_prices]
+        integral_indexes = [i for i, is_integral in enumerate(integral) if is_integral]
+        group_prices: list[dict[str, Decimal] | None] = [None] * len(products)
+        if integral_indexes:
+            calculated = self.one_one_price_calculator.calculate_prices_array(
+                np.array([int(standard_prices[i]) for i in integral_indexes], dtype=np.int64))
+            for position, i in enumerate(integral_indexes):
+                group_prices[i] = {group: Decimal(int(values[position])) for group, values in calculated.items()}
+
+        rows = []
+        for product, standard_price, prices in zip(products, standard_prices, group_prices):
+            if prices is None:
+                prices = self._calculate_group_prices(standard_price)
+            row = {
+                'test_product_raw_data_id': product['id'],
+                'compayny_goods_cd': product['compayny_goods_cd'],
+                'product_nm': product['product_nm'],
+                'standard_price': standard_price,
+                'one_one_price': prices['one_one'],
+            }
+            for group, shops in self.SHOP_PRICE_MAPPING.items():
+                for shop in shops:
+                    row[shop] = prices[group]
+            rows.append(row)
+        return rows
+
+    def _calculate_group_prices(self, standard_price: Decimal) -> dict[str, Decimal]:
+        """기준가 하나의 그룹별 가격 (calculate_prices_array와 같은 키)"""
+        one_one_price = self.one_one_price_calculator.calculate_one_one_price(standard_price)
+        return {
+            'one_one': one_one_price,
+            'group_115': self.one_one_price_calculator.calculate_shop_prices_115_percent(one_one_price),
+            'group_105': self.one_one_price_calculator.calculate_shop_prices_105_percent(one_one_price),
+            'group_same': one_one_price,
+            'group_plus100': self.one_one_price_calculator.calculate_shop_prices_plus_100(one_one_price),
+        }
+
+    async def calculate_and_save_one_one_prices_bulk(self, products: list[dict]) -> list[OneOnePriceDto]:
+        """
+        상품 목록의 1+1 가격을 한 번에 계산하고 upsert (INSERT ... ON CONFLICT, 청크당 쿼리 1회)
+        같은 상품이 여러 번 들어오면 한 번만 저장
+        Returns:
+            저장된 OneOnePriceDto 목록 (상품 id 중복 제거 후 입력 순서)
+        """
+        unique_products = list({product['id']: product for product in products}.values())
+        rows = self.build_one_one_price_rows(unique_products)
+        saved = await self.one_one_price_repository.upsert_one_one_price_data_bulk(
+            rows, chunk_size=SETTINGS.ONE_ONE_PRICE_UPSERT_CHUNK_SIZE)
+        return [OneOnePriceDto.model_validate(obj) for obj in saved]
+
 
 class OneOnePriceCalculator:
     
@@ -100,6 +164,31 @@ class OneOnePriceCalculator:
         thousands = math.ceil(float(value) / 1000) * 1000
         return Decimal(str(thousands))
     
+    @staticmethod
+    def _roundup_to_thousands_array(values: np.ndarray) -> np.ndarray:
+        """_roundup_to_thousands의 정수 배열 버전 (float 변환 없이 정확한 올림)"""
+        return -(-values // 1000) * 1000
+
+    def calculate_prices_array(self, standard_prices: np.ndarray) -> dict[str, np.ndarray]:
+        """
+        정수 기준가 배열의 1+1 가격과 그룹별 가격을 한 번에 계산 (스칼라 계산기와 같은 결과)
+        Returns:
+            one_one, group_115, group_105, group_same, group_plus100 -> int64 배열
+        """
+        standard_prices = np.asarray(standard_prices, dtype=np.int64)
+        base_prices = np.where(standard_prices + 100 < 10000, standard_prices * 2 + 2000, standard_prices * 2 + 1000)
+        one_one = self._roundup_to_thousands_array(base_prices) - 100
+        # roundup(x * 1.15, -3) == ceil(x * 115 / 100000) * 1000 (정수 나눗셈으로 계산)
+        group_115 = -(-(one_one * 115) // 100000) * 1000 - 100
+        group_105 = -(-(one_one * 105) // 100000) * 1000 - 100
+        return {
+            'one_one': one_one,
+            'group_115': group_115,
+            'group_105': group_105,
+            'group_same': one_one,
+            'group_plus100': one_one + 100,
+        }
+
     def calculate_one_one_price(self, standard_price: Decimal) -> Decimal:
         """1+1 가격 계산"""
         # if(기준가 + 100 < 10000, roundup(기준가 * 2 + 2000, -3) - 100, roundup(기준가 * 2 + 1000, -3) - 100)
@@ -2,6 +2,7 @@ import requests
 import aiohttp
 from urllib.parse import urljoin
 from core.settings import SETTINGS
+from core.http_client import http_session
 from pathlib import Path
 from utils.logs.sabangnet_logger import get_logger
 from utils.make_xml.product_create_xml import ProductCreateXml
@@ -37,7 +38,7 @@ class ProductCreateService:
             # return response_text
             
             # 비동기 HTTP 요청으로 변경
-            async with aiohttp.ClientSession() as session:
+            async with http_session() as session:
                 async with session.get(full_url, timeout=aiohttp.ClientTimeout(total=30)) as response:
                     response_text = await response.text()
                     # 로그에는 전체 응답을 기록하되, 너무 길면 일부만 표시
@@ -49,6 +49,10 @@ class ProductReadService:
             raise ValueError(f"Product raw data not found: {product_nm}")
         return ProductRawDataDto.model_validate(res)
     
+    async def get_price_rows_by_product_nm_and_gubun_pairs(self, pairs: list[tuple[str, str]]) -> list[dict]:
+        """(상품명, 구분) 목록으로 가격 계산용 상품 정보(id, compayny_goods_cd, goods_price 등) 일괄 조회"""
+        return await self.product_repository.find_price_rows_by_product_nm_and_gubun_pairs(pairs)
+
     async def get_product_raw_data_all(self) -> list[ProductRawDataDto]:
         objects = await self.product_repository.get_product_raw_data_all()
         return [ProductRawDataDto.model_validate(obj) for obj in objects]
@@ -141,7 +141,7 @@ class ProductCodeRegistrationService:
             result['goods_price'] = self._get_selling_price(product_nm, gubun)
 
             result['stock_use_yn'] = "N"
-            logger.info(f"stock_use_yn 처리 - source_data: {self.source_data.get('stock_use_yn')}, result: {result['stock_use_yn']}")
+            logger.debug(f"stock_use_yn 처리 - source_data: {self.source_data.get('stock_use_yn')}, result: {result['stock_use_yn']}")
             
             # TAG가[필수] (AH)
             result['goods_consumer_price'] = self._get_tag_price(product_nm, gubun)
@@ -12,6 +12,7 @@ from .product_excel_function_service import ProductCodeRegistrationService
 from repository.product_registration_repository import ProductRegistrationRepository
 from repository.product_repository import ProductRepository
 from core.db import get_async_session
+from core.settings import SETTINGS
 from models.product.product_registration_data import ProductRegistrationRawData
 from repository.product_mycategory_repository import ProductMyCategoryRepository
 from services.product_registration.product_registration_service import ProductRegistrationService
@@ -41,7 +42,45 @@ class ProductCodeIntegratedService:
                 class_cd_dict[f'class_cd{level}'] = None
         return class_cd_dict
 
-    async def generate_and_save_all_product_code_data(self, limit: int = None, offset: int = None) -> Dict[str, Any]:
+    @staticmethod
+    def _get_class_cd_dict_from_maps(class_cd_maps: dict[int, dict[str, str]], reg_dict: dict) -> dict:
+        """get_class_cd_dict와 같은 결과를 미리 조회한 분류코드 매핑에서 만듦 (DB 조회 없음)"""
+        class_cd_dict = {}
+        for level in [1, 2, 3, 4]:
+            class_nm = reg_dict.get(f'class_nm{level}')
+            class_cd_dict[f'class_cd{level}'] = class_cd_maps[level].get(class_nm) if class_nm else None
+        return class_cd_dict
+
+    def _generate_product_code_rows(
+            self,
+            registration_data_list: List[ProductRegistrationRawData],
+            class_cd_maps: dict[int, dict[str, str]],
+    ) -> Tuple[List[Tuple[str, str, Dict[str, Any]]], List[Dict[str, Any]]]:
+        """
+        등록 데이터 전체를 (상품명, 구분, 품번코드 데이터) 목록으로 메모리에서 변환
+        Returns:
+            (생성된 행 목록, 실패 목록)
+        """
+        rows, failed = [], []
+        for reg in registration_data_list:
+            reg_dict = reg.to_dict() if hasattr(reg, 'to_dict') else dict(reg.__dict__)
+            product_nm = reg_dict.get('product_nm')
+            class_cd_dict = self._get_class_cd_dict_from_maps(class_cd_maps, reg_dict)
+            service = ProductCodeRegistrationService(reg_dict, class_cd_dict)
+            for gubun in ["마스터", "전문몰", "1+1"]:
+                try:
+                    code_data = service.generate_product_code_data(product_nm, gubun)
+                    if code_data.get('compayny_goods_cd'):
+                        rows.append((product_nm, gubun, code_data))
+                    else:
+                        logger.warning(f"company_goods_cd가 생성되지 않음: {product_nm} ({gubun})")
+                        failed.append({'product_nm': product_nm, 'gubun': gubun, 'error': 'company_goods_cd 생성 실패'})
+                except Exception as e:
+                    logger.error(f"[generate_and_save_all_product_code_data] Error processing product code for '{product_nm}' ({gubun}): {str(e)}")
+                    failed.append({'product_nm': product_nm, 'gubun': gubun, 'error': str(e)})
+        return rows, failed
+
+    async def generate_and_save_all_product_code_data(self, limit: int = None, offset: int = None, bulk: bool = True) -> Dict[str, Any]:
         """
         product_registration_raw_data 테이블에서 데이터를 읽어 generate_product_code_data로 변환 후,
         test_product_raw_data 테이블에 저장하는 비동기 통합 함수 (유효성 검증 제외)
@@ -49,6 +88,8 @@ class ProductCodeIntegratedService:
         Args:
             limit: 조회할 데이터 수 제한
             offset: 조회 시작 위치
+            bulk: True면 청크 단위 INSERT ... ON CONFLICT 로 한 번에 저장 (커밋 1회),
+                  False면 (상품, 구분)마다 upsert_product_raw_data 호출
         Returns:
             {'success': [제품명...], 'failed': [{'제품명', 'error'} ...]}
         """
@@ -62,60 +103,20 @@ class ProductCodeIntegratedService:
             
             # 1. Fetch all registration data
             registration_data_list: List[ProductRegistrationRawData] = await self.reg_repo.get_products_all(limit=limit)
-            
-            # 모든 데이터를 상세히 로깅
             logger.info(f"registration_data_list count: {len(registration_data_list)}")
-            for i, reg_data in enumerate(registration_data_list):
-                logger.info(f"Data {i+1}: {reg_data.to_dict()}")
-            
-            success, failed = [], []
-            updated_count, created_count = 0, 0
-            
-            # logger.info(f"registration_data_list log value: {registration_data_list}")
-            for reg in registration_data_list:
-                reg_dict = reg.to_dict() if hasattr(reg, 'to_dict') else dict(reg.__dict__)
-                logger.debug(f"모든 컬럼 값: {reg_dict}")
-                logger.info(f"stock_use_yn 값 확인: {reg_dict.get('stock_use_yn')}")
-                product_nm = reg_dict.get('product_nm')
-                # 여기서 메서드 호출
-                class_cd_dict = await self.get_class_cd_dict(product_mycategory_repo, reg_dict)
-                # logger.info(f"class_cd_dict for product_nm={product_nm}: {class_cd_dict}")
-                for gubun in ["마스터", "전문몰", "1+1"]:
-                    try:
-                        service = ProductCodeRegistrationService(reg_dict, class_cd_dict)
-                        code_data = service.generate_product_code_data(product_nm, gubun)
-                        
-                        # company_goods_cd로 upsert 수행
-                        company_goods_cd = code_data.get('compayny_goods_cd')
-                        if company_goods_cd:
-                            # upsert 메서드 사용
-                            upsert_result = await self.prod_repo.upsert_product_raw_data(code_data)
-                            if upsert_result['success']:
-                                if upsert_result['action'] == 'updated':
-                                    updated_count += 1
-                                else:
-                                    created_count += 1
-                                success.append({
-                                    'product_nm': product_nm, 
-                                    'gubun': gubun, 
-                                    'company_goods_cd': company_goods_cd,
-                                    'action': upsert_result['action']
-                                })
-                            else:
-                                failed.append({
-                                    'product_nm': product_nm, 
-                                    'gubun': gubun, 
-                                    'error': 'upsert 실패',
-                                    'company_goods_cd': company_goods_cd
-                                })
-                        else:
-                            logger.warning(f"company_goods_cd가 생성되지 않음: {product_nm} ({gubun})")
-                            failed.append({'product_nm': product_nm, 'gubun': gubun, 'error': 'company_goods_cd 생성 실패'})
-                            
-                    except Exception as e:
-                        logger.error(f"[generate_and_save_all_product_code_data] Error processing product code for '{product_nm}' ({gubun}): {str(e)}")
-                        failed.append({'product_nm': product_nm, 'gubun': gubun, 'error': str(e)})
 
+            # 2. 마이카테고리 분류코드를 한 번에 조회해서 전체 행을 메모리에서 생성
+            class_cd_maps = await product_mycategory_repo.get_class_cd_maps()
+            rows, failed = self._generate_product_code_rows(registration_data_list, class_cd_maps)
+
+            # 3. 저장
+            if bulk:
+                success = await self._bulk_upsert_product_code_rows(rows, failed)
+            else:
+                success = await self._upsert_product_code_rows_one_by_one(rows, failed)
+
+            created_count = sum(1 for item in success if item['action'] == 'created')
+            updated_count = len(success) - created_count
             logger.info(f"처리 완료 - 생성: {created_count}개, 업데이트: {updated_count}개, 실패: {len(failed)}개")
             return {
                 'success': success, 
@@ -128,6 +129,59 @@ class ProductCodeIntegratedService:
                 }
             }
 
+    async def _bulk_upsert_product_code_rows(self, rows: List[Tuple[str, str, Dict[str, Any]]], failed: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """생성된 행 전체를 한 번에 upsert (저장 실패 시 모든 행을 failed에 추가)"""
+        try:
+            actions = await self.prod_repo.bulk_upsert_product_raw_data(
+                [code_data for _, _, code_data in rows],
+                chunk_size=SETTINGS.PRODUCT_CODE_UPSERT_CHUNK_SIZE,
+            )
+        except Exception as e:
+            logger.error(f"[generate_and_save_all_product_code_data] Bulk upsert failed: {str(e)}")
+            for product_nm, gubun, code_data in rows:
+                failed.append({
+                    'product_nm': product_nm,
+                    'gubun': gubun,
+                    'error': str(e),
+                    'company_goods_cd': code_data['compayny_goods_cd']
+                })
+            return []
+        return [
+            {
+                'product_nm': product_nm,
+                'gubun': gubun,
+                'company_goods_cd': code_data['compayny_goods_cd'],
+                'action': actions[code_data['compayny_goods_cd']]
+            }
+            for product_nm, gubun, code_data in rows
+        ]
+
+    async def _upsert_product_code_rows_one_by_one(self, rows: List[Tuple[str, str, Dict[str, Any]]], failed: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """(상품, 구분)마다 upsert_product_raw_data 호출 (행마다 커밋)"""
+        success = []
+        for product_nm, gubun, code_data in rows:
+            company_goods_cd = code_data['compayny_goods_cd']
+            try:
+                upsert_result = await self.prod_repo.upsert_product_raw_data(code_data)
+                if upsert_result['success']:
+                    success.append({
+                        'product_nm': product_nm, 
+                        'gubun': gubun, 
+                        'company_goods_cd': company_goods_cd,
+                        'action': upsert_result['action']
+                    })
+                else:
+                    failed.append({
+                        'product_nm': product_nm, 
+                        'gubun': gubun, 
+                        'error': 'upsert 실패',
+                        'company_goods_cd': company_goods_cd
+                    })
+            except Exception as e:
+                logger.error(f"[generate_and_save_all_product_code_data] Error processing product code for '{product_nm}' ({gubun}): {str(e)}")
+                failed.append({'product_nm': product_nm, 'gubun': gubun, 'error': str(e)})
+        return success
+
     async def _process_excel_and_db_storage(self, file_path: str, sheet_name: str) -> Tuple[ExcelProcessResultDto, ProductRegistrationBulkResponseDto]:
         """1단계: Excel 파일 처리 및 DB 저장"""
         logger.info("1단계: Excel 파일 처리 및 DB 저장 시작")
@@ -28,7 +28,7 @@ from schemas.product_registration import (
 from services.usecase.product_db_xml_usecase import ProductDbXmlUsecase
 from services.product.product_create_service import ProductCreateService
 from utils.make_xml.product_registration_xml import ProductRegistrationXml
-from minio_handler import upload_file_to_minio, get_minio_file_url
+from minio_handler import upload_file_to_minio_async, get_minio_file_url
 from utils.make_xml.sabang_api_result_parser import SabangApiResultParser
 from utils.excels.excel_handler import ExcelHandler
 
@@ -234,7 +234,7 @@ class ProductRegistrationService:
             logger.info(f"XML 파일 생성 완료: {xml_file_path}, 총 {total_count}개 상품")
 
             # 2. 파일 서버 업로드
-            object_name = upload_file_to_minio(xml_file_path)
+            object_name = await upload_file_to_minio_async(xml_file_path)
             logger.info(f"MinIO에 업로드된 XML 파일 이름: {object_name}")
             xml_url = get_minio_file_url(object_name)
             logger.info(f"MinIO에 업로드된 XML URL: {xml_url}")
@@ -406,7 +406,7 @@ class ProductRegistrationService:
                 raise FileNotFoundError(f"XML 파일이 존재하지 않습니다: {xml_file_path}")
             
             # 1. 파일 서버 업로드
-            object_name = upload_file_to_minio(xml_path)
+            object_name = await upload_file_to_minio_async(xml_path)
             logger.info(f"MinIO에 업로드된 XML 파일 이름: {object_name}")
             xml_url = get_minio_file_url(object_name)
             logger.info(f"MinIO에 업로드된 XML URL: {xml_url}")
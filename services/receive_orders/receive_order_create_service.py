@@ -1,18 +1,25 @@
-import re
 import json
-import hashlib
+import uuid
+import random
+import asyncio
+import aiohttp
 import requests
-import xml.etree.ElementTree as ET
+
+from lxml import etree
 
 from pathlib import Path
 from decimal import Decimal
 from urllib.parse import urljoin
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
+from typing import AsyncIterator
 from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from core.settings import SETTINGS
+from core.offload import run_io
+from core.http_client import http_session
 from utils.logs.sabangnet_logger import get_logger
+from utils.pii_masking import RECEIVE_ORDER_MASKING_RULES, mask_record
 from utils.sabangnet_path_utils import SabangNetPathUtils
 from utils.make_xml.order_create_xml import OrderCreateXml
 from minio_handler import upload_file_to_minio, get_minio_file_url
@@ -31,19 +38,7 @@ class ReceiveOrderCreateService:
     """
     
     _JSON_PATH = SabangNetPathUtils.get_json_file_path()
-    _MASKING_RULES = {
-        'USER_NAME': 'name',
-        'RECEIVE_NAME': 'name',
-        'USER_ID': 'user_id',
-        'RECEIVE_TEL': 'phone',
-        'RECEIVE_CEL': 'phone',
-        'USER_CEL': 'phone',
-        'RECEIVE_ADDR': 'address',
-        'RECEIVE_ZIPCODE': 'zipcode',
-        'ORDER_ID': 'id',
-        'MALL_ORDER_ID': 'id',
-        'MALL_USER_ID': 'user_id'
-    }
+    _STREAM_CHUNK_SIZE = 64 * 1024
     _DECIMAL_FIELDS = [
         'total_cost',
         'pay_cost',
@@ -122,151 +117,303 @@ class ReceiveOrderCreateService:
             logger.error(f"order_date 변환 실패: {val} ({e})")
             return None
 
+    def _convert_order_detail(self, order_detail: dict, safe_mode: bool = True) -> dict:
+        """
+        소문자 필드명 주문 dict 하나를 receive_orders 저장용으로 변환 (마스킹, 기본 필드, 타입 변환)
+        """
+
+        # 마스킹 처리
+        if safe_mode:
+            mask_record(order_detail, RECEIVE_ORDER_MASKING_RULES)
+
+        # 기본 필드 추가
+        order_detail["receive_dt"] = datetime.now()
+
+        # 필드 타입 변환
+        for field in self._DECIMAL_FIELDS:
+            if field in order_detail:
+                try:
+                    order_detail[field] = Decimal(order_detail[field]) if order_detail[field] != '' else None
+                except Exception as e:
+                    logger.error(f"{field} Decimal 변환 실패: {order_detail[field]} ({e})")
+                    order_detail[field] = None
+
+        for field in self._INT_FIELDS:
+            if field in order_detail:
+                try:
+                    order_detail[field] = int(order_detail[field]) if order_detail[field] != '' else None
+                except Exception as e:
+                    logger.error(f"{field} int 변환 실패: {order_detail[field]} ({e})")
+                    order_detail[field] = None
+
+        for field in self._DATE_FIELDS:
+            if field in order_detail:
+                order_detail[field] = self._parse_date_field(order_detail[field])
+
+        return order_detail
+
     def _convert_json_to_order_list(self, json_orders: list[dict], safe_mode: bool = True) -> list[dict]:
         """
         JSON 데이터를 파싱하여 주문 리스트를 반환하는 함수.
         """
         
-        order_dict_list = []
-        for order in json_orders:
+        order_dict_list = [
             # 대소문자 변환
-            order_detail = {k.lower(): v for k, v in order.items()}
-            
-            # 마스킹 처리
-            if safe_mode:
-                for field_name, mask_type in self._MASKING_RULES.items():
-                    if field_name in order_detail and order_detail[field_name]:
-                        order_detail[field_name] = self._mask_personal_info(order_detail[field_name], mask_type)
-            
-            # 기본 필드 추가
-            order_detail["receive_dt"] = datetime.now()
-            
-            # 필드 타입 변환
-            for field in self._DECIMAL_FIELDS:
-                if field in order_detail:
-                    try:
-                        order_detail[field] = Decimal(order_detail[field]) if order_detail[field] != '' else None
-                    except Exception as e:
-                        logger.error(f"{field} Decimal 변환 실패: {order_detail[field]} ({e})")
-                        order_detail[field] = None
-            
-            for field in self._INT_FIELDS:
-                if field in order_detail:
-                    try:
-                        order_detail[field] = int(order_detail[field]) if order_detail[field] != '' else None
-                    except Exception as e:
-                        logger.error(f"{field} int 변환 실패: {order_detail[field]} ({e})")
-                        order_detail[field] = None
-            
-            for field in self._DATE_FIELDS:
-                if field in order_detail:
-                    order_detail[field] = self._parse_date_field(order_detail[field])
-            
-            # dict 형태로 직접 추가
-            order_dict_list.append(order_detail)
-        
+            self._convert_order_detail({k.lower(): v for k, v in order.items()}, safe_mode)
+            for order in json_orders
+        ]
         logger.info(f"총 {len(order_dict_list)}개의 주문을 변환했습니다.")
         return order_dict_list
 
-    def _parse_xml_to_order_list(self, xml_content: str, safe_mode: bool = True) -> list[dict]:
+    def _data_element_to_order(self, data_node: etree._Element, safe_mode: bool = True) -> dict:
+        """
+        <DATA> 요소 하나를 주문 dict로 변환
+        """
+
+        order_detail = {}
+        for elem in data_node:
+            # 주석/처리 지시문 노드 제외
+            if not isinstance(elem.tag, str):
+                continue
+            elem_tag = elem.tag.strip()
+            if elem_tag and elem.text:
+                # XML 태그명을 소문자로 변환해서 저장
+                order_detail[elem_tag.lower()] = elem.text.strip()
+        return self._convert_order_detail(order_detail, safe_mode)
+
+    def _new_order_xml_parser(self, encoding: str | None = None) -> etree.XMLPullParser:
+        """
+        <DATA> 요소가 끝날 때마다 이벤트를 내는 증분 파서 (외부 엔티티는 해석하지 않음)
+        """
+
+        return etree.XMLPullParser(
+            events=("end",), tag="DATA", encoding=encoding,
+            resolve_entities=False, no_network=True, huge_tree=True,
+        )
+
+    def _read_orders(self, parser: etree.XMLPullParser, safe_mode: bool = True) -> list[dict]:
+        """
+        파서에 쌓인 <DATA> 요소를 주문 dict로 변환하고, 변환한 요소는 메모리에서 제거
+        """
+
+        orders = []
+        for _, data_node in parser.read_events():
+            orders.append(self._data_element_to_order(data_node, safe_mode))
+            # 처리한 요소와 앞서 처리한 형제 요소를 지워서 트리가 커지지 않도록 함
+            data_node.clear(keep_tail=False)
+            parent = data_node.getparent()
+            if parent is not None:
+                while data_node.getprevious() is not None:
+                    del parent[0]
+        return orders
+
+    def _parse_xml_to_order_list(self, xml_content: str | bytes, safe_mode: bool = True) -> list[dict]:
         """
         XML을 파싱하여 주문 리스트를 반환하는 함수.
         """
         
-        root = ET.fromstring(xml_content)
-        order_dict_list = []
-        for data_node in root.findall('DATA'):
-            # 먼저 dict로 데이터 수집
-            order_detail = {}
-            for elem in data_node.findall('*'):
-                elem_tag = elem.tag.strip() if elem.tag else ''
-                elem_text = elem.text.strip() if elem.text else ''
-                if elem.tag and elem.text:
-                    if safe_mode and (elem_tag in self._MASKING_RULES):
-                        mask_type = self._MASKING_RULES[elem_tag]
-                        elem_text = self._mask_personal_info(elem_text, mask_type)
-                    # XML 태그명을 소문자로 변환해서 저장
-                    order_detail[elem_tag.lower()] = elem_text
-            
-            # 기본 필드 추가
-            order_detail["receive_dt"] = datetime.now()
-            
-            # 필드 타입 변환
-            for field in self._DECIMAL_FIELDS:
-                if field in order_detail:
-                    try:
-                        order_detail[field] = Decimal(order_detail[field]) if order_detail[field] != '' else None
-                    except Exception as e:
-                        logger.error(f"{field} Decimal 변환 실패: {order_detail[field]} ({e})")
-                        order_detail[field] = None
-            
-            for field in self._INT_FIELDS:
-                if field in order_detail:
-                    try:
-                        order_detail[field] = int(order_detail[field]) if order_detail[field] != '' else None
-                    except Exception as e:
-                        logger.error(f"{field} int 변환 실패: {order_detail[field]} ({e})")
-                        order_detail[field] = None
-            
-            for field in self._DATE_FIELDS:
-                if field in order_detail:
-                    order_detail[field] = self._parse_date_field(order_detail[field])
-            
-            # dict 형태로 직접 추가
-            order_dict_list.append(order_detail)
-        
+        parser = self._new_order_xml_parser()
+        parser.feed(xml_content)
+        parser.close()
+        order_dict_list = self._read_orders(parser, safe_mode)
         logger.info(f"총 {len(order_dict_list)}개의 주문을 파싱했습니다.")
         return order_dict_list
 
-    def _mask_personal_info(self, value: str, mask_type: str) -> str:
+    async def iter_order_batches_from_sabangnet(
+            self,
+            xml_url: str,
+            safe_mode: bool = True,
+            batch_size: int | None = None
+    ) -> AsyncIterator[list[dict]]:
         """
-        민감타입에 해당하는 개인정보를 마스킹 처리하는 함수.
+        사방넷 주문 수집 응답을 내려받는 대로 파싱해서 batch_size개씩 주문 dict 리스트를 흘려보냄.
+        응답 전체를 메모리에 올리지 않고, 변환이 끝난 <DATA> 요소는 바로 지움.
         """
 
-        if not value or value.strip() == '':
-            return value
-
-        if mask_type == 'name':
-            # 이름: 첫 글자만 보이고 나머지는 *
-            if len(value) <= 1:
-                return '*'
-            return value[0] + '*' * (len(value) - 1)
+        batch_size = batch_size or SETTINGS.RECEIVE_ORDER_STREAM_BATCH_SIZE
+        api_url = urljoin(SETTINGS.SABANG_ADMIN_URL, '/RTL_API/xml_order_info.html')
+        full_url = f"{api_url}?xml_url={xml_url}"
+        logger.info(f"최종 요청 URL(스트리밍): {full_url}")
+        timeout = aiohttp.ClientTimeout(
+            total=None, sock_connect=30, sock_read=SETTINGS.RECEIVE_ORDER_STREAM_READ_TIMEOUT)
+
+        batch: list[dict] = []
+        total_count = 0
+        async with http_session() as session:
+            async with session.get(full_url, timeout=timeout) as response:
+                response.raise_for_status()
+                # 응답 헤더에 charset이 있으면 사용, 없으면 XML 선언의 encoding을 따름
+                parser = self._new_order_xml_parser(encoding=response.charset)
+                async for chunk in response.content.iter_chunked(self._STREAM_CHUNK_SIZE):
+                    parser.feed(chunk)
+                    batch.extend(self._read_orders(parser, safe_mode))
+                    while len(batch) >= batch_size:
+                        total_count += batch_size
+                        yield batch[:batch_size]
+                        batch = batch[batch_size:]
+                parser.close()
+                batch.extend(self._read_orders(parser, safe_mode))
+        if batch:
+            total_count += len(batch)
+            yield batch
+        logger.info(f"총 {total_count}개의 주문을 스트리밍으로 파싱했습니다.")
+
+    @staticmethod
+    def split_date_windows(ord_st_date: str, ord_ed_date: str, window_days: int = 1) -> list[tuple[str, str]]:
+        """
+        YYYYMMDD 기간을 window_days일 단위 구간 목록으로 나눔 (양 끝 포함)
+        """
 
-        elif mask_type == 'phone':
-            # 전화번호: 중간 4자리를 ****로 마스킹
-            phone_digits = re.sub(r'[^0-9]', '', value)
-            if len(phone_digits) >= 8:
-                if len(phone_digits) == 11:  # 휴대폰
-                    return phone_digits[:3] + '****' + phone_digits[7:]
-                elif len(phone_digits) == 10:  # 일반전화
-                    return phone_digits[:3] + '****' + phone_digits[6:]
-            return '****'
+        start = datetime.strptime(ord_st_date, '%Y%m%d').date()
+        end = datetime.strptime(ord_ed_date, '%Y%m%d').date()
+        if start > end:
+            raise ValueError(f"주문 수집 시작일이 종료일보다 늦습니다. ({ord_st_date} > {ord_ed_date})")
 
-        elif mask_type == 'address':
-            # 주소: 상세주소 부분을 마스킹
-            parts = value.split()
-            if len(parts) > 2:
-                # 시/도, 시/군/구는 유지하고 상세주소는 마스킹
-                return ' '.join(parts[:2]) + ' ****'
-            return '****'
+        windows = []
+        window_start = start
+        while window_start <= end:
+            window_end = min(window_start + timedelta(days=max(window_days, 1) - 1), end)
+            windows.append((window_start.strftime('%Y%m%d'), window_end.strftime('%Y%m%d')))
+            window_start = window_end + timedelta(days=1)
+        return windows
 
-        elif mask_type == 'zipcode':
-            # 우편번호: 앞 3자리만 유지
-            if len(value) >= 3:
-                return value[:3] + '*' * (len(value) - 3)
-            return '*' * len(value)
+    def create_window_request_xml_url(self, ord_st_date: str, ord_ed_date: str, order_status: str) -> str:
+        """
+        구간별 요청 XML 생성 -> MinIO 업로드 -> URL 반환 (동시에 여러 구간을 만들므로 파일명을 구간별로 구분)
+        """
 
-        elif mask_type == 'id':
-            # ID: 해시값으로 대체 (일관성 유지를 위해)
-            return hashlib.md5(value.encode()).hexdigest()[:8]
+        file_name = f"order_create_request_{ord_st_date}_{ord_ed_date}_{order_status}_{uuid.uuid4().hex[:8]}.xml"
+        xml_file_path = self.create_request_xml(ord_st_date, ord_ed_date, order_status, file_name)
+        try:
+            return self.get_xml_url_from_minio(xml_file_path)
+        finally:
+            Path(xml_file_path).unlink(missing_ok=True)
+
+    async def _stream_window_orders(
+            self,
+            ord_st_date: str,
+            ord_ed_date: str,
+            order_status: str,
+            safe_mode: bool,
+            semaphore: asyncio.Semaphore,
+            queue: asyncio.Queue
+    ) -> None:
+        """
+        한 구간의 주문을 받는 대로 배치 단위로 queue에 넣음 (구간 전체를 메모리에 모으지 않음)
+        동시 실행 수는 semaphore로 제한, 실패 시 지수 백오프 재시도 (재시도 때는 이미 넘긴 주문은 건너뜀)
+        """
 
-        elif mask_type == 'user_id':
-            # 사용자 ID: 앞 2자리만 유지
-            if len(value) > 2:
-                return value[:2] + '*' * (len(value) - 2)
-            return '*' * len(value)
+        max_retries = max(SETTINGS.RECEIVE_ORDER_COLLECT_MAX_RETRIES, 1)
+        backoff = SETTINGS.RECEIVE_ORDER_COLLECT_RETRY_BACKOFF
+        xml_url = None
+        delivered_idx: set[str] = set()
+        async with semaphore:
+            for attempt in range(1, max_retries + 1):
+                try:
+                    if xml_url is None:
+                        xml_url = await run_io(
+                            self.create_window_request_xml_url, ord_st_date, ord_ed_date, order_status)
+                    order_count = 0
+                    async for batch in self.iter_order_batches_from_sabangnet(xml_url, safe_mode):
+                        order_count += len(batch)
+                        new_orders = [order for order in batch if order.get('idx') not in delivered_idx]
+                        delivered_idx.update(order.get('idx') for order in new_orders)
+                        if new_orders:
+                            await queue.put(new_orders)
+                    logger.info(f"주문 수집 구간 완료: {ord_st_date}~{ord_ed_date} ({order_count}건)")
+                    return
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    if attempt >= max_retries:
+                        logger.error(f"주문 수집 구간 실패: {ord_st_date}~{ord_ed_date} ({attempt}회 시도) {e}")
+                        raise
+                    delay = backoff * (2 ** (attempt - 1)) + random.uniform(0, backoff)
+                    logger.warning(
+                        f"주문 수집 구간 재시도: {ord_st_date}~{ord_ed_date} "
+                        f"({attempt}/{max_retries}, {delay:.1f}초 후) {e}")
+                    await asyncio.sleep(delay)
+
+    async def collect_orders_to_db(
+            self,
+            ord_st_date: str,
+            ord_ed_date: str,
+            order_status: str,
+            safe_mode: bool = True
+    ) -> ReceiveOrdersBulkCreateResponse:
+        """
+        주문 수집 기간을 일 단위 구간으로 나눠 동시에(최대 RECEIVE_ORDER_COLLECT_CONCURRENCY개) 수집하고,
+        구간마다 스트리밍으로 파싱한 배치를 받는 대로 idx 중복을 제거해서 DB에 저장하는 함수.
+        다운로드/파싱(구간별 생산자)과 DB 저장(소비자 하나, 세션 하나)을 나눠서 저장하는 동안에도 다운로드가 이어지고,
+        대기 배치 수를 제한해서 메모리는 수집 기간과 관계없이 일정함. 배치마다 커밋됨.
+        재시도 후에도 실패한 구간이 있으면 나머지 구간은 저장하고 success=False로 반환.
+        """
 
-        return value
+        windows = self.split_date_windows(ord_st_date, ord_ed_date, SETTINGS.RECEIVE_ORDER_COLLECT_WINDOW_DAYS)
+        logger.info(f"주문 수집 시작: {ord_st_date}~{ord_ed_date} ({len(windows)}개 구간, 상태: {order_status})")
+        concurrency = max(SETTINGS.RECEIVE_ORDER_COLLECT_CONCURRENCY, 1)
+        semaphore = asyncio.Semaphore(concurrency)
+        # 다운로드가 저장보다 너무 앞서가지 않도록 대기 배치 수 제한 (메모리 상한)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+        failed_windows: list[tuple[str, str]] = []
+
+        async def _produce(window_start: str, window_end: str) -> None:
+            try:
+                await self._stream_window_orders(
+                    window_start, window_end, order_status, safe_mode, semaphore, queue)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                failed_windows.append((window_start, window_end))
+            # 구간 끝 표시
+            await queue.put(None)
+
+        producers = [
+            asyncio.create_task(_produce(window_start, window_end)) for window_start, window_end in windows
+        ]
+
+        seen_idx: set[str] = set()
+        total_count = 0
+        success_count = 0
+        finished_windows = 0
+        try:
+            while finished_windows < len(producers):
+                batch = await queue.get()
+                if batch is None:
+                    finished_windows += 1
+                    continue
+                # 구간 경계에 걸친 주문 등 이미 받은 idx는 제외
+                unique_orders = []
+                for order in batch:
+                    idx = order.get('idx')
+                    if idx is not None and idx in seen_idx:
+                        continue
+                    seen_idx.add(idx)
+                    unique_orders.append(order)
+                total_count += len(batch)
+                if unique_orders:
+                    success_models = await self.receive_orders_repository.bulk_insert_orders(
+                        unique_orders, commit=False)
+                    await self.session.commit()
+                    success_count += len(success_models)
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"주문 수집 저장 중 오류: {e} (저장 완료 {success_count}/{total_count}건)")
+            raise
+        finally:
+            for producer in producers:
+                producer.cancel()
+            await asyncio.gather(*producers, return_exceptions=True)
+
+        if failed_windows:
+            logger.error(f"주문 수집 실패 구간: {sorted(failed_windows)}")
+        logger.info(f"주문 수집 완료: {total_count}개 수집, {success_count}개 저장, 실패 구간 {len(failed_windows)}개")
+        return ReceiveOrdersBulkCreateResponse(
+            success=not failed_windows,
+            total_count=total_count,
+            success_count=success_count,
+            duplicated_count=total_count - success_count,
+        )
 
     async def save_orders_to_db_from_xml(self, xml_content: str, safe_mode: bool = True) -> ReceiveOrdersBulkCreateResponse:
         """
@@ -285,7 +432,7 @@ class ReceiveOrderCreateService:
                 success_count=len(success_models),
                 duplicated_count=len(order_dict_list) - len(success_models),
             )
-        except ET.ParseError as e:
+        except etree.XMLSyntaxError as e:
             logger.error(f"XML 파싱 오류: {e}")
             raise
         except Exception as e:
@@ -323,7 +470,7 @@ class ReceiveOrderCreateService:
                 success_count=len(receive_orders_dto_list),
                 duplicated_count=len(receive_orders_dict_list) - len(receive_orders_dto_list),
             )
-        except ET.ParseError as e:
+        except etree.XMLSyntaxError as e:
             logger.error(f"XML 파싱 오류: {e}")
             raise
         except Exception as e:
@@ -345,7 +492,8 @@ class ReceiveOrderCreateService:
         with open(json_file_path, "r", encoding="utf-8") as f:
             raw_order_data_list: list[dict] = json.load(f)
         
-        order_data_list = self._convert_json_to_order_list(raw_order_data_list)
+        # JSON 파일은 save_orders_to_json_from_xml에서 이미 마스킹된 상태로 저장되므로 다시 마스킹하지 않음
+        order_data_list = self._convert_json_to_order_list(raw_order_data_list, safe_mode=False)
         success_models = await self.receive_orders_repository.bulk_insert_orders(order_data_list)
         logger.info(f"저장된 주문 수: {len(success_models)}")
 
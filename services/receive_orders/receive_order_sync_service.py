@@ -0,0 +1,174 @@
+import asyncio
+import contextlib
+
+from datetime import datetime, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.settings import SETTINGS
+from core.db import AsyncSessionLocal
+from core.offload import run_io
+from utils.logs.sabangnet_logger import get_logger
+from repository.receive_orders_repository import ReceiveOrdersRepository
+from repository.receive_order_sync_state_repository import ReceiveOrderSyncStateRepository
+from services.receive_orders.receive_order_create_service import ReceiveOrderCreateService
+
+from schemas.receive_orders.response.receive_orders_response import ReceiveOrdersBulkCreateResponse
+
+
+logger = get_logger(__name__)
+
+
+class ReceiveOrderSyncService:
+    """
+    주문 증분 수집 서비스
+
+    주문 상태별로 마지막으로 저장한 주문의 reg_date/idx(워터마크)를 저장해 두고,
+    워터마크에서 RECEIVE_ORDER_SYNC_OVERLAP_MINUTES 만큼 겹쳐서 그 이후 주문만 저장합니다.
+    주문 저장과 워터마크 갱신은 한 트랜잭션으로 커밋되므로 저장에 실패하면 워터마크도 그대로입니다.
+
+    워커 간 중복 수집은 상태 행의 수집 중 표시(sync_started_at)로 막습니다.
+    표시는 짧은 트랜잭션으로 먼저 커밋하고, 사방넷 다운로드 동안에는 행을 잠그지 않으며
+    워터마크를 갱신하는 마지막 순간에만 행을 잠급니다.
+
+    사방넷 주문 수집 API는 일(YYYYMMDD) 단위로만 조회되므로 요청 구간은 워터마크 날짜 ~ 오늘이고,
+    워터마크 이전 주문은 파싱 직후 걸러서 DB에는 보내지 않습니다.
+    """
+
+    _REG_DATE_FORMAT = '%Y%m%d%H%M%S'
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self.receive_order_create_service = ReceiveOrderCreateService(session)
+        self.receive_orders_repository = ReceiveOrdersRepository(session)
+        self.sync_state_repository = ReceiveOrderSyncStateRepository(session)
+
+    def _get_sync_since(self, last_reg_date: str | None, now: datetime) -> datetime:
+        """이번 수집 시작 시각 (워터마크 - 겹침, 워터마크가 없으면 최초 수집 기간)"""
+        if last_reg_date:
+            try:
+                watermark = datetime.strptime(last_reg_date, self._REG_DATE_FORMAT)
+                return watermark - timedelta(minutes=SETTINGS.RECEIVE_ORDER_SYNC_OVERLAP_MINUTES)
+            except ValueError:
+                logger.warning(f"워터마크 형식 오류, 최초 수집 기간으로 수집: {last_reg_date}")
+        return now - timedelta(days=SETTINGS.RECEIVE_ORDER_SYNC_INITIAL_DAYS)
+
+    async def sync_orders(self, order_status: str, safe_mode: bool = True) -> ReceiveOrdersBulkCreateResponse | None:
+        """
+        주문 상태 하나의 워터마크 이후 주문을 수집/저장하고 워터마크를 앞으로 이동.
+        다른 워커가 같은 상태를 수집 중이면 건너뛰고 None 반환.
+        """
+
+        # 1. 수집 중 표시만 짧은 트랜잭션으로 커밋 (다운로드 동안 상태 행을 잠그지 않음)
+        try:
+            state = await self.sync_state_repository.claim_state(order_status, SETTINGS.RECEIVE_ORDER_SYNC_LEASE_SECONDS)
+            if state is None:
+                logger.info(f"주문 증분 수집 건너뜀 (다른 워커가 수집 중): 상태 {order_status}")
+                await self.session.rollback()
+                return None
+            claimed_at = state.sync_started_at
+            last_reg_date = state.last_reg_date
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"주문 증분 수집 시작 실패: 상태 {order_status}, {e}")
+            raise
+
+        # 2. 다운로드/저장 후 워터마크 갱신 + 표시 해제를 한 트랜잭션으로 커밋
+        try:
+            now = datetime.now()
+            since = self._get_sync_since(last_reg_date, now)
+            since_reg_date = since.strftime(self._REG_DATE_FORMAT)
+            ord_st_date = since.strftime('%Y%m%d')
+            ord_ed_date = now.strftime('%Y%m%d')
+            logger.info(
+                f"주문 증분 수집 시작: 상태 {order_status}, 워터마크 {last_reg_date}, "
+                f"{since_reg_date} 이후 주문 저장 (요청 구간 {ord_st_date}~{ord_ed_date})")
+
+            xml_url = await run_io(
+                self.receive_order_create_service.create_window_request_xml_url,
+                ord_st_date, ord_ed_date, order_status)
+
+            total_count = 0
+            success_count = 0
+            last_mark: tuple[str, str] | None = None
+            async for batch in self.receive_order_create_service.iter_order_batches_from_sabangnet(xml_url, safe_mode):
+                # reg_date가 없는 주문은 판단할 수 없으므로 저장 (중복은 DB에서 무시)
+                new_orders = [order for order in batch if (order.get('reg_date') or since_reg_date) >= since_reg_date]
+                if not new_orders:
+                    continue
+                total_count += len(new_orders)
+                success_models = await self.receive_orders_repository.bulk_insert_orders(new_orders, commit=False)
+                success_count += len(success_models)
+                batch_mark = max(
+                    ((order['reg_date'], order.get('idx') or '') for order in new_orders if order.get('reg_date')),
+                    default=None,
+                )
+                if batch_mark and (last_mark is None or batch_mark > last_mark):
+                    last_mark = batch_mark
+
+            state = await self.sync_state_repository.lock_state(order_status)
+            await self.sync_state_repository.advance(
+                state,
+                last_reg_date=last_mark[0] if last_mark else None,
+                last_idx=last_mark[1] if last_mark else None,
+                synced_count=success_count,
+                synced_at=now,
+            )
+            await self.sync_state_repository.release_claim(order_status, claimed_at)
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            logger.error(f"주문 증분 수집 실패: 상태 {order_status}, {e}")
+            await self._release_claim_after_failure(order_status, claimed_at)
+            raise
+
+        logger.info(
+            f"주문 증분 수집 완료: 상태 {order_status}, {total_count}개 수집, {success_count}개 저장, "
+            f"워터마크 {state.last_reg_date}")
+        return ReceiveOrdersBulkCreateResponse(
+            success=True,
+            total_count=total_count,
+            success_count=success_count,
+            duplicated_count=total_count - success_count,
+        )
+
+
+    async def _release_claim_after_failure(self, order_status: str, claimed_at: datetime) -> None:
+        """수집 실패 시 다음 주기에 바로 다시 수집하도록 표시 해제 (실패해도 lease가 지나면 다시 수집)"""
+        try:
+            await self.sync_state_repository.release_claim(order_status, claimed_at)
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            logger.warning(f"주문 증분 수집 표시 해제 실패: 상태 {order_status}, {e}")
+
+
+def get_sync_order_statuses() -> list[str]:
+    """증분 수집 대상 주문 상태 목록 (RECEIVE_ORDER_SYNC_ORDER_STATUSES, 콤마 구분)"""
+    return [status.strip() for status in SETTINGS.RECEIVE_ORDER_SYNC_ORDER_STATUSES.split(',') if status.strip()]
+
+
+async def run_receive_order_sync_once(order_statuses: list[str], safe_mode: bool = True) -> None:
+    """주문 상태별로 한 번씩 증분 수집 (상태별 세션/트랜잭션 분리, 한 상태가 실패해도 나머지는 진행)"""
+    for order_status in order_statuses:
+        try:
+            async with AsyncSessionLocal() as session:
+                await ReceiveOrderSyncService(session).sync_orders(order_status, safe_mode)
+        except Exception as e:
+            logger.error(f"주문 증분 수집 중 오류 (상태 {order_status}): {e}")
+
+
+async def run_receive_order_sync_worker(
+        order_statuses: list[str],
+        interval: float,
+        safe_mode: bool = True,
+        stop_event: asyncio.Event | None = None
+) -> None:
+    """interval초마다 증분 수집을 반복 (stop_event가 설정되거나 태스크가 취소되면 종료)"""
+    stop_event = stop_event or asyncio.Event()
+    logger.info(f"주문 증분 수집 워커 시작: 상태 {order_statuses}, 주기 {interval}초")
+    while not stop_event.is_set():
+        await run_receive_order_sync_once(order_statuses, safe_mode)
+        with contextlib.suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(stop_event.wait(), timeout=interval)
+    logger.info("주문 증분 수집 워커 종료")
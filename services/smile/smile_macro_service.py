@@ -1,3 +1,4 @@
+import asyncio
 import pandas as pd
 import os
 import random
@@ -6,6 +7,7 @@ from datetime import datetime, date, timedelta
 from typing import Optional, List, Dict, Any, Tuple
 from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
+from core.offload import run_io
 from utils.logs.sabangnet_logger import get_logger
 from utils.macros.smile.smile_macro_handler import SmileMacroHandler
 from utils.macros.smile.smile_common_utils import SmileCommonUtils
@@ -27,7 +29,7 @@ from schemas.macro_batch_processing.request.batch_process_request import BatchPr
 from schemas.macro_batch_processing.batch_process_dto import BatchProcessDto
 from schemas.receive_orders.request.receive_orders_request import BaseDateRangeRequest
 from services.macro_batch_processing.batch_info_create_service import BatchInfoCreateService
-from minio_handler import upload_and_get_url_and_size, url_arrange
+from minio_handler import upload_and_get_url_and_size_async, url_arrange
 from models.smile.smile_macro import SmileMacro
 logger = get_logger(__name__)
 
@@ -343,7 +345,8 @@ class SmileMacroService:
             sku_df = await self.get_sku_data_from_db()
             
             # 매크로 핸들러 초기화 (데이터베이스 리포지토리 전달)
-            macro_handler = SmileMacroHandler.from_file(
+            macro_handler = await run_io(
+                SmileMacroHandler.from_file,
                 file_path, 
                 erp_repository=self.erp_repository,
                 settlement_repository=self.settlement_repository
@@ -367,7 +370,7 @@ class SmileMacroService:
             self.logger.info(f"1-5단계 처리 후 데이터 행 수: {after_stage_5_rows}")
             
             # 6-8단계 처리
-            stage_6_8_success = macro_handler.process_stage_6_to_8(sku_df)
+            stage_6_8_success = await run_io(macro_handler.process_stage_6_to_8, sku_df)
             if not stage_6_8_success:
                 return SmileMacroResponseDto(
                     success=False,
@@ -384,10 +387,10 @@ class SmileMacroService:
             self.logger.info(f"6-8단계 처리 후 데이터 행 수: {after_stage_8_rows}")
             
             # A 컬럼을 기준으로 데이터 분리, Header 변경
-            a_handler, g_handler = self._split_data_by_column_a(macro_handler)
+            a_handler, g_handler = await run_io(self._split_data_by_column_a, macro_handler)
 
-            # A 데이터 값 변경
-            SmileCommonUtils.transform_column_a_data(macro_handler.ws)
+            # A 데이터 값 변경 (행 단위 변환이라 다른 단계와 같이 이벤트 루프 밖에서)
+            await run_io(SmileCommonUtils.transform_column_a_data, macro_handler.ws)
             # macro_handler data를 smile_macro DB에 저장하고 데이터 반환
             smile_macro_data_list = await self.save_macro_handler_to_db(macro_handler)
             
@@ -412,10 +415,10 @@ class SmileMacroService:
             # 전체 파일 저장
         
             # A 데이터 파일 저장
-            a_saved_path = self._save_data_file(a_handler, 'A', file_path)
+            a_saved_path = await run_io(self._save_data_file, a_handler, 'A', file_path)
             
             # G 데이터 파일 저장
-            g_saved_path = self._save_data_file(g_handler, 'G', file_path)
+            g_saved_path = await run_io(self._save_data_file, g_handler, 'G', file_path)
             
             # 처리된 행 수 계산
             a_processed_rows, g_processed_rows, _, total_processed_rows = self._calculate_processed_rows(a_handler, g_handler, [])
@@ -522,7 +525,7 @@ class SmileMacroService:
             
             # 파일 합치기
             from utils.excels.excel_handler import ExcelHandler
-            merged_file_path = ExcelHandler.merge_excel_files_smart(file_paths)
+            merged_file_path = await run_io(ExcelHandler.merge_excel_files_smart, file_paths)
             
             # 배치 프로세스 생성 (order_date_from/to를 date_from/to로 저장)
             batch_id = None
@@ -576,7 +579,8 @@ class SmileMacroService:
             sku_df = await self.get_sku_data_from_db()
             
             # 매크로 핸들러 초기화 (데이터베이스 리포지토리 전달)
-            macro_handler = SmileMacroHandler.from_file(
+            macro_handler = await run_io(
+                SmileMacroHandler.from_file,
                 merged_file_path, 
                 erp_repository=self.erp_repository,
                 settlement_repository=self.settlement_repository
@@ -596,7 +600,7 @@ class SmileMacroService:
             self.logger.info(f"1-5단계 처리 후 데이터 행 수: {after_stage_5_rows}")
             
             # 6-8단계 처리
-            stage_6_8_success = macro_handler.process_stage_6_to_8(sku_df)
+            stage_6_8_success = await run_io(macro_handler.process_stage_6_to_8, sku_df)
             if not stage_6_8_success:
                 raise Exception("6-8단계 처리 중 오류가 발생했습니다.")
             
@@ -609,10 +613,10 @@ class SmileMacroService:
             self.logger.info(f"6-8단계 처리 후 데이터 행 수: {after_stage_8_rows}")
             
             # A 컬럼을 기준으로 데이터 분리, Header 변경
-            a_handler, g_handler = self._split_data_by_column_a(macro_handler)
+            a_handler, g_handler = await run_io(self._split_data_by_column_a, macro_handler)
 
-            # A 데이터 값 변경
-            SmileCommonUtils.transform_column_a_data(macro_handler.ws)
+            # A 데이터 값 변경 (행 단위 변환이라 다른 단계와 같이 이벤트 루프 밖에서)
+            await run_io(SmileCommonUtils.transform_column_a_data, macro_handler.ws)
             
             # macro_handler를 smile_macro DB에 smile_erp 저장 (batch_id 포함)
             smile_macro_data_list = await self.save_macro_handler_to_db_v2(macro_handler, batch_id)
@@ -626,13 +630,13 @@ class SmileMacroService:
             await self.save_macro_handler_to_down_form_order(smile_macro_data_list_bundle, batch_id_bundle, 'smile_bundle')
 
             # A 데이터 파일 저장
-            a_saved_path = self._save_data_file(a_handler, 'A', merged_file_path)
+            a_saved_path = await run_io(self._save_data_file, a_handler, 'A', merged_file_path)
             # G 데이터 파일 저장
-            g_saved_path = self._save_data_file(g_handler, 'G', merged_file_path)
+            g_saved_path = await run_io(self._save_data_file, g_handler, 'G', merged_file_path)
             # full 데이터 파일 저장
-            full_saved_path = self._save_data_file(macro_handler, 'full', merged_file_path)
+            full_saved_path = await run_io(self._save_data_file, macro_handler, 'full', merged_file_path)
             # bundle 데이터 파일 저장
-            bundle_saved_path = self._save_bundle_data_to_excel(smile_macro_data_list_bundle, 'bundle', merged_file_path)
+            bundle_saved_path = await run_io(self._save_bundle_data_to_excel, smile_macro_data_list_bundle, 'bundle', merged_file_path)
             
             # 처리된 행 수 계산
             a_processed_rows, g_processed_rows, bundle_processed_rows, total_processed_rows = self._calculate_processed_rows(a_handler, g_handler, smile_macro_data_list_bundle)
@@ -720,7 +724,7 @@ class SmileMacroService:
             
             # 파일 합치기
             from utils.excels.excel_handler import ExcelHandler
-            merged_file_path = ExcelHandler.merge_excel_files_smart(file_paths)
+            merged_file_path = await run_io(ExcelHandler.merge_excel_files_smart, file_paths)
             
             # 합쳐진 파일로 매크로 처리 (동기적으로 처리)
             result = await self.process_smile_macro_with_db(merged_file_path, None, request_obj)
@@ -744,7 +748,7 @@ class SmileMacroService:
                     (result.output_path, 'a'),
                     (result.output_path2, 'g')
                 ]
-                upload_result = self._upload_multiple_files_to_minio(files_info)
+                upload_result = await self._upload_multiple_files_to_minio(files_info)
                 
                 # 결과에서 URL과 정보 추출
                 a_file_url = upload_result.get('a_file_url')
@@ -1109,7 +1113,7 @@ class SmileMacroService:
             df.to_excel(temp_file.name, index=False)
             
             # MinIO에 업로드
-            upload_result = self._upload_single_file_to_minio(
+            upload_result = await self._upload_single_file_to_minio(
                 temp_file.name, "smile_macro_full", "full"
             )
             full_file_url = upload_result.get('full_file_url')
@@ -1185,7 +1189,7 @@ class SmileMacroService:
             ]
             
             # 다중 파일 업로드
-            result = self._upload_multiple_files_to_minio(files_info)
+            result = await self._upload_multiple_files_to_minio(files_info)
             
             return result
             
@@ -1443,7 +1447,7 @@ class SmileMacroService:
         
         return a_processed_rows, g_processed_rows, bundle_processed_rows, total_processed_rows
 
-    def _upload_single_file_to_minio(self, file_path: str, template_code: str, file_type: str) -> dict:
+    async def _upload_single_file_to_minio(self, file_path: str, template_code: str, file_type: str) -> dict:
         """
         단일 파일을 MinIO에 업로드하는 메서드
         
@@ -1457,7 +1461,7 @@ class SmileMacroService:
         """
         try:
             file_name = os.path.basename(file_path)
-            file_url, minio_object_name, file_size = upload_and_get_url_and_size(
+            file_url, minio_object_name, file_size = await upload_and_get_url_and_size_async(
                 file_path, template_code, file_name
             )
             file_url = url_arrange(file_url)
@@ -1471,9 +1475,9 @@ class SmileMacroService:
             self.logger.error(f"{file_type} 파일 MinIO 업로드 실패: {str(e)}")
             raise e
     
-    def _upload_multiple_files_to_minio(self, files_info: List[tuple]) -> dict:
+    async def _upload_multiple_files_to_minio(self, files_info: List[tuple]) -> dict:
         """
-        여러 파일을 MinIO에 업로드하는 메서드
+        여러 파일을 MinIO에 동시에 업로드하는 메서드
         
         Args:
             files_info: [(file_path, file_type), ...] 형태의 파일 정보 리스트
@@ -1485,10 +1489,10 @@ class SmileMacroService:
             template_code = "smile_macro"
             result = {}
             
+            uploads = []
             for file_path, file_type in files_info:
                 if file_path and os.path.exists(file_path):
-                    upload_result = self._upload_single_file_to_minio(file_path, template_code, file_type)
-                    result.update(upload_result)
+                    uploads.append(self._upload_single_file_to_minio(file_path, template_code, file_type))
                 else:
                     self.logger.warning(f"{file_type} 파일이 존재하지 않습니다: {file_path}")
                     # 빈 값으로 설정
@@ -1496,6 +1500,9 @@ class SmileMacroService:
                     result[f'{file_type}_minio_object_name'] = None
                     result[f'{file_type}_file_size'] = 0
             
+            for upload_result in await asyncio.gather(*uploads):
+                result.update(upload_result)
+            
             return result
             
         except Exception as e:
@@ -4,11 +4,19 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from repository.export_templates_repository import ExportTemplateRepository
 from repository.template_column_mapping_repository import TemplateColumnMappingRepository
 from utils.logs.sabangnet_logger import get_logger
+from utils.mappings.formula_engine import compile_formula, is_formula_source
 
 logger = get_logger(__name__)
 
 
 class TemplateMappingService:
+
+    # convert_name(delivery_method_str) 수식에서 그대로 남기는 배송방법
+    _DELIVERY_METHOD_NAMES = {
+        '선결제': '선결제',
+        '착불': '착불',
+    }
+
     def __init__(self, session: AsyncSession):
         self.session = session
         self.export_template_repository = ExportTemplateRepository(session)
@@ -168,7 +176,7 @@ class TemplateMappingService:
 
     def _apply_formula(self, df: pd.DataFrame, source: str, transform_config: dict) -> pd.Series:
         """
-        수식 적용 (간단한 구현)
+        수식 적용 (formula_engine으로 컴파일한 수식을 컬럼 단위로 계산)
         
         Args:
             df: DataFrame
@@ -176,29 +184,15 @@ class TemplateMappingService:
             transform_config: 변환 설정
             
         Returns:
-            계산된 Series
+            계산된 Series (계산할 수 없는 수식이면 빈 문자열 Series, 계산할 수 없는 행(0으로 나누기 등)만 None)
         """
+        if not is_formula_source(source):
+            return pd.Series([''] * len(df), index=df.index)
         try:
             if source == "convert_name(delivery_method_str)":
-                # 배송방법 변환 예시
-                return df.get('delivery_method_str', '').map({
-                    '선결제': '선결제',
-                    '착불': '착불'
-                }).fillna('')
-            elif source == "mall_won_cost * sale_cnt":
-                # 정산예정금액 계산
-                mall_won_cost = df.get('mall_won_cost', 0)
-                sale_cnt = df.get('sale_cnt', 0)
-                return mall_won_cost * sale_cnt
-            elif source == "pay_cost - mall_won_cost * sale_cnt":
-                # 서비스이용료 계산
-                pay_cost = df.get('pay_cost', 0)
-                mall_won_cost = df.get('mall_won_cost', 0)
-                sale_cnt = df.get('sale_cnt', 0)
-                return pay_cost - (mall_won_cost * sale_cnt)
-            else:
-                # 기본적으로 빈 값 반환
-                return pd.Series([''] * len(df))
+                # 배송방법 변환 (알려진 배송방법만 남기고 나머지는 빈 값, 기존 동작 유지)
+                return df['delivery_method_str'].map(self._DELIVERY_METHOD_NAMES).fillna('')
+            return compile_formula(source).evaluate(df)
         except Exception as e:
             logger.error(f"수식 적용 실패: {source}, {str(e)}")
-            return pd.Series([''] * len(df))
+            return pd.Series([''] * len(df), index=df.index)
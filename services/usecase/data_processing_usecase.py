@@ -4,9 +4,13 @@ import unicodedata
 import re
 import os
 import pandas as pd
+from pathlib import Path
 from datetime import datetime
 from fastapi import UploadFile
 from typing import Any, Optional
+# core
+from core.settings import SETTINGS
+from core.offload import run_io, run_cpu
 # util
 from utils.excels.convert_xlsx import ConvertXlsx
 from utils.logs.sabangnet_logger import get_logger
@@ -34,10 +38,11 @@ from services.down_form_orders.template_config_read_service import TemplateConfi
 from services.down_form_orders.down_form_order_create_service import DownFormOrderCreateService
 from services.export_templates.export_templates_read_service import ExportTemplatesReadService
 from services.macro_batch_processing.batch_info_create_service import BatchInfoCreateService
+from services.macro_batch_processing.macro_result_cache_service import MacroResultCacheService
 from services.vlookup_datas.vlookup_datas_read_service import VlookupDatasReadService
 from services.vlookup_datas.vlookup_datas_create_service import VlookupDatasCreateService
 # file
-from minio_handler import temp_file_to_object_name, delete_temp_file, upload_and_get_url_and_size, url_arrange
+from minio_handler import temp_file_to_object_name, delete_temp_file, upload_and_get_url_and_size_async, upload_many_and_get_url_and_size_async, url_arrange
 
 
 logger = get_logger(__name__)
@@ -55,6 +60,7 @@ class DataProcessingUsecase:
         self.export_templates_read_service = ExportTemplatesReadService(
             session)
         self.batch_info_create_service = BatchInfoCreateService(session)
+        self.macro_result_cache_service = MacroResultCacheService(session)
         self.order_create_service = ReceiveOrderCreateService(session)
         self.vlookup_datas_read_service = VlookupDatasReadService(session)
         self.vlookup_datas_create_service = VlookupDatasCreateService(session)
@@ -220,17 +226,14 @@ class DataProcessingUsecase:
         date_from = filters.get('date_from').strftime('%Y%m%d')
         date_to = filters.get('date_to').strftime('%Y%m%d')
         order_status = STATUS_LABEL_TO_CODE[filters.get('order_status')].value
-        xml_file_path = self.order_create_service.create_request_xml(
+        safe_mode = os.getenv("DEPLOY_ENV", "production") != "production"
+        # 기간을 일 단위 구간으로 나눠 동시에 수집 (구간별 요청 XML 생성/업로드/재시도 포함)
+        receive_orders_saved = await self.order_create_service.collect_orders_to_db(
             ord_st_date=date_from,
             ord_ed_date=date_to,
-            order_status=order_status
+            order_status=order_status,
+            safe_mode=safe_mode
         )
-        xml_url = self.order_create_service.get_xml_url_from_minio(
-            xml_file_path)
-        xml_content = self.order_create_service.get_orders_from_sabangnet(
-            xml_url)
-        safe_mode = os.getenv("DEPLOY_ENV", "production") != "production"
-        receive_orders_saved = await self.order_create_service.save_orders_to_db_from_xml(xml_content, safe_mode)
         logger.info(
             f"[END] save_receive_orders_to_db | receive_orders_saved: {receive_orders_saved}")
         return receive_orders_saved.success
@@ -445,16 +448,30 @@ class DataProcessingUsecase:
         # 2. 파일명 파싱하여 sub_site 정보 추출
         parsed = self.parse_filename(file.filename)
         sub_site = parsed.get('sub_site')
+        is_star = parsed.get('is_star', False)
         logger.info(f"sub_site: {sub_site}")
 
-        # 3. 임시 파일 생성
-        file_name, file_path = await self.process_macro_with_tempfile(template_code, file, sub_site)
-        logger.info(
-            f"temporary file path: {file_path} | file name: {file_name}")
-        # 4. 엑셀파일 데이터 파일 변환 후 임시파일 삭제
-        dataframe = ExcelHandler.file_path_to_dataframe(file_path)
+        # 3. 매크로 결과 캐시 조회 (같은 파일 + 같은 조건이면 매크로 생략)
+        cache_key = None
+        dataframe = None
+        if SETTINGS.MACRO_RESULT_CACHE_ENABLED:
+            cache_key = await run_io(
+                MacroResultCacheService.build_cache_key_from_upload, file, template_code, sub_site, is_star)
+            dataframe = await self.macro_result_cache_service.get(cache_key)
+
+        if dataframe is None:
+            # 4. 임시 파일 생성 후 매크로 실행
+            file_name, file_path = await self.process_macro_with_tempfile(template_code, file, sub_site)
+            logger.info(
+                f"temporary file path: {file_path} | file name: {file_name}")
+            workbook_bytes = await run_io(Path(file_path).read_bytes) if cache_key else None
+            # 5. 엑셀파일 데이터 파일 변환 후 임시파일 삭제
+            dataframe = await run_io(ExcelHandler.file_path_to_dataframe, file_path)
+            if cache_key:
+                await self.macro_result_cache_service.put(
+                    cache_key, template_code, sub_site, is_star, workbook_bytes, dataframe)
         logger.info(f"dataframe: {len(dataframe)}")
-        # 5. 데이터 저장
+        # 6. 데이터 저장
         saved_count = await self.process_excel_to_down_form_orders(dataframe, template_code, work_status=work_status)
         logger.info(
             f"[END] save_down_form_orders_from_macro_run_excel | saved_count={saved_count}")
@@ -470,7 +487,7 @@ class DataProcessingUsecase:
         """
 
         file_name = file.filename
-        temp_upload_file_path = temp_file_to_object_name(file)
+        temp_upload_file_path = await run_io(temp_file_to_object_name, file)
         try:
             file_path = await self.run_macro_with_file(template_code, temp_upload_file_path, sub_site, is_star)
         finally:
@@ -489,8 +506,8 @@ class DataProcessingUsecase:
         # is_star=True인 경우 B열 사이트 값에 "-스타배송" 추가
         if is_star:
             logger.info(f"스타배송 모드 활성화 - B열 사이트 값 수정 시작")
-            file_path = self.order_macro_utils.modify_site_column_for_star_delivery(
-                file_path)
+            file_path = await run_io(
+                self.order_macro_utils.modify_site_column_for_star_delivery, file_path)
             logger.info(f"스타배송 수정 완료: {file_path}")
 
         # 템플릿 코드로 sub_site 여부 조회
@@ -513,13 +530,13 @@ class DataProcessingUsecase:
                 raise ValueError(
                     f"Macro '{macro_name}' not found in MACRO_MAP.")
             try:
-                # ERP 매크로와 합포장 매크로를 구분하여 호출
+                # ERP 매크로와 합포장 매크로를 구분하여 호출 (엑셀 매크로는 CPU 작업이라 프로세스 풀에서 실행)
                 if macro_name in ["AliMacro", "ZigzagMacro", "BrandiMacro", "ECTSiteMacro", "GmarketAuctionMacro"]:
                     # ERP 매크로: file_path와 is_star 두 개 인자 전달
-                    result = macro_func(file_path, is_star)
+                    result = await run_cpu(macro_func, file_path, is_star)
                 else:
                     # 합포장 매크로: file_path 하나만 전달
-                    result = macro_func(file_path)
+                    result = await run_cpu(macro_func, file_path)
                 logger.info(
                     f"Macro '{macro_name}' executed successfully. file_path={result}")
                 return result
@@ -547,15 +564,15 @@ class DataProcessingUsecase:
 
         # 2. 데이터 1대1 매핑 변환 (DB_to_DB 에서는 합포장, ERP 구분없이 사용)
         processed_data = await DataProcessingUtils.process_receive_order_data(receive_orders_data, config)
-        # 3. 매크로 실행
+        # 3. 매크로 실행 (pandas 매크로는 CPU 작업이라 프로세스 풀에서 실행)
         run_macro_data: list[dict[str, Any]] = []
         macro_func = self.order_macro_utils.MACRO_MAP_V3.get(template_code)
         if macro_func:
             if template_code == 'zigzag_erp' or template_code == 'zigzag_bundle':
                 processed_vlookup_data = await self.vlookup_data_processing(processed_data)
-                run_macro_data = macro_func(processed_vlookup_data, is_star)
+                run_macro_data = await run_cpu(macro_func, processed_vlookup_data, is_star)
             else:
-                run_macro_data = macro_func(processed_data, is_star)
+                run_macro_data = await run_cpu(macro_func, processed_data, is_star)
         else:
             logger.error(f"Macro not found for template code: {template_code}")
             raise ValueError(
@@ -678,6 +695,36 @@ class DataProcessingUsecase:
                     )
         return temp_file_path, file_name
 
+    @staticmethod
+    def _add_island_delivery(file_path: str) -> str:
+        """
+        매크로 결과 파일에 도서지역 배송비 추가 후 저장 (동기, 오프로드 풀에서 실행)
+        args:
+            file_path: 매크로 결과 파일 경로
+        returns:
+            file_path: 저장된 파일 경로
+        """
+        ex = ExcelHandler.from_file(file_path, sheet_index=0)
+        ex.add_island_delivery(ex.wb)
+        return ex.save_file(file_path)
+
+    @staticmethod
+    def _add_island_delivery_and_template_code(file_path: str, template_code: str) -> tuple[str, pd.DataFrame]:
+        """
+        매크로 결과 파일에 도서지역 배송비, 템플릿 코드 추가 후 저장하고 dataframe 반환 (동기, 오프로드 풀에서 실행)
+        args:
+            file_path: 매크로 결과 파일 경로
+            template_code: 템플릿 코드
+        returns:
+            new_file_path: 저장된 파일 경로
+            dataframe: 저장된 파일의 dataframe
+        """
+        ex = ExcelHandler.from_file(file_path, sheet_index=0)
+        ex.add_island_delivery(ex.wb)
+        ex.create_template_code_in_excel(template_code)
+        new_file_path = ex.save_file(file_path)
+        return new_file_path, ex.to_dataframe()
+
     async def _process_file_basic(self, file: UploadFile) -> dict[str, Any]:
         """
         기본 파일 처리 로직 (DB 저장만)
@@ -697,83 +744,90 @@ class DataProcessingUsecase:
     async def _process_file_with_batch(
         self,
         file: UploadFile,
-        request_obj: BatchProcessRequest
-    ) -> dict[str, Any]:
+        context: dict[str, Any]
+    ) -> None:
         """
-        배치 정보와 함께 파일 처리 로직 (DB 저장 + MinIO 업로드)
+        배치 정보와 함께 파일 처리 로직 중 업로드 전 단계 (매크로 실행 + DB 저장)
+        업로드는 bulk 쪽에서 모든 파일을 모아 동시에 진행
         args:
             file: file
-            request_obj: request object
-        returns:
-            dict: {"filename": str, "saved_count": int, "template_code": str, "batch_id": str, "file_url": str}
+            context: 처리 결과를 채울 딕셔너리 (template_code, saved_count, file_name, file_path)
         """
         original_filename = file.filename
         logger.info(f"original_filename={original_filename}")
-        try:
-            # 1. 파일 이름에서 템플릿 코드 조회
-            template_code = await self.find_template_code_by_filename(original_filename)
-            logger.info(f"template_code: {template_code}")
-            if not template_code:
-                raise ValueError(
-                    f"Template code not found for filename: {original_filename}")
-
-            # 2. 파일명 파싱하여 sub_site 정보 추출
-            parsed = self.parse_filename(original_filename)
-            sub_site = parsed.get('sub_site')
-            is_star = parsed.get('is_star')
-            logger.info(f"sub_site: {sub_site} | is_star: {is_star}")
 
-            # 3. 임시 파일 생성 및 매크로 실행
-            file_name, file_path = await self.process_macro_with_tempfile(template_code, file, sub_site, is_star)
-            logger.info(
-                f"temporary file path: {file_path} | file name: {file_name}")
-            ex = ExcelHandler.from_file(file_path, sheet_index=0)
-            # 4. 도서지역 배송비 추가
-            ex.add_island_delivery(ex.wb)
+        # 1. 파일 이름에서 템플릿 코드 조회
+        template_code = await self.find_template_code_by_filename(original_filename)
+        context["template_code"] = template_code
+        logger.info(f"template_code: {template_code}")
+        if not template_code:
+            raise ValueError(
+                f"Template code not found for filename: {original_filename}")
 
-            # 5. 템플릿 코드 추가
-            ex.create_template_code_in_excel(template_code)
-            new_file_path = ex.save_file(file_path)
-            dataframe = ex.to_dataframe()
+        # 2. 파일명 파싱하여 sub_site 정보 추출
+        parsed = self.parse_filename(original_filename)
+        sub_site = parsed.get('sub_site')
+        is_star = parsed.get('is_star')
+        logger.info(f"sub_site: {sub_site} | is_star: {is_star}")
 
-            # 6. down_form_order 테이블에 저장
-            saved_count = await self.process_excel_to_down_form_orders(dataframe, template_code, work_status="macro_run")
-            logger.info(f"saved_count: {saved_count}")
+        # 3. 임시 파일 생성 및 매크로 실행
+        file_name, file_path = await self.process_macro_with_tempfile(template_code, file, sub_site, is_star)
+        logger.info(
+            f"temporary file path: {file_path} | file name: {file_name}")
+        # 4. 도서지역 배송비 추가, 5. 템플릿 코드 추가
+        new_file_path, dataframe = await run_io(
+            self._add_island_delivery_and_template_code, file_path, template_code)
 
-            # 6. 파일 업로드 및 batch 저장
-            file_url, minio_object_name, file_size = upload_and_get_url_and_size(
-                new_file_path, template_code, file_name)
-            file_url = url_arrange(file_url)
+        # 6. down_form_order 테이블에 저장
+        saved_count = await self.process_excel_to_down_form_orders(dataframe, template_code, work_status="macro_run")
+        logger.info(f"saved_count: {saved_count}")
+        context.update(saved_count=saved_count, file_name=file_name, file_path=new_file_path)
 
-            batch_id = await self.batch_info_create_service.build_and_save_batch(
-                BatchProcessDto.build_success,
-                original_filename,
-                file_url,
-                file_size,
-                request_obj
-            )
-            return {
-                "filename": original_filename,
-                "saved_count": saved_count,
-                "template_code": template_code,
-                "batch_id": batch_id,
-                "file_url": file_url,
-                "minio_object_name": minio_object_name
-            }
-        except Exception as e:
+    async def _save_batch_for_file(
+        self,
+        context: dict[str, Any],
+        request_obj: BatchProcessRequest
+    ) -> dict[str, Any]:
+        """
+        파일 처리 결과(context)로 batch 저장
+        args:
+            context: _process_file_with_batch + 업로드 결과 (error가 있으면 실패 batch 저장)
+            request_obj: request object
+        returns:
+            dict: {"filename": str, "saved_count": int, "template_code": str, "batch_id": str, "file_url": str}
+        """
+        original_filename = context["filename"]
+        if "error" in context:
             batch_id = await self.batch_info_create_service.build_and_save_batch(
                 BatchProcessDto.build_error,
-                file.filename,
+                original_filename,
                 request_obj,
-                str(e)
+                str(context["error"])
             )
             return {
                 "filename": original_filename,
-                "template_code": template_code,
+                "template_code": context["template_code"],
                 "batch_id": batch_id,
-                "error_message": str(e)
+                "error_message": str(context["error"])
             }
 
+        file_url = url_arrange(context["file_url"])
+        batch_id = await self.batch_info_create_service.build_and_save_batch(
+            BatchProcessDto.build_success,
+            original_filename,
+            file_url,
+            context["file_size"],
+            request_obj
+        )
+        return {
+            "filename": original_filename,
+            "saved_count": context["saved_count"],
+            "template_code": context["template_code"],
+            "batch_id": batch_id,
+            "file_url": file_url,
+            "minio_object_name": context["minio_object_name"]
+        }
+
     async def bulk_save_down_form_orders_from_macro_run_excel(
         self,
         files: list[UploadFile]
@@ -830,8 +884,27 @@ class DataProcessingUsecase:
         failed_results: list[dict[str, Any]] = []
         total_saved_count: int = 0
 
-        for file in files:
-            result: dict[str, Any] = await self._process_file_with_batch(file, request_obj)
+        # 1. 매크로 실행 + DB 저장 (같은 세션을 쓰므로 파일 순서대로)
+        contexts: list[dict[str, Any]] = [{"filename": file.filename, "template_code": None} for file in files]
+        for file, context in zip(files, contexts):
+            try:
+                await self._process_file_with_batch(file, context)
+            except Exception as e:
+                context["error"] = e
+
+        # 2. 결과 파일 업로드 (파일 N개를 동시에)
+        ready = [context for context in contexts if "error" not in context]
+        uploads = await upload_many_and_get_url_and_size_async(
+            [(context["file_path"], context["template_code"], context["file_name"]) for context in ready])
+        for context, upload in zip(ready, uploads):
+            if isinstance(upload, BaseException):
+                context["error"] = upload
+            else:
+                context["file_url"], context["minio_object_name"], context["file_size"] = upload
+
+        # 3. batch 저장
+        for context in contexts:
+            result: dict[str, Any] = await self._save_batch_for_file(context, request_obj)
             saved_count = result.get('saved_count')
             if saved_count:
                 successful_results.append(result)
@@ -942,11 +1015,9 @@ class DataProcessingUsecase:
             logger.info(f"file_name: {file_name} | file_path: {file_path}")
 
             # 4. 도서지역 배송비 추가
-            ex = ExcelHandler.from_file(file_path, sheet_index=0)
-            ex.add_island_delivery(ex.wb)
-            file_path = ex.save_file(file_path)
+            file_path = await run_io(self._add_island_delivery, file_path)
 
-            file_url, minio_object_name, file_size = upload_and_get_url_and_size(
+            file_url, minio_object_name, file_size = await upload_and_get_url_and_size_async(
                 file_path, template_code, file_name)
             file_url = url_arrange(file_url)
             batch_id = await self.batch_info_create_service.build_and_save_batch(
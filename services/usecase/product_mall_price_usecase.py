@@ -1,5 +1,10 @@
+# std
+import asyncio
 # sql
 from sqlalchemy.ext.asyncio import AsyncSession
+# core
+from core.settings import SETTINGS
+from core.offload import run_io
 # service
 from services.count_excuting_service import CountExecutingService
 from services.product.product_read_service import ProductReadService
@@ -12,13 +17,16 @@ from utils.make_xml.mall_price_registration_xml import MallPriceRegistrationXml
 # model
 from models.count_executing_data.count_executing_data import CountExecuting
 # file
-from file_server_handler import upload_to_file_server, get_file_server_url
+from file_server_handler import upload_to_file_server_async, get_file_server_url
 # schema
 from schemas.mall_price.mall_price_dto import MallPriceDto
 
 
 logger = get_logger(__name__)
 
+# mall_price 가격 컬럼(Integer) 최대값
+_INT32_MAX = 2 ** 31 - 1
+
 
 class ProductMallPriceUsecase:
     def __init__(self, session: AsyncSession):
@@ -45,7 +53,7 @@ class ProductMallPriceUsecase:
             count_rev=mall_price_create_db_count
         )
         # upload to file server
-        object_name = upload_to_file_server(xml_file_path)
+        object_name = await upload_to_file_server_async(xml_file_path)
         logger.info(f"파일 서버에 업로드된 XML 파일 이름: {object_name}")
         xml_url = get_file_server_url(object_name)
         logger.info(f"파일 서버에 업로드된 XML URL: {xml_url}")
@@ -63,4 +71,116 @@ class ProductMallPriceUsecase:
         }
 
 
-    
\ No newline at end of file
+    
+
+    async def _submit_mall_price_chunk(
+            self,
+            mall_price_dtos: list[MallPriceDto],
+            count_rev: int,
+            chunk_no: int,
+            semaphore: asyncio.Semaphore
+    ) -> tuple[str, list[dict], list[dict]]:
+        """상품 묶음 하나를 XML 생성 -> 파일 서버 업로드(async) -> 사방넷 요청 (동기 IO는 run_io로)"""
+        async with semaphore:
+            xml_file_path = await run_io(
+                self.mall_price_registration_xml.make_mall_price_dtos_registration_xml,
+                mall_price_dtos, count_rev, chunk_no
+            )
+            object_name = await upload_to_file_server_async(xml_file_path)
+            xml_url = get_file_server_url(object_name)
+            logger.info(f"[{chunk_no}] 파일 서버에 업로드된 XML URL: {xml_url} ({len(mall_price_dtos)}개 상품)")
+            response_text = await run_io(self.mall_price_request_service.request_sabangnet_product_update, xml_url)
+            success_items, failed_items = parse_sabangnet_response(response_text)
+            return xml_url, success_items, failed_items
+
+    async def setting_mall_prices(self, compayny_goods_cds: list[str]) -> dict:
+        """
+        여러 상품의 쇼핑몰 가격을 한 번에 계산/저장하고,
+        MALL_PRICE_BULK_CHUNK_SIZE개씩 XML 하나로 묶어 동시에(최대 MALL_PRICE_BULK_CONCURRENCY개) 사방넷에 요청.
+        사방넷 응답은 상품코드별로 다시 나눠서 반환.
+        """
+        codes = list(dict.fromkeys(code.strip() for code in compayny_goods_cds if code and code.strip()))
+        items = {code: {"compayny_goods_cd": code, "success": False, "message": "", "xml_file_path": None,
+                        "success_items": [], "failed_items": []} for code in codes}
+
+        # 1. 상품 조회 (한 번에)
+        product_raw_data_dtos = await self.product_read_service.get_product_raw_data_by_company_goods_cds(codes)
+        products_by_code = {}
+        for product_raw_data_dto in product_raw_data_dtos:
+            products_by_code.setdefault(product_raw_data_dto.compayny_goods_cd, product_raw_data_dto)
+
+        products = []
+        for code in codes:
+            product_raw_data_dto = products_by_code.get(code)
+            if product_raw_data_dto is None:
+                items[code]["message"] = "상품을 찾을 수 없습니다."
+                continue
+            if product_raw_data_dto.goods_price is None:
+                items[code]["message"] = "원본 상품 가격이 없습니다."
+                continue
+            standard_price = int(product_raw_data_dto.goods_price)
+            if standard_price * 115 // 100 + 3999 > _INT32_MAX:
+                items[code]["message"] = "원본 상품 가격이 너무 커서 계산할 수 없습니다."
+                continue
+            products.append({
+                "product_raw_data_id": product_raw_data_dto.id,
+                "standard_price": standard_price,
+                "product_nm": product_raw_data_dto.product_nm,
+                "compayny_goods_cd": code,
+            })
+
+        xml_urls = []
+        if products:
+            # 2. 가격 계산/저장 (조회 1회 + 커밋 1회)
+            mall_price_dtos = await self.mall_price_write_service.setting_mall_prices(products)
+
+            # 3. 묶음별 XML 생성/업로드/요청 동시 처리
+            count_rev = await self.count_executing_service.get_and_increment(CountExecuting, "mall_price_create_db")
+            chunk_size = max(SETTINGS.MALL_PRICE_BULK_CHUNK_SIZE, 1)
+            chunks = [mall_price_dtos[i:i + chunk_size] for i in range(0, len(mall_price_dtos), chunk_size)]
+            semaphore = asyncio.Semaphore(max(SETTINGS.MALL_PRICE_BULK_CONCURRENCY, 1))
+            outcomes = await asyncio.gather(
+                *(self._submit_mall_price_chunk(chunk, count_rev, chunk_no, semaphore)
+                  for chunk_no, chunk in enumerate(chunks, start=1)),
+                return_exceptions=True
+            )
+
+            # 4. 응답을 상품코드별로 매핑
+            for chunk, outcome in zip(chunks, outcomes):
+                chunk_codes = [mall_price_dto.compayny_goods_cd for mall_price_dto in chunk]
+                if isinstance(outcome, BaseException):
+                    logger.error(f"쇼핑몰 가격 대량 등록 묶음 실패 ({len(chunk_codes)}개 상품): {outcome}")
+                    for code in chunk_codes:
+                        items[code]["message"] = f"사방넷 요청 실패: {outcome}"
+                    continue
+                xml_url, success_items, failed_items = outcome
+                xml_urls.append(xml_url)
+                for code in chunk_codes:
+                    items[code]["xml_file_path"] = xml_url
+                for item in success_items:
+                    if item["company_goods_cd"] in items:
+                        items[item["company_goods_cd"]]["success_items"].append(item)
+                for item in failed_items:
+                    if item["company_goods_cd"] in items:
+                        items[item["company_goods_cd"]]["failed_items"].append(item)
+                for code in chunk_codes:
+                    item = items[code]
+                    item["success"] = bool(item["success_items"]) and not item["failed_items"]
+                    if item["success"]:
+                        item["message"] = "상품정보 수정 요청 완료"
+                    elif item["failed_items"]:
+                        item["message"] = f"{len(item['failed_items'])}개 쇼핑몰 가격 수정 실패"
+                    else:
+                        item["message"] = "사방넷 응답에 상품 결과가 없습니다."
+
+        success_count = sum(1 for item in items.values() if item["success"])
+        logger.info(f"쇼핑몰 가격 대량 등록 완료: {len(codes)}개 중 {success_count}개 성공, XML {len(xml_urls)}개")
+        return {
+            "success": success_count == len(codes),
+            "message": "상품정보 대량 수정 요청 완료",
+            "total_count": len(codes),
+            "success_count": success_count,
+            "failed_count": len(codes) - success_count,
+            "xml_file_paths": xml_urls,
+            "items": list(items.values()),
+        }
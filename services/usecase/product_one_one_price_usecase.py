@@ -6,6 +6,10 @@ from schemas.one_one_price.request.one_one_price_request import OneOnePriceCreat
 from schemas.one_one_price.one_one_price_dto import OneOnePriceDto, OneOnePriceBulkDto
 
 
+# one_one_price.standard_price(Integer) 최대값
+_INT32_MAX = 2 ** 31 - 1
+
+
 class ProductOneOnePriceUsecase:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -33,23 +37,61 @@ class ProductOneOnePriceUsecase:
         return one_one_price_dto
 
     async def calculate_and_save_one_one_prices_bulk(self, product_nm_and_gubun_list: List[OneOnePriceCreate]) -> OneOnePriceBulkDto:
+        """
+        1+1 가격 대량 계산/저장
+        상품 조회(IN 쿼리 1회) -> 가격 일괄 계산 -> upsert(청크당 쿼리 1회) 순서로 처리하고
+        상품별 실패(상품 없음, 기준가 없음 등)는 errors에 담아 나머지 상품은 계속 처리
+        """
         success_count: int = 0
-        error_count: int = 0 
+        error_count: int = 0
         created_product_nm: List[str] = []
         errors: List[str] = []
         success_data: List[OneOnePriceDto] = []
 
-        for product_nm_and_gubun in product_nm_and_gubun_list:
-            product_nm, gubun = product_nm_and_gubun.product_nm, product_nm_and_gubun.gubun
+        pairs = list(dict.fromkeys((item.product_nm, item.gubun) for item in product_nm_and_gubun_list))
+        product_rows = await self.product_read_service.get_price_rows_by_product_nm_and_gubun_pairs(pairs)
+        products_by_pair: dict[tuple[str, str], list[dict]] = {}
+        for product in product_rows:
+            products_by_pair.setdefault((product["product_nm"], product["gubun"]), []).append(product)
+
+        # 요청 순서대로 (상품 또는 에러 메시지) 결정
+        resolved: List[dict | str] = []
+        for item in product_nm_and_gubun_list:
+            products = products_by_pair.get((item.product_nm, item.gubun), [])
+            if not products:
+                resolved.append(f"Product raw data not found: {item.product_nm}")
+            elif len(products) > 1:
+                resolved.append(f"Multiple product raw data found: {item.product_nm} ({item.gubun})")
+            elif products[0]["goods_price"] is None:
+                resolved.append(f"Standard price not found: {item.product_nm}")
+            elif abs(products[0]["goods_price"]) > _INT32_MAX:
+                # standard_price 컬럼(Integer) 범위 초과
+                resolved.append("원본 상품 가격이 너무 커서 계산할 수 없습니다.")
+            else:
+                resolved.append(products[0])
+
+        saved_by_product_id: dict[int, OneOnePriceDto] = {}
+        save_error: str | None = None
+        products_to_save = [product for product in resolved if isinstance(product, dict)]
+        if products_to_save:
             try:
-                one_one_price_dto: OneOnePriceDto = await self.calculate_and_save_one_one_price(product_nm=product_nm, gubun=gubun)
+                saved = await self.one_one_price_service.calculate_and_save_one_one_prices_bulk(products_to_save)
+                saved_by_product_id = {dto.test_product_raw_data_id: dto for dto in saved}
+            except Exception as e:
+                save_error = str(e)
+
+        for product in resolved:
+            if isinstance(product, str):
+                errors.append(product)
+                error_count += 1
+            elif save_error is not None:
+                errors.append(save_error)
+                error_count += 1
+            else:
+                one_one_price_dto = saved_by_product_id[product["id"]]
                 success_count += 1
                 created_product_nm.append(one_one_price_dto.product_nm)
                 success_data.append(one_one_price_dto)
-            except Exception as e:
-                errors.append(str(e))
-                error_count += 1
-                continue
 
         return OneOnePriceBulkDto(
             success_count=success_count,
@@ -57,4 +99,4 @@ class ProductOneOnePriceUsecase:
             created_product_nm=created_product_nm,
             errors=errors,
             success_data=success_data,
-        )
\ No newline at end of file
+        )
@@ -326,26 +326,6 @@ class TestReceiveOrderIntegration:
         # Mock service 메서드들 설정
         mock_service.create_request_xml.return_value = "/path/to/xml/file.xml"
         mock_service.get_xml_url_from_minio.return_value = "http://example.com/xml"
-        mock_service.get_orders_from_sabangnet.return_value = """
-        <SABANGNET_ORDER_INFO>
-            <DATA>
-                <ORDER_ID>ORDER_20250602_001</ORDER_ID>
-                <MALL_ID>TEST_MALL</MALL_ID>
-                <USER_NAME>테스트 주문자</USER_NAME>
-                <RECEIVE_NAME>테스트 수취인</RECEIVE_NAME>
-                <TOTAL_COST>25000</TOTAL_COST>
-                <ORDER_DATE>20250602</ORDER_DATE>
-            </DATA>
-            <DATA>
-                <ORDER_ID>ORDER_20250602_002</ORDER_ID>
-                <MALL_ID>TEST_MALL</MALL_ID>
-                <USER_NAME>테스트 주문자2</USER_NAME>
-                <RECEIVE_NAME>테스트 수취인2</RECEIVE_NAME>
-                <TOTAL_COST>30000</TOTAL_COST>
-                <ORDER_DATE>20250602</ORDER_DATE>
-            </DATA>
-        </SABANGNET_ORDER_INFO>
-        """
         
         # Mock DB 저장 결과
         mock_bulk_response = ReceiveOrdersBulkCreateResponse(
@@ -355,7 +335,7 @@ class TestReceiveOrderIntegration:
             duplicated_count=0
         )
         
-        mock_service.save_orders_to_db_from_xml.return_value = mock_bulk_response
+        mock_service.collect_orders_to_db.return_value = mock_bulk_response
         
         # Given: 기본 요청 데이터
         request_data = {
@@ -382,15 +362,12 @@ class TestReceiveOrderIntegration:
         assert response_data["duplicated_count"] == 0
         
         # Mock 메서드들이 올바른 파라미터로 호출되었는지 확인
-        mock_service.create_request_xml.assert_called_once_with(
-            ord_st_date="20250602",
-            ord_ed_date="20250606",
-            order_status="004"
-        )
-        # get_xml_url_from_minio는 동기 메서드이므로 await 없이 호출됨
-        mock_service.get_xml_url_from_minio.assert_called_once()
-        mock_service.get_orders_from_sabangnet.assert_called_once()
-        mock_service.save_orders_to_db_from_xml.assert_called_once()
+        # (구간별 요청 XML 생성/업로드/수집은 collect_orders_to_db 안에서 처리)
+        mock_service.collect_orders_to_db.assert_called_once()
+        call_kwargs = mock_service.collect_orders_to_db.call_args.kwargs
+        assert call_kwargs["ord_st_date"] == "20250602"
+        assert call_kwargs["ord_ed_date"] == "20250606"
+        assert call_kwargs["order_status"] == "004"
 
     def test_save_receive_orders_to_db_from_xml_with_empty_request(
             self,
@@ -405,18 +382,6 @@ class TestReceiveOrderIntegration:
         # Mock service 메서드들 설정
         mock_service.create_request_xml.return_value = "/path/to/xml/file.xml"
         mock_service.get_xml_url_from_minio.return_value = "http://example.com/xml"
-        mock_service.get_orders_from_sabangnet.return_value = """
-        <SABANGNET_ORDER_INFO>
-            <DATA>
-                <ORDER_ID>ORDER_20250602_001</ORDER_ID>
-                <MALL_ID>TEST_MALL</MALL_ID>
-                <USER_NAME>테스트 주문자</USER_NAME>
-                <RECEIVE_NAME>테스트 수취인</RECEIVE_NAME>
-                <TOTAL_COST>25000</TOTAL_COST>
-                <ORDER_DATE>20250602</ORDER_DATE>
-            </DATA>
-        </SABANGNET_ORDER_INFO>
-        """
         
         # Mock DB 저장 결과
         mock_bulk_response = ReceiveOrdersBulkCreateResponse(
@@ -426,7 +391,7 @@ class TestReceiveOrderIntegration:
             duplicated_count=0
         )
         
-        mock_service.save_orders_to_db_from_xml.return_value = mock_bulk_response
+        mock_service.collect_orders_to_db.return_value = mock_bulk_response
         
         # Given: 기본값 사용 (요청 데이터 없음)
         request_data = {}
@@ -450,7 +415,7 @@ class TestReceiveOrderIntegration:
         # Mock service가 API 요청에서 실패하도록 설정
         mock_service.create_request_xml.return_value = "/path/to/xml/file.xml"
         mock_service.get_xml_url_from_minio.return_value = "http://example.com/xml"
-        mock_service.get_orders_from_sabangnet.side_effect = Exception("API 요청 실패")
+        mock_service.collect_orders_to_db.side_effect = Exception("API 요청 실패")
         
         # Given: 기본 요청 데이터
         request_data = {
@@ -480,21 +445,9 @@ class TestReceiveOrderIntegration:
         # Mock service 메서드들 설정
         mock_service.create_request_xml.return_value = "/path/to/xml/file.xml"
         mock_service.get_xml_url_from_minio.return_value = "http://example.com/xml"
-        mock_service.get_orders_from_sabangnet.return_value = """
-        <SABANGNET_ORDER_INFO>
-            <DATA>
-                <ORDER_ID>ORDER_20250602_001</ORDER_ID>
-                <MALL_ID>TEST_MALL</MALL_ID>
-                <USER_NAME>테스트 주문자</USER_NAME>
-                <RECEIVE_NAME>테스트 수취인</RECEIVE_NAME>
-                <TOTAL_COST>25000</TOTAL_COST>
-                <ORDER_DATE>20250602</ORDER_DATE>
-            </DATA>
-        </SABANGNET_ORDER_INFO>
-        """
         
         # Mock DB 저장에서 실패하도록 설정
-        mock_service.save_orders_to_db_from_xml.side_effect = Exception("DB 저장 실패")
+        mock_service.collect_orders_to_db.side_effect = Exception("DB 저장 실패")
         
         # Given: 기본 요청 데이터
         request_data = {
@@ -0,0 +1,145 @@
+"""
+AIMD 동시성 제한기 단위 테스트
+"""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from core import adaptive_limiter
+from core.adaptive_limiter import AdaptiveConcurrencyLimiter, get_adaptive_limiter, is_congestion_status
+from core.settings import SETTINGS
+from services.ecount.ecount_sale_service import EcountSaleService
+from utils.api_client import aiohttp_post
+
+
+@pytest.fixture
+async def throttling_server():
+    """동시 요청이 capacity를 넘으면 429를 주는 이카운트 API 대역"""
+
+    state = {"capacity": 6, "running": 0, "max_running": 0, "throttled": 0, "sequence": []}
+
+    async def handler(request: web.Request) -> web.Response:
+        if state["sequence"]:
+            status = state["sequence"].pop(0)
+            return web.Response(status=status, text="Too Many Requests")
+        if state["running"] >= state["capacity"]:
+            state["throttled"] += 1
+            return web.Response(status=429, text="<html>Too Many Requests</html>", content_type="text/html")
+        state["running"] += 1
+        state["max_running"] = max(state["max_running"], state["running"])
+        try:
+            await asyncio.sleep(0.005)
+            return web.json_response({"Status": "200"})
+        finally:
+            state["running"] -= 1
+
+    app = web.Application()
+    app.router.add_post("/OAPI/V2/Sale/SaveSale", handler)
+    server = TestServer(app)
+    await server.start_server()
+    server.state = state
+    yield server
+    await server.close()
+
+
+class TestWindow:
+    """창 크기 증가/감소 규칙 테스트"""
+
+    async def test_additive_increase_and_hard_cap(self):
+        limiter = AdaptiveConcurrencyLimiter("test", initial_window=2, min_window=1, max_window=3)
+
+        for _ in range(4):
+            async with limiter.slot() as slot:
+                slot.report(congested=False)
+        assert limiter.limit == 3
+
+        for _ in range(20):
+            async with limiter.slot() as slot:
+                slot.report(congested=False)
+        assert limiter.metrics.window == 3
+        assert limiter.metrics.succeeded == 24
+
+    async def test_one_decrease_per_window(self):
+        limiter = AdaptiveConcurrencyLimiter("test", initial_window=8, min_window=1, max_window=16)
+        slots = [await limiter.slot().__aenter__() for _ in range(4)]
+
+        # 같은 창에서 나간 요청들이 동시에 429를 받아도 한 번만 줄임
+        for slot in slots:
+            slot.report(congested=True)
+        assert limiter.metrics.window == 4
+        assert limiter.metrics.decreases == 1
+        assert limiter.metrics.congested == 4
+
+        async with limiter.slot() as slot:
+            slot.report(congested=True)
+        assert limiter.metrics.window == 2
+
+    async def test_waits_for_free_slot(self):
+        limiter = AdaptiveConcurrencyLimiter("test", initial_window=1, min_window=1, max_window=1)
+        order = []
+
+        async def _job(name):
+            async with limiter.slot():
+                order.append(f"{name}-start")
+                await asyncio.sleep(0.01)
+                order.append(f"{name}-end")
+
+        await asyncio.gather(_job("a"), _job("b"))
+
+        assert order == ["a-start", "a-end", "b-start", "b-end"]
+        assert limiter.metrics.in_flight == 0
+
+    def test_congestion_status(self):
+        assert [is_congestion_status(status) for status in (None, 200, 400, 429, 500, 503)] == [
+            True, False, False, True, True, True,
+        ]
+
+
+class TestConvergence:
+    """429를 주는 대역 서버에 대해 창 크기가 수용량 근처로 수렴하는지 테스트"""
+
+    async def test_converges_to_server_capacity(self, throttling_server):
+        limiter = AdaptiveConcurrencyLimiter("test", initial_window=1, min_window=1, max_window=32)
+        url = str(throttling_server.make_url("/OAPI/V2/Sale/SaveSale"))
+        windows = []
+
+        async def _call():
+            async with limiter.slot() as slot:
+                data, status, error = await aiohttp_post(url, {}, timeout=5)
+                slot.report(congested=is_congestion_status(status))
+                windows.append(limiter.metrics.window)
+                return status
+
+        statuses = await asyncio.gather(*[_call() for _ in range(600)])
+
+        state = throttling_server.state
+        assert statuses.count(429) == state["throttled"] > 0
+        # 후반부 창 크기는 수용량(6)의 절반 ~ 수용량 + 약간 사이에서 진동
+        assert all(3 <= window <= 8 for window in windows[-200:])
+        assert max(windows) < 32
+        assert statuses.count(429) < 60
+
+    async def test_sale_service_retries_throttled_request(self, throttling_server, monkeypatch):
+        monkeypatch.setattr(adaptive_limiter, "_limiters", {})
+        monkeypatch.setattr(SETTINGS, "ECOUNT_THROTTLE_RETRY_BACKOFF", 0)
+        throttling_server.state["sequence"] = [429, 429]
+        service = EcountSaleService()
+
+        data, status, error = await service._post(str(throttling_server.make_url("/OAPI/V2/Sale/SaveSale")), {})
+
+        assert (data, status) == ({"Status": "200"}, 200)
+        metrics = get_adaptive_limiter("ecount").metrics
+        assert (metrics.congested, metrics.succeeded) == (2, 1)
+
+    async def test_sale_service_does_not_retry_server_error(self, throttling_server, monkeypatch):
+        monkeypatch.setattr(adaptive_limiter, "_limiters", {})
+        throttling_server.state["sequence"] = [503]
+        service = EcountSaleService()
+
+        data, status, error = await service._post(str(throttling_server.make_url("/OAPI/V2/Sale/SaveSale")), {})
+
+        assert (data, status, error) == (None, 503, "Too Many Requests")
+        assert adaptive_limiter.get_adaptive_limiter_metrics()["ecount"]["decreases"] == 1
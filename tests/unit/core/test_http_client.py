@@ -0,0 +1,72 @@
+"""
+core.http_client 단위 테스트
+"""
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from core.http_client import close_http_client, http_session, start_http_client
+from utils.api_client import aiohttp_post
+
+
+@pytest.fixture
+async def stub_server():
+    """요청을 보낸 클라이언트 소켓(포트)을 기록하는 로컬 서버"""
+    peers: list = []
+    cookies: list = []
+
+    async def handler(request: web.Request) -> web.Response:
+        peers.append(request.transport.get_extra_info("peername"))
+        cookies.append(dict(request.cookies))
+        response = web.json_response({"ok": True})
+        response.set_cookie("SESSION", "from-previous-call")
+        return response
+
+    app = web.Application()
+    app.router.add_post("/echo", handler)
+    server = TestServer(app)
+    await server.start_server()
+    server.peers = peers
+    server.cookies = cookies
+    yield server
+    await server.close()
+
+
+class TestHttpClient:
+    """공용 커넥션 풀 재사용 테스트"""
+
+    async def test_shared_session_reuses_connection(self, stub_server):
+        session = await start_http_client()
+        try:
+            for i in range(5):
+                data, status, error = await aiohttp_post(str(stub_server.make_url("/echo")), {"i": i})
+                assert (data, status, error) == ({"ok": True}, 200, None)
+            async with http_session() as borrowed:
+                assert borrowed is session
+        finally:
+            await close_http_client()
+
+        assert len(stub_server.peers) == 5
+        assert len(set(stub_server.peers)) == 1
+        assert session.closed
+
+    async def test_shared_session_does_not_carry_cookies_between_calls(self, stub_server):
+        await start_http_client()
+        try:
+            # IP 주소에는 기본 쿠키 저장소도 쿠키를 저장하지 않으므로 호스트 이름으로 요청
+            url = str(stub_server.make_url("/echo")).replace("127.0.0.1", "localhost")
+            for i in range(2):
+                await aiohttp_post(url, {"i": i})
+        finally:
+            await close_http_client()
+
+        assert stub_server.cookies == [{}, {}]
+
+    async def test_falls_back_to_temporary_session_without_registry(self, stub_server):
+        for i in range(3):
+            data, status, _ = await aiohttp_post(str(stub_server.make_url("/echo")), {"i": i})
+            assert status == 200
+
+        # 호출마다 새 연결
+        assert len(set(stub_server.peers)) == 3
@@ -0,0 +1,99 @@
+"""
+core.offload 단위 테스트
+"""
+
+import time
+import asyncio
+import threading
+import pytest
+
+from core.offload import run_io, io_bound, get_offload_metrics, IO_POOL_NAME, _OffloadPool, _make_io_executor
+
+
+def _blocking_sleep(seconds: float) -> float:
+    time.sleep(seconds)
+    return seconds
+
+
+class TestOffload:
+    """오프로드 풀 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_event_loop_stays_responsive(self):
+        """blocking 작업이 도는 동안에도 이벤트 루프가 다른 코루틴을 처리하는지 확인"""
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        tick_task = asyncio.create_task(ticker())
+        try:
+            result = await run_io(_blocking_sleep, 0.3)
+        finally:
+            tick_task.cancel()
+
+        assert result == 0.3
+        # 루프가 막혔다면 ticks는 0~1 수준
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_io_bound_decorator_and_metrics(self):
+        """데코레이터로 감싼 함수 결과와 지표 집계 확인"""
+        before = get_offload_metrics()[IO_POOL_NAME]
+
+        @io_bound
+        def add(a: int, b: int = 0) -> int:
+            return a + b
+
+        results = await asyncio.gather(*[add(i, b=1) for i in range(5)])
+
+        after = get_offload_metrics()[IO_POOL_NAME]
+        assert results == [1, 2, 3, 4, 5]
+        assert after["submitted"] - before["submitted"] == 5
+        assert after["completed"] - before["completed"] == 5
+        assert after["queued"] == 0
+        assert after["running"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_call_is_counted_and_raised(self):
+        """예외는 호출한 쪽으로 그대로 전달되고 실패 건수로 집계"""
+        before = get_offload_metrics()[IO_POOL_NAME]["failed"]
+
+        def boom():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await run_io(boom)
+
+        assert get_offload_metrics()[IO_POOL_NAME]["failed"] == before + 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_before_start_leaves_queue(self):
+        """워커가 잡기 전에 취소된 작업은 queued 에서 빠지고 실행되지 않음"""
+        pool = _OffloadPool("test-offload-cancel", 1, _make_io_executor)
+        release = threading.Event()
+        ran = []
+        try:
+            blocker = asyncio.create_task(pool.submit(release.wait, 5))
+            waiting = asyncio.create_task(pool.submit(ran.append, "ran"))
+            while pool.metrics.running != 1 or pool.metrics.queued != 1:
+                await asyncio.sleep(0.01)
+
+            waiting.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiting
+            assert pool.metrics.queued == 0
+
+            release.set()
+            assert await blocker is True
+        finally:
+            release.set()
+            pool.shutdown()
+
+        assert ran == []
+        assert pool.metrics.to_dict()["queued"] == 0
+        assert pool.metrics.running == 0
+        assert pool.metrics.completed == 1
@@ -0,0 +1,88 @@
+"""
+한진 운송장 출력 결과 일괄 저장(multi-row INSERT + UPDATE ... FROM unnest) 단위 테스트
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from repository.hanjin_printwbls_repository import HanjinPrintwblsRepository
+
+
+def _repository(updated_rows: int = 0) -> HanjinPrintwblsRepository:
+    session = MagicMock()
+    insert_result = MagicMock()
+    insert_result.scalars.return_value.all.side_effect = lambda: [
+        SimpleNamespace(**row) for row in session.execute.await_args_list[0].args[1]
+    ]
+    session.execute = AsyncMock(side_effect=[insert_result, SimpleNamespace(rowcount=updated_rows)])
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    session.close = AsyncMock()
+    return HanjinPrintwblsRepository(session)
+
+
+def _record(idx: str, wbl_num: str | None) -> dict:
+    return {
+        "idx": idx, "prt_add": "주소", "zip_cod": "12345", "snd_zip": "08609",
+        "msg_key": f"K-{idx}", "result_code": "OK", "wbl_num": wbl_num, "unknown_field": "x",
+    }
+
+
+class TestCreateManyFromApiResponses:
+    """한 트랜잭션 / 두 문장으로 저장하는지 테스트"""
+
+    async def test_insert_and_invoice_update_in_one_commit(self):
+        repository = _repository(updated_rows=5)
+        process_dt = datetime(2025, 9, 24, 9, 0)
+
+        created, updated_rows = await repository.create_many_from_api_responses(
+            [_record("A1", "W1"), _record("B1/B2", "W2"), _record("C1", None), _record("A1", "W3")],
+            batch_id=7, process_dt=process_dt)
+
+        session = repository.session
+        assert session.execute.await_count == 2
+        session.commit.assert_awaited_once()
+        session.rollback.assert_not_awaited()
+        assert ([record.idx for record in created], updated_rows) == (["A1", "B1/B2", "C1", "A1"], 5)
+
+        insert_stmt, rows = session.execute.await_args_list[0].args
+        assert "INSERT INTO hanjin_printwbls" in str(insert_stmt.compile(dialect=postgresql.dialect()))
+        assert "unknown_field" not in rows[0]
+        assert rows[2]["wbl_num"] is None
+
+        update_stmt = session.execute.await_args_list[1].args[0]
+        compiled = update_stmt.compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        assert sql.startswith("UPDATE down_form_orders SET ")
+        assert "invoice_no=t.invoice_no" in sql
+        assert "unnest(%(idxs)s::VARCHAR[], %(invoice_nos)s::VARCHAR[]) WITH ORDINALITY AS v(idx, invoice_no, ord)" in sql
+        assert "JOIN LATERAL unnest(array_append(string_to_array(v.idx, " in sql
+        assert "DISTINCT ON" in sql and "v.ord DESC" in sql
+        assert "WHERE down_form_orders.idx = t.idx" in sql
+        # 운송장번호가 없는 주문은 업데이트하지 않음
+        assert compiled.params["idxs"] == ["A1", "B1/B2", "A1"]
+        assert compiled.params["invoice_nos"] == ["W1", "W2", "W3"]
+        assert (compiled.params["batch_id"], compiled.params["process_dt"]) == (7, process_dt)
+
+    async def test_failure_rolls_back_everything(self):
+        repository = _repository()
+        repository.session.execute.side_effect = [MagicMock(), RuntimeError("db down")]
+
+        try:
+            await repository.create_many_from_api_responses([_record("A1", "W1")])
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("예외가 전달되어야 함")
+
+        repository.session.rollback.assert_awaited_once()
+        repository.session.commit.assert_not_awaited()
+
+    async def test_empty_input_skips_query(self):
+        repository = _repository()
+
+        assert await repository.create_many_from_api_responses([]) == ([], 0)
+        repository.session.execute.assert_not_awaited()
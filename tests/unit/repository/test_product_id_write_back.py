@@ -0,0 +1,52 @@
+"""
+사방넷 상품 등록 결과 product_id 일괄 저장(UPDATE ... FROM unnest) 단위 테스트
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from sqlalchemy.dialects import postgresql
+
+from repository.product_repository import ProductRepository
+
+
+def _repository(matched_codes: list[str]) -> ProductRepository:
+    session = MagicMock()
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = matched_codes
+    session.execute = AsyncMock(return_value=result)
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    return ProductRepository(session)
+
+
+class TestUpdateProductIdsBatch:
+    """set 기반 product_id 저장 테스트"""
+
+    async def test_single_update_returns_only_unmatched(self):
+        repository = _repository(["OMTA", "B"])
+
+        result = await repository.update_product_ids_by_compayny_goods_cd_with_bracket_removal_batch(
+            [("OMTA", 11), ("B", 12), ("C", 13), ("B", 14)])
+
+        repository.session.execute.assert_awaited_once()
+        repository.session.commit.assert_awaited_once()
+        query = repository.session.execute.await_args.args[0]
+        sql = str(query.compile(dialect=postgresql.dialect()))
+        assert "FROM unnest(" in sql
+        assert "replace(replace(compayny_goods_cd, '[', ''), ']', '') = v.code" in sql
+        params = query.compile(dialect=postgresql.dialect()).params
+        assert params["codes"] == ["OMTA", "B", "C"]
+        assert params["product_ids"] == [11, 14, 13]
+        assert result == {
+            "success_count": 3,
+            "failed_count": 1,
+            "failed_items": [{"response_compayny_goods_cd": "C", "product_id": 13}],
+        }
+
+    async def test_empty_input_skips_query(self):
+        repository = _repository([])
+
+        result = await repository.update_product_ids_by_compayny_goods_cd_with_bracket_removal_batch([])
+
+        repository.session.execute.assert_not_awaited()
+        assert result["success_count"] == 0
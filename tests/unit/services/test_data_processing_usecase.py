@@ -0,0 +1,111 @@
+"""
+DataProcessingUsecase DB -> DB 매크로 실행 (run_macro_to_down_form_order) 단위 테스트
+"""
+
+import pickle
+import pytest
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from services.usecase.data_processing_usecase import DataProcessingUsecase
+from utils.mappings.down_form_order_mapper import map_raw_to_down_form_and_receive_order
+
+
+def _config(template_code: str) -> dict:
+    return {
+        "template_code": template_code,
+        "column_mappings": [
+            {"target_column": "주문번호", "source_field": "order_id"},
+            {"target_column": "금액", "source_field": "pay_cost"},
+        ],
+    }
+
+
+@pytest.fixture
+def usecase():
+    usecase = DataProcessingUsecase(MagicMock())
+    usecase.template_config_read_service.get_template_config_by_template_code_with_mapping = AsyncMock(
+        side_effect=_config)
+    usecase.down_form_order_create_service.bulk_create_down_form_orders_with_dict = AsyncMock(
+        side_effect=lambda rows: len(rows))
+    usecase.vlookup_data_processing = AsyncMock(side_effect=lambda rows: rows)
+    return usecase
+
+
+class TestRunMacroToDownFormOrder:
+    """V3 매크로가 이벤트 루프 밖(프로세스 풀)에서 실행되는지 테스트"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("template_code", ["gmarket_erp", "basic_bundle", "zigzag_erp", "zigzag_bundle"])
+    async def test_macro_runs_on_cpu_pool(self, usecase, template_code):
+        macro_func = MagicMock()
+        usecase.order_macro_utils.MACRO_MAP_V3[template_code] = macro_func
+        raw_rows = [{"order_id": "A-1", "pay_cost": 1000}, {"order_id": "A-2", "pay_cost": 2000}]
+
+        with patch("services.usecase.data_processing_usecase.run_cpu",
+                   AsyncMock(return_value=[{"idx": "1"}])) as run_cpu:
+            saved_count = await usecase.run_macro_to_down_form_order(template_code, raw_rows, True)
+
+        assert saved_count == 1
+        macro_func.assert_not_called()
+        run_cpu.assert_awaited_once()
+        func, rows, is_star = run_cpu.await_args.args
+        assert func is macro_func
+        assert [row["order_id"] for row in rows] == ["A-1", "A-2"]
+        assert is_star is True
+        assert usecase.vlookup_data_processing.await_count == (1 if template_code.startswith("zigzag") else 0)
+
+    @pytest.mark.parametrize("template_code", ["gmarket_erp", "gmarket_bundle", "brandi_erp", "zigzag_erp",
+                                               "zigzag_bundle", "basic_erp", "basic_bundle"])
+    def test_macro_funcs_can_be_sent_to_process_pool(self, usecase, template_code):
+        macro_func = usecase.order_macro_utils.MACRO_MAP_V3[template_code]
+
+        assert pickle.loads(pickle.dumps(macro_func)).__name__ == macro_func.__name__
+
+    @pytest.mark.asyncio
+    async def test_bundle_gets_rows_mapped_by_erp_run(self, usecase):
+        """ERP -> 합포장 순서로 같은 receive_orders 목록을 쓰면 합포장 입력에 ERP 매핑 결과가 들어감"""
+        configs = {
+            "basic_erp": {
+                "template_code": "basic_erp",
+                "column_mappings": [
+                    {"source_field": "service_fee", "field_type": "formula",
+                     "transform_config": {"source": "pay_cost - mall_won_cost * sale_cnt"}},
+                    {"source_field": "etc_msg", "field_type": "empty"},
+                    {"source_field": "order_id", "field_type": "variable"},
+                ],
+            },
+            "basic_bundle": {
+                "template_code": "basic_bundle",
+                "column_mappings": [
+                    {"source_field": "order_id", "field_type": "variable"},
+                    {"source_field": "service_fee", "field_type": "variable"},
+                    {"source_field": "etc_msg", "field_type": "variable"},
+                ],
+            },
+        }
+        usecase.template_config_read_service.get_template_config_by_template_code_with_mapping = AsyncMock(
+            side_effect=configs.get)
+        receive_orders = [
+            {"order_id": "A-1", "pay_cost": Decimal("10000"), "mall_won_cost": Decimal("4000"), "sale_cnt": 2,
+             "etc_msg": "메모"},
+            {"order_id": "A-2", "pay_cost": Decimal("8000"), "mall_won_cost": None, "sale_cnt": 1,
+             "etc_msg": None},
+        ]
+        # 기존 행 단위 매핑으로 ERP -> 합포장을 이어서 돌린 결과
+        baseline_rows = [dict(row) for row in receive_orders]
+        for row in baseline_rows:
+            map_raw_to_down_form_and_receive_order(row, configs["basic_erp"])
+        expected_bundle_input = [
+            map_raw_to_down_form_and_receive_order(row, configs["basic_bundle"]) for row in baseline_rows]
+
+        with patch("services.usecase.data_processing_usecase.run_cpu", AsyncMock(return_value=[])) as run_cpu:
+            await usecase.run_macro_to_down_form_order("basic_erp", receive_orders)
+            await usecase.run_macro_to_down_form_order("basic_bundle", receive_orders)
+
+        bundle_rows = run_cpu.await_args_list[1].args[1]
+        assert [
+            {field: row[field] for field in expected_bundle_input[0]} for row in bundle_rows
+        ] == expected_bundle_input
+        assert bundle_rows[0]["service_fee"] == Decimal("2000")
+        assert [row["etc_msg"] for row in bundle_rows] == [None, None]
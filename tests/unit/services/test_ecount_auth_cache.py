@@ -0,0 +1,77 @@
+"""
+이카운트 인증 세션 캐시 단위 테스트
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from core.settings import SETTINGS
+from schemas.ecount.auth_schemas import EcountAuthInfo
+from services.ecount.ecount_auth_service import EcountAuthManager, is_session_error
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    monkeypatch.setattr(SETTINGS, "ECOUNT_SESSION_TTL", 60)
+    monkeypatch.setattr(EcountAuthManager, "_auth_cache", {})
+    monkeypatch.setattr(EcountAuthManager, "_inflight_logins", {})
+    manager = EcountAuthManager()
+    sessions = iter(f"SESSION-{i}" for i in range(100))
+
+    async def _authenticate(com_code, user_id, api_cert_key, is_test):
+        await asyncio.sleep(0.01)
+        session_id = next(sessions)
+        return session_id, EcountAuthInfo(com_code=com_code, user_id=user_id, api_cert_key=api_cert_key,
+                                          zone="A", domain="", session_id=session_id)
+
+    auth_service = MagicMock()
+    auth_service.authenticate = AsyncMock(side_effect=_authenticate)
+    auth_service.validate_session = AsyncMock(return_value=True)
+    monkeypatch.setattr(manager, "auth_service", auth_service)
+    return manager
+
+
+class TestEcountAuthManager:
+    """TTL 캐시 / 단일 로그인 / 무효화 테스트"""
+
+    async def test_concurrent_callers_share_one_login(self, manager):
+        results = await asyncio.gather(*[manager.get_authenticated_info("C", "U", "K", True) for _ in range(5)])
+        again = await manager.get_authenticated_info("C", "U", "K", True)
+
+        assert {info.session_id for info in results} == {"SESSION-0"}
+        assert again.session_id == "SESSION-0"
+        assert manager.auth_service.authenticate.await_count == 1
+        manager.auth_service.validate_session.assert_not_awaited()
+
+    async def test_relogin_after_local_expiry(self, manager, monkeypatch):
+        monkeypatch.setattr(SETTINGS, "ECOUNT_SESSION_TTL", 0.2)
+
+        first = await manager.get_authenticated_info("C", "U", "K", True)
+        assert (await manager.get_authenticated_info("C", "U", "K", True)).session_id == first.session_id
+        await asyncio.sleep(0.25)
+
+        assert (await manager.get_authenticated_info("C", "U", "K", True)).session_id == "SESSION-1"
+
+    async def test_invalidate_session_forces_relogin(self, manager):
+        first = await manager.get_authenticated_info("C", "U", "K", True)
+
+        manager.invalidate_session(first.session_id)
+
+        assert (await manager.get_authenticated_info("C", "U", "K", True)).session_id == "SESSION-1"
+
+    async def test_failed_login_is_not_cached(self, manager):
+        manager.auth_service.authenticate = AsyncMock(return_value=(None, None))
+
+        assert await manager.get_authenticated_info("C", "U", "K", True) is None
+        assert await manager.get_authenticated_info("C", "U", "K", True) is None
+        assert manager.auth_service.authenticate.await_count == 2
+
+
+def test_is_session_error():
+    assert is_session_error({"Status": "500", "Error": {"Code": 999, "Message": "Please login."}})
+    assert is_session_error({"Status": "500", "Error": "세션이 만료되었습니다."})
+    assert not is_session_error({"Status": "200", "Error": None})
+    assert not is_session_error({"Status": "500", "Error": {"Message": "필수값 누락"}})
+    assert not is_session_error("timeout")
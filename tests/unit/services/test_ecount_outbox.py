@@ -0,0 +1,188 @@
+"""
+이카운트 전송 outbox (멱등 키 / 일괄 전송 / 재시도) 단위 테스트
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from core.settings import SETTINGS
+from repository.ecount_outbox_repository import EcountOutboxRepository
+from schemas.ecount.ecount_schemas import EcountSaleDto
+from services.ecount.ecount_outbox_service import EcountOutboxService
+
+
+AUTH_INFO = SimpleNamespace(session_id="SESSION")
+
+
+def _sale(upload_ser_no: int, order_no: str, qty: int = 1, batch_id: str = "B1") -> EcountSaleDto:
+    return EcountSaleDto(
+        com_code="80001", user_id="USER", upload_ser_no=upload_ser_no, prod_cd="P1", qty=qty,
+        size_des=order_no, batch_id=batch_id, work_status="ERP 업로드 전", is_test=True,
+    )
+
+
+def _api_response(results: list[bool], slip_nos: list[str]) -> dict:
+    return {
+        "Data": {
+            "EXPIRE_DATE": "", "QUANTITY_INFO": "", "TRACE_ID": "TRACE",
+            "SuccessCnt": sum(results), "FailCnt": len(results) - sum(results),
+            "ResultDetails": [{"IsSuccess": ok, "TotalError": "OK" if ok else "품목코드 없음"} for ok in results],
+            "SlipNos": slip_nos,
+        },
+        "Status": "200", "Timestamp": "", "IsEnableNoL4": False,
+    }
+
+
+class _FakeOutboxRepository:
+    """ecount_outbox 테이블 대역 (ON CONFLICT DO NOTHING / pending만 가져감)"""
+
+    def __init__(self):
+        self.rows: dict[str, SimpleNamespace] = {}
+
+    async def enqueue(self, rows, chunk_size=500):
+        for row in rows:
+            if row["idempotency_key"] not in self.rows:
+                self.rows[row["idempotency_key"]] = SimpleNamespace(
+                    id=len(self.rows) + 1, slip_no=None, trace_id=None, last_error=None, **row)
+        return [self.rows[row["idempotency_key"]] for row in rows]
+
+    async def claim_pending(self, limit, after_id=0, ids=None, lease_seconds=300):
+        claimed = [
+            row for row in sorted(self.rows.values(), key=lambda row: row.id)
+            if row.status == "pending" and row.id > after_id and (ids is None or row.id in ids)
+        ][:limit]
+        for row in claimed:
+            row.status = "sending"
+            row.attempts += 1
+        return claimed
+
+    async def save_results(self, results):
+        by_id = {row.id: row for row in self.rows.values()}
+        for result in results:
+            row = by_id[result["id"]]
+            row.status, row.slip_no, row.trace_id, row.last_error = (
+                result["status"], result["slip_no"], result["trace_id"], result["last_error"])
+
+
+@pytest.fixture
+def service():
+    service = EcountOutboxService(MagicMock())
+    service.outbox_repository = _FakeOutboxRepository()
+    service.sale_service = MagicMock()
+    service.sale_service.send_bulk_datas = AsyncMock()
+    return service
+
+
+class TestBuildOutboxRows:
+    """전표 묶음 / 멱등 키 테스트"""
+
+    def test_groups_lines_by_slip(self, service):
+        entries = service.build_outbox_rows(
+            [_sale(1, "O1"), _sale(1, "O1", qty=2), _sale(2, "O2")], "okmart_erp_sale_ok", "B1")
+
+        assert [len(dtos) for _, dtos in entries] == [2, 1]
+        row = entries[0][0]
+        assert row["kind"] == "sale"
+        assert row["order_keys"] == "O1,O1"
+        assert [line["QTY"] for line in row["payload"]] == [1, 2]
+        assert "BATCH_ID" not in row["payload"][0]
+        assert "WORK_STATUS" not in row["payload"][0]
+
+    def test_key_is_deterministic_across_batches_and_positions(self, service):
+        first = service.build_outbox_rows([_sale(1, "O1"), _sale(2, "O2")], "okmart_erp_sale_ok", "B1")
+        again = service.build_outbox_rows([_sale(7, "O2", batch_id="B2"), _sale(3, "O1", batch_id="B2")], "okmart_erp_sale_ok", "B2")
+
+        assert {row["idempotency_key"] for row, _ in first} == {row["idempotency_key"] for row, _ in again}
+        other_template = service.build_outbox_rows([_sale(1, "O1")], "okmart_erp_sale_iyes", "B1")
+        assert other_template[0][0]["idempotency_key"] != first[0][0]["idempotency_key"]
+
+    def test_identical_slips_get_distinct_keys(self, service):
+        entries = service.build_outbox_rows([_sale(1, "O1"), _sale(2, "O1")], "okmart_erp_sale_ok", "B1")
+
+        assert entries[0][0]["idempotency_key"] != entries[1][0]["idempotency_key"]
+
+
+class TestSubmitAndDrain:
+    """일괄 전송 / 재전송 시 성공 전표 제외 테스트"""
+
+    async def test_resubmit_only_sends_unsucceeded_slips(self, service):
+        service.sale_service.send_bulk_datas.return_value = (_api_response([True, False], ["S-1"]), 200, None)
+        dtos = [_sale(1, "O1"), _sale(2, "O2")]
+
+        _, errors, counts = await service.submit(dtos, AUTH_INFO, "okmart_erp_sale_ok", "B1")
+
+        bulk_datas = service.sale_service.send_bulk_datas.await_args.args[0]
+        assert [line["UPLOAD_SER_NO"] for line in bulk_datas] == [1, 2]
+        assert (dtos[0].is_success, dtos[0].slip_nos) == (True, "S-1")
+        assert (dtos[1].is_success, dtos[1].error_message) == (False, "품목코드 없음")
+        assert counts == {"success_count": 1, "fail_count": 1, "skipped_count": 0}
+        assert errors == ["전표 O2 failed: 품목코드 없음"]
+
+        # 같은 파일을 다시 올리면 성공한 전표는 보내지 않음 (실패 전표는 이카운트 거부라 그대로 failed)
+        service.sale_service.send_bulk_datas.reset_mock()
+        retry_dtos = [_sale(5, "O1", batch_id="B2"), _sale(6, "O2", batch_id="B2"), _sale(7, "O3", batch_id="B2")]
+        service.sale_service.send_bulk_datas.return_value = (_api_response([True], ["S-3"]), 200, None)
+
+        _, errors, counts = await service.submit(retry_dtos, AUTH_INFO, "okmart_erp_sale_ok", "B2")
+
+        bulk_datas = service.sale_service.send_bulk_datas.await_args.args[0]
+        assert [(line["SIZE_DES"], line["UPLOAD_SER_NO"]) for line in bulk_datas] == [("O3", 1)]
+        assert [dto.slip_nos for dto in retry_dtos] == ["S-1", None, "S-3"]
+        assert counts == {"success_count": 2, "fail_count": 1, "skipped_count": 1}
+
+    async def test_throttled_rows_stay_pending_until_max_attempts(self, service, monkeypatch):
+        monkeypatch.setattr(SETTINGS, "ECOUNT_OUTBOX_MAX_ATTEMPTS", 2)
+        service.sale_service.send_bulk_datas.return_value = (None, 429, "Too Many Requests")
+        await service.outbox_repository.enqueue([row for row, _ in service.build_outbox_rows([_sale(1, "O1")], "okmart_erp_sale_ok", "B1")])
+
+        first = await service.drain(auth_info=AUTH_INFO)
+        second = await service.drain(auth_info=AUTH_INFO)
+
+        assert (first["pending"], second["failed"]) == (1, 1)
+        assert service.sale_service.send_bulk_datas.await_count == 2
+
+    async def test_server_error_marks_unknown_and_is_not_resent(self, service):
+        service.sale_service.send_bulk_datas.return_value = (None, 503, "unavailable")
+        await service.outbox_repository.enqueue([row for row, _ in service.build_outbox_rows(
+            [_sale(1, "O1"), _sale(2, "O2")], "okmart_erp_sale_ok", "B1")])
+
+        summary = await service.drain(auth_info=AUTH_INFO)
+        again = await service.drain(auth_info=AUTH_INFO)
+
+        assert summary["unknown"] == 2
+        assert again["claimed"] == 0
+        assert service.sale_service.send_bulk_datas.await_count == 1
+
+    async def test_drain_chunks_requests(self, service, monkeypatch):
+        monkeypatch.setattr(SETTINGS, "ECOUNT_OUTBOX_DRAIN_SIZE", 2)
+        service.sale_service.send_bulk_datas.side_effect = lambda lines, *args: (
+            _api_response([True] * len(lines), [f"S-{line['SIZE_DES']}" for line in lines]), 200, None)
+        await service.outbox_repository.enqueue([row for row, _ in service.build_outbox_rows(
+            [_sale(i, f"O{i}") for i in range(5)], "okmart_erp_sale_ok", "B1")])
+
+        summary = await service.drain(auth_info=AUTH_INFO)
+
+        assert summary["succeeded"] == 5
+        assert [len(call.args[0]) for call in service.sale_service.send_bulk_datas.await_args_list] == [2, 2, 1]
+
+
+class TestClaimPendingQuery:
+    """여러 워커가 같은 행을 가져가지 않는지 (SKIP LOCKED) 테스트"""
+
+    async def test_claim_uses_skip_locked(self):
+        session = MagicMock()
+        result = MagicMock()
+        result.scalars.return_value.all.return_value = []
+        session.execute = AsyncMock(return_value=result)
+        session.commit = AsyncMock()
+        session.close = AsyncMock()
+
+        await EcountOutboxRepository(session).claim_pending(10, after_id=3)
+
+        sql = str(session.execute.await_args_list[1].args[0].compile(dialect=postgresql.dialect()))
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "attempts=(ecount_outbox.attempts + %(attempts_1)s)" in sql
+        session.commit.assert_awaited_once()
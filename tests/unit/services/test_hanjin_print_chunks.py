@@ -0,0 +1,138 @@
+"""
+한진 print-wbls 청크 단위 동시 요청 / msg_key 매칭 단위 테스트
+"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from core.settings import SETTINGS
+from schemas.hanjin.hanjin_printWbls_dto import AddressItem
+from services.hanjin import hanjin_print_service
+from services.hanjin.hanjin_print_service import HanjinPrintService
+
+
+@pytest.fixture
+async def hanjin_server():
+    """응답 순서를 뒤집어 주고, 지정한 청크는 처음 한 번 500을 주는 한진 API 대역"""
+
+    state = {"requests": [], "fail_once": set(), "drop": set(), "running": 0, "max_running": 0}
+
+    async def handler(request: web.Request) -> web.Response:
+        body = await request.json()
+        keys = [address["msg_key"] for address in body["address_list"]]
+        state["requests"].append(keys)
+        state["running"] += 1
+        state["max_running"] = max(state["max_running"], state["running"])
+        try:
+            await asyncio.sleep(0.01)
+        finally:
+            state["running"] -= 1
+        if keys[0] in state["fail_once"]:
+            state["fail_once"].discard(keys[0])
+            return web.Response(status=500, text="temporary error")
+        address_list = [
+            {"msg_key": key, "result_code": "OK", "wbl_num": f"W{key}"}
+            for key in reversed(keys) if key not in state["drop"]
+        ]
+        return web.json_response({"total_cnt": len(address_list), "error_cnt": 0, "address_list": address_list})
+
+    app = web.Application()
+    app.router.add_post("/v1/wbl/{client_id}/print-wbls", handler)
+    server = TestServer(app)
+    await server.start_server()
+    server.state = state
+    yield server
+    await server.close()
+
+
+@pytest.fixture
+def service(hanjin_server, monkeypatch):
+    monkeypatch.setattr(SETTINGS, "HANJIN_PRINT_WBLS_CHUNK_SIZE", 2)
+    monkeypatch.setattr(SETTINGS, "HANJIN_PRINT_WBLS_CONCURRENCY", 2)
+    monkeypatch.setattr(SETTINGS, "HANJIN_PRINT_WBLS_MAX_RETRIES", 2)
+    monkeypatch.setattr(SETTINGS, "HANJIN_PRINT_WBLS_RETRY_BACKOFF", 0)
+    service = HanjinPrintService(MagicMock())
+    service.api_base_url = str(hanjin_server.make_url("")).rstrip("/")
+    service.x_api_key = "KEY"
+    service.default_client_id = "CLIENT"
+    service.hanjin_csr_num = "1234567"
+    return service
+
+
+def _addresses(count: int) -> list[AddressItem]:
+    return [AddressItem(address=f"주소{i}", snd_zip="08609", rcv_zip="12345", msg_key=f"K{i:03d}") for i in range(count)]
+
+
+class TestGeneratePrintWblsInChunks:
+    """청크 분할 / 동시 요청 / msg_key 매칭 테스트"""
+
+    async def test_chunks_are_sent_concurrently_and_matched_by_key(self, service, hanjin_server):
+        hanjin_server.state["fail_once"] = {"K002"}
+
+        response = await service.generate_print_wbls_in_chunks(_addresses(5))
+
+        state = hanjin_server.state
+        assert sorted(map(tuple, state["requests"])) == [
+            ("K000", "K001"), ("K002", "K003"), ("K002", "K003"), ("K004",),
+        ]
+        assert state["max_running"] == 2
+        assert {key: result.wbl_num for key, result in response.results.items()} == {
+            f"K{i:03d}": f"WK{i:03d}" for i in range(5)
+        }
+        assert response.failed_items == []
+        assert response.total_cnt == 5
+
+    async def test_failed_chunk_is_returned_for_retry(self, service, hanjin_server, monkeypatch):
+        monkeypatch.setattr(SETTINGS, "HANJIN_PRINT_WBLS_MAX_RETRIES", 1)
+        hanjin_server.state["fail_once"] = {"K002"}
+        hanjin_server.state["drop"] = {"K000"}
+
+        response = await service.generate_print_wbls_in_chunks(_addresses(5))
+
+        assert sorted(response.results) == ["K001", "K004"]
+        assert [item.msg_key for item in response.failed_items] == ["K000", "K002", "K003"]
+        assert "500" in response.errors["K002"]
+
+        retried = await service.generate_print_wbls_in_chunks(response.failed_items[1:])
+        assert sorted(retried.results) == ["K002", "K003"]
+
+    async def test_duplicate_msg_key_is_rejected(self, service):
+        addresses = _addresses(2)
+        addresses[1].msg_key = addresses[0].msg_key
+
+        with pytest.raises(ValueError):
+            await service.generate_print_wbls_in_chunks(addresses)
+
+
+class TestCreateAndProcessPrintwbls:
+    """주문과 응답을 목록 위치가 아니라 msg_key로 매칭하는지 테스트"""
+
+    async def test_orders_are_matched_by_msg_key(self, service, hanjin_server, monkeypatch):
+        orders = [SimpleNamespace(idx=f"ORDER-{i}", receive_addr=f"주소{i}", receive_zipcode="12345") for i in range(3)]
+        down_form_repo = MagicMock()
+        down_form_repo.get_orders_by_form_name_without_invoice_no = AsyncMock(return_value=orders)
+        printwbls_repo = MagicMock()
+        printwbls_repo.create_many_from_api_responses = AsyncMock(
+            side_effect=lambda records, **kwargs: ([SimpleNamespace(**record) for record in records], len(records)))
+        monkeypatch.setattr(hanjin_print_service, "DownFormOrderRepository", lambda session: down_form_repo)
+        monkeypatch.setattr(hanjin_print_service, "HanjinPrintwblsRepository", lambda session: printwbls_repo)
+        # 첫 번째 청크(주문 0, 1)는 응답에서 주문 0이 빠짐
+        monkeypatch.setattr(hanjin_print_service.random, "randint", lambda a, b: 11)
+        msg_key_of_first = f"{hanjin_print_service.datetime.now().strftime('%y%m%d')}1101"
+        hanjin_server.state["drop"] = {msg_key_of_first}
+
+        result = await service.create_and_process_printwbls_from_down_form_orders(limit=3)
+
+        printwbls_repo.create_many_from_api_responses.assert_awaited_once()
+        records = printwbls_repo.create_many_from_api_responses.await_args.args[0]
+        invoices = {record["idx"]: record["wbl_num"] for record in records}
+        assert invoices == {"ORDER-1": f"W{msg_key_of_first[:-1]}2", "ORDER-2": f"W{msg_key_of_first[:-1]}3"}
+        assert (result.success_count, result.failed_count) == (2, 1)
+        assert (result.created_printwbls_count, result.updated_down_form_orders_count) == (2, 2)
+        assert result.details[0].idx == "ORDER-0"
+        assert result.details[0].error_message == "한진 API 응답에 해당 msg_key가 없습니다."
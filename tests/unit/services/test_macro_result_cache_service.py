@@ -0,0 +1,131 @@
+"""
+매크로 결과 캐시 단위 테스트
+"""
+
+import io
+import gzip
+import pickle
+import datetime as dt
+from decimal import Decimal
+import pytest
+import pandas as pd
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import UploadFile
+
+from services.usecase.data_processing_usecase import DataProcessingUsecase
+from services.macro_batch_processing.macro_result_cache_service import MacroResultCacheService
+
+
+def _upload_file(content: bytes, filename: str = "[G마켓,옥션]-ERP용.xlsx") -> UploadFile:
+    return UploadFile(file=io.BytesIO(content), filename=filename)
+
+
+class TestMacroResultCacheKey:
+    """캐시 키 / 직렬화 테스트"""
+
+    def test_hash_upload_file_rewinds_pointer(self):
+        upload = _upload_file(b"excel-bytes")
+        upload.file.read(3)
+
+        first = MacroResultCacheService.hash_upload_file(upload)
+        second = MacroResultCacheService.hash_upload_file(upload)
+
+        assert first == second
+        assert upload.file.tell() == 0
+        assert upload.file.read() == b"excel-bytes"
+
+    def test_build_cache_key_depends_on_every_part(self):
+        base = MacroResultCacheService.build_cache_key("h", "gmarket_erp", None, False, "1")
+
+        assert base == MacroResultCacheService.build_cache_key("h", "gmarket_erp", None, False, "1")
+        assert base != MacroResultCacheService.build_cache_key("h2", "gmarket_erp", None, False, "1")
+        assert base != MacroResultCacheService.build_cache_key("h", "basic_erp", None, False, "1")
+        assert base != MacroResultCacheService.build_cache_key("h", "gmarket_erp", "지그재그", False, "1")
+        assert base != MacroResultCacheService.build_cache_key("h", "gmarket_erp", None, True, "1")
+        assert base != MacroResultCacheService.build_cache_key("h", "gmarket_erp", None, False, "2")
+
+    def test_dataframe_blob_round_trip(self):
+        df = pd.DataFrame({
+            "주문번호": ["A-1", "A-2", None],
+            "수량": [1, 2, 3],
+            "금액": [1000.5, 0.0, 12.25],
+        })
+
+        restored = MacroResultCacheService.blob_to_dataframe(MacroResultCacheService.dataframe_to_blob(df))
+
+        pd.testing.assert_frame_equal(restored, df)
+
+    def test_dataframe_blob_keeps_dtypes_and_cell_types(self):
+        df = pd.DataFrame({
+            "주문일시": pd.to_datetime(["2025-09-01 10:00:00.123456789", None]),
+            "금액": [0.1 + 0.2, float("nan")],
+            "혼합": [dt.datetime(2025, 9, 1, 9, 30), Decimal("12.30")],
+            "주문일": [dt.date(2025, 9, 1), 7],
+            "여부": [True, False],
+            "분류": pd.Categorical(["a", "b"]),
+        }, index=[5, 9])
+        df.columns = ["주문일시", "금액", "혼합", "주문일", "여부", "주문일시"]
+
+        restored = MacroResultCacheService.blob_to_dataframe(MacroResultCacheService.dataframe_to_blob(df))
+
+        pd.testing.assert_frame_equal(restored, df)
+        assert [type(value) for value in restored.iloc[:, 2]] == [dt.datetime, Decimal]
+
+    def test_pickle_blob_is_rejected_without_loading(self):
+        class _Exploit:
+            def __reduce__(self):
+                return (exec, ("raise SystemExit('pickle executed')",))
+
+        blob = gzip.compress(pickle.dumps(_Exploit()))
+
+        with pytest.raises(ValueError):
+            MacroResultCacheService.blob_to_dataframe(blob)
+
+
+class TestMacroRunExcelWithCache:
+    """excel-run-macro-db 흐름에서 캐시 적중/미스 동작 테스트"""
+
+    @pytest.fixture
+    def usecase(self):
+        usecase = DataProcessingUsecase(MagicMock())
+        usecase.find_template_code_by_filename = AsyncMock(return_value="gmarket_erp")
+        usecase.process_excel_to_down_form_orders = AsyncMock(return_value=2)
+        usecase.process_macro_with_tempfile = AsyncMock()
+        usecase.macro_result_cache_service = MagicMock(spec=MacroResultCacheService)
+        usecase.macro_result_cache_service.get = AsyncMock()
+        usecase.macro_result_cache_service.put = AsyncMock()
+        return usecase
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_macro(self, usecase):
+        cached = pd.DataFrame({"idx": ["1", "2"]})
+        usecase.macro_result_cache_service.get.return_value = cached
+
+        saved_count = await usecase.save_down_form_orders_from_macro_run_excel(_upload_file(b"same"), work_status="macro_run")
+
+        assert saved_count == 2
+        usecase.process_macro_with_tempfile.assert_not_awaited()
+        usecase.macro_result_cache_service.put.assert_not_awaited()
+        df_arg = usecase.process_excel_to_down_form_orders.await_args.args[0]
+        assert df_arg is cached
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_runs_macro_and_stores_result(self, usecase, tmp_path):
+        result_path = tmp_path / "result.xlsx"
+        result_path.write_bytes(b"workbook")
+        macro_df = pd.DataFrame({"idx": ["1", "2"]})
+        usecase.macro_result_cache_service.get.return_value = None
+        usecase.process_macro_with_tempfile.return_value = ("upload.xlsx", str(result_path))
+
+        with patch(
+            "services.usecase.data_processing_usecase.ExcelHandler.file_path_to_dataframe",
+            return_value=macro_df,
+        ):
+            saved_count = await usecase.save_down_form_orders_from_macro_run_excel(_upload_file(b"new"), work_status="macro_run")
+
+        assert saved_count == 2
+        usecase.process_macro_with_tempfile.assert_awaited_once()
+        put_args = usecase.macro_result_cache_service.put.await_args.args
+        assert put_args[1:4] == ("gmarket_erp", None, False)
+        assert put_args[4] == b"workbook"
+        assert put_args[5] is macro_df
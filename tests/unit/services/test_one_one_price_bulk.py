@@ -0,0 +1,116 @@
+"""
+1+1 가격 일괄 계산 / 대량 저장 usecase 단위 테스트
+"""
+
+import random
+from decimal import Decimal
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from schemas.one_one_price.request.one_one_price_request import OneOnePriceCreate
+from services.one_one_price.one_one_price_service import OneOnePriceCalculator, OneOnePriceService
+from services.usecase.product_one_one_price_usecase import ProductOneOnePriceUsecase
+
+
+def _scalar_row(service: OneOnePriceService, standard_price: Decimal) -> dict:
+    calculator = service.one_one_price_calculator
+    one_one_price = calculator.calculate_one_one_price(standard_price)
+    prices = {
+        "group_115": calculator.calculate_shop_prices_115_percent(one_one_price),
+        "group_105": calculator.calculate_shop_prices_105_percent(one_one_price),
+        "group_same": one_one_price,
+        "group_plus100": calculator.calculate_shop_prices_plus_100(one_one_price),
+    }
+    row = {"standard_price": standard_price, "one_one_price": one_one_price}
+    for group, shops in OneOnePriceService.SHOP_PRICE_MAPPING.items():
+        row.update({shop: prices[group] for shop in shops})
+    return row
+
+
+class _FakeOneOnePriceRepository:
+    def __init__(self):
+        self.rows: list[dict] = []
+
+    async def upsert_one_one_price_data_bulk(self, rows, chunk_size=500):
+        self.rows.extend(rows)
+        return [SimpleNamespace(**row) for row in reversed(rows)]
+
+
+class TestCalculatePricesArray:
+    """numpy 정수 연산 결과가 스칼라 계산기와 같은지 테스트"""
+
+    def test_matches_scalar_calculator(self):
+        rng = random.Random(0)
+        standard_prices = [0, 1, 8899, 8900, 9899, 9900, 9901, 10000, 10500, 11000, 12345, 2 ** 31 - 1]
+        standard_prices += [rng.randint(0, 3_000_000) for _ in range(2000)]
+        standard_prices += [rng.randint(1, 3000) * 500 for _ in range(500)]
+        service = OneOnePriceService(MagicMock())
+
+        rows = service.build_one_one_price_rows([
+            {"id": i, "compayny_goods_cd": f"C{i}", "product_nm": f"상품{i}", "goods_price": Decimal(price)}
+            for i, price in enumerate(standard_prices)
+        ])
+
+        for row, price in zip(rows, standard_prices):
+            expected = _scalar_row(service, Decimal(price))
+            assert {key: row[key] for key in expected} == expected, price
+
+    def test_non_integral_price_falls_back_to_scalar(self):
+        service = OneOnePriceService(MagicMock())
+
+        row = service.build_one_one_price_rows([
+            {"id": 1, "compayny_goods_cd": "C1", "product_nm": "상품", "goods_price": Decimal("4999.5")},
+        ])[0]
+
+        assert row["one_one_price"] == _scalar_row(service, Decimal("4999.5"))["one_one_price"]
+
+    def test_roundup_is_exact(self):
+        values = OneOnePriceCalculator._roundup_to_thousands_array(np.array([11000, 11001, 11999, 0, -1], dtype=np.int64))
+
+        assert values.tolist() == [11000, 12000, 12000, 0, 0]
+
+
+class TestCalculateAndSaveBulk:
+    """조회 1회 / 저장 1회로 처리하고 상품별 결과를 요청 순서대로 돌려주는지 테스트"""
+
+    @pytest.fixture
+    def usecase(self):
+        usecase = ProductOneOnePriceUsecase(MagicMock())
+        usecase.product_read_service = MagicMock()
+        usecase.product_read_service.get_price_rows_by_product_nm_and_gubun_pairs = AsyncMock(return_value=[
+            {"id": 1, "product_nm": "A", "gubun": "마스터", "compayny_goods_cd": "A1", "goods_price": Decimal("9900")},
+            {"id": 2, "product_nm": "B", "gubun": "마스터", "compayny_goods_cd": "B2", "goods_price": None},
+            {"id": 3, "product_nm": "C", "gubun": "마스터", "compayny_goods_cd": "C3", "goods_price": Decimal("5000")},
+            {"id": 4, "product_nm": "D", "gubun": "마스터", "compayny_goods_cd": "D4", "goods_price": Decimal(2 ** 31)},
+        ])
+        usecase.one_one_price_service.one_one_price_repository = _FakeOneOnePriceRepository()
+        return usecase
+
+    async def test_bulk_results_in_request_order(self, usecase):
+        request = [OneOnePriceCreate(product_nm=name, gubun="마스터") for name in ["C", "X", "A", "B", "D", "C"]]
+
+        result = await usecase.calculate_and_save_one_one_prices_bulk(request)
+
+        usecase.product_read_service.get_price_rows_by_product_nm_and_gubun_pairs.assert_awaited_once()
+        saved_rows = usecase.one_one_price_service.one_one_price_repository.rows
+        assert [row["test_product_raw_data_id"] for row in saved_rows] == [3, 1]
+        assert result.success_count == 3
+        assert result.created_product_nm == ["C", "A", "C"]
+        assert [dto.one_one_price for dto in result.success_data] == [Decimal("11900"), Decimal("20900"), Decimal("11900")]
+        assert result.success_data[1].shop0007 == Decimal("24900")
+        assert result.error_count == 3
+        assert result.errors[0] == "Product raw data not found: X"
+        assert result.errors[2] == "원본 상품 가격이 너무 커서 계산할 수 없습니다."
+
+    async def test_save_failure_marks_pending_items(self, usecase):
+        usecase.one_one_price_service.one_one_price_repository.upsert_one_one_price_data_bulk = AsyncMock(
+            side_effect=RuntimeError("db down"))
+
+        result = await usecase.calculate_and_save_one_one_prices_bulk(
+            [OneOnePriceCreate(product_nm=name, gubun="마스터") for name in ["A", "X"]])
+
+        assert result.success_count == 0
+        assert result.errors == ["db down", "Product raw data not found: X"]
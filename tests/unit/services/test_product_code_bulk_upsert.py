@@ -0,0 +1,72 @@
+"""
+품번코드 생성 -> test_product_raw_data 일괄 저장 단위 테스트
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+import core.db
+from services.product_registration import product_integrated_service
+from services.product_registration.product_integrated_service import ProductCodeIntegratedService
+
+
+def _registration(product_nm: str, class_nm1: str | None) -> SimpleNamespace:
+    data = {"product_nm": product_nm, "goods_nm": f"{product_nm} 상품", "goods_price": 5000, "class_nm1": class_nm1}
+    return SimpleNamespace(to_dict=lambda: dict(data))
+
+
+@pytest.fixture
+def repositories(monkeypatch):
+    async def _session():
+        yield MagicMock()
+
+    reg_repo = MagicMock()
+    reg_repo.get_products_all = AsyncMock(return_value=[_registration("A", "생활"), _registration("B", "없는분류")])
+    prod_repo = MagicMock()
+    prod_repo.bulk_upsert_product_raw_data = AsyncMock(
+        side_effect=lambda rows, chunk_size: {
+            row["compayny_goods_cd"]: "updated" if row["compayny_goods_cd"] == "A" else "created" for row in rows
+        })
+    mycategory_repo = MagicMock()
+    mycategory_repo.get_class_cd_maps = AsyncMock(return_value={1: {"생활": "C01"}, 2: {}, 3: {}, 4: {}})
+
+    monkeypatch.setattr(core.db, "get_async_session", _session)
+    monkeypatch.setattr(product_integrated_service, "ProductRegistrationRepository", lambda session: reg_repo)
+    monkeypatch.setattr(product_integrated_service, "ProductRepository", lambda session: prod_repo)
+    monkeypatch.setattr(product_integrated_service, "ProductMyCategoryRepository", lambda session: mycategory_repo)
+    return SimpleNamespace(reg=reg_repo, prod=prod_repo, mycategory=mycategory_repo)
+
+
+class TestGenerateAndSaveAllProductCodeData:
+    """분류코드 1회 조회 + 일괄 upsert 테스트"""
+
+    async def test_bulk_mode_upserts_once(self, repositories):
+        result = await ProductCodeIntegratedService().generate_and_save_all_product_code_data()
+
+        repositories.mycategory.get_class_cd_maps.assert_awaited_once()
+        repositories.prod.bulk_upsert_product_raw_data.assert_awaited_once()
+        rows = repositories.prod.bulk_upsert_product_raw_data.await_args.args[0]
+        assert [row["compayny_goods_cd"] for row in rows] == ["[OMT]A", "A", "1+1 A", "[OMT]B", "B", "1+1 B"]
+        assert [row["class_cd1"] for row in rows] == ["C01"] * 3 + [None] * 3
+        assert result["summary"] == {"created_count": 5, "updated_count": 1, "failed_count": 0, "total_processed": 6}
+        assert result["success"][1] == {"product_nm": "A", "gubun": "전문몰", "company_goods_cd": "A", "action": "updated"}
+
+    async def test_bulk_failure_marks_every_row_failed(self, repositories):
+        repositories.prod.bulk_upsert_product_raw_data.side_effect = RuntimeError("db down")
+
+        result = await ProductCodeIntegratedService().generate_and_save_all_product_code_data()
+
+        assert result["success"] == []
+        assert result["summary"]["failed_count"] == 6
+        assert {item["error"] for item in result["failed"]} == {"db down"}
+
+    async def test_row_mode_matches_bulk_rows(self, repositories):
+        repositories.prod.upsert_product_raw_data = AsyncMock(return_value={"success": True, "action": "created"})
+
+        result = await ProductCodeIntegratedService().generate_and_save_all_product_code_data(bulk=False)
+
+        assert repositories.prod.upsert_product_raw_data.await_count == 6
+        repositories.prod.bulk_upsert_product_raw_data.assert_not_awaited()
+        assert result["summary"]["created_count"] == 6
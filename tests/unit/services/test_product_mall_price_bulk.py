@@ -0,0 +1,93 @@
+"""
+쇼핑몰 가격 대량 등록 usecase 단위 테스트
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from lxml import etree
+
+from core.settings import SETTINGS
+from services.usecase import product_mall_price_usecase
+from services.mall_price.mall_price_write_service import MallPriceWriteService
+from services.usecase.product_mall_price_usecase import ProductMallPriceUsecase
+
+
+class _FakeMallPriceRepository:
+    def __init__(self):
+        self.saved_batches = []
+
+    async def save_mall_prices(self, new_objs):
+        self.saved_batches.append(new_objs)
+        return new_objs
+
+
+@pytest.fixture
+def usecase(tmp_path, monkeypatch):
+    monkeypatch.setattr(SETTINGS, "MALL_PRICE_BULK_CHUNK_SIZE", 2)
+    monkeypatch.setattr(SETTINGS, "MALL_PRICE_BULK_CONCURRENCY", 2)
+    usecase = ProductMallPriceUsecase(MagicMock())
+    monkeypatch.setattr(usecase.mall_price_registration_xml, "_PATH", str(tmp_path))
+
+    products = {
+        code: SimpleNamespace(id=i, compayny_goods_cd=code, goods_price=10000 + i, product_nm=f"상품{i}")
+        for i, code in enumerate(["A1", "B2", "C3", "F6", "D4", "E5"], start=1)
+    }
+    products["E5"].goods_price = None
+    usecase.product_read_service = MagicMock()
+    usecase.product_read_service.get_product_raw_data_by_company_goods_cds = AsyncMock(
+        side_effect=lambda codes: [products[code] for code in codes if code in products])
+    usecase.mall_price_write_service = MallPriceWriteService(MagicMock())
+    usecase.mall_price_write_service.mall_price_repository = _FakeMallPriceRepository()
+    usecase.count_executing_service = MagicMock()
+    usecase.count_executing_service.get_and_increment = AsyncMock(return_value=7)
+
+    uploaded = {}
+
+    async def _upload(xml_file_path):
+        uploaded[str(xml_file_path).rsplit("/", 1)[-1]] = xml_file_path
+        return str(xml_file_path).rsplit("/", 1)[-1]
+
+    def _request(xml_url):
+        # 요청 XML의 상품코드마다 쇼핑몰 결과 한 줄씩 응답 (C3는 실패)
+        object_name = xml_url.rsplit("/", 1)[-1]
+        root = etree.parse(uploaded[object_name]).getroot()
+        if "D4" in [code.text for code in root.iter("COMPAYNY_GOODS_CD")]:
+            raise ConnectionError("사방넷 응답 없음")
+        lines = [
+            f"[{i}] {'수정 실패' if data.findtext('COMPAYNY_GOODS_CD') == 'C3' else '수정 성공'} : {i} "
+            f"[{data.findtext('COMPAYNY_GOODS_CD')}]"
+            for i, data in enumerate(root.iter("DATA"), start=1)
+        ]
+        return "\n".join(lines)
+
+    monkeypatch.setattr(product_mall_price_usecase, "upload_to_file_server_async", _upload)
+    monkeypatch.setattr(product_mall_price_usecase, "get_file_server_url", lambda name: f"http://file/{name}")
+    monkeypatch.setattr(usecase.mall_price_request_service, "request_sabangnet_product_update", _request)
+    return usecase
+
+
+class TestSettingMallPrices:
+    """가격 계산 일괄 저장 -> 묶음별 XML 동시 요청 -> 상품코드별 결과 매핑 테스트"""
+
+    async def test_results_are_mapped_back_per_sku(self, usecase):
+        result = await usecase.setting_mall_prices(["A1", "B2", "C3", "F6", "D4", "E5", "ZZ", "A1"])
+
+        items = {item["compayny_goods_cd"]: item for item in result["items"]}
+        assert list(items) == ["A1", "B2", "C3", "F6", "D4", "E5", "ZZ"]
+        # 가격 계산/저장은 한 번에
+        saved = usecase.mall_price_write_service.mall_price_repository.saved_batches
+        assert len(saved) == 1 and [obj.compayny_goods_cd for obj in saved[0]] == ["A1", "B2", "C3", "F6", "D4"]
+        assert saved[0][0].shop0075 == 10001
+        # 2개씩 묶어서 XML 생성 (A1, B2 / C3, F6 / D4)
+        assert items["A1"]["xml_file_path"] == items["B2"]["xml_file_path"]
+        assert len(items["A1"]["success_items"]) == 31
+        assert items["A1"]["success"] and items["B2"]["success"]
+        assert not items["C3"]["success"] and len(items["C3"]["failed_items"]) == 31
+        assert items["F6"]["success"] and items["F6"]["xml_file_path"] == items["C3"]["xml_file_path"]
+        assert "사방넷 요청 실패" in items["D4"]["message"]
+        assert items["E5"]["message"] == "원본 상품 가격이 없습니다."
+        assert items["ZZ"]["message"] == "상품을 찾을 수 없습니다."
+        assert len(result["xml_file_paths"]) == 2
+        assert (result["total_count"], result["success_count"], result["success"]) == (7, 3, False)
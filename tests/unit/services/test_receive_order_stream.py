@@ -0,0 +1,221 @@
+"""
+사방넷 주문 수집 XML 스트리밍 파싱/저장 단위 테스트
+"""
+
+import asyncio
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from core.settings import SETTINGS
+from services.receive_orders.receive_order_create_service import ReceiveOrderCreateService
+
+
+def _order_xml(count: int) -> bytes:
+    rows = "".join(
+        f"<DATA><IDX>{i}</IDX><ORDER_ID><![CDATA[ORDER-{i}]]></ORDER_ID><RECEIVE_NAME>홍길동</RECEIVE_NAME>"
+        f"<PAY_COST>{1000 + i}</PAY_COST><SALE_CNT>2</SALE_CNT><ORDER_DATE>20250602</ORDER_DATE>"
+        f"<DELV_MSG></DELV_MSG><!-- 주석 --></DATA>"
+        for i in range(count)
+    )
+    xml = f'<?xml version="1.0" encoding="euc-kr"?><SABANG_ORDER_LIST><HEADER><SEND_DATE>20250602</SEND_DATE></HEADER>{rows}</SABANG_ORDER_LIST>'
+    return xml.encode("euc-kr")
+
+
+class _FakeReceiveOrdersRepository:
+    def __init__(self):
+        self.batches: list[list[dict]] = []
+
+    async def bulk_insert_orders(self, orders: list[dict], commit: bool = True) -> list:
+        assert commit is False
+        self.batches.append(orders)
+        await asyncio.sleep(0)
+        # 첫 번째 주문은 이미 저장된 것으로 가정 (중복 무시)
+        return [order for order in orders if order["idx"] != "0"]
+
+
+@pytest.fixture
+def service():
+    service = ReceiveOrderCreateService(AsyncMock())
+    service.receive_orders_repository = _FakeReceiveOrdersRepository()
+    return service
+
+
+@pytest.fixture
+async def sabangnet_server(monkeypatch):
+    """응답을 작은 청크로 나눠 보내는 사방넷 주문 수집 API 대역"""
+
+    body = _order_xml(25)
+
+    async def handler(request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "text/xml"})
+        await response.prepare(request)
+        for i in range(0, len(body), 97):
+            await response.write(body[i:i + 97])
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_get("/RTL_API/xml_order_info.html", handler)
+    server = TestServer(app)
+    await server.start_server()
+    monkeypatch.setattr(SETTINGS, "SABANG_ADMIN_URL", str(server.make_url("/")))
+    yield server
+    await server.close()
+
+
+class TestParseOrderXml:
+    """lxml 증분 파서 변환 테스트"""
+
+    def test_parse_converts_and_masks(self, service):
+        orders = service._parse_xml_to_order_list(_order_xml(2), safe_mode=True)
+
+        assert len(orders) == 2
+        assert orders[1]["idx"] == "1"
+        assert orders[1]["receive_name"] == "홍**"
+        assert orders[1]["order_id"] != "ORDER-1"
+        assert orders[1]["pay_cost"] == Decimal("1001")
+        assert orders[1]["sale_cnt"] == 2
+        assert str(orders[1]["order_date"]) == "2025-06-02"
+        # 빈 요소, 주석은 저장하지 않음
+        assert "delv_msg" not in orders[1]
+
+    def test_parse_accepts_text_without_masking(self, service):
+        orders = service._parse_xml_to_order_list(
+            "<SABANG_ORDER_LIST><DATA><IDX>1</IDX><RECEIVE_NAME>홍길동</RECEIVE_NAME></DATA></SABANG_ORDER_LIST>",
+            safe_mode=False,
+        )
+
+        assert orders[0]["idx"] == "1"
+        assert orders[0]["receive_name"] == "홍길동"
+
+
+class TestStreamOrdersFromSabangnet:
+    """청크 단위 다운로드 -> 배치 파싱 -> 저장 테스트"""
+
+    async def test_iter_batches(self, service, sabangnet_server, monkeypatch):
+        batches = [batch async for batch in service.iter_order_batches_from_sabangnet("http://xml", False, batch_size=10)]
+
+        assert [len(batch) for batch in batches] == [10, 10, 5]
+        assert [order["idx"] for batch in batches for order in batch] == [str(i) for i in range(25)]
+
+
+class TestCollectOrdersByDateWindows:
+    """일 단위 구간 동시 수집 테스트"""
+
+    def test_split_date_windows(self):
+        assert ReceiveOrderCreateService.split_date_windows("20250630", "20250702") == [
+            ("20250630", "20250630"), ("20250701", "20250701"), ("20250702", "20250702"),
+        ]
+        assert ReceiveOrderCreateService.split_date_windows("20250601", "20250605", window_days=2) == [
+            ("20250601", "20250602"), ("20250603", "20250604"), ("20250605", "20250605"),
+        ]
+        with pytest.raises(ValueError):
+            ReceiveOrderCreateService.split_date_windows("20250602", "20250601")
+
+    @pytest.fixture
+    def windowed_service(self, service, monkeypatch):
+        monkeypatch.setattr(SETTINGS, "RECEIVE_ORDER_COLLECT_CONCURRENCY", 2)
+        monkeypatch.setattr(SETTINGS, "RECEIVE_ORDER_COLLECT_RETRY_BACKOFF", 0)
+        monkeypatch.setattr(SETTINGS, "RECEIVE_ORDER_COLLECT_MAX_RETRIES", 2)
+        monkeypatch.setattr(service, "create_window_request_xml_url", lambda st, ed, status: st)
+        service.running = 0
+        service.max_running = 0
+        service.attempts = {}
+        return service
+
+    async def test_collect_runs_windows_concurrently_and_dedups(self, windowed_service, monkeypatch):
+        service = windowed_service
+
+        async def _fake_stream(xml_url, safe_mode, batch_size=None):
+            service.attempts[xml_url] = service.attempts.get(xml_url, 0) + 1
+            service.running += 1
+            service.max_running = max(service.max_running, service.running)
+            try:
+                await asyncio.sleep(0.01)
+                if xml_url == "20250602" and service.attempts[xml_url] == 1:
+                    raise ConnectionError("일시적 오류")
+                # 구간 경계에 걸친 주문(idx=shared)은 여러 구간에서 내려옴
+                yield [{"idx": f"{xml_url}-1"}, {"idx": "shared"}]
+            finally:
+                service.running -= 1
+
+        monkeypatch.setattr(service, "iter_order_batches_from_sabangnet", _fake_stream)
+
+        response = await service.collect_orders_to_db("20250601", "20250604", "004", safe_mode=False)
+
+        inserted = [order["idx"] for batch in service.receive_orders_repository.batches for order in batch]
+        assert sorted(inserted) == ["20250601-1", "20250602-1", "20250603-1", "20250604-1", "shared"]
+        assert service.attempts["20250602"] == 2
+        assert service.max_running <= 2
+        assert response.success is True
+        assert response.total_count == 8
+        assert response.success_count == 5
+
+    async def test_collect_reports_failed_windows(self, windowed_service, monkeypatch):
+        service = windowed_service
+
+        async def _fake_stream(xml_url, safe_mode, batch_size=None):
+            if xml_url == "20250602":
+                raise ConnectionError("계속 실패")
+            yield [{"idx": xml_url}]
+
+        monkeypatch.setattr(service, "iter_order_batches_from_sabangnet", _fake_stream)
+
+        response = await service.collect_orders_to_db("20250601", "20250603", "004", safe_mode=False)
+
+        assert response.success is False
+        assert response.success_count == 2
+
+    async def test_collect_saves_each_streamed_batch(self, windowed_service, sabangnet_server, monkeypatch):
+        service = windowed_service
+        monkeypatch.setattr(SETTINGS, "RECEIVE_ORDER_STREAM_BATCH_SIZE", 10)
+
+        response = await service.collect_orders_to_db("20250601", "20250601", "004", safe_mode=False)
+
+        # 구간 전체를 모으지 않고 파싱한 배치마다 저장, 배치마다 커밋
+        assert [len(batch) for batch in service.receive_orders_repository.batches] == [10, 10, 5]
+        assert service.session.commit.await_count == 3
+        assert (response.total_count, response.success_count, response.duplicated_count) == (25, 24, 1)
+
+    async def test_retried_window_does_not_resend_saved_orders(self, windowed_service, monkeypatch):
+        service = windowed_service
+
+        async def _flaky_stream(xml_url, safe_mode, batch_size=None):
+            service.attempts[xml_url] = service.attempts.get(xml_url, 0) + 1
+            yield [{"idx": "1"}, {"idx": "2"}]
+            if service.attempts[xml_url] == 1:
+                raise ConnectionError("연결 끊김")
+            yield [{"idx": "3"}]
+
+        monkeypatch.setattr(service, "iter_order_batches_from_sabangnet", _flaky_stream)
+
+        response = await service.collect_orders_to_db("20250601", "20250601", "004", safe_mode=False)
+
+        assert service.receive_orders_repository.batches == [[{"idx": "1"}, {"idx": "2"}], [{"idx": "3"}]]
+        assert (response.success, response.total_count) == (True, 3)
+
+    async def test_insert_error_rolls_back_and_stops_downloads(self, windowed_service, monkeypatch):
+        service = windowed_service
+        service.receive_orders_repository.bulk_insert_orders = AsyncMock(side_effect=RuntimeError("DB 오류"))
+        cancelled = []
+
+        async def _endless_stream(xml_url, safe_mode, batch_size=None):
+            try:
+                while True:
+                    yield [{"idx": f"{xml_url}-{len(cancelled)}"}]
+                    await asyncio.sleep(0)
+            except asyncio.CancelledError:
+                cancelled.append(xml_url)
+                raise
+
+        monkeypatch.setattr(service, "iter_order_batches_from_sabangnet", _endless_stream)
+
+        with pytest.raises(RuntimeError):
+            await service.collect_orders_to_db("20250601", "20250602", "004", safe_mode=False)
+
+        service.session.rollback.assert_awaited_once()
+        assert sorted(cancelled) == ["20250601", "20250602"]
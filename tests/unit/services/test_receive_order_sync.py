@@ -0,0 +1,154 @@
+"""
+워터마크 기반 주문 증분 수집 단위 테스트
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from core.settings import SETTINGS
+from repository.receive_order_sync_state_repository import ReceiveOrderSyncStateRepository
+from services.receive_orders import receive_order_sync_service
+from services.receive_orders.receive_order_sync_service import ReceiveOrderSyncService
+
+
+class _FakeReceiveOrdersRepository:
+    def __init__(self, fail: bool = False):
+        self.inserted: list[dict] = []
+        self.commits: list[bool] = []
+        self.fail = fail
+
+    async def bulk_insert_orders(self, orders: list[dict], commit: bool = True) -> list:
+        if self.fail:
+            raise RuntimeError("DB 오류")
+        self.commits.append(commit)
+        self.inserted.extend(orders)
+        return orders
+
+
+def _make_service(monkeypatch, state, batches, fail: bool = False):
+    # 세션 커밋/롤백, 상태 행 표시/잠금, 사방넷 요청 순서를 events에 기록
+    events = []
+    session = MagicMock()
+    session.commit = AsyncMock(side_effect=lambda: events.append("commit"))
+    session.rollback = AsyncMock(side_effect=lambda: events.append("rollback"))
+    session.flush = AsyncMock()
+    service = ReceiveOrderSyncService(session)
+    service.events = events
+    service.receive_orders_repository = _FakeReceiveOrdersRepository(fail)
+    service.sync_state_repository = ReceiveOrderSyncStateRepository(session)
+    service.sync_state_repository.claim_state = AsyncMock(
+        side_effect=lambda status, lease: events.append("claim") or state)
+    service.sync_state_repository.lock_state = AsyncMock(side_effect=lambda status: events.append("lock") or state)
+    service.sync_state_repository.release_claim = AsyncMock(
+        side_effect=lambda status, claimed_at: events.append(("release", claimed_at)))
+    service.requested_windows = []
+
+    def _create_xml_url(st, ed, status):
+        service.requested_windows.append((st, ed, status))
+        return "http://xml"
+
+    async def _fake_stream(xml_url, safe_mode, batch_size=None):
+        events.append("download")
+        for batch in batches:
+            yield batch
+
+    monkeypatch.setattr(service.receive_order_create_service, "create_window_request_xml_url", _create_xml_url)
+    monkeypatch.setattr(service.receive_order_create_service, "iter_order_batches_from_sabangnet", _fake_stream)
+    monkeypatch.setattr(receive_order_sync_service, "datetime", SimpleNamespace(
+        now=lambda: datetime(2025, 6, 3, 12, 0, 0), strptime=datetime.strptime))
+    return service
+
+
+CLAIMED_AT = datetime(2025, 6, 3, 3, 0, 0)
+
+
+def _state(last_reg_date=None, last_idx=None):
+    return SimpleNamespace(order_status="004", last_reg_date=last_reg_date, last_idx=last_idx,
+                           last_synced_at=None, last_synced_count=0, sync_started_at=CLAIMED_AT)
+
+
+class TestReceiveOrderSync:
+    """워터마크 이후 주문만 저장하고 워터마크를 이동하는지 테스트"""
+
+    async def test_sync_from_watermark_with_overlap(self, monkeypatch):
+        monkeypatch.setattr(SETTINGS, "RECEIVE_ORDER_SYNC_OVERLAP_MINUTES", 10)
+        state = _state("20250603110000", "100")
+        batches = [
+            [{"idx": "90", "reg_date": "20250603104959"}, {"idx": "100", "reg_date": "20250603110000"}],
+            [{"idx": "101", "reg_date": "20250603113000"}, {"idx": "102"}],
+        ]
+        service = _make_service(monkeypatch, state, batches)
+
+        response = await service.sync_orders("004", safe_mode=False)
+
+        assert service.requested_windows == [("20250603", "20250603", "004")]
+        # 겹침(10분) 이전 주문은 저장하지 않음, 겹침 구간 주문은 다시 보냄(중복은 DB에서 무시)
+        assert [order["idx"] for order in service.receive_orders_repository.inserted] == ["100", "101", "102"]
+        assert service.receive_orders_repository.commits == [False, False]
+        assert (state.last_reg_date, state.last_idx) == ("20250603113000", "101")
+        assert state.last_synced_count == 3
+        assert response.total_count == 3
+
+    async def test_state_row_is_not_locked_during_download(self, monkeypatch):
+        monkeypatch.setattr(SETTINGS, "RECEIVE_ORDER_SYNC_LEASE_SECONDS", 600)
+        state = _state("20250603110000", "100")
+        service = _make_service(monkeypatch, state, [[{"idx": "101", "reg_date": "20250603113000"}]])
+
+        await service.sync_orders("004")
+
+        # 수집 중 표시를 커밋한 뒤 다운로드하고, 워터마크 갱신 직전에만 행을 잠금
+        assert service.events == ["claim", "commit", "download", "lock", ("release", CLAIMED_AT), "commit"]
+        service.sync_state_repository.claim_state.assert_awaited_once_with("004", 600)
+
+    async def test_first_sync_uses_initial_days_and_keeps_watermark_when_empty(self, monkeypatch):
+        monkeypatch.setattr(SETTINGS, "RECEIVE_ORDER_SYNC_INITIAL_DAYS", 2)
+        state = _state()
+        service = _make_service(monkeypatch, state, [[]])
+
+        response = await service.sync_orders("004")
+
+        assert service.requested_windows == [("20250601", "20250603", "004")]
+        assert state.last_reg_date is None
+        assert state.last_synced_at == datetime(2025, 6, 3, 12, 0, 0)
+        assert response.total_count == 0
+
+    async def test_watermark_does_not_move_on_insert_failure(self, monkeypatch):
+        state = _state("20250603110000", "100")
+        service = _make_service(monkeypatch, state, [[{"idx": "101", "reg_date": "20250603113000"}]], fail=True)
+
+        with pytest.raises(RuntimeError):
+            await service.sync_orders("004")
+
+        assert state.last_reg_date == "20250603110000"
+        # 주문 저장은 롤백하고 수집 중 표시만 해제해서 다음 주기에 다시 수집
+        assert service.events == ["claim", "commit", "download", "rollback", ("release", CLAIMED_AT), "commit"]
+
+    async def test_skips_status_locked_by_other_worker(self, monkeypatch):
+        service = _make_service(monkeypatch, None, [])
+
+        assert await service.sync_orders("004") is None
+        assert service.requested_windows == []
+        assert service.events == ["claim", "rollback"]
+
+
+class TestReceiveOrderSyncStateClaim:
+    """수집 중 표시 쿼리 테스트"""
+
+    async def test_claim_is_single_conditional_update_without_row_lock(self):
+        session = MagicMock()
+        session.execute = AsyncMock()
+        repository = ReceiveOrderSyncStateRepository(session)
+
+        await repository.claim_state("004", lease_seconds=600)
+
+        insert_sql, claim_sql = [
+            str(call.args[0].compile(dialect=postgresql.dialect())) for call in session.execute.await_args_list]
+        assert "ON CONFLICT (order_status) DO NOTHING" in insert_sql
+        assert claim_sql.startswith("UPDATE receive_order_sync_state SET sync_started_at=now()")
+        assert "receive_order_sync_state.sync_started_at IS NULL OR receive_order_sync_state.sync_started_at <" in claim_sql
+        assert "RETURNING" in claim_sql
+        assert "FOR UPDATE" not in claim_sql
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+BundleUtilsV3 합포장 집계 벤치마크 (기존 groupby + lambda vs 벡터화)
+
+gmarket / zigzag / basic 합포장 매크로 입력(ERP 매크로 결과) 기준으로
+집계 단계만 시간을 재고, 두 결과가 같은지 함께 확인합니다.
+
+사용법:
+    python tests/unit/utils/benchmark_bundle_utils_v3.py [행 수, 기본 100000]
+"""
+
+import os
+import sys
+import time
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.join(os.path.dirname(__file__), '../../..')
+sys.path.append(project_root)
+
+from utils.macros.happojang.bundle_utils_v3 import BundleUtilsV3
+from tests.unit.utils.test_bundle_utils_v3 import ERP_MACROS, make_order_rows, _legacy_run_bundle_macro
+
+
+def _measure(func, *args):
+    started_at = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started_at
+
+
+def run_benchmark(count: int = 100_000):
+    print(f"주문 행 수: {count:,}")
+    print(f"{'macro':<16}{'groups':>10}{'legacy(s)':>12}{'vectorized(s)':>15}{'speedup':>10}  match")
+    print("-" * 72)
+    for macro_name, erp_macro in ERP_MACROS.items():
+        erp_rows = erp_macro(make_order_rows(count, seed=1))
+        expected, legacy_time = _measure(_legacy_run_bundle_macro, erp_rows)
+        result, vectorized_time = _measure(lambda rows: BundleUtilsV3(rows).run_bundle_macro(), erp_rows)
+        print(
+            f"{macro_name:<16}{len(result):>10,}{legacy_time:>12.3f}{vectorized_time:>15.3f}"
+            f"{legacy_time / vectorized_time:>9.1f}x  {result == expected}"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+sabangnet_logger 레코드당 비용 벤치마크 (기존 동기 기록 vs 큐 + 미리 만든 포맷터)
+
+get_logger 와 같은 콘솔 + 파일 핸들러 구성으로 logger.info() 를 반복 호출하고,
+호출한 스레드가 레코드 하나에 쓰는 시간을 잽니다.
+콘솔 출력은 /dev/null 로, 로그 파일은 임시 디렉토리로 보냅니다.
+
+    - legacy   : 기존 방식 (레코드마다 상대 경로 계산 + 포맷터 생성, 호출한 스레드에서 콘솔/파일 쓰기)
+    - queue    : 큐에 넣고 바로 반환 (drain 은 리스너 스레드가 큐를 다 비울 때까지 걸린 시간 포함)
+    - hot loop : 같은 줄에서 행마다 찍는 로그 (초당 건수 제한이 걸린 경우)
+
+사용법:
+    python tests/unit/utils/benchmark_sabangnet_logger.py [레코드 수, 기본 50000]
+"""
+
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 Python 경로에 추가
+project_root = os.path.join(os.path.dirname(__file__), '../../..')
+sys.path.append(project_root)
+
+from core.settings import SETTINGS
+from utils.logs import sabangnet_logger
+from utils.logs.sabangnet_logger import get_logger, stop_log_listener
+from utils.sabangnet_path_utils import SabangNetPathUtils
+from tests.unit.utils.test_sabangnet_logger import FILE_FORMAT, _LegacyColoredFormatter, _LegacyPlainFormatter
+
+
+def _legacy_logger(log_dir: Path, devnull) -> logging.Logger:
+    logger = logging.getLogger("benchmark_legacy")
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    console_handler = logging.StreamHandler(devnull)
+    console_handler.setFormatter(_LegacyColoredFormatter("business"))
+    file_handler = logging.FileHandler(log_dir / "benchmark_legacy.log", delay=True, encoding='utf-8')
+    file_handler.setFormatter(_LegacyPlainFormatter(FILE_FORMAT, datefmt='%Y-%m-%d %H:%M:%S'))
+    logger.addHandler(console_handler)
+    logger.addHandler(file_handler)
+    return logger
+
+
+def _queue_logger(name: str, devnull) -> logging.Logger:
+    stdout, sys.stdout = sys.stdout, devnull
+    try:
+        return get_logger(name)
+    finally:
+        sys.stdout = stdout
+
+
+def _log_rows(logger: logging.Logger, count: int) -> None:
+    for i in range(count):
+        logger.info("행 %d 처리 완료 (주문번호 %s)", i, f"ORDER-{i}")
+
+
+def _measure(logger: logging.Logger, count: int, drain: bool = False) -> tuple[float, float]:
+    started_at = time.perf_counter()
+    _log_rows(logger, count)
+    caller_time = time.perf_counter() - started_at
+    if drain:
+        stop_log_listener()
+    return caller_time, time.perf_counter() - started_at
+
+
+def run_benchmark(count: int = 50_000):
+    with tempfile.TemporaryDirectory() as log_dir, open(os.devnull, "w", encoding="utf-8") as devnull:
+        SabangNetPathUtils.get_log_file_path = classmethod(lambda cls: Path(log_dir))
+
+        legacy_time, _ = _measure(_legacy_logger(Path(log_dir), devnull), count)
+
+        SETTINGS.LOG_RATE_LIMIT_PER_SECOND = 0
+        queue_time, queue_drain_time = _measure(_queue_logger("benchmark_queue", devnull), count, drain=True)
+
+        SETTINGS.LOG_RATE_LIMIT_PER_SECOND = 20
+        hot_time, hot_drain_time = _measure(_queue_logger("benchmark_hot_loop", devnull), count, drain=True)
+
+        for handlers in sabangnet_logger._sinks.values():
+            for handler in handlers:
+                handler.close()
+
+    print(f"레코드 수: {count:,}")
+    print(f"{'mode':<12}{'caller(us/rec)':>16}{'drain(s)':>10}{'speedup':>10}")
+    print("-" * 48)
+    for mode, caller_time, drain_time in [
+        ("legacy", legacy_time, legacy_time),
+        ("queue", queue_time, queue_drain_time),
+        ("hot loop", hot_time, hot_drain_time),
+    ]:
+        print(f"{mode:<12}{caller_time / count * 1e6:>16.2f}{drain_time:>10.3f}{legacy_time / caller_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
@@ -0,0 +1,136 @@
+"""
+BundleUtilsV3 합포장 집계 단위 테스트
+
+벡터화 집계 결과가 기존 groupby + lambda 집계(_legacy_run_bundle_macro)와
+행 순서, 값, 타입까지 같은지 확인합니다.
+"""
+
+import random
+import pytest
+import pandas as pd
+
+from utils.macros.happojang.bundle_utils_v3 import BundleUtilsV3
+from utils.macros.ERP.v3.g_a_erp_macro_v3 import gauc_erp_macro_run
+from utils.macros.ERP.v3.etc_site_macro_v3 import etc_site_macro_run
+from utils.macros.ERP.v3.zigzag_erp_macrp_v3 import zigzag_erp_macro_run
+
+
+ERP_MACROS = {
+    "gmarket_bundle": gauc_erp_macro_run,
+    "zigzag_bundle": zigzag_erp_macro_run,
+    "basic_bundle": etc_site_macro_run,
+}
+
+
+def _legacy_run_bundle_macro(row_datas: list[dict]) -> list[dict]:
+    """벡터화 이전 BundleUtilsV3.run_bundle_macro (비교 기준)"""
+    def reversed_join(target_str):
+        return lambda x: target_str.join(filter(None, x[::-1]))
+
+    def sum_to_str():
+        return lambda x: str(sum(int(val) for val in x if val is not None))
+
+    df = pd.DataFrame(row_datas, dtype=object)
+    df['bundle_key'] = df['receive_zipcode'] + df['receive_addr'] + df['receive_name']
+    all_columns = {
+        'order_id': 'max', 'item_name': reversed_join(' + '), 'service_fee': 'max',
+        'pay_cost': 'sum', 'delv_cost': 'max', 'idx': reversed_join('/'),
+        'product_name': reversed_join(' / '), 'mall_product_id': reversed_join('/'),
+        'sku_value': reversed_join('/'), 'sale_cnt': sum_to_str(), 'expected_payout': 'max',
+        'delv_msg': reversed_join('/'), 'etc_cost': sum_to_str(),
+        'seq': 'first', 'fld_dsp': 'first', 'process_dt': 'first', 'form_name': 'first',
+        'receive_name': 'first', 'receive_addr': 'first', 'receive_zipcode': 'first',
+        'receive_cel': 'first', 'receive_tel': 'first', 'delivery_method_str': 'first',
+        'invoice_no': 'first', 'location_nm': 'first', 'order_etc_7': 'first',
+        'product_id': 'first', 'free_gift': 'first', 'work_status': 'first',
+        'mall_order_id': 'first',
+    }
+    agg_dict = {col: func for col, func in all_columns.items() if col in df.columns}
+    df = df.groupby('bundle_key', as_index=False).agg(agg_dict)
+    df.drop('bundle_key', axis=1, inplace=True)
+    return df.to_dict(orient='records')
+
+
+def make_order_rows(count: int, seed: int = 0, fld_dsp: str = "G마켓") -> list[dict]:
+    """수취인이 겹치는(합포장 대상) 주문 행 생성"""
+    rng = random.Random(seed)
+    receivers = [
+        (f"{10000 + i:05d}", f"서울시 강남구 테헤란로 {i}길", f"수취인{i}")
+        for i in range(max(1, count // 3))
+    ]
+    rows = []
+    for i in range(count):
+        zipcode, addr, name = rng.choice(receivers)
+        rows.append({
+            "idx": f"{9000000 + i}",
+            "seq": i,
+            "order_id": f"ORD{rng.randint(1, count):08d}",
+            "mall_order_id": f"M{rng.randint(1, count // 2 + 1):08d}",
+            "fld_dsp": fld_dsp,
+            "process_dt": "2025-09-01",
+            "form_name": "기본양식",
+            "item_name": rng.choice(["상품A 1개", "상품B 2개", "", None]),
+            "product_name": rng.choice(["수집상품A", "수집상품B", None]),
+            "mall_product_id": rng.choice([f"P{rng.randint(1, 500)}", None]),
+            "sku_value": rng.choice(["블랙/FREE", "화이트/L", ""]),
+            "sale_cnt": rng.choice([1, 2, "3", None]),
+            "pay_cost": rng.randint(1, 50) * 1000,
+            "expected_payout": rng.randint(1, 50) * 1000,
+            "service_fee": rng.choice([0, 500, None]),
+            "delv_cost": rng.choice([0, 3000, "", None]),
+            "delv_msg": rng.choice(["문 앞", "", None]),
+            "receive_name": name,
+            "receive_addr": addr,
+            "receive_zipcode": zipcode if rng.random() > 0.01 else None,
+            "receive_cel": "01012345678",
+            "receive_tel": "010-1234-5678",
+            "delivery_method_str": rng.choice(["선불", "착불", None]),
+            "invoice_no": None,
+            "location_nm": None,
+            "order_etc_7": None,
+            "product_id": f"G{rng.randint(1, 300)}",
+            "free_gift": None,
+            "mall_product_name": None,
+        })
+    return rows
+
+
+class TestBundleUtilsV3:
+    """BundleUtilsV3 집계 테스트"""
+
+    @pytest.mark.parametrize("macro_name", list(ERP_MACROS))
+    def test_matches_legacy_aggregation(self, macro_name):
+        erp_rows = ERP_MACROS[macro_name](make_order_rows(3000, seed=7))
+
+        result = BundleUtilsV3(erp_rows).run_bundle_macro()
+        expected = _legacy_run_bundle_macro(erp_rows)
+
+        assert result == expected
+        assert [type(v) for v in result[0].values()] == [type(v) for v in expected[0].values()]
+
+    def test_reversed_join_and_sum(self):
+        rows = [
+            {"receive_zipcode": "1", "receive_addr": "A", "receive_name": "홍", "idx": "1", "item_name": "a",
+             "sale_cnt": 1, "etc_cost": "100"},
+            {"receive_zipcode": "2", "receive_addr": "B", "receive_name": "김", "idx": "2", "item_name": "",
+             "sale_cnt": None, "etc_cost": "50"},
+            {"receive_zipcode": "1", "receive_addr": "A", "receive_name": "홍", "idx": "3", "item_name": "c",
+             "sale_cnt": "2", "etc_cost": "200"},
+        ]
+
+        result = BundleUtilsV3(rows).run_bundle_macro()
+
+        assert result == [
+            {"item_name": "c + a", "idx": "3/1", "sale_cnt": "3", "etc_cost": "300",
+             "receive_name": "홍", "receive_addr": "A", "receive_zipcode": "1"},
+            {"item_name": "", "idx": "2", "sale_cnt": "0", "etc_cost": "50",
+             "receive_name": "김", "receive_addr": "B", "receive_zipcode": "2"},
+        ]
+
+    def test_rows_without_bundle_key_are_dropped(self):
+        rows = [
+            {"receive_zipcode": None, "receive_addr": "A", "receive_name": "홍", "idx": "1"},
+            {"receive_zipcode": "1", "receive_addr": "A", "receive_name": "홍", "idx": "2"},
+        ]
+
+        assert BundleUtilsV3(rows).run_bundle_macro() == _legacy_run_bundle_macro(rows)
@@ -0,0 +1,82 @@
+"""
+엑셀 -> down_form_orders 컬럼 단위 매핑 단위 테스트
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pandas as pd
+import pytest
+
+from utils.mappings.down_form_order_mapper import (
+    convert_column_to_db_type,
+    convert_field_to_db_type,
+    map_excel_to_down_form,
+)
+
+
+COLUMN_VALUES = {
+    "seq": [1, "7", "", 0, "  ", 3.0],
+    "order_id": ["O1", 12345, 1.5, "", "x" * 120, "O2"],
+    "delivery_method_str": ["선결제", "착불이아주긴배송방법입니다", "", "  ", 1, "착불"],
+    "pay_cost": [12000, "3000", "", 0, 1500.5, "  "],
+    "order_date": [datetime(2024, 1, 2, 3, 4, 5), "", "2024-01-01", "  ", "20240101", datetime(2024, 1, 3)],
+    "error_logs": [{"a": 1}, "", "x", 0, "y", "z"],
+}
+
+
+def _config() -> dict:
+    return {
+        "column_mappings": [
+            {"target_column": "주문번호", "source_field": "order_id"},
+            {"target_column": "수취인", "source_field": "receive_name"},
+            {"target_column": "전화번호", "source_field": "receive_cel"},
+            {"target_column": "주소", "source_field": "receive_addr"},
+            {"target_column": "금액", "source_field": "pay_cost"},
+        ],
+    }
+
+
+class TestConvertColumnToDbType:
+    """convert_column_to_db_type 가 값 단위 변환과 같은 결과를 내는지 테스트"""
+
+    @pytest.mark.parametrize("field", list(COLUMN_VALUES))
+    def test_matches_field_conversion(self, field):
+        values = COLUMN_VALUES[field]
+
+        result = convert_column_to_db_type(field, pd.Series(values, dtype=object))
+
+        assert result.tolist() == [convert_field_to_db_type(field, value) for value in values]
+
+    def test_empty_excel_cells_become_none(self):
+        result = convert_column_to_db_type("pay_cost", pd.Series([12000.0, float("nan")]))
+
+        assert result.tolist() == [Decimal("12000.0"), None]
+
+
+class TestMapExcelToDownForm:
+    """map_excel_to_down_form 테스트"""
+
+    def test_renames_converts_and_drops_unmapped_columns(self, monkeypatch):
+        monkeypatch.setenv("DEPLOY_ENV", "production")
+        df = pd.DataFrame({
+            "주문번호": [1001, "O2"], "수취인": ["홍길동", None], "전화번호": ["010-1234-5678", ""],
+            "주소": ["서울시 강남구 역삼동 1", "부산"], "금액": [12000, ""], "무시": [1, 2],
+        })
+
+        rows = map_excel_to_down_form(df, _config())
+
+        assert rows == [
+            {"order_id": "1001", "receive_name": "홍길동", "receive_cel": "010-1234-5678",
+             "receive_addr": "서울시 강남구 역삼동 1", "pay_cost": Decimal("12000")},
+            {"order_id": "O2", "receive_name": None, "receive_cel": "",
+             "receive_addr": "부산", "pay_cost": None},
+        ]
+
+    def test_masks_personal_info_outside_production(self, monkeypatch):
+        monkeypatch.setenv("DEPLOY_ENV", "dev")
+        df = pd.DataFrame({"수취인": ["홍길동"], "전화번호": ["010-1234-5678"], "주소": ["서울시 강남구 역삼동 1"]})
+
+        row = map_excel_to_down_form(df, _config())[0]
+
+        assert row == {"receive_name": "홍**", "receive_cel": "010****5678", "receive_addr": "서울시 강남구 ****"}
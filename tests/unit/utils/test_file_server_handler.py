@@ -0,0 +1,121 @@
+"""
+file_server_handler async 업로드 클라이언트 (스트리밍 / 재시도 / 이벤트 루프 비차단) 단위 테스트
+"""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+import file_server_handler
+from core.settings import SETTINGS
+
+
+@pytest.fixture
+async def file_server(monkeypatch):
+    """multipart를 천천히 읽는 파일 서버 대역 (지정한 횟수만큼 먼저 실패 응답)"""
+
+    state = {"uploads": [], "fail_statuses": [], "requests": 0}
+
+    async def upload(request: web.Request) -> web.Response:
+        state["requests"] += 1
+        reader = await request.multipart()
+        fields, size, file_name = {}, 0, None
+        async for part in reader:
+            if part.name == "file":
+                file_name = part.filename
+                while chunk := await part.read_chunk(256 * 1024):
+                    size += len(chunk)
+                    await asyncio.sleep(0.005)
+            else:
+                fields[part.name] = await part.text()
+        if state["fail_statuses"]:
+            return web.Response(status=state["fail_statuses"].pop(0), text="busy")
+        state["uploads"].append({"size": size, "file_name": file_name, **fields})
+        return web.json_response({"success": True, "filename": fields["filename"]})
+
+    async def upload_xml(request: web.Request) -> web.Response:
+        state["requests"] += 1
+        data = await request.post()
+        state["uploads"].append(dict(data))
+        return web.json_response({"success": True, "filename": data["filename"]})
+
+    app = web.Application(client_max_size=64 * 1024 * 1024)
+    app.router.add_post("/api/upload", upload)
+    app.router.add_post("/api/upload-xml", upload_xml)
+    server = TestServer(app)
+    await server.start_server()
+    server.state = state
+    monkeypatch.setattr(file_server_handler, "FILE_SERVER_API_URL", str(server.make_url("/api")))
+    monkeypatch.setattr(SETTINGS, "FILE_SERVER_RETRY_BACKOFF", 0)
+    yield server
+    await server.close()
+
+
+@pytest.fixture
+def large_file(tmp_path):
+    path = tmp_path / "mall_price_7_1.xml"
+    path.write_bytes(b"<DATA/>" * (8 * 1024 * 1024 // 7))
+    return path
+
+
+class TestUploadToFileServerAsync:
+    """파일 서버 async 업로드 테스트"""
+
+    async def test_event_loop_stays_responsive_during_large_upload(self, file_server, large_file):
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker_task = asyncio.create_task(ticker())
+        try:
+            object_name = await file_server_handler.upload_to_file_server_async(large_file, "renamed.xml")
+        finally:
+            ticker_task.cancel()
+
+        upload = file_server.state["uploads"][0]
+        assert object_name == "renamed.xml"
+        assert (upload["size"], upload["file_name"], upload["filename"]) == (
+            large_file.stat().st_size, "mall_price_7_1.xml", "renamed.xml")
+        # 서버가 청크마다 쉬는 동안(32청크 x 5ms 이상) 루프가 계속 돌았는지
+        assert ticks >= 5
+
+    async def test_server_errors_are_retried_with_a_fresh_stream(self, file_server, large_file):
+        file_server.state["fail_statuses"] = [503, 502]
+
+        assert await file_server_handler.upload_to_file_server_async(large_file) == "mall_price_7_1.xml"
+
+        assert file_server.state["requests"] == 3
+        assert file_server.state["uploads"][0]["size"] == large_file.stat().st_size
+
+    async def test_client_errors_are_not_retried(self, file_server, large_file):
+        file_server.state["fail_statuses"] = [400]
+
+        with pytest.raises(RuntimeError, match="HTTP 400"):
+            await file_server_handler.upload_to_file_server_async(large_file)
+
+        assert file_server.state["requests"] == 1
+
+    async def test_gives_up_after_max_retries(self, file_server, large_file, monkeypatch):
+        monkeypatch.setattr(SETTINGS, "FILE_SERVER_MAX_RETRIES", 2)
+        file_server.state["fail_statuses"] = [503, 503, 503]
+
+        with pytest.raises(RuntimeError, match="network error"):
+            await file_server_handler.upload_to_file_server_async(large_file)
+
+        assert file_server.state["requests"] == 2
+
+    async def test_xml_content_upload(self, file_server):
+        filename = await file_server_handler.upload_xml_content_to_file_server_async("<SABANG/>", "mall_request.xml")
+
+        assert filename == "mall_request.xml"
+        assert file_server.state["uploads"] == [{"content": "<SABANG/>", "filename": "mall_request.xml"}]
+
+    async def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            await file_server_handler.upload_to_file_server_async(tmp_path / "missing.xml")
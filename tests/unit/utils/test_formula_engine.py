@@ -0,0 +1,161 @@
+"""
+템플릿 수식 엔진 단위 테스트
+"""
+
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pytest
+
+from services.template_mapping_service import TemplateMappingService
+from utils.mappings.formula_engine import FormulaError, compile_formula, compile_template_formulas
+from utils.mappings.down_form_order_mapper import (
+    eval_formula,
+    map_raw_to_down_form_and_receive_order,
+    map_receive_orders_to_down_form,
+)
+
+
+def _config() -> dict:
+    return {
+        "template_code": "test_erp",
+        "column_mappings": [
+            {"source_field": "expected_payout", "field_type": "formula",
+             "transform_config": {"source": "sum(mall_won_cost * sale_cnt)"}},
+            {"source_field": "service_fee", "field_type": "formula",
+             "transform_config": {"source": "pay_cost - mall_won_cost * sale_cnt"}},
+            {"source_field": "delivery_method_str", "field_type": "formula",
+             "transform_config": {"source": "convert_name(delivery_method_str)"}},
+            {"source_field": "sum_pay_cost", "field_type": "formula", "transform_config": {"source": "=SUM(A1:A3)"}},
+            {"source_field": "etc_msg", "field_type": "empty"},
+            {"source_field": "receive_name", "field_type": "variable"},
+        ],
+    }
+
+
+class TestCompileFormula:
+    """수식 컴파일 / 평가 테스트"""
+
+    def test_row_evaluation(self):
+        formula = compile_formula("pay_cost - mall_won_cost * sale_cnt")
+
+        assert formula.fields == ("pay_cost", "mall_won_cost", "sale_cnt")
+        assert formula.evaluate_row({"pay_cost": Decimal("10000"), "mall_won_cost": Decimal("4000"), "sale_cnt": 2}) == 2000
+        # 숫자 필드의 빈 값은 0, 문자열 숫자는 숫자로
+        assert formula.evaluate_row({"pay_cost": "10000", "mall_won_cost": None, "sale_cnt": 2}) == 10000
+
+    def test_field_names_are_not_replaced_as_substrings(self):
+        formula = compile_formula("sum_pay_cost - pay_cost")
+
+        assert formula.evaluate_row({"pay_cost": 100, "sum_pay_cost": 300}) == 200
+
+    def test_column_evaluation_matches_row_evaluation(self):
+        rows = [
+            {"pay_cost": Decimal("10000.00"), "mall_won_cost": Decimal("4000.00"), "sale_cnt": 2},
+            {"pay_cost": None, "mall_won_cost": Decimal("1000.00"), "sale_cnt": 3},
+            {"pay_cost": Decimal("5000.00"), "mall_won_cost": None, "sale_cnt": None},
+        ]
+        formula = compile_formula("pay_cost - mall_won_cost * sale_cnt")
+
+        result = formula.evaluate(pd.DataFrame(rows, dtype=object))
+
+        assert result.tolist() == [formula.evaluate_row(row) for row in rows]
+
+    def test_column_evaluation_falls_back_to_rows_for_bad_values(self):
+        df = pd.DataFrame({"receive_name": ["홍길동", 3]}, dtype=object)
+
+        result = compile_formula("receive_name + '님'").evaluate(df)
+
+        assert result.tolist() == ["홍길동님", None]
+
+    def test_non_numeric_string_in_numeric_field_fails_only_that_row(self):
+        rows = [
+            {"mall_won_cost": "1000", "sale_cnt": 2},
+            {"mall_won_cost": "abc", "sale_cnt": 2},
+            {"mall_won_cost": " ", "sale_cnt": 2},
+        ]
+        formula = compile_formula("mall_won_cost * sale_cnt")
+
+        result = formula.evaluate(pd.DataFrame(rows, dtype=object))
+
+        # 0으로 바꾸지 않고 그 행만 None, 빈 문자열은 빈 값이라 0
+        assert result.tolist() == [2000, None, 0]
+        assert eval_formula({"source": "mall_won_cost * sale_cnt"}, rows[1]) is None
+
+    def test_division_by_zero_gives_none_instead_of_inf(self):
+        rows = [{"pay_cost": 100, "sale_cnt": 4}, {"pay_cost": 100, "sale_cnt": 0}, {"pay_cost": 100, "sale_cnt": None}]
+        formula = compile_formula("pay_cost / sale_cnt")
+
+        result = formula.evaluate(pd.DataFrame(rows))
+
+        assert result.tolist() == [25.0, None, None]
+        assert [eval_formula({"source": "pay_cost / sale_cnt"}, row) for row in rows] == [25.0, None, None]
+
+    @pytest.mark.parametrize("source", [
+        '__import__("os").system("ls")',
+        "pay_cost.__class__",
+        "pay_cost ** 2",
+        "int(pay_cost)",
+        "[pay_cost]",
+    ])
+    def test_rejects_non_whitelisted_syntax(self, source):
+        with pytest.raises(FormulaError):
+            compile_formula(source)
+
+        assert eval_formula({"source": source}, {"pay_cost": 1}) is None
+
+
+class TestTemplateFormulas:
+    """템플릿 단위 컴파일 / 컬럼 단위 매핑 테스트"""
+
+    def test_template_formulas_are_cached(self):
+        compiled = compile_template_formulas(_config())
+
+        assert set(compiled) == {"expected_payout", "service_fee", "delivery_method_str"}
+        assert compile_template_formulas(_config()) is compiled
+
+    def test_columnwise_mapping_matches_row_mapping(self):
+        rows = [
+            {"idx": "1", "pay_cost": Decimal("10000.00"), "mall_won_cost": Decimal("4000.00"), "sale_cnt": 2,
+             "delivery_method_str": "선결제", "receive_name": "홍길동"},
+            {"idx": "2", "pay_cost": Decimal("8000.00"), "mall_won_cost": None, "sale_cnt": 1,
+             "delivery_method_str": None, "receive_name": None},
+        ]
+
+        expected_rows = [dict(row) for row in rows]
+        expected = [map_raw_to_down_form_and_receive_order(row, _config()) for row in expected_rows]
+        result = map_receive_orders_to_down_form(rows, _config())
+
+        assert result == expected
+        # 원본 row도 기존 함수처럼 formula/empty 결과가 반영됨
+        assert rows == expected_rows
+        assert rows[0]["service_fee"] == Decimal("2000.00")
+        assert rows[1]["etc_msg"] is None
+        assert result[0]["service_fee"] == Decimal("2000.00")
+        assert result[1]["delivery_method_str"] == ""
+        assert result[0]["sum_pay_cost"] is None
+
+
+class TestTemplateMappingServiceApplyFormula:
+    """TemplateMappingService._apply_formula 테스트"""
+
+    @pytest.fixture
+    def service(self):
+        return TemplateMappingService(MagicMock())
+
+    def test_convert_name_keeps_only_known_delivery_methods(self, service):
+        df = pd.DataFrame({"delivery_method_str": ["선결제", "신용", None, "착불"]})
+
+        result = service._apply_formula(df, "convert_name(delivery_method_str)", {})
+
+        assert result.tolist() == ["선결제", "", "", "착불"]
+        # 컬럼이 없으면 빈 값
+        assert service._apply_formula(pd.DataFrame({"a": [1]}), "convert_name(delivery_method_str)", {}).tolist() == [""]
+
+    def test_other_formulas_use_engine(self, service):
+        df = pd.DataFrame({"pay_cost": [10000, 100], "mall_won_cost": [4000, "abc"], "sale_cnt": [2, 1]})
+
+        assert service._apply_formula(df, "pay_cost - mall_won_cost * sale_cnt", {}).tolist() == [2000, None]
+        assert service._apply_formula(df, "pay_cost / 0", {}).tolist() == [None, None]
+        assert service._apply_formula(df, "=SUM(A1:A2)", {}).tolist() == ["", ""]
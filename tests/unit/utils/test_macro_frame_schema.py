@@ -0,0 +1,148 @@
+"""
+ERP v3 매크로 DataFrame 스키마 단위 테스트
+"""
+
+from decimal import Decimal
+
+import pandas as pd
+
+from utils.macros.ERP.v3.macro_frame_schema import to_macro_frame, from_macro_frame
+from utils.macros.ERP.v3.g_a_erp_macro_v3 import gauc_erp_macro_run
+from utils.macros.ERP.v3.etc_site_macro_v3 import etc_site_macro_run
+from utils.macros.ERP.v3.brandi_erp_macro_v3 import brandi_erp_macro_run
+from utils.macros.order_macro_utils import OrderMacroUtils
+
+
+def _order_row(**overrides) -> dict:
+    row = {
+        "idx": "1", "order_id": "O1", "mall_order_id": "M1", "fld_dsp": "G마켓", "form_name": "gmarket_erp",
+        "item_name": "상품A 1개", "product_name": "수집상품", "receive_name": "홍길동",
+        "receive_addr": "서울시 강남구", "receive_zipcode": "06000", "receive_cel": "01012345678",
+        "receive_tel": None, "delivery_method_str": "선불", "invoice_no": None, "sale_cnt": 1,
+        "pay_cost": "12000", "expected_payout": "10000", "service_fee": "500", "delv_cost": "3000",
+    }
+    row.update(overrides)
+    return row
+
+
+# 소수 원화 / 빈 금액 입력 (receive_orders Numeric 컬럼은 Decimal 또는 None)
+FRACTIONAL_AMOUNTS = dict(pay_cost=Decimal("12000.55"), expected_payout=Decimal("10000.4"),
+                          service_fee=Decimal("500.7"), delv_cost=Decimal("3000.5"))
+MISSING_AMOUNTS = dict(pay_cost=None, expected_payout=None, service_fee=Decimal("0.6"), delv_cost=None)
+AMOUNT_FIELDS = ("pay_cost", "expected_payout", "service_fee", "delv_cost", "etc_cost")
+
+
+def _amounts(row: dict) -> dict:
+    return {field: (row[field], type(row[field])) for field in AMOUNT_FIELDS}
+
+
+class TestMacroFrameSchema:
+    """to_macro_frame / from_macro_frame 테스트"""
+
+    def test_entry_dtypes(self):
+        df = to_macro_frame([_order_row(), _order_row(idx="2", delv_cost="", pay_cost=None, fld_dsp=None)])
+
+        assert df["expected_payout"].dtype == "int64"
+        assert df["delv_cost"].tolist() == [3000, 0]
+        # pay_cost는 변환하지 않음 (빈 값은 None 그대로)
+        assert df["pay_cost"].tolist() == ["12000", None]
+        assert isinstance(df["fld_dsp"].dtype, pd.CategoricalDtype)
+        assert isinstance(df["receive_name"].dtype, pd.StringDtype)
+        # 스키마에 없는 컬럼은 그대로
+        assert df["sale_cnt"].dtype == object
+
+    def test_fractional_amounts_are_not_rounded(self):
+        df = to_macro_frame([_order_row(**FRACTIONAL_AMOUNTS), _order_row(idx="2", **MISSING_AMOUNTS)])
+
+        assert df["expected_payout"].tolist() == [10000.4, 0.0]
+        assert df["delv_cost"].tolist() == [3000.5, 0.0]
+        assert df["pay_cost"].tolist() == [Decimal("12000.55"), None]
+
+    def test_exit_returns_plain_python_values(self):
+        df = to_macro_frame([_order_row(receive_tel=None, pay_cost=None)])
+        df["etc_cost"] = df["expected_payout"] + df["service_fee"] + df["delv_cost"]
+
+        row = from_macro_frame(df)[0]
+
+        assert row["etc_cost"] == "13500"
+        assert row["pay_cost"] is None
+        assert row["receive_tel"] is None
+        assert row["fld_dsp"] == "G마켓"
+        assert type(row["expected_payout"]) is int
+
+    def test_exit_truncates_fractional_etc_cost(self):
+        # 기존 매크로의 etc_cost.astype(int).astype(str) 과 같이 소수점 버림
+        df = to_macro_frame([_order_row(**FRACTIONAL_AMOUNTS)])
+        df["etc_cost"] = df["expected_payout"] + df["service_fee"] + df["delv_cost"]
+
+        assert from_macro_frame(df)[0]["etc_cost"] == "13501"
+
+
+class TestErpMacroV3WithSchema:
+    """스키마 적용 후 ERP / 합포장 매크로 결과 테스트"""
+
+    def test_gmarket_erp_amounts(self):
+        rows = gauc_erp_macro_run([_order_row()])
+
+        assert rows[0]["etc_cost"] == "13500"
+        assert rows[0]["item_name"] == "상품A"
+        assert rows[0]["delivery_method_str"] == ""
+        assert rows[0]["receive_cel"] == "010-1234-5678"
+
+    def test_etc_site_today_house_site_is_zero(self):
+        rows = etc_site_macro_run([_order_row(fld_dsp="오늘의집", form_name="basic_erp")])
+
+        assert rows[0]["fld_dsp"] == "0"
+
+    def test_star_average_keeps_fractional_delivery_cost(self):
+        rows = brandi_erp_macro_run([
+            _order_row(idx="1", order_id="O1", delv_cost="3000"),
+            _order_row(idx="2", order_id="O2", delv_cost="4000"),
+        ], is_star=True)
+
+        assert [row["delv_cost"] for row in rows] == [3500.0, 3500.0]
+
+    def test_bundle_macro_uses_typed_frame(self):
+        rows = OrderMacroUtils().run_gmarket_bundle_macro([
+            _order_row(idx="1", order_id="O1", item_name="상품A 1개", sale_cnt=1, pay_cost=12000),
+            _order_row(idx="2", order_id="O2", item_name="상품B 2개", sale_cnt=2, receive_tel="021234567",
+                       pay_cost=12000),
+        ])
+
+        assert len(rows) == 1
+        assert rows[0]["idx"] == "2/1"
+        assert rows[0]["item_name"] == "상품B 2개 + 상품A"
+        assert rows[0]["sale_cnt"] == "3"
+        assert rows[0]["pay_cost"] == 24000
+        assert rows[0]["fld_dsp"] == "G마켓"
+        assert rows[0]["invoice_no"] is None
+
+    def test_gmarket_erp_golden_fractional_and_missing_amounts(self):
+        """스키마 적용 전 매크로 결과(값 / 타입)와 같은지 확인"""
+        rows = gauc_erp_macro_run([
+            _order_row(**FRACTIONAL_AMOUNTS),
+            _order_row(idx="2", order_id="O2", mall_order_id="M2", receive_name="김철수", **MISSING_AMOUNTS),
+        ])
+
+        assert [_amounts(row) for row in rows] == [
+            {"pay_cost": (None, type(None)), "expected_payout": (0.0, float), "service_fee": (0.6, float),
+             "delv_cost": (0.0, float), "etc_cost": ("0", str)},
+            {"pay_cost": (Decimal("12000.55"), Decimal), "expected_payout": (10000.4, float),
+             "service_fee": (500.7, float), "delv_cost": (3000.5, float), "etc_cost": ("13501", str)},
+        ]
+
+    def test_bundle_golden_fractional_and_missing_pay_cost(self):
+        """합포장 pay_cost 합계는 None을 건너뛰고, 전부 None인 묶음은 0 (스키마 적용 전과 같음)"""
+        rows = OrderMacroUtils().run_gmarket_bundle_macro([
+            _order_row(**FRACTIONAL_AMOUNTS),
+            _order_row(idx="2", order_id="O2", **MISSING_AMOUNTS),
+            _order_row(idx="3", order_id="O3", receive_name="김철수", **MISSING_AMOUNTS),
+            _order_row(idx="4", order_id="O4", receive_name="김철수", **MISSING_AMOUNTS),
+        ])
+
+        assert [(row["idx"], _amounts(row)) for row in rows] == [
+            ("4/3", {"pay_cost": (0, int), "expected_payout": (0.0, float), "service_fee": (0.6, float),
+                     "delv_cost": (0.0, float), "etc_cost": ("0", str)}),
+            ("2/1", {"pay_cost": (Decimal("12000.55"), Decimal), "expected_payout": (10000.4, float),
+                     "service_fee": (500.7, float), "delv_cost": (3000.5, float), "etc_cost": ("16502", str)}),
+        ]
@@ -0,0 +1,209 @@
+"""
+minio_handler 업로드 경로 (버킷 확인 캐시 / 버퍼 업로드 / 동시 업로드) 단위 테스트
+"""
+
+import io
+import time
+import threading
+
+import pytest
+from minio.error import S3Error
+
+import minio_handler
+
+
+class _FakeMinio:
+    """업로드 호출과 동시 실행 수를 기록하는 MinIO 클라이언트 대역"""
+
+    def __init__(self, bucket_exists: bool = True):
+        self.exists = bucket_exists
+        self.bucket_checks = 0
+        self.made_buckets = 0
+        self.puts: list[dict] = []
+        self.missing_once = False
+        self.fail_paths: set[str] = set()
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def bucket_exists(self, bucket_name):
+        self.bucket_checks += 1
+        return self.exists
+
+    def make_bucket(self, bucket_name):
+        self.made_buckets += 1
+        self.exists = True
+
+    def _record(self, **kwargs):
+        if self.missing_once:
+            self.missing_once = False
+            raise S3Error("NoSuchBucket", "bucket does not exist", "", "", "", None)
+        self.puts.append(kwargs)
+
+    def fput_object(self, bucket_name, object_name, file_path, **kwargs):
+        with self._lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            time.sleep(0.05)
+            if file_path in self.fail_paths:
+                raise S3Error("AccessDenied", "denied", "", "", "", None)
+            self._record(object_name=object_name, file_path=file_path, **kwargs)
+        finally:
+            with self._lock:
+                self.running -= 1
+
+    def put_object(self, bucket_name, object_name, data, length, **kwargs):
+        self._record(object_name=object_name, body=data.read(length), length=length, data=data, **kwargs)
+
+    def presigned_get_object(self, bucket_name, object_name, **kwargs):
+        return f"http://minio:9000/{bucket_name}/{object_name}?X-Amz-Signature=abc"
+
+    def stat_object(self, bucket_name, object_name):
+        raise AssertionError("크기를 알고 있으면 stat_object를 호출하지 않아야 함")
+
+
+@pytest.fixture
+def fake_minio(monkeypatch):
+    fake = _FakeMinio()
+    monkeypatch.setattr(minio_handler, "minio_client", fake)
+    monkeypatch.setattr(minio_handler, "_bucket_ready", False)
+    monkeypatch.setattr(minio_handler, "_presign_cache", minio_handler.OrderedDict())
+    return fake
+
+
+class TestBucketCheck:
+    """버킷 확인 캐시 테스트"""
+
+    def test_bucket_is_checked_once_per_process(self, fake_minio):
+        fake_minio.exists = False
+
+        for i in range(3):
+            minio_handler.upload_bytes_to_minio(b"data", f"obj{i}")
+
+        assert (fake_minio.bucket_checks, fake_minio.made_buckets) == (1, 1)
+        assert len(fake_minio.puts) == 3
+
+    def test_missing_bucket_is_rechecked_and_retried_once(self, fake_minio):
+        minio_handler.upload_bytes_to_minio(b"data", "first")
+        fake_minio.missing_once = True
+
+        minio_handler.upload_bytes_to_minio(b"data", "second")
+
+        assert fake_minio.bucket_checks == 2
+        assert [put["object_name"] for put in fake_minio.puts] == ["first", "second"]
+        assert fake_minio.puts[1]["body"] == b"data"
+
+    def test_upload_uses_parallel_multipart_settings(self, fake_minio, tmp_path):
+        path = tmp_path / "a.xlsx"
+        path.write_bytes(b"x")
+
+        assert minio_handler.upload_file_to_minio(str(path)) == "a.xlsx"
+
+        put = fake_minio.puts[0]
+        assert put["part_size"] == minio_handler.MINIO_PART_SIZE
+        assert put["num_parallel_uploads"] == minio_handler.MINIO_PARALLEL_UPLOADS
+
+
+class TestBufferUpload:
+    """메모리 버퍼 업로드 테스트"""
+
+    def test_buffer_is_uploaded_from_current_position_without_copy(self, fake_minio):
+        buffer = io.BytesIO(b"headerbody")
+        buffer.seek(6)
+
+        minio_handler.upload_bytes_to_minio(buffer, "obj", content_type="text/plain")
+
+        put = fake_minio.puts[0]
+        assert put["data"] is buffer
+        assert (put["length"], put["body"], put["content_type"]) == (4, b"body", "text/plain")
+
+
+class TestConcurrentUpload:
+    """여러 파일 동시 업로드 테스트"""
+
+    async def test_files_upload_concurrently_and_failures_stay_in_place(self, fake_minio, tmp_path):
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"f{i}.xlsx"
+            path.write_bytes(b"x")
+            paths.append(str(path))
+        fake_minio.fail_paths = {paths[1]}
+
+        results = await minio_handler.upload_many_and_get_url_and_size_async(
+            [(path, "tpl", f"f{i}.xlsx") for i, path in enumerate(paths)])
+
+        assert fake_minio.max_running > 1
+        assert isinstance(results[1], RuntimeError)
+        file_url, object_name, file_size = results[0]
+        assert object_name.startswith("excel/tpl/") and object_name.endswith("_f0.xlsx")
+        # 크기는 업로드한 로컬 파일에서 (stat_object 호출 없음)
+        assert file_url.startswith("https://minio/") and file_size == 1
+        assert sum(1 for result in results if isinstance(result, tuple)) == 3
+        assert fake_minio.bucket_checks == 1
+        # 업로드한 임시 파일은 삭제
+        assert [path for path in paths if not (tmp_path / path).exists()] == [paths[0], paths[2], paths[3]]
+
+
+class _Clock:
+    """minio_handler.time 대역 (모듈 안에서만 교체)"""
+
+    def __init__(self, now: float):
+        self.now = now
+
+    def time(self) -> float:
+        return self.now
+
+
+class TestPresignCache:
+    """presigned URL 캐시 / 일괄 서명 테스트"""
+
+    @pytest.fixture
+    def signer(self, monkeypatch):
+        calls = []
+
+        def presigned_get_object(bucket_name, object_name, expires, request_date):
+            calls.append((object_name, expires, request_date))
+            return f"http://minio:9000/{bucket_name}/{object_name}?X-Amz-Date={request_date:%Y%m%dT%H%M%SZ}"
+
+        client = type("Client", (), {})()
+        client.presigned_get_object = presigned_get_object
+        monkeypatch.setattr(minio_handler, "minio_client", client)
+        monkeypatch.setattr(minio_handler, "_presign_cache", minio_handler.OrderedDict())
+        monkeypatch.setattr(minio_handler, "MINIO_PRESIGN_CACHE_WINDOW", 3600)
+        clock = _Clock(1_700_000_000)
+        monkeypatch.setattr(minio_handler, "time", clock)
+        return calls, clock
+
+    def test_same_window_is_served_from_cache(self, signer):
+        calls, clock = signer
+
+        first = minio_handler.get_presigned_url("a.xlsx")
+        clock.now += 60
+        again = minio_handler.get_presigned_url("a.xlsx")
+
+        assert first == again
+        assert len(calls) == 1
+        # 서명 시각은 구간 시작으로 맞춤
+        assert calls[0][2].timestamp() == 1_700_000_000 // 3600 * 3600
+
+        clock.now += 3600
+        assert minio_handler.get_presigned_url("a.xlsx") != first
+        assert len(calls) == 2
+
+    def test_batch_signs_only_uncached_objects_in_input_order(self, signer):
+        calls, _ = signer
+        minio_handler.get_presigned_url("b.xlsx")
+
+        urls = minio_handler.get_minio_file_urls(["c.xlsx", "b.xlsx", "a.xlsx", "c.xlsx"])
+
+        assert list(urls) == ["c.xlsx", "b.xlsx", "a.xlsx"]
+        assert [call[0] for call in calls] == ["b.xlsx", "c.xlsx", "a.xlsx"]
+        assert urls["a.xlsx"].startswith("https://minio/")
+
+    def test_cache_is_bounded(self, signer, monkeypatch):
+        monkeypatch.setattr(minio_handler.SETTINGS, "MINIO_PRESIGN_CACHE_SIZE", 2)
+
+        minio_handler.get_presigned_urls(["a", "b", "c"])
+
+        assert [key[1] for key in minio_handler._presign_cache] == ["b", "c"]
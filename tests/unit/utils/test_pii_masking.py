@@ -0,0 +1,71 @@
+"""
+개인정보 마스킹 공용 모듈 단위 테스트
+"""
+
+import pandas as pd
+import pytest
+
+from utils.pii_masking import (
+    DOWN_FORM_MASKING_RULES,
+    RECEIVE_ORDER_MASKING_RULES,
+    mask_frame,
+    mask_record,
+    mask_series,
+    mask_value,
+)
+
+
+SAMPLE_VALUES = [
+    "홍길동", "김", "010-1234-5678", "02-123-4567", "0101234567", "12", "서울시 강남구 역삼동 1",
+    "서울 강남", "부산시   해운대구  우동 ", "06000", "ab", "abcdef", "", "  ", None, 6000,
+]
+
+
+class TestMaskValue:
+    """값 단위 마스킹 테스트"""
+
+    @pytest.mark.parametrize("mask_type, value, expected", [
+        ("name", "홍길동", "홍**"),
+        ("name", "김", "*"),
+        ("phone", "010-1234-5678", "010****5678"),
+        ("phone", "02-123-4567", "****"),
+        ("phone", "0212345678", "021****5678"),
+        ("address", "서울시 강남구 역삼동 1", "서울시 강남구 ****"),
+        ("address", "서울 강남", "****"),
+        ("zipcode", "06000", "060**"),
+        ("zipcode", "12", "**"),
+        ("id", "ORDER-1", "2de7830e"),
+        ("user_id", "abcdef", "ab****"),
+        ("user_id", "ab", "**"),
+        ("name", "  ", "  "),
+        ("unknown", "홍길동", "홍길동"),
+    ])
+    def test_mask_types(self, mask_type, value, expected):
+        assert mask_value(value, mask_type) == expected
+
+    def test_mask_record_only_touches_rule_fields(self):
+        record = {"receive_name": "홍길동", "receive_cel": "", "item_name": "상품A"}
+
+        mask_record(record, RECEIVE_ORDER_MASKING_RULES)
+
+        assert record == {"receive_name": "홍**", "receive_cel": "", "item_name": "상품A"}
+
+
+class TestMaskSeries:
+    """컬럼 단위 마스킹이 값 단위 마스킹과 같은 결과를 내는지 테스트"""
+
+    @pytest.mark.parametrize("mask_type", ["name", "phone", "address", "zipcode", "id", "user_id"])
+    def test_matches_value_masking(self, mask_type):
+        result = mask_series(pd.Series(SAMPLE_VALUES, dtype=object), mask_type)
+
+        assert result.tolist() == [mask_value(value, mask_type) for value in SAMPLE_VALUES]
+
+    def test_mask_frame_matches_mask_record(self):
+        rows = [
+            {"receive_name": "홍길동", "receive_cel": "010-1234-5678", "order_id": "O1", "item_name": "상품A"},
+            {"receive_name": None, "receive_cel": "", "order_id": "O2", "item_name": "상품B"},
+        ]
+
+        masked = mask_frame(pd.DataFrame(rows, dtype=object), DOWN_FORM_MASKING_RULES)
+
+        assert masked.to_dict("records") == [mask_record(dict(row), DOWN_FORM_MASKING_RULES) for row in rows]
@@ -0,0 +1,72 @@
+"""
+상품 등록 XML 스트리밍 writer 단위 테스트
+"""
+
+from decimal import Decimal
+
+from lxml import etree
+
+from schemas.product.product_raw_data_dto import ProductRawDataDto
+from utils.make_xml.product_registration_xml import ProductRegistrationXml
+from utils.mappings.product_create_field_eng_mapping import get_db_to_xml_mapping
+
+
+def _dto(i: int, **values) -> ProductRawDataDto:
+    fields = {field: None for field in ProductRawDataDto.model_fields}
+    fields.update(id=i, goods_nm=f"상품{i}", compayny_goods_cd=f"CD{i}", goods_gubun=1, origin="국산",
+                  goods_cost=Decimal("1000.00"))
+    fields.update(values)
+    return ProductRawDataDto.model_construct(**fields)
+
+
+class TestWriteProductRegistrationXml:
+    """DATA 블록 스트리밍 기록 테스트"""
+
+    def test_writes_header_and_all_mapped_fields(self, tmp_path):
+        file_path = tmp_path / "product.xml"
+
+        count = ProductRegistrationXml().write_product_registration_xml((_dto(i) for i in range(3)), file_path)
+
+        assert count == 3
+        assert file_path.read_bytes().startswith(b'<?xml version="1.0" encoding="euc-kr"?>\n<SABANGNET_GOODS_REGI>')
+        root = etree.parse(str(file_path)).getroot()
+        assert root.findtext("HEADER/RESULT_TYPE") == "XML"
+        data = root.findall("DATA")
+        assert len(data) == 3
+        assert [child.tag for child in data[0]] == [tag for tag in get_db_to_xml_mapping().values() if tag]
+        assert data[2].findtext("COMPAYNY_GOODS_CD") == "CD2"
+        assert data[0].findtext("GOODS_COST") == "1000.00"
+        assert data[0].findtext("GOODS_KEYWORD") == ""
+
+    def test_field_escaping(self, tmp_path):
+        file_path = tmp_path / "product.xml"
+        product = _dto(
+            1,
+            goods_nm="A &amp; B \x01",
+            goods_remarks="<p>상세 & 설명</p>",
+            prop_val1="a]]>b < c",
+        )
+
+        ProductRegistrationXml().write_product_registration_xml([product, {"goods_nm": "딕셔너리"}], file_path)
+
+        raw = file_path.read_bytes().decode("euc-kr")
+        assert "<GOODS_REMARKS><![CDATA[<p>상세 & 설명</p>]]></GOODS_REMARKS>" in raw
+        data = etree.parse(str(file_path)).getroot().findall("DATA")
+        # HTML 엔티티는 원본으로 복원, XML에서 쓸 수 없는 제어 문자는 제거
+        assert data[0].findtext("GOODS_NM") == "A & B "
+        # CDATA로 감쌀 수 없는 값은 이스케이프
+        assert data[0].findtext("PROP_VAL1") == "a]]>b < c"
+        assert data[1].findtext("GOODS_NM") == "딕셔너리"
+
+    def test_non_euc_kr_characters_are_not_wrapped_in_cdata(self, tmp_path):
+        file_path = tmp_path / "product.xml"
+        product = _dto(1, goods_remarks="<p>인기 상품 😀 №1</p>", goods_nm="<b>№ 2</b>")
+
+        ProductRegistrationXml().write_product_registration_xml([product], file_path)
+
+        raw = file_path.read_bytes().decode("euc-kr")
+        # CDATA 안의 &#NNNN; 은 풀리지 않으므로 EUC-KR로 못 쓰는 문자가 있으면 이스케이프
+        assert "<![CDATA[<p>인기" not in raw
+        assert "<GOODS_NM><![CDATA[<b>№ 2</b>]]></GOODS_NM>" in raw
+        data = etree.parse(str(file_path)).getroot().find("DATA")
+        assert data.findtext("GOODS_REMARKS") == "<p>인기 상품 😀 №1</p>"
@@ -0,0 +1,213 @@
+"""
+sabangnet_logger 로그 큐 파이프라인 (미리 만든 포맷터 / 백그라운드 기록 / 반복 로그 제한) 단위 테스트
+"""
+
+import logging
+import threading
+import uuid
+from pathlib import Path
+
+import pytest
+
+from core.settings import SETTINGS
+from utils.logs import sabangnet_logger
+from utils.logs.sabangnet_logger import (
+    ColoredFormatter, PlainFormatter, RateLimitFilter, YELLOW, RESET, get_logger, stop_log_listener,
+)
+from utils.sabangnet_path_utils import SabangNetPathUtils
+
+
+FILE_FORMAT = "%(asctime)s | 경로: %(pathname)s | 함수: %(funcName)s() | %(lineno)d번째 줄... \n└─%(levelname)-5s: %(message)s"
+
+
+class _LegacyColoredFormatter(logging.Formatter):
+    """기존 ColoredFormatter (레코드마다 상대 경로 계산 + 포맷터 생성) - 결과 비교 / 벤치마크용"""
+
+    def __init__(self, log_type: str):
+        super().__init__()
+        self.log_type = log_type
+
+    def format(self, record):
+        level_color = ColoredFormatter.LEVEL_COLORS.get(record.levelname, RESET)
+        try:
+            record.pathname = str(Path(record.pathname).relative_to(SabangNetPathUtils.get_project_root()))
+        except (ValueError, ImportError):
+            pass
+        if self.log_type == "business":
+            colored_format = f"{YELLOW}%(asctime)s | 경로: %(pathname)s | 함수: %(funcName)s() | %(lineno)d번째 줄...{RESET}\n└─{level_color}%(levelname)-5s{RESET} %(message)s"
+        else:
+            colored_format = f"{YELLOW}%(asctime)s{RESET} | {level_color}%(levelname)-5s{RESET} %(message)s"
+        return logging.Formatter(colored_format, datefmt='%Y-%m-%d %H:%M:%S').format(record)
+
+
+class _LegacyPlainFormatter(logging.Formatter):
+    """기존 PlainFormatter - 결과 비교 / 벤치마크용"""
+
+    def format(self, record):
+        try:
+            record.pathname = str(Path(record.pathname).relative_to(SabangNetPathUtils.get_project_root()))
+        except (ValueError, ImportError):
+            pass
+        return super().format(record)
+
+
+def _record(level: int = logging.INFO, pathname: str = None, msg: str = "행 %d 처리", args=(3,)) -> logging.LogRecord:
+    pathname = pathname or str(SabangNetPathUtils.get_project_root() / "services" / "macro.py")
+    record = logging.LogRecord("macro", level, pathname, 42, msg, args, None, func="run")
+    record.created = 1_700_000_000.0
+    return record
+
+
+class _ThreadRecorder(logging.Handler):
+    """어느 스레드에서 기록됐는지 남기는 핸들러"""
+
+    def __init__(self):
+        super().__init__()
+        self.records: list[tuple[str, str]] = []
+
+    def emit(self, record):
+        self.records.append((threading.current_thread().name, record.getMessage()))
+
+
+@pytest.fixture
+def logger_name(tmp_path, monkeypatch):
+    monkeypatch.setattr(SabangNetPathUtils, "get_log_file_path", classmethod(lambda cls: tmp_path))
+    name = f"test_logger_{uuid.uuid4().hex[:8]}"
+    yield name
+    stop_log_listener()
+    for handler in sabangnet_logger._sinks.pop(name, []):
+        handler.close()
+
+
+class TestFormatters:
+    """미리 만든 포맷터가 기존 출력과 같은지 테스트"""
+
+    @pytest.mark.parametrize("log_type", ["business", "http"])
+    @pytest.mark.parametrize("level", [logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, 5])
+    def test_colored_output_is_unchanged(self, log_type, level):
+        assert ColoredFormatter(log_type).format(_record(level)) == _LegacyColoredFormatter(log_type).format(_record(level))
+
+    def test_plain_output_is_unchanged_and_path_is_relative(self):
+        new = PlainFormatter(FILE_FORMAT, datefmt='%Y-%m-%d %H:%M:%S').format(_record())
+        legacy = _LegacyPlainFormatter(FILE_FORMAT, datefmt='%Y-%m-%d %H:%M:%S').format(_record())
+
+        assert new == legacy
+        assert f"경로: {Path('services/macro.py')} |" in new
+
+    def test_path_outside_project_is_kept(self):
+        record = _record(pathname="/usr/lib/python3/site.py")
+
+        PlainFormatter(FILE_FORMAT).format(record)
+
+        assert record.pathname == "/usr/lib/python3/site.py"
+
+
+class TestQueuePipeline:
+    """큐 / 리스너 스레드 기록 테스트"""
+
+    def test_records_are_written_on_listener_thread(self, logger_name, tmp_path):
+        logger = get_logger(logger_name)
+        recorder = _ThreadRecorder()
+        sabangnet_logger._sinks[logger_name].append(recorder)
+
+        logger.info("주문 %s 저장", "A-1")
+        try:
+            raise ValueError("잘못된 값")
+        except ValueError:
+            logger.exception("저장 실패")
+        stop_log_listener()
+
+        assert [type(handler) for handler in logger.handlers] == [sabangnet_logger._LogQueueHandler]
+        assert recorder.records[0][1] == "주문 A-1 저장"
+        assert all(thread != threading.current_thread().name for thread, _ in recorder.records)
+        text = next(tmp_path.rglob(f"{logger_name}.log")).read_text(encoding="utf-8")
+        assert "INFO : 주문 A-1 저장" in text
+        # 예외 정보는 호출한 스레드에서 메시지에 미리 붙여서 보냄
+        assert "ValueError: 잘못된 값" in text
+
+    def test_handler_level_is_respected(self, logger_name):
+        logger = get_logger(logger_name, level="WARNING")
+        recorder = _ThreadRecorder()
+        sabangnet_logger._sinks[logger_name].append(recorder)
+
+        logger.info("안 남음")
+        logger.warning("남음")
+        stop_log_listener()
+
+        assert [msg for _, msg in recorder.records] == ["남음"]
+
+    def test_queue_can_be_disabled(self, logger_name, monkeypatch):
+        monkeypatch.setattr(SETTINGS, "LOG_QUEUE_ENABLED", False)
+        logger = get_logger(logger_name)
+        recorder = _ThreadRecorder()
+        sabangnet_logger._sinks[logger_name].append(recorder)
+
+        logger.info("바로 기록")
+
+        assert recorder.records == [(threading.current_thread().name, "바로 기록")]
+
+    def test_http_file_logger_error_keeps_real_location(self, monkeypatch):
+        captured = []
+        recorder = _ThreadRecorder()
+        recorder.emit = captured.append
+        monkeypatch.setitem(sabangnet_logger._sinks, "http_file_logger", [recorder])
+
+        try:
+            int("x")
+        except ValueError as exc:
+            sabangnet_logger.http_file_logger.error("요청 실패", exc)
+        stop_log_listener()
+
+        record = captured[0]
+        assert (record.pathname, record.funcName) == (__file__, "test_http_file_logger_error_keeps_real_location")
+        assert record.getMessage().startswith("요청 실패\ninvalid literal")
+        assert "Traceback" in record.getMessage()
+
+
+class TestRateLimitFilter:
+    """같은 위치 반복 로그 제한 테스트"""
+
+    class _Clock:
+        def __init__(self):
+            self.now = 100.0
+
+        def __call__(self):
+            return self.now
+
+    def test_hot_call_site_is_limited_and_suppressed_count_reported(self):
+        clock = self._Clock()
+        rate_filter = RateLimitFilter(3, clock=clock)
+
+        passed = [rate_filter.filter(_record(args=(i,))) for i in range(10)]
+        warning = rate_filter.filter(_record(logging.WARNING))
+        other_line = _record()
+        other_line.lineno = 43
+
+        assert passed == [True] * 3 + [False] * 7
+        assert warning is True
+        assert rate_filter.filter(other_line) is True
+
+        clock.now += 1
+        record = _record(args=(10,))
+        assert rate_filter.filter(record) is True
+        assert record.getMessage() == "행 10 처리 (같은 위치 로그 7건 생략)"
+
+    def test_get_logger_limits_per_row_messages(self, logger_name, monkeypatch):
+        monkeypatch.setattr(SETTINGS, "LOG_RATE_LIMIT_PER_SECOND", 5)
+        logger = get_logger(logger_name)
+        recorder = _ThreadRecorder()
+        sabangnet_logger._sinks[logger_name].append(recorder)
+
+        for i in range(100):
+            logger.info("행 %d 처리", i)
+        logger.error("실패")
+        stop_log_listener()
+
+        assert [msg for _, msg in recorder.records] == [f"행 {i} 처리" for i in range(5)] + ["실패"]
+
+    def test_rate_limit_can_be_disabled(self, logger_name, monkeypatch):
+        monkeypatch.setattr(SETTINGS, "LOG_RATE_LIMIT_PER_SECOND", 0)
+        logger = get_logger(logger_name)
+
+        assert logger.handlers[0].filters == []
+
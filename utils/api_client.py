@@ -1,19 +1,27 @@
 import aiohttp
 
+from core.http_client import http_session
+
+
 async def aiohttp_post(url, json, timeout=30, logger=None):
     try:
-        async with aiohttp.ClientSession() as session:
+        async with http_session() as session:
             async with session.post(
                 url,
                 json=json,
                 headers={"Content-Type": "application/json"},
                 timeout=aiohttp.ClientTimeout(total=timeout)
             ) as response:
-                data = await response.json()
                 if response.status != 200:
+                    # 429/5xx는 게이트웨이가 HTML을 주기도 하므로 상태 코드는 본문과 무관하게 돌려줌
+                    try:
+                        data = await response.json(content_type=None)
+                    except ValueError:
+                        data = await response.text()
                     if logger:
                         logger.error(f"API POST {url} failed: HTTP {response.status}, {data}")
                     return None, response.status, data
+                data = await response.json()
                 return data, response.status, None
     except Exception as e:
         if logger:
@@ -23,6 +23,13 @@
     스택트레이스:
         기본 방법으로 로거 선언하고,
         logger.error("로그 메시지", stack_info=True) 로 설정하면 됩니다.
+
+    큐 / 반복 로그 제한:
+        logger.info() 는 메시지만 만들어 큐에 넣고 바로 돌아오고,
+        실제 콘솔/파일 쓰기는 백그라운드 리스너 스레드가 합니다. (SETTINGS.LOG_QUEUE_ENABLED)
+        서버 종료 시 stop_log_listener() 로 큐에 남은 로그를 모두 기록합니다.
+        get_logger 로거는 같은 위치(파일:줄)의 INFO 이하 로그를 초당 SETTINGS.LOG_RATE_LIMIT_PER_SECOND 건까지만 남기고,
+        생략한 건수는 다음 로그 뒤에 붙여 줍니다. WARNING 이상은 항상 남습니다.
     
 예시:
     from utils.sabangnet_logger import get_logger
@@ -35,16 +42,23 @@
 import os
 import sys
 import time
+import queue
+import atexit
 import socket
 import inspect
 import logging
 import platform
+import threading
 import traceback
 from pathlib import Path
+from typing import Optional
 from datetime import datetime
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from fastapi import Request, Response
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
+from core.settings import SETTINGS
 from utils.sabangnet_path_utils import SabangNetPathUtils
 
 
@@ -64,6 +78,16 @@ BLUE = '\033[94m'
 RESET = '\033[0m'
 
 
+@lru_cache(maxsize=4096)
+def _relative_path(pathname: str) -> str:
+    """전체 경로를 프로젝트 루트 기준 상대 경로로 변환 (로그 찍는 위치 수만큼만 계산하고 캐시)"""
+    try:
+        return str(Path(pathname).relative_to(SabangNetPathUtils.get_project_root()))
+    except ValueError:
+        # 상대 경로 변환 실패 시 (이미 상대 경로거나 프로젝트 밖 파일) 원본 사용
+        return pathname
+
+
 class ColoredFormatter(logging.Formatter):
     """콘솔용 색깔 포맷터 -> 실제 로그 레벨에 따라 색깔 적용"""
 
@@ -78,31 +102,26 @@ class ColoredFormatter(logging.Formatter):
     def __init__(self, log_type: str):
         super().__init__()
         self.log_type = log_type
-
-    def format(self, record):
-        # 실제 로그 레벨에 따라 색깔 선택
-        level_color = self.LEVEL_COLORS.get(record.levelname, RESET)
-
-        # 전체 경로를 프로젝트 루트 기준 상대 경로로 변환
-        try:
-            full_path = Path(record.pathname)
-            project_root = SabangNetPathUtils.get_project_root()
-            relative_path = full_path.relative_to(project_root)
-            record.pathname = str(relative_path)
-        except (ValueError, ImportError):
-            # 상대 경로 변환 실패 시 원본 사용
-            pass
-
+        # 레벨별 포맷터는 한 번만 만들어 두고 재사용 (레코드마다 새로 만들지 않음)
+        self._level_formatters = {
+            levelname: self._build_formatter(level_color)
+            for levelname, level_color in self.LEVEL_COLORS.items()
+        }
+        self._default_formatter = self._build_formatter(RESET)
+
+    def _build_formatter(self, level_color: str) -> logging.Formatter:
         # 색깔이 적용된 포맷
         if self.log_type == "business":
             colored_format = f"{YELLOW}%(asctime)s | 경로: %(pathname)s | 함수: %(funcName)s() | %(lineno)d번째 줄...{RESET}\n└─{level_color}%(levelname)-5s{RESET} %(message)s"
         else:
             colored_format = f"{YELLOW}%(asctime)s{RESET} | {level_color}%(levelname)-5s{RESET} %(message)s"
+        return logging.Formatter(colored_format, datefmt='%Y-%m-%d %H:%M:%S')
 
-        # 임시 포맷터로 포맷팅
-        temp_formatter = logging.Formatter(
-            colored_format, datefmt='%Y-%m-%d %H:%M:%S')
-        return temp_formatter.format(record)
+    def format(self, record):
+        record.pathname = _relative_path(record.pathname)
+        # 실제 로그 레벨에 따라 색깔 선택
+        formatter = self._level_formatters.get(record.levelname, self._default_formatter)
+        return formatter.format(record)
 
 
 # 파일용 포맷터 (색깔 없음, 깔끔한 텍스트) - 커스텀 클래스로 변경
@@ -110,19 +129,141 @@ class PlainFormatter(logging.Formatter):
     """파일용 무색 포맷터 -> 색깔 없이 상대 경로만 표시"""
 
     def format(self, record):
-        # 전체 경로를 프로젝트 루트 기준 상대 경로로 변환
-        try:
-            full_path = Path(record.pathname)
-            project_root = SabangNetPathUtils.get_project_root()
-            relative_path = full_path.relative_to(project_root)
-            record.pathname = str(relative_path)
-        except (ValueError, ImportError):
-            # 상대 경로 변환 실패 시 원본 사용
-            pass
-
+        record.pathname = _relative_path(record.pathname)
         return super().format(record)
 
 
+class RateLimitFilter(logging.Filter):
+    """
+    같은 위치(파일:줄)에서 반복해서 찍히는 로그를 interval초당 limit건까지만 남기는 필터.
+    행마다 찍는 INFO/DEBUG 로그용이고, WARNING 이상은 항상 통과시킵니다.
+    버린 건수는 다음 구간에 처음 통과하는 로그 뒤에 붙여서 남깁니다.
+    """
+
+    def __init__(self, limit: int, interval: float = 1.0, clock=time.monotonic):
+        super().__init__()
+        self.limit = limit
+        self.interval = interval
+        self.clock = clock
+        # (파일, 줄) -> [구간 시작 시각, 구간 안에서 통과한 건수, 버린 건수]
+        # 여러 스레드가 동시에 찍으면 건수가 조금 어긋날 수 있지만 락 없이 둠
+        self._windows: dict[tuple[str, int], list] = {}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+
+        now = self.clock()
+        key = (record.pathname, record.lineno)
+        window = self._windows.get(key)
+        if window is None:
+            self._windows[key] = [now, 1, 0]
+            return True
+
+        if now - window[0] >= self.interval:
+            suppressed = window[2]
+            window[0], window[1], window[2] = now, 1, 0
+            if suppressed:
+                record.msg = f"{record.getMessage()} (같은 위치 로그 {suppressed}건 생략)"
+                record.args = None
+            return True
+
+        if window[1] < self.limit:
+            window[1] += 1
+            return True
+
+        window[2] += 1
+        return False
+
+
+# 로그 큐 파이프라인
+# 로거에는 큐에 넣기만 하는 핸들러(_LogQueueHandler) 하나만 달고,
+# 실제 콘솔/파일 쓰기는 QueueListener 스레드가 로거 이름별로 등록된 핸들러(_sinks)로 나눠서 처리합니다.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_sinks: dict[str, list[logging.Handler]] = {}
+_listener: Optional[QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+def _dispatch(record: logging.LogRecord) -> None:
+    """로거 이름으로 실제 출력 핸들러를 찾아 기록 (핸들러 레벨 적용)"""
+    for handler in _sinks.get(record.name, ()):
+        if record.levelno >= handler.level:
+            handler.handle(record)
+
+
+class _SinkDispatcher(logging.Handler):
+    """QueueListener에 등록하는 단일 핸들러 -> 로거별 실제 핸들러로 전달"""
+
+    def handle(self, record):
+        _dispatch(record)
+        return True
+
+
+def start_log_listener() -> None:
+    """로그 큐 리스너 스레드 시작 (첫 로그가 들어올 때 자동으로 불림)"""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            _listener = QueueListener(_log_queue, _SinkDispatcher())
+            _listener.start()
+
+
+def stop_log_listener() -> None:
+    """큐에 남은 로그를 모두 기록하고 리스너 스레드를 멈춤 (서버 종료 / 프로세스 종료 시)"""
+    global _listener
+    with _listener_lock:
+        listener, _listener = _listener, None
+    if listener is not None:
+        listener.stop()
+
+
+def _reset_log_queue_after_fork() -> None:
+    # 포크된 자식 프로세스에는 리스너 스레드가 없으므로 새 큐로 다시 시작
+    global _log_queue, _listener, _listener_lock
+    _log_queue = queue.SimpleQueue()
+    _listener = None
+    _listener_lock = threading.Lock()
+
+
+atexit.register(stop_log_listener)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_log_queue_after_fork)
+
+
+class _LogQueueHandler(QueueHandler):
+    """호출한 스레드에서는 메시지만 만들어 큐에 넣는 핸들러"""
+
+    def __init__(self):
+        super().__init__(_log_queue)
+
+    def emit(self, record):
+        if not SETTINGS.LOG_QUEUE_ENABLED:
+            # 큐를 끄면 호출한 스레드에서 바로 씀
+            try:
+                _dispatch(record)
+            except Exception:
+                self.handleError(record)
+            return
+        super().emit(record)
+
+    def enqueue(self, record):
+        if _listener is None:
+            start_log_listener()
+        _log_queue.put_nowait(record)
+
+
+def _attach_handlers(logger: logging.Logger, handlers: list[logging.Handler],
+                     log_level: int, rate_limit: bool = False) -> None:
+    """실제 출력 핸들러는 리스너 쪽에 등록하고, 로거에는 큐 핸들러 하나만 붙임"""
+    _sinks[logger.name] = handlers
+    queue_handler = _LogQueueHandler()
+    queue_handler.setLevel(log_level)
+    if rate_limit and SETTINGS.LOG_RATE_LIMIT_PER_SECOND:
+        queue_handler.addFilter(RateLimitFilter(SETTINGS.LOG_RATE_LIMIT_PER_SECOND))
+    logger.addHandler(queue_handler)
+
+
 class HTTPLoggingMiddleware(BaseHTTPMiddleware):
     """HTTP 요청/응답을 커스텀 로거로 기록하는 미들웨어"""
 
@@ -263,6 +404,8 @@ def get_logger_base(file_name: str):
     # 기존 핸들러 제거 (중복 방지)
     for handler in logger.handlers[:]:  # 슬라이싱 -> 얕은복사 -> 원본 삭제되도 반영 안되서 괜찮음...
         logger.removeHandler(handler)
+    for handler in _sinks.pop(logger.name, []):
+        handler.close()
 
     # 로거 전파 비활성화 (부모 로거로 전파 방지 -> 중복 로그 방지 -> 활성화 하면 부모 로거에서 또 로그 찍혀서 두 번씩 나오는 것 처럼 보임)
     logger.propagate = False
@@ -282,7 +425,6 @@ def get_logger(file_name: str, level: str = "INFO") -> logging.Logger:
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
 
     # 파일 핸들러 추가 (색깔 없음)
     date_folder = datetime.now().strftime('%Y%m%d')
@@ -296,7 +438,9 @@ def get_logger(file_name: str, level: str = "INFO") -> logging.Logger:
     file_handler = logging.FileHandler(log_path, delay=True, encoding='utf-8')
     file_handler.setLevel(log_level)
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+
+    # 행마다 찍는 로그가 쌓이지 않도록 같은 위치 로그는 초당 건수 제한
+    _attach_handlers(logger, [console_handler, file_handler], log_level, rate_limit=True)
 
     # 설정 완료 추가
     _setup_loggers.add(file_name)
@@ -321,7 +465,7 @@ def get_http_cli_logger(level: str = "INFO"):
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    _attach_handlers(logger, [console_handler], log_level)
 
     return logger
 
@@ -347,7 +491,7 @@ def get_http_file_logger(level: str = "INFO"):
     file_handler = logging.FileHandler(log_path, delay=True, encoding='utf-8')
     file_handler.setLevel(log_level)
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    _attach_handlers(logger, [file_handler], log_level)
 
     # 에러 전용 메서드 추가
     def log_error_with_location(msg: str, exc: Exception):
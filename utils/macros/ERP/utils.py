@@ -112,7 +112,7 @@ def add_island_delivery(df: pd.DataFrame):
 
     for island_info in island_dict:
         # 해당 사이트의 제주도 배송 데이터 필터링
-        site_mask = jeju_data['fld_dsp'].fillna('').str.contains(
+        site_mask = jeju_data['fld_dsp'].str.contains(
             island_info['fld_dsp'], case=False, na=False
         )
         target_indices = jeju_data[site_mask].index
@@ -192,7 +192,8 @@ def star_average_process(df: pd.DataFrame):
             avg_delivery = valid_delivery_df[valid_delivery_df['star_avg'].isin(
                 groups_with_multiple)].groupby('star_avg')['delv_cost'].mean()
 
-            # 평균 배송비 적용
+            # 평균 배송비 적용 (평균은 소수가 나올 수 있으므로 정수 금액 컬럼을 실수로 변환)
+            df['delv_cost'] = df['delv_cost'].astype('float64')
             df.loc[df['star_avg'].isin(avg_delivery.index), 'delv_cost'] = df.loc[df['star_avg'].isin(
                 avg_delivery.index), 'star_avg'].map(avg_delivery)
 
@@ -1,5 +1,6 @@
 import pandas as pd
 from utils.macros.ERP.utils import macro_basic_process, star_average_process
+from utils.macros.ERP.v3.macro_frame_schema import to_macro_frame, from_macro_frame, ensure_category
 from utils.logs.sabangnet_logger import get_logger
 
 logger = get_logger(__name__)
@@ -10,8 +11,11 @@ class ERPEtcSiteMacroV3:
         self.is_star = is_star
 
     def etc_site_macro_run(self):
+        return from_macro_frame(self.etc_site_macro_frame())
+
+    def etc_site_macro_frame(self) -> pd.DataFrame:
         logger.info(f"[START]etc_site_macro_run")
-        df = pd.DataFrame(self.row_datas, dtype=object)
+        df = to_macro_frame(self.row_datas)
 
         
         # 기본처리
@@ -24,30 +28,24 @@ class ERPEtcSiteMacroV3:
         df = self._overlap_by_site_column(df)
         df = self._toss_process_column(df)
 
-        # 숫자 타입 변환
-        df['expected_payout'] = pd.to_numeric(df['expected_payout'], errors='coerce').fillna(0)
-        df['service_fee'] = pd.to_numeric(df['service_fee'], errors='coerce').fillna(0)
-        df['delv_cost'] = pd.to_numeric(df['delv_cost'], errors='coerce').fillna(0)
-
         # 금액 계산
         df['etc_cost'] = df['expected_payout'] + df['service_fee'] + df['delv_cost']
-        df['etc_cost'] = df['etc_cost'].astype(int).astype(str)
 
         # 스타배송 평균 배송비 적용
         if self.is_star:
             df = star_average_process(df)
 
-        macro_run_datas = df.to_dict(orient='records')
         logger.info(f"[END]etc_site_macro_run")
-        return macro_run_datas
+        return df
     
     def _overlap_by_site_column(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         각 사이트별 중복 주문 처리 
         """
         
-        # 오늘의집: 항상 0
-        df.loc[df['fld_dsp'].str.contains('오늘의집', na=False), 'fld_dsp'] = 0
+        # 오늘의집: 항상 0 (fld_dsp는 category 컬럼이라 카테고리 먼저 추가)
+        ensure_category(df, 'fld_dsp', '0')
+        df.loc[df['fld_dsp'].str.contains('오늘의집', na=False), 'fld_dsp'] = '0'
         
         # 톡스토어, 롯데온, 보리보리, 스마트스토어: 중복 체크
         sites_to_check = ['톡스토어', '롯데온', '보리보리', '스마트스토어']
@@ -61,7 +59,7 @@ class ERPEtcSiteMacroV3:
                 
                 # 중복된 행의 V 값을 0으로 설정
                 duplicate_indices = site_df[duplicates].index
-                df.loc[duplicate_indices, 'fld_dsp'] = 0
+                df.loc[duplicate_indices, 'fld_dsp'] = '0'
         return df
     
     def _toss_process_column(self, df: pd.DataFrame) -> pd.DataFrame:
@@ -80,7 +78,6 @@ class ERPEtcSiteMacroV3:
             
             # 주문번호)와 금액[배송비미포함] 처리
             toss_orders['order_id'] = toss_orders['order_id'].astype(str).str.strip()
-            toss_orders['expected_payout'] = pd.to_numeric(toss_orders['expected_payout'], errors='coerce').fillna(0)
             
             # 주문번호 별로 금액 합계 및 첫 번째 행 인덱스 수집
             order_summary = toss_orders.groupby('order_id').agg({
@@ -121,4 +118,8 @@ class ERPEtcSiteMacroV3:
         return df
     
 def etc_site_macro_run(row_datas: list[dict], is_star: bool = False) -> list[dict]:
-    return ERPEtcSiteMacroV3(row_datas, is_star).etc_site_macro_run()
\ No newline at end of file
+    return ERPEtcSiteMacroV3(row_datas, is_star).etc_site_macro_run()
+
+
+def etc_site_macro_frame(row_datas: list[dict], is_star: bool = False) -> pd.DataFrame:
+    return ERPEtcSiteMacroV3(row_datas, is_star).etc_site_macro_frame()
@@ -1,5 +1,6 @@
 import pandas as pd
 from utils.macros.ERP.utils import macro_basic_process, star_average_process
+from utils.macros.ERP.v3.macro_frame_schema import to_macro_frame, from_macro_frame
 from utils.logs.sabangnet_logger import get_logger
 
 
@@ -12,8 +13,11 @@ class GAERPMacroV3:
         self.is_star = is_star
 
     def gauc_erp_macro_run(self):
+        return from_macro_frame(self.gauc_erp_macro_frame())
+
+    def gauc_erp_macro_frame(self) -> pd.DataFrame:
         logger.info(f"[START]gauc_erp_macro_run")
-        df = pd.DataFrame(self.row_datas, dtype=object)
+        df = to_macro_frame(self.row_datas)
 
         # 정렬
         df.sort_values(
@@ -28,29 +32,22 @@ class GAERPMacroV3:
         # 장바구니 중복값 배송비 제거
         df = self._process_dupl_basket(df)
 
-        # 숫자 타입 변환
-        df['expected_payout'] = pd.to_numeric(df['expected_payout'], errors='coerce').fillna(0)
-        df['service_fee'] = pd.to_numeric(df['service_fee'], errors='coerce').fillna(0)
-        df['delv_cost'] = pd.to_numeric(df['delv_cost'], errors='coerce').fillna(0)
-
         # 금액 계산
         df['etc_cost'] = df['expected_payout'] + df['service_fee'] + df['delv_cost']
-        df['etc_cost'] = df['etc_cost'].astype(int).astype(str)
 
         # 스타배송 평균 배송비 적용
         if self.is_star:
             df = star_average_process(df)
 
-        macro_run_datas = df.to_dict(orient='records')
         logger.info(f"[END]gauc_erp_macro_run")
-        return macro_run_datas
+        return df
 
     def _process_dupl_basket(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         장바구니 중복값 배송비 제거
         """
         # 특정 키값 생성
-        df['site_basket'] = df['fld_dsp'] + \
+        df['site_basket'] = df['fld_dsp'].astype('string') + \
             '_' + df['mall_order_id'].astype(str)
 
         # 배송비 유효성 체크
@@ -77,3 +74,7 @@ class GAERPMacroV3:
 
 def gauc_erp_macro_run(row_datas: list[dict], is_star: bool = False) -> list[dict]:
     return GAERPMacroV3(row_datas, is_star).gauc_erp_macro_run()
+
+
+def gauc_erp_macro_frame(row_datas: list[dict], is_star: bool = False) -> pd.DataFrame:
+    return GAERPMacroV3(row_datas, is_star).gauc_erp_macro_frame()
@@ -0,0 +1,78 @@
+"""
+ERP v3 / 합포장 매크로 공용 DataFrame 스키마.
+
+매크로마다 dtype=object 로 DataFrame을 만들고 pd.to_numeric / astype(str) 을 반복하던 것을
+진입 시 한 번(to_macro_frame), 반환 시 한 번(from_macro_frame)만 변환하도록 모았습니다.
+
+    - 원화 금액  : 숫자 (없는 값은 0, 소수는 그대로)  expected_payout, service_fee, delv_cost
+    - 사이트/양식 : category                          fld_dsp, form_name
+    - 텍스트     : string                            수취인, 주소, 상품명 등
+
+금액 컬럼은 기존 매크로의 pd.to_numeric(errors='coerce').fillna(0) 과 같은 dtype을 유지합니다.
+(반올림/정수 변환을 하지 않으므로 소수 원화도 그대로 계산)
+pay_cost 는 비어 있을 수 있고 합포장에서 None 을 건너뛰고 합산하므로 변환하지 않습니다.
+스키마에 없는 컬럼(seq, process_dt, sale_cnt 등)은 들어온 값 그대로 둡니다.
+"""
+import pandas as pd
+
+
+# 원화 금액 (매크로 금액 계산에 쓰이므로 없는 값은 0)
+WON_AMOUNT_COLUMNS = ("expected_payout", "service_fee", "delv_cost")
+CATEGORY_COLUMNS = ("fld_dsp", "form_name")
+TEXT_COLUMNS = (
+    "idx", "order_id", "mall_order_id", "product_id", "product_name", "mall_product_id",
+    "item_name", "sku_value", "receive_name", "receive_addr", "receive_zipcode",
+    "receive_cel", "receive_tel", "delv_msg", "delivery_method_str", "invoice_no",
+    "location_nm", "order_etc_7", "free_gift", "work_status",
+)
+# down_form_orders 에서 Text 컬럼이라 반환 시 문자열로 내보내는 금액 컬럼
+STR_OUTPUT_COLUMNS = ("etc_cost",)
+
+
+def _to_won(series: pd.Series) -> pd.Series:
+    return pd.to_numeric(series, errors='coerce').fillna(0)
+
+
+def to_macro_frame(row_datas: list[dict]) -> pd.DataFrame:
+    """
+    매크로 입력 행을 스키마 dtype의 DataFrame으로 변환 (매크로 진입 시 한 번)
+    """
+    df = pd.DataFrame(row_datas, dtype=object)
+    for col in WON_AMOUNT_COLUMNS:
+        if col in df.columns:
+            df[col] = _to_won(df[col])
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("string").astype("category")
+    for col in TEXT_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("string")
+    return df
+
+
+def ensure_category(df: pd.DataFrame, col: str, value: str) -> None:
+    """category 컬럼에 value를 대입하기 전에 카테고리 추가"""
+    if isinstance(df[col].dtype, pd.CategoricalDtype) and value not in df[col].cat.categories:
+        df[col] = df[col].cat.add_categories([value])
+
+
+def from_macro_frame(df: pd.DataFrame) -> list[dict]:
+    """
+    스키마 DataFrame을 DB 저장용 dict 리스트로 변환 (매크로 반환 시 한 번)
+    string / category / nullable 정수 컬럼의 빈 값은 None, etc_cost는 기존처럼 정수(소수점 버림) 문자열로 내보냄
+    """
+    names = list(df.columns)
+    columns = []
+    for col in names:
+        series = df[col]
+        if col in STR_OUTPUT_COLUMNS and pd.api.types.is_numeric_dtype(series.dtype):
+            values = series.astype(int).astype(str).tolist()
+        elif isinstance(series.dtype, (pd.StringDtype, pd.CategoricalDtype)) or (
+                pd.api.types.is_extension_array_dtype(series.dtype)
+                and pd.api.types.is_integer_dtype(series.dtype)):
+            values = series.to_numpy(dtype=object, na_value=None).tolist()
+        else:
+            # tolist()는 numpy 스칼라를 파이썬 기본 타입으로 바꿔줌 (to_dict의 값별 변환보다 빠름)
+            values = series.tolist()
+        columns.append(values)
+    return [dict(zip(names, row)) for row in zip(*columns)]
@@ -5,7 +5,7 @@ from utils.mappings.down_form_order_mapper import (
     map_raw_to_down_form,
     map_excel_to_down_form,
     map_aggregated_to_down_form,
-    map_raw_to_down_form_and_receive_order
+    map_receive_orders_to_down_form
 )
 
 
@@ -104,13 +104,15 @@ class DataProcessingUtils:
         ) -> list[dict[str, Any]]:
         """receive_orders row를 down_form_orders 스키마에 맞게 변환(Macro V3용)"""
         processed_data = []
-        for seq, raw_row in enumerate(raw_data, start=1):
+        # formula 컬럼은 템플릿별로 컴파일된 수식으로 전체 행을 한 번에 계산
+        mapped_rows = map_receive_orders_to_down_form(raw_data, config)
+        for seq, mapped_row in enumerate(mapped_rows, start=1):
             processed_row = {
                 'process_dt': datetime.now(),
                 'form_name': config['template_code'],
                 'seq': seq,
             }
-            processed_row.update(map_raw_to_down_form_and_receive_order(raw_row, config))
+            processed_row.update(mapped_row)
             processed_data.append(processed_row)
         return processed_data
     
@@ -1,12 +1,36 @@
 from utils.logs.sabangnet_logger import get_logger
+import numpy as np
 import pandas as pd
+from utils.macros.ERP.v3.macro_frame_schema import from_macro_frame
 
 logger = get_logger(__name__)
 
 
 class BundleUtilsV3:
-    def __init__(self, row_datas: list[dict]):
-        self.df = pd.DataFrame(row_datas, dtype=object)
+    """
+    합포장 집계 (우편번호 + 주소 + 수취인명 기준)
+
+    문자열 join / 정수 합계 컬럼은 그룹마다 파이썬 lambda를 부르지 않고
+    그룹 코드(factorize) -> 안정 정렬 -> numpy reduceat 으로 한 번에 계산합니다.
+    결과(그룹 순서, 값, 타입)는 기존 groupby + lambda 집계와 동일합니다.
+    """
+
+    # 역순 join 컬럼: 구분자
+    REVERSED_JOIN_COLUMNS = {
+        'item_name': ' + ',  # 제품명
+        'idx': '/',  # 사방넷주문번호
+        'product_name': ' / ',  # 수집상품명
+        'mall_product_id': '/',  # 상품번호
+        'sku_value': '/',  # 수집옵션
+        'delv_msg': '/',  # 배송메시지
+    }
+
+    def __init__(self, row_datas: list[dict] | pd.DataFrame):
+        # ERP v3 매크로 결과 DataFrame(macro_frame_schema)은 dict 변환 없이 그대로 사용
+        if isinstance(row_datas, pd.DataFrame):
+            self.df = row_datas.copy()
+        else:
+            self.df = pd.DataFrame(row_datas, dtype=object)
 
     def run_bundle_macro(self):
         logger.info(f"[START]run_bundle_macro_data")
@@ -15,18 +39,18 @@ class BundleUtilsV3:
 
         all_columns = {
             'order_id': 'max',  # 주문 번호
-            'item_name': self.reversed_join(' + '),  # 제품명
+            'item_name': 'reversed_join',  # 제품명
             'service_fee': 'max',  # 서비스이용료
             'pay_cost': 'sum',  # 금액[배송비미포함]
             'delv_cost': 'max',
-            'idx': self.reversed_join('/'),  # 사방넷주문번호
-            'product_name': self.reversed_join(' / '),  # 수집상품명
-            'mall_product_id': self.reversed_join('/'),  # 상품번호
-            'sku_value': self.reversed_join('/'),  # 수집옵션
-            'sale_cnt': self.sum_to_str(),  # 수량
+            'idx': 'reversed_join',  # 사방넷주문번호
+            'product_name': 'reversed_join',  # 수집상품명
+            'mall_product_id': 'reversed_join',  # 상품번호
+            'sku_value': 'reversed_join',  # 수집옵션
+            'sale_cnt': 'sum_to_str',  # 수량
             'expected_payout': 'max',  # 정산예정금액
-            'delv_msg': self.reversed_join('/'),  # 배송메시지
-            'etc_cost': self.sum_to_str(),  # 금액(이미 ERP 매크로를 통해 계산된 값)
+            'delv_msg': 'reversed_join',  # 배송메시지
+            'etc_cost': 'sum_to_str',  # 금액(이미 ERP 매크로를 통해 계산된 값)
 
             # 나머지 컬럼
             'seq': 'first',
@@ -49,17 +73,110 @@ class BundleUtilsV3:
         }
         agg_dict = {col: func for col, func in all_columns.items()
                     if col in self.df.columns}
-        self.df = self.df.groupby('bundle_key', as_index=False).agg(agg_dict)
-        self.df.drop('bundle_key', axis=1, inplace=True)
+        self.df = self._aggregate(self.df, agg_dict)
 
-        run_bundle_macro_data = self.df.to_dict(orient='records')
+        run_bundle_macro_data = from_macro_frame(self.df)
         logger.info(f"[END]run_bundle_macro_data")
         return run_bundle_macro_data
 
-    def reversed_join(self, target_str: str) -> str:
-        """역순으로 join"""
-        return lambda x: target_str.join(filter(None, x[::-1]))
+    def _aggregate(self, df: pd.DataFrame, agg_dict: dict[str, str]) -> pd.DataFrame:
+        """
+        bundle_key 기준 집계
+        1. bundle_key를 정렬된 그룹 코드로 변환 (groupby 기본 정렬과 같은 순서, 키가 없는 행은 제외)
+        2. 그룹 코드 오름차순 + 그룹 안에서는 원래 행의 역순으로 안정 정렬
+        3. join/합계 컬럼은 정렬된 배열에서 그룹 경계별 reduceat, 나머지는 pandas 내장 집계
+        """
+        codes, uniques = pd.factorize(df['bundle_key'], sort=True)
+        n_groups = len(uniques)
+
+        valid = codes >= 0
+        positions = np.flatnonzero(valid)
+        valid_codes = codes[valid]
+        # 역순 행 위치에 대해 그룹 코드 안정 정렬 -> 그룹 오름차순, 그룹 내 원래 행 역순
+        reversed_order = positions[::-1][np.argsort(valid_codes[::-1], kind='stable')]
+        sorted_codes = codes[reversed_order]
+
+        result = {}
+        builtin_agg = {}
+        for col, func in agg_dict.items():
+            if func == 'reversed_join':
+                values = self._object_values(df[col])[reversed_order]
+                result[col] = self._grouped_join(values, sorted_codes, n_groups, self.REVERSED_JOIN_COLUMNS[col])
+            elif func == 'sum_to_str':
+                values = self._object_values(df[col])[reversed_order]
+                result[col] = self._grouped_int_sum(values, sorted_codes, n_groups).astype(str).astype(object)
+            elif func == 'max' and (maxed := self._grouped_max(self._object_values(df[col])[reversed_order], sorted_codes)) is not None:
+                result[col] = maxed
+            else:
+                builtin_agg[col] = func
+
+        # first / sum 과 NA가 섞인 max는 pandas 내장 집계 (object max의 NA 처리 규칙을 그대로 따르기 위함)
+        if builtin_agg:
+            grouped = df.loc[valid, list(builtin_agg)].groupby(valid_codes, sort=True).agg(builtin_agg)
+            for col in builtin_agg:
+                result[col] = grouped[col].array
+        return pd.DataFrame(result, columns=list(agg_dict))
+
+    @staticmethod
+    def _object_values(series: pd.Series) -> np.ndarray:
+        """object 배열로 변환 (string/category/Int64 컬럼의 pd.NA는 None으로)"""
+        if series.dtype == object:
+            return series.to_numpy()
+        return series.to_numpy(dtype=object, na_value=None)
+
+    @staticmethod
+    def _group_starts(sorted_codes: np.ndarray) -> np.ndarray:
+        """정렬된 그룹 코드 배열에서 각 그룹이 시작하는 위치"""
+        if len(sorted_codes) == 0:
+            return np.empty(0, dtype=np.intp)
+        return np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+
+    @classmethod
+    def _grouped_join(cls, values: np.ndarray, sorted_codes: np.ndarray, n_groups: int, sep: str) -> np.ndarray:
+        """
+        그룹 정렬된 값들을 sep으로 join (falsy 값 제외, 값이 없는 그룹은 빈 문자열)
+        """
+        joined = np.full(n_groups, '', dtype=object)
+        keep = values.astype(bool)
+        values = values[keep]
+        codes = sorted_codes[keep]
+        if len(values) == 0:
+            return joined
+
+        starts = cls._group_starts(codes)
+        # 그룹 첫 값을 제외한 나머지 앞에 구분자를 붙여두고 그룹별로 이어붙이기
+        parts = values.copy()
+        not_first = np.ones(len(parts), dtype=bool)
+        not_first[starts] = False
+        parts[not_first] = np.add(sep, parts[not_first])
+        joined[codes[starts]] = np.add.reduceat(parts, starts)
+        return joined
+
+    @classmethod
+    def _grouped_max(cls, values: np.ndarray, sorted_codes: np.ndarray) -> np.ndarray | None:
+        """
+        그룹별 최대값 (값 순위로 factorize 후 순위의 그룹별 최대값을 원래 값으로 되돌림)
+        NA가 있거나 문자열/정수/실수 한 종류로 이뤄지지 않은 컬럼은 None 반환 -> pandas 집계 사용
+        """
+        if len(values) == 0 or pd.isna(values).any():
+            return None
+        if pd.api.types.infer_dtype(values, skipna=False) not in ('string', 'integer', 'floating'):
+            return None
+        ranks, uniques = pd.factorize(values, sort=True)
+        starts = cls._group_starts(sorted_codes)
+        return np.asarray(uniques, dtype=object)[np.maximum.reduceat(ranks, starts)]
 
-    def sum_to_str(self) -> str:
-        """정수 합계 문자열로 반환"""
-        return lambda x: str(sum(int(val) for val in x if val is not None))
+    @classmethod
+    def _grouped_int_sum(cls, values: np.ndarray, sorted_codes: np.ndarray, n_groups: int) -> np.ndarray:
+        """
+        그룹별 int64 합계 (None 제외, 값이 없는 그룹은 0)
+        """
+        sums = np.zeros(n_groups, dtype=np.int64)
+        not_none = np.not_equal(values, None)
+        if not not_none.any():
+            return sums
+        ints = np.frompyfunc(int, 1, 1)(values[not_none]).astype(np.int64)
+        codes = sorted_codes[not_none]
+        starts = cls._group_starts(codes)
+        sums[codes[starts]] = np.add.reduceat(ints, starts)
+        return sums
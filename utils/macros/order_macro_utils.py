@@ -13,9 +13,9 @@ from utils.macros.ERP.zigzag_erp_macro_v2 import ERPZigzagMacroV2
 from utils.macros.ERP.v1.brandi_erp_macro import ERPBrandiMacro
 
 # v3
-from utils.macros.ERP.v3.g_a_erp_macro_v3 import gauc_erp_macro_run
-from utils.macros.ERP.v3.etc_site_macro_v3 import etc_site_macro_run
-from utils.macros.ERP.v3.zigzag_erp_macrp_v3 import zigzag_erp_macro_run
+from utils.macros.ERP.v3.g_a_erp_macro_v3 import gauc_erp_macro_run, gauc_erp_macro_frame
+from utils.macros.ERP.v3.etc_site_macro_v3 import etc_site_macro_run, etc_site_macro_frame
+from utils.macros.ERP.v3.zigzag_erp_macrp_v3 import zigzag_erp_macro_run, zigzag_erp_macro_frame
 from utils.macros.ERP.v3.brandi_erp_macro_v3 import brandi_erp_macro_run
 from utils.macros.happojang.bundle_utils_v3 import BundleUtilsV3
 # dto
@@ -78,15 +78,15 @@ class OrderMacroUtils:
         return ERPZigzagMacroV2(file_path, is_star).zigzag_erp_macro_run()
 
     def run_gmarket_bundle_macro(self, row_datas: list[dict], is_star: bool = False) -> int:
-        erp_macro_run_data = gauc_erp_macro_run(row_datas, is_star)
+        erp_macro_run_data = gauc_erp_macro_frame(row_datas, is_star)
         return BundleUtilsV3(erp_macro_run_data).run_bundle_macro()
     
     def run_zigzag_bundle_macro(self, row_datas: list[dict], is_star: bool = False) -> int:
-        erp_macro_run_data = zigzag_erp_macro_run(row_datas, is_star)
+        erp_macro_run_data = zigzag_erp_macro_frame(row_datas, is_star)
         return BundleUtilsV3(erp_macro_run_data).run_bundle_macro()
 
     def run_basic_bundle_macro(self, row_datas: list[dict], is_star: bool = False) -> int:
-        erp_macro_run_data = etc_site_macro_run(row_datas, is_star)
+        erp_macro_run_data = etc_site_macro_frame(row_datas, is_star)
         return BundleUtilsV3(erp_macro_run_data).run_bundle_macro()
 
 
@@ -3,6 +3,7 @@ import openpyxl
 from openpyxl.styles import PatternFill
 from openpyxl.utils import get_column_letter
 from typing import Dict, List, Optional, Tuple, Any
+from core.offload import run_io
 from utils.logs.sabangnet_logger import get_logger
 from utils.excels.excel_handler import ExcelHandler
 from utils.macros.smile.smile_common_utils import SmileCommonUtils
@@ -70,11 +71,12 @@ class SmileMacroHandler:
             bool: 처리 성공 여부
         """
         try:
-            self._stage_1_basic_formatting()
+            # 동기 단계는 오프로드 풀에서, DB 조회가 있는 2단계만 이벤트 루프에서 실행
+            await run_io(self._stage_1_basic_formatting)
             await self._stage_2_erp_matching(erp_data, settlement_data)
-            self._stage_3_delete_colored_rows()
-            self._stage_4_delete_conditioned_rows()
-            self._stage_5_final_processing()
+            await run_io(self._stage_3_delete_colored_rows)
+            await run_io(self._stage_4_delete_conditioned_rows)
+            await run_io(self._stage_5_final_processing)
             return True
         except Exception as e:
             self.logger.error(f"1-5단계 처리 중 오류: {str(e)}")
@@ -56,18 +56,32 @@ class MallPriceRegistrationXml(SabangnetXml):
         if file_name is None:
             raw_name = f"{mall_price_dto.compayny_goods_cd}_mall_price_registration_{datetime.now().strftime('%Y%m%d')}_{count_rev}.xml"
             file_name = f"{self._PATH}/" + sanitize_filename(raw_name)
+        self._write_mall_price_xml([mall_price_dto], file_name, mall_stock_rate)
+        return file_name
 
+    def make_mall_price_dtos_registration_xml(self, mall_price_dtos: list[MallPriceDto], count_rev: int, chunk_no: int, mall_stock_rate: int=None, file_name=None):
+        """
+        여러 상품의 쇼핑몰 가격을 DATA 여러 개가 들어간 XML 하나로 생성 (대량 가격 등록용)
+        """
+        if file_name is None:
+            raw_name = f"bulk_mall_price_registration_{datetime.now().strftime('%Y%m%d')}_{count_rev}_{chunk_no}.xml"
+            file_name = f"{self._PATH}/" + sanitize_filename(raw_name)
+        self._write_mall_price_xml(mall_price_dtos, file_name, mall_stock_rate)
+        return file_name
+
+    def _write_mall_price_xml(self, mall_price_dtos: list[MallPriceDto], file_name: str, mall_stock_rate: int=None) -> None:
         root = ET.Element("SABANGNET_GOODS_REGI")
         self._create_product_header(root=root)
-        for shop_code in self.SHOP_CODE:
-            price = getattr(mall_price_dto, shop_code, None)
-            self.create_body(
-                root=root,
-                shop_code=shop_code,
-                compayny_goods_cd=mall_price_dto.compayny_goods_cd,
-                price=price,
-                mall_stock_rate=mall_stock_rate,
-            )
+        for mall_price_dto in mall_price_dtos:
+            for shop_code in self.SHOP_CODE:
+                price = getattr(mall_price_dto, shop_code, None)
+                self.create_body(
+                    root=root,
+                    shop_code=shop_code,
+                    compayny_goods_cd=mall_price_dto.compayny_goods_cd,
+                    price=price,
+                    mall_stock_rate=mall_stock_rate,
+                )
         tree = ET.ElementTree(root)
         ET.indent(tree, space="\t", level=0)
 
@@ -78,5 +92,3 @@ class MallPriceRegistrationXml(SabangnetXml):
         with open(file_path, "wb") as f:
             f.write('<?xml version="1.0" encoding="euc-kr"?>\n'.encode("EUC-KR"))
             tree.write(f, encoding='EUC-KR', xml_declaration=False)
-
-        return file_name
@@ -1,12 +1,13 @@
-from typing import Any
+import re
+import html
+from typing import Any, Iterable
 from pathlib import Path
 from datetime import datetime
 import xml.etree.ElementTree as ET
-import html
+from lxml import etree
 from core.settings import SETTINGS
 from utils.logs.sabangnet_logger import get_logger
 from utils.make_xml.sabangnet_xml import SabangnetXml
-from models.product.product_raw_data import ProductRawData
 from utils.make_xml.file_name_for_xml import sanitize_filename
 from schemas.product.product_raw_data_dto import ProductRawDataDto
 from utils.mappings.product_create_field_eng_mapping import get_db_to_xml_mapping
@@ -14,42 +15,90 @@ from utils.mappings.product_create_field_eng_mapping import get_db_to_xml_mappin
 
 logger = get_logger(__name__, level="DEBUG")
 
+# XML 1.0에서 허용되지 않는 제어 문자 (탭, 줄바꿈 제외)
+_INVALID_XML_CHARS = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def _is_euc_kr_encodable(text: str) -> bool:
+    try:
+        text.encode("euc-kr")
+    except UnicodeEncodeError:
+        return False
+    return True
+
 
 class ProductRegistrationXml(SabangnetXml):
 
     _PATH = "./files/xml/request/product"
 
-    def create_body_product_registration(self, root, product_raw_data_dto: ProductRawDataDto, row_idx: int):
+    def _product_xml_fields(self) -> list[tuple[str, str]]:
+        """DB 필드 -> XML 태그 목록 (태그가 없는 필드 제외, 파일 하나에 한 번만 계산)"""
+        return [(db_field, xml_tag_name) for db_field, xml_tag_name in get_db_to_xml_mapping().items() if xml_tag_name]
+
+    @staticmethod
+    def _to_xml_text(db_value: Any) -> str | etree.CDATA | None:
+        """
+        필드 값을 XML 텍스트로 변환
+        HTML 엔티티는 원본 텍스트로 복원하고(예: &lt; -> <), 태그(<, >)가 들어 있는 값(상세설명 HTML 등)은
+        CDATA로 감싸서 원본 그대로 전달. 그 외 값은 lxml이 필요한 문자(&, <, >)만 이스케이프.
+        EUC-KR로 쓸 수 없는 문자(이모지 등)는 &#NNNN; 문자 참조로 기록되는데, CDATA 안에서는 참조가 풀리지 않으므로
+        그런 값은 CDATA로 감싸지 않고 이스케이프.
+        """
+        if db_value is None:
+            return None
+        text = _INVALID_XML_CHARS.sub("", html.unescape(str(db_value)))
+        if ("<" in text or ">" in text) and "]]>" not in text and _is_euc_kr_encodable(text):
+            return etree.CDATA(text)
+        return text
+
+    def _make_data_element(self, product_raw_data_dto: ProductRawDataDto | dict, fields: list[tuple[str, str]]) -> etree._Element:
+        """상품 하나의 DATA 엘리먼트 생성 (파일에 기록한 뒤 버려지므로 메모리에는 상품 하나만 유지)"""
+        if isinstance(product_raw_data_dto, dict):
+            get_value = product_raw_data_dto.get
+        else:
+            def get_value(db_field: str) -> Any:
+                return getattr(product_raw_data_dto, db_field, None)
+
+        data = etree.Element("DATA")
+        data.text = "\n\t\t"
+        child = None
+        for db_field, xml_tag_name in fields:
+            child = etree.SubElement(data, xml_tag_name)
+            child.text = self._to_xml_text(get_value(db_field))
+            child.tail = "\n\t\t"
+        if child is not None:
+            child.tail = "\n\t"
+        return data
+
+    def write_product_registration_xml(self, product_raw_data_dto_list: Iterable[ProductRawDataDto], file_path: Path) -> int:
         """
-        상품 등록용 XML body 생성
+        상품 등록용 XML을 파일에 스트리밍으로 기록 (DATA 블록을 하나씩 EUC-KR로 바로 씀)
+        상품 수와 관계없이 메모리 사용량이 일정하므로 제너레이터도 받을 수 있음
         Args:
-            root: XML 루트 엘리먼트
-            product_raw_data_dto: ProductRawDataDto
-            row_idx: 행 인덱스
+            product_raw_data_dto_list: ProductRawDataDto (또는 같은 키의 dict) 목록
+            file_path: 저장할 파일 경로
         Returns:
-            생성된 DATA 엘리먼트
+            기록한 상품 수
         """
-        data = ET.SubElement(root, "DATA")
-        
-        product_raw_data = ProductRawData(**product_raw_data_dto.model_dump())
-        # DB 필드와 XML 태그 매핑 처리
-        for db_field, xml_tag_name in get_db_to_xml_mapping().items():
-            if xml_tag_name:
-                db_value = getattr(product_raw_data, db_field, None)
-                child = ET.SubElement(data, xml_tag_name)
-                # HTML 엔티티가 인코딩된 경우 디코딩하여 원본 텍스트로 복원
-                if db_value is not None:
-                    # HTML 엔티티 디코딩 (예: &lt; -> <, &gt; -> >)
-                    decoded_value = html.unescape(str(db_value))
-                    child.text = decoded_value
-                else:
-                    child.text = ""
-    
-        return data
+        fields = self._product_xml_fields()
+        count = 0
+        with open(file_path, "wb") as f, etree.xmlfile(f, encoding="euc-kr") as xf:
+            f.write('<?xml version="1.0" encoding="euc-kr"?>\n'.encode("EUC-KR"))
+            with xf.element("SABANGNET_GOODS_REGI"):
+                header = etree.Element("HEADER")
+                for tag, text in self._product_header_fields():
+                    etree.SubElement(header, tag).text = text
+                etree.indent(header, space="\t", level=1)
+                xf.write("\n\t", header)
+                for product_raw_data_dto in product_raw_data_dto_list:
+                    xf.write("\n\t", self._make_data_element(product_raw_data_dto, fields))
+                    count += 1
+                xf.write("\n")
+        return count
 
     def make_product_registration_xml(
             self,
-            product_raw_data_dto_list: list[ProductRawDataDto],
+            product_raw_data_dto_list: Iterable[ProductRawDataDto],
             product_create_db_count: int,
             file_name: str = None,
             dst_path_name: str = None
@@ -57,7 +106,7 @@ class ProductRegistrationXml(SabangnetXml):
         """
         상품 등록용 XML 파일 생성
         Args:
-            product_data_list: ProductRawDataDto 리스트
+            product_raw_data_dto_list: ProductRawDataDto 리스트 (제너레이터 가능)
             product_create_db_count: 이미 증가된 product_create_db 카운터 값
             file_name: 파일명 (선택사항)
         Returns:
@@ -71,38 +120,13 @@ class ProductRegistrationXml(SabangnetXml):
                 base_name = f"product_create_request_db_test_{now_str}_{product_create_db_count}.xml"
             file_name = f"{self._PATH}/" + sanitize_filename(base_name)
 
-        # XML 루트 엘리먼트 생성
-        root = ET.Element("SABANGNET_GOODS_REGI")
-        
-        # 헤더 생성
-        self._create_product_header(root=root)
-        
-        # 각 상품 데이터에 대해 body 생성
-        for idx, product_raw_data_dto in enumerate(product_raw_data_dto_list):
-            self.create_body_product_registration(
-                root=root,
-                product_raw_data_dto=product_raw_data_dto,
-                row_idx=idx
-            )
-        
-        # XML 파일 저장
-        tree = ET.ElementTree(root)
-        ET.indent(tree, space="\t", level=0)
-
         # 파일 경로 객체 생성
         file_path = Path(file_name)
         file_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # 임시로 메모리에 XML 문자열 생성
-        xml_string = ET.tostring(root, encoding='unicode')
-        
-        # HTML 엔티티를 원본으로 복원 (XML 라이브러리가 자동으로 인코딩한 것을 되돌림)
-        xml_string = xml_string.replace('&lt;', '<').replace('&gt;', '>')
-        
-        with open(file_path, "wb") as f:
-            f.write('<?xml version="1.0" encoding="euc-kr"?>\n'.encode("EUC-KR"))
-            f.write(xml_string.encode("EUC-KR"))
-        
+        count = self.write_product_registration_xml(product_raw_data_dto_list, file_path)
+        logger.info(f"상품 등록 XML 생성 완료: {count}개 상품, {file_path}")
+
         return file_path
 
     def _make_test_xml_element(self, xml_tag_name: str, db_field: str, db_value: Any, data_element: ET.Element, row_idx: int) -> None:
@@ -10,24 +10,23 @@ class SabangnetXml:
     _SEND_GOODS_CD_RT = SETTINGS.SABANG_SEND_GOODS_CD_RT
 
     
+    def _product_header_fields(self) -> list[tuple[str, str]]:
+        """상품 등록 XML HEADER 태그/값 목록 (ElementTree, 스트리밍 writer 공용)"""
+        return [
+            ("SEND_COMPAYNY_ID", self._COMPAYNY_ID),
+            ("SEND_AUTH_KEY", self._AUTH_KEY),
+            ("SEND_DATA", datetime.now().strftime("%Y%m%d")),
+            ("SEND_GOODS_CD_RT", self._SEND_GOODS_CD_RT if self._SEND_GOODS_CD_RT else "Y"),
+            ("RESULT_TYPE", "XML"),
+        ]
+
     def _create_product_header(self, root: ET.Element) -> ET.Element:
         
         header = ET.SubElement(root, "HEADER")
         
-        send_company_id = ET.SubElement(header, "SEND_COMPAYNY_ID")
-        send_company_id.text = self._COMPAYNY_ID
-        
-        send_auth_key = ET.SubElement(header, "SEND_AUTH_KEY")
-        send_auth_key.text = self._AUTH_KEY
-        
-        send_date = ET.SubElement(header, "SEND_DATA")
-        send_date.text = datetime.now().strftime("%Y%m%d")
-        
-        send_goods_cd_rt = ET.SubElement(header, "SEND_GOODS_CD_RT")
-        send_goods_cd_rt.text = self._SEND_GOODS_CD_RT if self._SEND_GOODS_CD_RT else "Y"
-        
-        result_type = ET.SubElement(header, "RESULT_TYPE")
-        result_type.text = "XML"
+        for tag, text in self._product_header_fields():
+            child = ET.SubElement(header, tag)
+            child.text = text
     
     def _create_order_header(self, root: ET.Element) -> ET.Element:
         
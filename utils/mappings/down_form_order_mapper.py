@@ -1,27 +1,24 @@
 import os
-import re
-import hashlib
+import numpy as np
 import pandas as pd
 from typing import Any
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 from datetime import datetime
 from utils.logs.sabangnet_logger import get_logger
+from utils.pii_masking import DOWN_FORM_MASKING_RULES, mask_frame
+from utils.mappings.formula_engine import (
+    NUMERIC_FIELDS,
+    compile_formula,
+    compile_template_formulas,
+    is_formula_source,
+)
 
 
 logger = get_logger(__name__)
 
 
-# 개인정보 마스킹 규칙 (ReceiveOrderCreateService._MASKING_RULES와 동일)
-MASKING_RULES = {
-    'receive_name': 'name',
-    'receive_tel': 'phone',
-    'receive_cel': 'phone',
-    'receive_addr': 'address',
-    'receive_zipcode': 'zipcode',
-    'order_id': 'id',
-    'mall_order_id': 'id',
-    'mall_user_id': 'user_id',
-}
+# 개인정보 마스킹 규칙 (utils.pii_masking 공용 규칙)
+MASKING_RULES = DOWN_FORM_MASKING_RULES
 
 # 데이터베이스 스키마에 따른 필드 타입 매핑
 FIELD_TYPE_MAPPING = {
@@ -95,6 +92,30 @@ FIELD_TYPE_MAPPING = {
     'error_logs': 'jsonb',
 }
 
+# String(n) 컬럼 길이 제한 (down_form_orders 스키마)
+FIELD_MAX_LENGTHS = {
+    'delivery_method_str': 10,
+    'form_name': 30,
+    'order_id': 100,
+    'mall_product_id': 50,
+    'item_name': 100,
+    'receive_name': 100,
+    'receive_cel': 20,
+    'receive_tel': 20,
+    'receive_zipcode': 15,
+    'price_formula': 50,
+    'work_status': 14,
+    'idx': 50,
+    'reg_date': 14,
+    'ord_confirm_date': 14,
+    'rtn_dt': 14,
+    'chng_dt': 14,
+    'delivery_confirm_date': 14,
+    'cancel_dt': 14,
+    'hope_delv_date': 14,
+    'inv_send_dm': 14,
+}
+
 
 def convert_field_to_db_type(field_name: str, value: Any) -> Any:
     """
@@ -119,86 +140,11 @@ def convert_field_to_db_type(field_name: str, value: Any) -> Any:
             str_value = str(value)
 
             # String 필드들의 길이 제한 적용
-            if field_name == 'delivery_method_str' and len(str_value) > 10:
-                logger.warning(
-                    f"delivery_method_str value too long: {str_value}, truncating to 10 characters")
-                return str_value[:10]
-            elif field_name == 'form_name' and len(str_value) > 30:
-                logger.warning(
-                    f"form_name value too long: {str_value}, truncating to 30 characters")
-                return str_value[:30]
-            elif field_name == 'order_id' and len(str_value) > 100:
-                logger.warning(
-                    f"order_id value too long: {str_value}, truncating to 100 characters")
-                return str_value[:100]
-            elif field_name == 'mall_product_id' and len(str_value) > 50:
-                logger.warning(
-                    f"mall_product_id value too long: {str_value}, truncating to 50 characters")
-                return str_value[:50]
-            elif field_name == 'item_name' and len(str_value) > 100:
-                logger.warning(
-                    f"item_name value too long: {str_value}, truncating to 100 characters")
-                return str_value[:100]
-            elif field_name == 'receive_name' and len(str_value) > 100:
-                logger.warning(
-                    f"receive_name value too long: {str_value}, truncating to 100 characters")
-                return str_value[:100]
-            elif field_name == 'receive_cel' and len(str_value) > 20:
-                logger.warning(
-                    f"receive_cel value too long: {str_value}, truncating to 20 characters")
-                return str_value[:20]
-            elif field_name == 'receive_tel' and len(str_value) > 20:
-                logger.warning(
-                    f"receive_tel value too long: {str_value}, truncating to 20 characters")
-                return str_value[:20]
-            elif field_name == 'receive_zipcode' and len(str_value) > 15:
-                logger.warning(
-                    f"receive_zipcode value too long: {str_value}, truncating to 15 characters")
-                return str_value[:15]
-            elif field_name == 'price_formula' and len(str_value) > 50:
-                logger.warning(
-                    f"price_formula value too long: {str_value}, truncating to 50 characters")
-                return str_value[:50]
-            elif field_name == 'work_status' and len(str_value) > 14:
-                logger.warning(
-                    f"work_status value too long: {str_value}, truncating to 14 characters")
-                return str_value[:14]
-            elif field_name == 'idx' and len(str_value) > 50:
-                logger.warning(
-                    f"idx value too long: {str_value}, truncating to 50 characters")
-                return str_value[:50]
-            elif field_name == 'reg_date' and len(str_value) > 14:
+            max_length = FIELD_MAX_LENGTHS.get(field_name)
+            if max_length is not None and len(str_value) > max_length:
                 logger.warning(
-                    f"reg_date value too long: {str_value}, truncating to 14 characters")
-                return str_value[:14]
-            elif field_name == 'ord_confirm_date' and len(str_value) > 14:
-                logger.warning(
-                    f"ord_confirm_date value too long: {str_value}, truncating to 14 characters")
-                return str_value[:14]
-            elif field_name == 'rtn_dt' and len(str_value) > 14:
-                logger.warning(
-                    f"rtn_dt value too long: {str_value}, truncating to 14 characters")
-                return str_value[:14]
-            elif field_name == 'chng_dt' and len(str_value) > 14:
-                logger.warning(
-                    f"chng_dt value too long: {str_value}, truncating to 14 characters")
-                return str_value[:14]
-            elif field_name == 'delivery_confirm_date' and len(str_value) > 14:
-                logger.warning(
-                    f"delivery_confirm_date value too long: {str_value}, truncating to 14 characters")
-                return str_value[:14]
-            elif field_name == 'cancel_dt' and len(str_value) > 14:
-                logger.warning(
-                    f"cancel_dt value too long: {str_value}, truncating to 14 characters")
-                return str_value[:14]
-            elif field_name == 'hope_delv_date' and len(str_value) > 14:
-                logger.warning(
-                    f"hope_delv_date value too long: {str_value}, truncating to 14 characters")
-                return str_value[:14]
-            elif field_name == 'inv_send_dm' and len(str_value) > 14:
-                logger.warning(
-                    f"inv_send_dm value too long: {str_value}, truncating to 14 characters")
-                return str_value[:14]
+                    f"{field_name} value too long: {str_value}, truncating to {max_length} characters")
+                return str_value[:max_length]
 
             return str_value
         elif field_type == 'int':
@@ -247,38 +193,88 @@ def convert_row_to_db_types(row: dict[str, Any]) -> dict[str, Any]:
     return converted_row
 
 
-def _mask_personal_info(value: str, mask_type: str) -> str:
-    if not value or str(value).strip() == '':
-        return value
-    value = str(value)
-    if mask_type == 'name':
-        if len(value) <= 1:
-            return '*'
-        return value[0] + '*' * (len(value) - 1)
-    elif mask_type == 'phone':
-        phone_digits = re.sub(r'[^0-9]', '', value)
-        if len(phone_digits) >= 8:
-            if len(phone_digits) == 11:
-                return phone_digits[:3] + '****' + phone_digits[7:]
-            elif len(phone_digits) == 10:
-                return phone_digits[:3] + '****' + phone_digits[6:]
-        return '****'
-    elif mask_type == 'address':
-        parts = value.split()
-        if len(parts) > 2:
-            return ' '.join(parts[:2]) + ' ****'
-        return '****'
-    elif mask_type == 'zipcode':
-        if len(value) >= 3:
-            return value[:3] + '*' * (len(value) - 3)
-        return '*' * len(value)
-    elif mask_type == 'id':
-        return hashlib.md5(value.encode()).hexdigest()[:8]
-    elif mask_type == 'user_id':
-        if len(value) > 2:
-            return value[:2] + '*' * (len(value) - 2)
-        return '*' * len(value)
-    return value
+def _is_blank(series: pd.Series) -> pd.Series:
+    """공백뿐인 문자열 여부"""
+    is_str = series.map(type).eq(str)
+    return series.where(is_str, 'x').astype(str).str.strip().eq('')
+
+
+def _is_falsy(series: pd.Series) -> pd.Series:
+    """파이썬 기준 falsy 값 여부 (0, 0.0, False, '') - convert_field_to_db_type의 `if value` 조건"""
+    return series.isin([0, ''])
+
+
+def _map_unique(series: pd.Series, func) -> pd.Series:
+    """값 종류별로 한 번만 func을 호출해서 매핑 (금액/ID처럼 같은 값이 반복되는 컬럼용)"""
+    uniques = pd.unique(series)
+    return series.map(dict(zip(uniques, map(func, uniques))))
+
+
+def _to_decimal(value: Any) -> Decimal | None:
+    try:
+        return Decimal(str(value))
+    except InvalidOperation:
+        logger.warning(f"Decimal 변환 실패: {value}")
+        return None
+
+
+def convert_column_to_db_type(field_name: str, series: pd.Series) -> pd.Series:
+    """
+    convert_field_to_db_type의 컬럼 단위 버전 (결과는 object Series, 빈 값은 None)
+    엑셀에서 읽은 빈 셀(NaN/NaT)도 None으로 처리
+    """
+    field_type = FIELD_TYPE_MAPPING.get(field_name)
+    series = series.astype(object)
+    present = series.notna().to_numpy()
+    result = np.full(len(series), None, dtype=object)
+    values = series[present]
+    # keep: values 중 변환 결과를 채울 위치 (나머지는 None)
+    keep = np.ones(len(values), dtype=bool)
+
+    if len(values) == 0:
+        converted = values
+    elif not field_type or field_type == 'jsonb':
+        converted = values
+    elif field_type == 'str':
+        # object -> str 변환은 값마다 str()과 동일 (12000.0 -> '12000.0', Timestamp -> '2024-01-01 00:00:00')
+        converted = values.astype(str)
+        max_length = FIELD_MAX_LENGTHS.get(field_name)
+        if max_length is not None:
+            too_long = converted.str.len() > max_length
+            if too_long.any():
+                logger.warning(
+                    f"{field_name} value too long: {int(too_long.sum())} rows, truncating to {max_length} characters")
+                converted = converted.str.slice(0, max_length)
+    elif field_type == 'int':
+        keep = ~(_is_blank(values) | _is_falsy(values)).to_numpy()
+        numbers = pd.to_numeric(values.where(keep, 0), errors='coerce')
+        invalid = numbers.isna().to_numpy() & keep
+        if invalid.any():
+            logger.warning(f"Error converting {field_name} to int: {int(invalid.sum())} rows")
+        keep &= ~invalid
+        converted = numbers.fillna(0).astype('int64').astype(object)
+    elif field_type == 'decimal':
+        keep = ~(_is_blank(values) | _is_falsy(values)).to_numpy()
+        converted = _map_unique(values.where(keep, 0), _to_decimal)
+    elif field_type == 'datetime':
+        keep = ~_is_blank(values).to_numpy()
+        converted = values
+    else:
+        converted = values
+
+    positions = np.flatnonzero(present)[keep]
+    result[positions] = converted.to_numpy(dtype=object)[keep]
+    return pd.Series(result, index=series.index, dtype=object)
+
+
+def convert_frame_to_db_types(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    DataFrame의 모든 컬럼을 데이터베이스 스키마에 맞게 변환 (convert_row_to_db_types의 컬럼 단위 버전)
+    """
+    return pd.DataFrame(
+        {field: convert_column_to_db_type(field, df[field]) for field in df.columns},
+        index=df.index, columns=df.columns,
+    )
 
 
 def map_raw_to_down_form(raw_row: dict[str, Any], config: dict) -> dict[str, Any]:
@@ -373,47 +369,13 @@ def map_aggregated_to_down_form(group_rows: list[dict[str, Any]], config: dict)
 
 def eval_formula(transform_config: dict, row: dict) -> Any:
     """
-    source 수식을 계산하여 반환 (eval 사용 대신 새로운 방법을 찾아야 함)
+    source 수식을 계산하여 반환 (formula_engine으로 한 번 컴파일한 수식을 행 단위로 평가)
     """
+    source = transform_config.get('source')
+    if not is_formula_source(source):
+        return None
     try:
-        source = transform_config.get('source')
-        if not source or source.startswith('='):
-            return None
-
-        # None 값을 변환
-        processed_row = {}
-        for key, value in row.items():
-            if value is None:
-                # 숫자 연산이 필요한 필드는 0으로, 문자열은 공백으로
-                if is_numeric_field(key):
-                    processed_row[key] = 0
-                else:
-                    processed_row[key] = ""
-            else:
-                processed_row[key] = value
-
-        # 변수 치환
-        formula = source
-        for key, value in processed_row.items():
-            if key in formula:
-                if isinstance(value, str):
-                    # 문자열 값은 따옴표로 감싸기
-                    formula = formula.replace(key, f'"{value}"')
-                else:
-                    # 숫자 값은 그대로 치환
-                    formula = formula.replace(key, str(value))
-
-        if 'convert_name' in formula:
-            formula = formula.replace('convert_name(', '').replace(')', '')
-        elif 'sum' in formula:
-            formula = formula.replace('sum(', '').replace(')', '')
-
-        safe_functions = {
-            'int': int,
-            'str': str
-        }
-
-        return eval(formula, {"__builtins__": {}}, safe_functions)
+        return compile_formula(source).evaluate_row(row)
     except Exception as e:
         logger.error(f"수식 계산 실패: {source}, 에러: {e}")
         return None
@@ -423,41 +385,89 @@ def is_numeric_field(field_name: str) -> bool:
     """
     필드가 숫자 연산에 사용되는지 확인
     """
-    # 숫자 연산에 사용되는 필드들
-    numeric_fields = {
-        'pay_cost', 'delv_cost', 'total_cost', 'expected_payout',
-        'mall_won_cost', 'sale_cnt', 'service_fee', 'sum_p_ea',
-        'sum_expected_payout', 'sum_pay_cost', 'sum_delv_cost',
-        'sum_total_cost', 'etc_cost', 'price_formula'
-    }
+    return field_name in NUMERIC_FIELDS
 
-    return field_name in numeric_fields
+
+def map_receive_orders_to_down_form(raw_data: list[dict[str, Any]], config: dict) -> list[dict[str, Any]]:
+    """
+    receive_orders row 목록을 down_form_orders 스키마에 맞게 변환 (map_raw_to_down_form_and_receive_order의 일괄 버전)
+    formula 컬럼은 행마다 계산하지 않고 템플릿별로 컴파일된 수식을 컬럼 단위로 한 번에 계산
+    기존 행 단위 함수와 같이 raw_data의 각 row에도 formula/empty 결과(타입 변환 전 값)를 반영
+    (같은 목록으로 ERP -> 합포장 매크로를 이어서 돌리면 합포장 쪽은 ERP 매핑 결과를 입력으로 받음)
+    """
+    if not raw_data:
+        return []
+    df = pd.DataFrame(raw_data, dtype=object)
+    formulas = compile_template_formulas(config)
+    written_fields = []
+    for col in config['column_mappings']:
+        field = col['source_field']
+        field_type = col.get('field_type')
+        if field_type == 'formula':
+            compiled = formulas.get(field)
+            if compiled is None:
+                df[field] = None
+            else:
+                try:
+                    df[field] = compiled.evaluate(df)
+                except Exception as e:
+                    logger.error(f"수식 계산 실패: {compiled.source}, 에러: {e}")
+                    df[field] = None
+            written_fields.append(field)
+        elif field_type == 'empty':
+            df[field] = None
+            written_fields.append(field)
+        elif field not in df.columns:
+            df[field] = None
+    _write_back_to_raw_rows(raw_data, df, config, written_fields)
+
+    # down_form_orders 스키마에 맞게 타입 변환 및 매핑
+    fields = [field for field in df.columns if field in FIELD_TYPE_MAPPING]
+    df = df[fields].astype(object)
+    df = df.where(df.notna(), None)
+    return [
+        {field: convert_field_to_db_type(field, value) for field, value in zip(fields, values)}
+        for values in df.itertuples(index=False, name=None)
+    ]
+
+
+def _write_back_to_raw_rows(raw_data: list[dict[str, Any]], df: pd.DataFrame, config: dict, written_fields: list[str]) -> None:
+    """map_receive_orders_to_down_form 계산 결과를 원본 row에 반영 (map_raw_to_down_form_and_receive_order와 같은 결과)"""
+    written_fields = list(dict.fromkeys(written_fields))
+    columns = {}
+    for field in written_fields:
+        values = df[field].astype(object)
+        columns[field] = values.where(values.notna(), None).tolist()
+    for i, raw_row in enumerate(raw_data):
+        for col in config['column_mappings']:
+            raw_row.setdefault(col['source_field'], None)
+        for field in written_fields:
+            raw_row[field] = columns[field][i]
 
 
 def map_excel_to_down_form(df: pd.DataFrame, config: dict) -> list[dict[str, Any]]:
     """
     excel 데이터를 down_form_orders 스키마에 맞게 변환
+    행 단위 반복 없이 컬럼명 변경(col_map) -> 컬럼별 타입 변환 -> 컬럼별 마스킹 순서로 처리
     """
     column_mappings = config.get('column_mappings', [])
     # target_column(엑셀 컬럼명) -> source_field(DB 필드명) 매핑 dict
     col_map = {col['target_column']: col['source_field']
                for col in column_mappings}
     logger.info(f"col_map: {col_map}")
-    raw_data = []
-    # 엑셀 데이터 → DB 저장용 dict 변환
+
+    mapped = df.loc[:, df.columns.isin(list(col_map))].rename(columns=col_map)
+    # 같은 DB 필드로 매핑된 엑셀 컬럼이 여러 개면 마지막 컬럼 값 사용 (기존 dict 매핑과 동일)
+    mapped = mapped.loc[:, ~mapped.columns.duplicated(keep='last')]
+
+    # 데이터베이스 스키마에 맞게 타입 변환
+    mapped = convert_frame_to_db_types(mapped)
+
+    # 개인정보 마스킹 (TEST 환경에서만)
     is_test_env = os.getenv("DEPLOY_ENV", "production") != "production"
-    for _, row in df.iterrows():
-        mapped_row = {col_map.get(col, col): row[col]
-                      for col in df.columns if col in col_map}
-
-        # 데이터베이스 스키마에 맞게 타입 변환
-        mapped_row = convert_row_to_db_types(mapped_row)
-
-        # 개인정보 마스킹 (TEST 환경에서만)
-        if is_test_env:
-            for field, mask_type in MASKING_RULES.items():
-                if field in mapped_row and mapped_row[field]:
-                    mapped_row[field] = _mask_personal_info(
-                        mapped_row[field], mask_type)
-        raw_data.append(mapped_row)
-    return raw_data
+    if is_test_env:
+        mask_frame(mapped, MASKING_RULES)
+
+    # 엑셀 데이터 → DB 저장용 dict 변환
+    fields = list(mapped.columns)
+    return [dict(zip(fields, values)) for values in mapped.itertuples(index=False, name=None)]
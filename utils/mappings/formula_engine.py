@@ -0,0 +1,222 @@
+"""
+템플릿 컬럼 수식(transform_config['source']) 엔진.
+
+기존 eval_formula는 행마다 필드명을 값 문자열로 치환한 뒤 eval 했기 때문에
+    - 행 수만큼 문자열 치환 + eval 비용이 들고
+    - 'pay_cost'가 'sum_pay_cost' 안에서도 치환되는 식의 부분 문자열 버그가 있고
+    - 값에 따옴표나 코드가 들어 있으면 그대로 실행되는 문제가 있었습니다.
+
+여기서는 수식을 한 번만 ast로 파싱해서 허용된 노드만으로 평가 함수를 만들고(compile_formula, 수식별 캐시),
+템플릿 단위로 컴파일 결과를 캐시합니다(compile_template_formulas).
+평가 함수는 스칼라(행 단위)와 pandas Series(컬럼 단위) 모두에 동작합니다.
+
+허용 문법:
+    - 필드명, 숫자/문자열 상수
+    - 이항 연산 + - * / , 단항 연산 + -
+    - 함수 sum(x), convert_name(x) (기존 eval_formula와 같이 인자를 그대로 반환)
+
+계산할 수 없는 행은 (기존 eval_formula와 같이) 그 행만 None:
+    - 숫자 필드에 숫자로 바꿀 수 없는 문자열이 있는 행 (빈 문자열은 빈 값으로 보고 0)
+    - 0으로 나누는 행 (컬럼 단위로 계산해도 inf가 아니라 None)
+"""
+import ast
+from functools import lru_cache
+from typing import Any, Callable
+
+import pandas as pd
+
+from utils.logs.sabangnet_logger import get_logger
+
+
+logger = get_logger(__name__)
+
+
+# 숫자 연산에 사용되는 필드 (값이 없으면 0, 나머지 필드는 빈 문자열로 채움)
+NUMERIC_FIELDS = frozenset({
+    'pay_cost', 'delv_cost', 'total_cost', 'expected_payout',
+    'mall_won_cost', 'sale_cnt', 'service_fee', 'sum_p_ea',
+    'sum_expected_payout', 'sum_pay_cost', 'sum_delv_cost',
+    'sum_total_cost', 'etc_cost', 'price_formula'
+})
+
+def _divide(left: Any, right: Any) -> Any:
+    """나눗셈 (pandas는 0으로 나누면 inf를 돌려주므로, 행 단위와 같이 ZeroDivisionError를 냄)"""
+    if isinstance(right, pd.Series):
+        if right.eq(0).any():
+            raise ZeroDivisionError("0으로 나누는 행이 있습니다.")
+    elif right == 0:
+        raise ZeroDivisionError("0으로 나눌 수 없습니다.")
+    return left / right
+
+
+_BINARY_OPERATORS: dict[type, Callable[[Any, Any], Any]] = {
+    ast.Add: lambda left, right: left + right,
+    ast.Sub: lambda left, right: left - right,
+    ast.Mult: lambda left, right: left * right,
+    ast.Div: _divide,
+}
+
+_UNARY_OPERATORS: dict[type, Callable[[Any], Any]] = {
+    ast.UAdd: lambda operand: +operand,
+    ast.USub: lambda operand: -operand,
+}
+
+# 수식에서 호출 가능한 함수 (sum/convert_name은 행 단위 값이므로 인자를 그대로 반환)
+_FUNCTIONS: dict[str, Callable[[Any], Any]] = {
+    'sum': lambda value: value,
+    'convert_name': lambda value: value,
+}
+
+
+class FormulaError(ValueError):
+    """허용되지 않은 수식이거나 평가에 필요한 필드가 없을 때"""
+
+
+def is_formula_source(source: Any) -> bool:
+    """엔진으로 계산하는 수식인지 확인 (비어 있거나 '='로 시작하는 엑셀 수식은 제외)"""
+    return isinstance(source, str) and bool(source.strip()) and not source.startswith('=')
+
+
+def _fill_operand(field: str, value: Any) -> Any:
+    """
+    스칼라 피연산자 준비: 숫자 필드의 빈 값(빈 문자열 포함)은 0, 문자열 숫자는 숫자로 / 그 외 필드의 빈 값은 ''
+    숫자 필드에 숫자로 바꿀 수 없는 문자열이 있으면 FormulaError (0으로 조용히 바꾸지 않음)
+    """
+    if field in NUMERIC_FIELDS:
+        if value is None or value is pd.NA or (isinstance(value, float) and value != value):
+            return 0
+        if isinstance(value, str):
+            if not value.strip():
+                return 0
+            numeric = pd.to_numeric(value, errors='coerce')
+            if pd.isna(numeric):
+                raise FormulaError(f"숫자 필드 {field}의 값을 숫자로 바꿀 수 없습니다: {value!r}")
+            return numeric.item()
+        return value
+    if value is None or value is pd.NA or (isinstance(value, float) and value != value):
+        return ""
+    return value
+
+
+def _fill_operand_series(field: str, series: pd.Series) -> pd.Series:
+    """컬럼 피연산자 준비 (_fill_operand와 같은 규칙을 컬럼 단위로)"""
+    if field in NUMERIC_FIELDS:
+        if series.dtype == object:
+            is_str = series.map(type).eq(str)
+            if is_str.any():
+                blank = is_str & series.where(is_str, "x").str.strip().eq("")
+                numeric = pd.to_numeric(series.where(is_str & ~blank), errors='coerce')
+                if (is_str & ~blank & numeric.isna()).any():
+                    # 숫자가 아닌 문자열이 있는 행만 None이 되도록 행 단위 계산으로 넘김
+                    raise FormulaError(f"숫자 필드 {field}에 숫자로 바꿀 수 없는 문자열이 있습니다.")
+                series = series.where(~is_str, numeric).where(~blank, 0)
+        return series.where(series.notna(), 0)
+    return series.where(series.notna(), "")
+
+
+class CompiledFormula:
+    """한 번 파싱된 수식. 행(dict) 단위와 DataFrame 컬럼 단위 평가를 모두 지원"""
+
+    def __init__(self, source: str):
+        self.source = source
+        try:
+            tree = ast.parse(source.strip(), mode='eval')
+        except SyntaxError as e:
+            raise FormulaError(f"수식 파싱 실패: {source}, 에러: {e}") from e
+        fields: list[str] = []
+        self._evaluate = self._compile(tree.body, fields)
+        self.fields = tuple(dict.fromkeys(fields))
+
+    def _compile(self, node: ast.AST, fields: list[str]) -> Callable[[dict[str, Any]], Any]:
+        """허용된 노드만으로 평가 함수(env -> 값)를 조립"""
+        if isinstance(node, ast.Name):
+            name = node.id
+            fields.append(name)
+            return lambda env: env[name]
+        if isinstance(node, ast.Constant) and type(node.value) in (int, float, str):
+            value = node.value
+            return lambda env: value
+        if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+            operator = _BINARY_OPERATORS[type(node.op)]
+            left = self._compile(node.left, fields)
+            right = self._compile(node.right, fields)
+            return lambda env: operator(left(env), right(env))
+        if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+            operator = _UNARY_OPERATORS[type(node.op)]
+            operand = self._compile(node.operand, fields)
+            return lambda env: operator(operand(env))
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+                and node.func.id in _FUNCTIONS and len(node.args) == 1 and not node.keywords):
+            function = _FUNCTIONS[node.func.id]
+            argument = self._compile(node.args[0], fields)
+            return lambda env: function(argument(env))
+        raise FormulaError(f"허용되지 않은 수식 구문: {ast.dump(node)} (수식: {self.source})")
+
+    def evaluate_row(self, row: dict[str, Any]) -> Any:
+        """단일 행(dict) 평가"""
+        missing = [field for field in self.fields if field not in row]
+        if missing:
+            raise FormulaError(f"수식 필드 없음: {missing} (수식: {self.source})")
+        env = {field: _fill_operand(field, row[field]) for field in self.fields}
+        return self._evaluate(env)
+
+    def evaluate(self, df: pd.DataFrame) -> pd.Series:
+        """
+        DataFrame 컬럼 단위 평가
+        컬럼 연산이 실패하면(특정 행만 타입이 안 맞는 경우 등) 행 단위로 다시 평가해서 실패한 행만 None
+        """
+        missing = [field for field in self.fields if field not in df.columns]
+        if missing:
+            raise FormulaError(f"수식 필드 없음: {missing} (수식: {self.source})")
+        try:
+            env = {field: _fill_operand_series(field, df[field]) for field in self.fields}
+            result = self._evaluate(env)
+        except Exception as e:
+            logger.warning(f"수식 컬럼 계산 실패, 행 단위로 재계산: {self.source}, 에러: {e}")
+            return pd.Series(
+                [self._evaluate_row_or_none(row) for row in df[list(self.fields)].to_dict('records')],
+                index=df.index, dtype=object,
+            )
+        if not isinstance(result, pd.Series):
+            # 필드 없이 상수만 있는 수식
+            return pd.Series([result] * len(df), index=df.index, dtype=object)
+        return result
+
+    def _evaluate_row_or_none(self, row: dict[str, Any]) -> Any:
+        try:
+            return self.evaluate_row(row)
+        except Exception as e:
+            logger.error(f"수식 계산 실패: {self.source}, 에러: {e}")
+            return None
+
+
+@lru_cache(maxsize=512)
+def compile_formula(source: str) -> CompiledFormula:
+    """수식 문자열을 컴파일 (같은 수식은 한 번만 파싱)"""
+    return CompiledFormula(source)
+
+
+@lru_cache(maxsize=256)
+def _compile_template_formulas(template_key: str, sources: tuple[tuple[str, str], ...]) -> dict[str, CompiledFormula]:
+    compiled = {}
+    for field, source in sources:
+        try:
+            compiled[field] = compile_formula(source)
+        except FormulaError as e:
+            # 잘못된 수식은 해당 컬럼만 None 처리되도록 제외
+            logger.error(f"[{template_key}] {e}")
+    return compiled
+
+
+def compile_template_formulas(config: dict) -> dict[str, CompiledFormula]:
+    """
+    템플릿 config의 formula 컬럼을 source_field -> CompiledFormula 로 컴파일 (템플릿별 캐시)
+    캐시 키에 수식 내용이 포함되므로 템플릿 수식이 바뀌면 새로 컴파일됩니다.
+    """
+    sources = tuple(
+        (col['source_field'], (col.get('transform_config') or {}).get('source'))
+        for col in config.get('column_mappings', [])
+        if col.get('field_type') == 'formula'
+        and is_formula_source((col.get('transform_config') or {}).get('source'))
+    )
+    return _compile_template_formulas(str(config.get('template_code', '')), sources)
@@ -0,0 +1,197 @@
+"""
+개인정보 마스킹 공용 모듈.
+
+ReceiveOrderCreateService(XML/JSON 주문 수집)와 down_form_order_mapper(엑셀 업로드)에
+각각 있던 마스킹 로직을 한 곳으로 모았습니다. 두 경로 모두 같은 규칙으로 마스킹됩니다.
+
+    - mask_value   : 값 하나 (XML 파싱처럼 레코드를 하나씩 만드는 경로)
+    - mask_record  : dict 레코드 하나 (rules에 있는 필드만)
+    - mask_series  : pandas 컬럼 단위 (엑셀 매핑처럼 DataFrame이 있는 경로)
+    - mask_frame   : DataFrame의 rules 컬럼 전체
+
+마스킹 타입:
+    name     홍길동        -> 홍**
+    phone    010-1234-5678 -> 010****5678 (10/11자리가 아니면 ****)
+    address  서울 강남구 역삼동 1 -> 서울 강남구 ****
+    zipcode  06000         -> 060**
+    id       주문번호       -> md5 앞 8자리 (같은 값은 같은 결과)
+    user_id  abcdef        -> ab****
+빈 값, 공백뿐인 문자열은 그대로 둡니다.
+"""
+import re
+import hashlib
+from functools import lru_cache
+from typing import Any, Iterable, Iterator
+
+import numpy as np
+import pandas as pd
+
+
+# down_form_orders 필드 기준 마스킹 규칙
+DOWN_FORM_MASKING_RULES = {
+    'receive_name': 'name',
+    'receive_tel': 'phone',
+    'receive_cel': 'phone',
+    'receive_addr': 'address',
+    'receive_zipcode': 'zipcode',
+    'order_id': 'id',
+    'mall_order_id': 'id',
+    'mall_user_id': 'user_id',
+}
+
+# 사방넷 주문 수집(receive_orders) 필드 기준 마스킹 규칙 (XML 태그를 소문자로 바꾼 이름)
+RECEIVE_ORDER_MASKING_RULES = {
+    'user_name': 'name',
+    'receive_name': 'name',
+    'user_id': 'user_id',
+    'receive_tel': 'phone',
+    'receive_cel': 'phone',
+    'user_cel': 'phone',
+    'receive_addr': 'address',
+    'receive_zipcode': 'zipcode',
+    'order_id': 'id',
+    'mall_order_id': 'id',
+    'mall_user_id': 'user_id',
+}
+
+_NON_DIGIT_PATTERN = re.compile(r'[^0-9]')
+_PHONE_MASK = '****'
+
+
+@lru_cache(maxsize=65536)
+def _hash_id(value: str) -> str:
+    # 주문번호는 같은 값이 여러 행에 반복되므로 캐시
+    return hashlib.md5(value.encode()).hexdigest()[:8]
+
+
+def _mask_name(value: str) -> str:
+    if len(value) <= 1:
+        return '*'
+    return value[0] + '*' * (len(value) - 1)
+
+
+def _mask_phone(value: str) -> str:
+    digits = _NON_DIGIT_PATTERN.sub('', value)
+    if len(digits) == 11:  # 휴대폰
+        return digits[:3] + _PHONE_MASK + digits[7:]
+    if len(digits) == 10:  # 일반전화
+        return digits[:3] + _PHONE_MASK + digits[6:]
+    return _PHONE_MASK
+
+
+def _mask_address(value: str) -> str:
+    # 시/도, 시/군/구는 유지하고 상세주소는 마스킹
+    parts = value.split(None, 2)
+    if len(parts) > 2:
+        return parts[0] + ' ' + parts[1] + ' ****'
+    return '****'
+
+
+def _mask_zipcode(value: str) -> str:
+    if len(value) >= 3:
+        return value[:3] + '*' * (len(value) - 3)
+    return '*' * len(value)
+
+
+def _mask_user_id(value: str) -> str:
+    if len(value) > 2:
+        return value[:2] + '*' * (len(value) - 2)
+    return '*' * len(value)
+
+
+_VALUE_MASKERS = {
+    'name': _mask_name,
+    'phone': _mask_phone,
+    'address': _mask_address,
+    'zipcode': _mask_zipcode,
+    'id': _hash_id,
+    'user_id': _mask_user_id,
+}
+
+
+def mask_value(value: Any, mask_type: str) -> Any:
+    """값 하나 마스킹 (빈 값, 공백뿐인 문자열, 알 수 없는 mask_type은 그대로 반환)"""
+    if not value:
+        return value
+    value = str(value)
+    if not value.strip():
+        return value
+    masker = _VALUE_MASKERS.get(mask_type)
+    return masker(value) if masker else value
+
+
+def mask_record(record: dict[str, Any], rules: dict[str, str]) -> dict[str, Any]:
+    """dict 레코드의 rules 필드를 제자리에서 마스킹하고 같은 dict 반환"""
+    for field, mask_type in rules.items():
+        value = record.get(field)
+        if value:
+            record[field] = mask_value(value, mask_type)
+    return record
+
+
+def iter_masked_records(records: Iterable[dict[str, Any]], rules: dict[str, str]) -> Iterator[dict[str, Any]]:
+    """레코드를 하나씩 마스킹하면서 흘려보냄 (전체 목록을 메모리에 모으지 않는 스트리밍 경로용)"""
+    for record in records:
+        yield mask_record(record, rules)
+
+
+def _stars(counts: pd.Series) -> pd.Series:
+    """개수별 '*' 문자열 (개수 종류만큼만 문자열을 만듦)"""
+    counts = counts.clip(lower=0)
+    return counts.map({count: '*' * count for count in counts.unique()})
+
+
+def mask_series(series: pd.Series, mask_type: str) -> pd.Series:
+    """
+    컬럼 단위 마스킹 (mask_value와 같은 결과, 결과는 object Series)
+    """
+    series = series.astype(object)
+    if mask_type not in _VALUE_MASKERS:
+        return series
+    is_str = series.map(type).eq(str)
+    strings = series.where(is_str, '').astype(str)
+    # 비어 있지 않고 공백뿐이지 않은 값만 마스킹 (문자열이 아닌 값은 str()로 변환해서 마스킹)
+    target = series.where(series.notna(), '').astype(bool).to_numpy()
+    target &= ~(is_str & strings.str.strip().eq('')).to_numpy()
+    if not target.any():
+        return series
+    values = series[target].astype(str)
+    lengths = values.str.len()
+
+    if mask_type == 'name':
+        masked = values.str[0] + _stars(lengths - 1)
+        masked[lengths <= 1] = '*'
+    elif mask_type == 'phone':
+        digits = values.str.replace(_NON_DIGIT_PATTERN, '', regex=True)
+        digit_lengths = digits.str.len()
+        head = digits.str[:3] + _PHONE_MASK
+        masked = pd.Series(np.where(digit_lengths == 11, head + digits.str[7:],
+                                    np.where(digit_lengths == 10, head + digits.str[6:], _PHONE_MASK)),
+                           index=values.index, dtype=object)
+    elif mask_type == 'address':
+        # split(maxsplit=2)가 3조각이면 전체 split 결과가 2조각 초과
+        parts = values.str.split(n=2)
+        long_address = parts.str.len() > 2
+        masked = pd.Series('****', index=values.index, dtype=object)
+        masked[long_address] = parts[long_address].str[0] + ' ' + parts[long_address].str[1] + ' ****'
+    elif mask_type == 'zipcode':
+        masked = values.str[:3] + _stars(lengths - 3)
+        masked[lengths < 3] = _stars(lengths[lengths < 3])
+    elif mask_type == 'id':
+        uniques = pd.unique(values)
+        masked = values.map(dict(zip(uniques, map(_hash_id, uniques))))
+    else:  # user_id
+        masked = values.str[:2] + _stars(lengths - 2)
+        masked[lengths <= 2] = _stars(lengths[lengths <= 2])
+
+    result = series.to_numpy(dtype=object, copy=True)
+    result[target] = masked.to_numpy(dtype=object)
+    return pd.Series(result, index=series.index, dtype=object)
+
+
+def mask_frame(df: pd.DataFrame, rules: dict[str, str]) -> pd.DataFrame:
+    """DataFrame의 rules 컬럼을 컬럼 단위로 마스킹 (df를 제자리에서 바꾸고 반환)"""
+    for field, mask_type in rules.items():
+        if field in df.columns:
+            df[field] = mask_series(df[field], mask_type)
+    return df